@@ -0,0 +1,34 @@
+-- =============================================================================
+-- Migration 020: Experiment Sequential State
+--
+-- Purpose: Persist the running always-valid p-value of each mixture
+-- sequential probability ratio test (mSPRT), so save_experiment_results can
+-- continue a test across calls without reusing fixed-horizon p-values that
+-- callers store in experiment_results.vs_control_p_value.
+--
+-- New Tables:
+--   1. experiment_sequential_state - Running mSPRT p-value per variant/metric
+--
+-- Dependencies: Requires migration 018 (ab_experiments, experiment_variants)
+--
+-- Created: 2026-10-18
+-- =============================================================================
+
+CREATE TABLE IF NOT EXISTS experiment_sequential_state (
+    experiment_id INTEGER NOT NULL,
+    variant_id INTEGER NOT NULL,
+    metric_name TEXT NOT NULL,
+
+    -- Running minimum of the mSPRT p-value across checks
+    p_value REAL NOT NULL CHECK (p_value >= 0.0 AND p_value <= 1.0),
+    updated_at TEXT NOT NULL DEFAULT (datetime('now')),
+
+    PRIMARY KEY (experiment_id, variant_id, metric_name),
+    FOREIGN KEY (experiment_id) REFERENCES ab_experiments(experiment_id) ON DELETE CASCADE,
+    FOREIGN KEY (variant_id) REFERENCES experiment_variants(variant_id) ON DELETE CASCADE
+);
+
+-- =============================================================================
+-- Verification Queries (run after migration)
+-- =============================================================================
+-- SELECT name FROM sqlite_master WHERE type='table' AND name = 'experiment_sequential_state';
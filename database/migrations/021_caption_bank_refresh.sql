@@ -0,0 +1,35 @@
+-- =============================================================================
+-- Migration 021: Caption Bank Incremental Refresh
+--
+-- Purpose: Schema used by rebuild_caption_bank.py --incremental.
+-- - Index mass_messages.message_content so a refresh can re-aggregate the
+--   captions touched by new messages without scanning the whole table
+-- - Track the mass_messages rowid high-water mark folded into caption_bank_v2
+--
+-- New Tables:
+--   1. caption_bank_refresh_state - Last mass_messages rowid in the bank
+--
+-- New Indexes:
+--   1. idx_mass_messages_content - mass_messages(message_content)
+--
+-- Dependencies: Requires mass_messages (caption_bank_v2 comes from migration 019)
+--
+-- Created: 2026-10-18
+-- =============================================================================
+
+CREATE INDEX IF NOT EXISTS idx_mass_messages_content ON mass_messages(message_content);
+
+CREATE TABLE IF NOT EXISTS caption_bank_refresh_state (
+    source TEXT PRIMARY KEY,
+
+    -- Newest mass_messages rowid included in caption_bank_v2
+    last_rowid INTEGER NOT NULL,
+    last_sending_time TEXT,
+    refreshed_at TEXT NOT NULL DEFAULT (datetime('now'))
+);
+
+-- =============================================================================
+-- Verification Queries (run after migration)
+-- =============================================================================
+-- SELECT name FROM sqlite_master WHERE type='index' AND name = 'idx_mass_messages_content';
+-- SELECT name FROM sqlite_master WHERE type='table' AND name = 'caption_bank_refresh_state';
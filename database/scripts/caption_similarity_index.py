@@ -0,0 +1,653 @@
+#!/usr/bin/env python3
+"""
+Caption Near-Duplicate Index (MinHash / LSH)
+
+Exact-hash dedup only catches captions whose normalized text is identical.
+This module estimates Jaccard similarity of character shingles with MinHash
+signatures and finds candidates through locality-sensitive hashing (LSH)
+bands, so "captions within similarity >= X of this one" is answered from a
+handful of bucket lookups instead of a pairwise scan.
+
+Components:
+    - minhash_signature(): MinHash signature of a caption (NumPy when
+      available, identical pure-Python fallback otherwise)
+    - LSHIndex: in-memory banded index, used at ingest to collapse
+      near-duplicates (collapse_near_duplicates)
+    - SignatureStore: persisted signatures keyed by normalized-text hash,
+      so each distinct caption is only signed once
+    - CaptionSimilarityIndex: persisted LSH index over a caption table
+      (caption_bank by default), built in bulk and updated incrementally;
+      several tables can be indexed side by side
+
+With NUM_PERM = 64 split into 16 bands of 4 rows, pairs at Jaccard 0.5
+become candidates about half the time and pairs at 0.8+ almost always;
+candidates are then filtered on their estimated similarity.
+
+Usage:
+    python caption_similarity_index.py --build
+    python caption_similarity_index.py --update
+    python caption_similarity_index.py --query "caption text" --threshold 0.8
+    python caption_similarity_index.py --build --table caption_bank_v2
+
+Created: 2025-12-22
+"""
+
+import argparse
+import hashlib
+import logging
+import random
+import re
+import sqlite3
+import struct
+import sys
+import zlib
+from array import array
+from collections import defaultdict
+from pathlib import Path
+from typing import Any, Iterable, Optional
+
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    np = None
+    NUMPY_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+# Database path
+DB_PATH = Path(__file__).parent.parent / 'eros_sd_main.db'
+
+# Character shingle length
+SHINGLE_SIZE = 5
+
+# Signature length and LSH banding (NUM_PERM = BANDS * ROWS_PER_BAND)
+NUM_PERM = 64
+BANDS = 16
+ROWS_PER_BAND = NUM_PERM // BANDS
+
+# Default similarity at which captions are treated as near-duplicates
+NEAR_DUPLICATE_THRESHOLD = 0.85
+
+# Rows per executemany batch for bulk builds
+BATCH_SIZE = 5000
+
+# Fixed seed: signatures are persisted, so the hash family must be stable
+_SEED = 0x45524F53
+_MASK64 = (1 << 64) - 1
+
+_rng = random.Random(_SEED)
+_HASH_A = tuple(_rng.getrandbits(64) | 1 for _ in range(NUM_PERM))
+_HASH_B = tuple(_rng.getrandbits(64) for _ in range(NUM_PERM))
+
+# Changing any of these invalidates persisted signatures and buckets
+INDEX_PARAMS = f"shingle={SHINGLE_SIZE};perm={NUM_PERM};bands={BANDS};seed={_SEED}"
+
+_WHITESPACE_RE = re.compile(r'\s+')
+_IDENTIFIER_RE = re.compile(r'^[A-Za-z_][A-Za-z0-9_]*$')
+
+# (band, bucket) pairs per bucket lookup query (two parameters each)
+PROBE_CHUNK = 400
+
+
+def normalize_text(text: Optional[str]) -> str:
+    """Lowercase and collapse whitespace (same normalization as caption_hash)."""
+    if not text:
+        return ""
+    return _WHITESPACE_RE.sub(' ', text.strip()).lower()
+
+
+def text_key(text: Optional[str]) -> str:
+    """SHA256 of normalized text; matches rebuild_caption_bank.compute_hash."""
+    return hashlib.sha256(normalize_text(text).encode('utf-8')).hexdigest()
+
+
+def shingle_hashes(text: Optional[str]) -> list[int]:
+    """Return the distinct 32-bit hashes of the text's character shingles."""
+    normalized = normalize_text(text)
+    if len(normalized) <= SHINGLE_SIZE:
+        return [zlib.crc32(normalized.encode('utf-8'))]
+    return list({
+        zlib.crc32(normalized[i:i + SHINGLE_SIZE].encode('utf-8'))
+        for i in range(len(normalized) - SHINGLE_SIZE + 1)
+    })
+
+
+def minhash_signature(text: Optional[str]) -> tuple[int, ...]:
+    """
+    Compute the MinHash signature of a caption.
+
+    Each of the NUM_PERM hash functions is multiply-shift hashing,
+    h(x) = ((a * x + b) mod 2**64) >> 32, over the shingle hashes.
+
+    Args:
+        text: Caption text.
+
+    Returns:
+        Tuple of NUM_PERM 32-bit minimums.
+    """
+    shingles = shingle_hashes(text)
+    if NUMPY_AVAILABLE:
+        values = np.array(shingles, dtype=np.uint64)
+        a = np.array(_HASH_A, dtype=np.uint64)[:, None]
+        b = np.array(_HASH_B, dtype=np.uint64)[:, None]
+        return tuple(int(v) for v in ((a * values + b) >> np.uint64(32)).min(axis=1))
+    return tuple(
+        min([((a * h + b) & _MASK64) >> 32 for h in shingles])
+        for a, b in zip(_HASH_A, _HASH_B)
+    )
+
+
+def band_keys(signature: tuple[int, ...]) -> list[int]:
+    """Return one signed 64-bit bucket key per LSH band."""
+    keys = []
+    for band in range(BANDS):
+        rows = signature[band * ROWS_PER_BAND:(band + 1) * ROWS_PER_BAND]
+        digest = hashlib.blake2b(struct.pack(f'<{ROWS_PER_BAND}I', *rows), digest_size=8).digest()
+        keys.append(int.from_bytes(digest, 'little', signed=True))
+    return keys
+
+
+def estimate_similarity(sig_a: tuple[int, ...], sig_b: tuple[int, ...]) -> float:
+    """Estimate Jaccard similarity as the fraction of agreeing signature rows."""
+    return sum(1 for x, y in zip(sig_a, sig_b) if x == y) / NUM_PERM
+
+
+def pack_signature(signature: tuple[int, ...]) -> bytes:
+    """Serialize a signature for storage."""
+    return array('I', signature).tobytes()
+
+
+def unpack_signature(blob: bytes) -> tuple[int, ...]:
+    """Deserialize a stored signature."""
+    values = array('I')
+    values.frombytes(blob)
+    return tuple(values)
+
+
+class LSHIndex:
+    """In-memory banded LSH index over MinHash signatures."""
+
+    def __init__(self):
+        self._signatures: dict[Any, tuple[int, ...]] = {}
+        self._buckets: list[dict[int, set]] = [defaultdict(set) for _ in range(BANDS)]
+
+    def __len__(self) -> int:
+        return len(self._signatures)
+
+    def add(self, key: Any, signature: tuple[int, ...]) -> None:
+        """Index a signature under key (replacing any previous one)."""
+        if key in self._signatures:
+            self.remove(key)
+        self._signatures[key] = signature
+        for band, bucket in enumerate(band_keys(signature)):
+            self._buckets[band][bucket].add(key)
+
+    def remove(self, key: Any) -> None:
+        """Drop a key from the index."""
+        signature = self._signatures.pop(key, None)
+        if signature is None:
+            return
+        for band, bucket in enumerate(band_keys(signature)):
+            members = self._buckets[band].get(bucket)
+            if members is not None:
+                members.discard(key)
+                if not members:
+                    del self._buckets[band][bucket]
+
+    def query(self, signature: tuple[int, ...], threshold: float) -> list[tuple[Any, float]]:
+        """
+        Find indexed keys whose estimated similarity is at least threshold.
+
+        Returns:
+            (key, similarity) pairs, most similar first.
+        """
+        candidates: set = set()
+        for band, bucket in enumerate(band_keys(signature)):
+            candidates.update(self._buckets[band].get(bucket, ()))
+
+        matches = []
+        for key in candidates:
+            similarity = estimate_similarity(signature, self._signatures[key])
+            if similarity >= threshold:
+                matches.append((key, similarity))
+        matches.sort(key=lambda match: -match[1])
+        return matches
+
+
+def collapse_near_duplicates(
+    items: Iterable[tuple[Any, tuple[int, ...]]],
+    threshold: float = NEAR_DUPLICATE_THRESHOLD,
+    candidates: Optional[set] = None,
+) -> dict[Any, Any]:
+    """
+    Greedily collapse near-duplicates, keeping the first of each cluster.
+
+    Items must arrive in priority order (best performer first). Each item
+    is compared to the items kept so far; if one is within threshold the
+    item is a near-duplicate of it, otherwise it is kept.
+
+    Args:
+        items: (key, signature) pairs in priority order.
+        threshold: Minimum estimated Jaccard similarity.
+        candidates: If given, only these keys may be collapsed; others are
+            always kept (used to limit an incremental pass to new captions).
+
+    Returns:
+        Mapping of near-duplicate key to the key it duplicates.
+    """
+    index = LSHIndex()
+    duplicates: dict[Any, Any] = {}
+    for key, signature in items:
+        if candidates is None or key in candidates:
+            matches = index.query(signature, threshold)
+            if matches:
+                duplicates[key] = matches[0][0]
+                continue
+        index.add(key, signature)
+    return duplicates
+
+
+# DDL is run statement by statement with execute(): executescript() would
+# COMMIT any transaction the caller has open (e.g. a caption bank rebuild).
+SIGNATURE_SCHEMA = (
+    """
+    CREATE TABLE IF NOT EXISTS minhash_signatures (
+        caption_hash TEXT PRIMARY KEY,
+        params TEXT NOT NULL,
+        signature BLOB NOT NULL
+    ) WITHOUT ROWID
+    """,
+)
+
+INDEX_SCHEMA = (
+    """
+    CREATE TABLE IF NOT EXISTS caption_lsh_members (
+        source_table TEXT NOT NULL,
+        caption_id NOT NULL,
+        caption_hash TEXT NOT NULL,
+        params TEXT NOT NULL,
+        PRIMARY KEY (source_table, caption_id)
+    )
+    """,
+    """
+    CREATE TABLE IF NOT EXISTS caption_lsh_buckets (
+        source_table TEXT NOT NULL,
+        band INTEGER NOT NULL,
+        bucket INTEGER NOT NULL,
+        caption_id NOT NULL,
+        PRIMARY KEY (source_table, band, bucket, caption_id)
+    ) WITHOUT ROWID
+    """,
+    """
+    CREATE INDEX IF NOT EXISTS idx_lsh_buckets_caption
+        ON caption_lsh_buckets(source_table, caption_id)
+    """,
+)
+
+
+def _execute_all(conn: sqlite3.Connection, statements: Iterable[str]) -> None:
+    """Run statements one by one inside the caller's transaction."""
+    for statement in statements:
+        conn.execute(statement)
+
+
+class SignatureStore:
+    """MinHash signatures persisted by normalized-text hash."""
+
+    def __init__(self, conn: sqlite3.Connection):
+        self.conn = conn
+        _execute_all(conn, SIGNATURE_SCHEMA)
+
+    def get_many(self, texts: dict[str, str]) -> dict[str, tuple[int, ...]]:
+        """
+        Return signatures for many captions, signing only unseen ones.
+
+        New signatures are written with executemany; does not commit.
+
+        Args:
+            texts: Mapping of caption_hash (see text_key) to caption text.
+
+        Returns:
+            Mapping of caption_hash to signature.
+        """
+        signatures: dict[str, tuple[int, ...]] = {}
+        hashes = list(texts)
+        for start in range(0, len(hashes), 500):
+            chunk = hashes[start:start + 500]
+            placeholders = ", ".join("?" for _ in chunk)
+            cursor = self.conn.execute(
+                f"SELECT caption_hash, signature FROM minhash_signatures "
+                f"WHERE params = ? AND caption_hash IN ({placeholders})",
+                [INDEX_PARAMS, *chunk]
+            )
+            for caption_hash, blob in cursor:
+                signatures[caption_hash] = unpack_signature(blob)
+
+        missing = [caption_hash for caption_hash in hashes if caption_hash not in signatures]
+        for start in range(0, len(missing), BATCH_SIZE):
+            rows = []
+            for caption_hash in missing[start:start + BATCH_SIZE]:
+                signature = minhash_signature(texts[caption_hash])
+                signatures[caption_hash] = signature
+                rows.append((caption_hash, INDEX_PARAMS, pack_signature(signature)))
+            self.conn.executemany(
+                "INSERT OR REPLACE INTO minhash_signatures (caption_hash, params, signature) VALUES (?, ?, ?)",
+                rows
+            )
+        if missing:
+            logger.info(f"Computed {len(missing)} new MinHash signatures")
+        return signatures
+
+
+class CaptionSimilarityIndex:
+    """
+    Persisted LSH index over a caption table (caption_bank by default).
+
+    Tables (rows are keyed by source table, so indexes of different
+    caption tables live side by side):
+        caption_lsh_members: (source_table, caption_id) -> caption_hash of
+            the indexed text
+        caption_lsh_buckets: (source_table, band, bucket) -> caption_id,
+            WITHOUT ROWID so a lookup is one primary-key range scan per band
+    """
+
+    def __init__(
+        self,
+        conn: sqlite3.Connection,
+        source_table: str = 'caption_bank',
+        id_column: str = 'caption_id',
+        text_column: str = 'caption_text',
+    ):
+        for name in (source_table, id_column, text_column):
+            if not _IDENTIFIER_RE.match(name):
+                raise ValueError(f"Invalid SQL identifier: {name!r}")
+        self.conn = conn
+        self.source_table = source_table
+        self.id_column = id_column
+        self.text_column = text_column
+        self.signatures = SignatureStore(conn)
+
+        columns = {row[1] for row in self.conn.execute("PRAGMA table_info(caption_lsh_members)")}
+        if columns and 'source_table' not in columns:
+            # Tables from before per-source keying hold derived data only
+            logger.warning("Dropping unkeyed caption LSH index tables; rebuild with --build")
+            _execute_all(conn, (
+                "DROP TABLE IF EXISTS caption_lsh_buckets",
+                "DROP TABLE IF EXISTS caption_lsh_members",
+            ))
+        _execute_all(conn, INDEX_SCHEMA)
+
+    def __len__(self) -> int:
+        return self.conn.execute(
+            "SELECT COUNT(*) FROM caption_lsh_members WHERE source_table = ?",
+            (self.source_table,)
+        ).fetchone()[0]
+
+    def _source_rows(self) -> Iterable[tuple[Any, str]]:
+        cursor = self.conn.execute(
+            f"SELECT {self.id_column}, {self.text_column} FROM {self.source_table} "
+            f"WHERE {self.text_column} IS NOT NULL"
+        )
+        while True:
+            rows = cursor.fetchmany(BATCH_SIZE)
+            if not rows:
+                return
+            yield from rows
+
+    def _index_rows(self, rows: list[tuple[Any, str]]) -> None:
+        """Sign and bucket a batch of (caption_id, text) rows. Does not commit."""
+        texts = {}
+        keyed = []
+        for caption_id, text in rows:
+            caption_hash = text_key(text)
+            texts[caption_hash] = text
+            keyed.append((caption_id, caption_hash))
+        signatures = self.signatures.get_many(texts)
+
+        self.conn.executemany(
+            "INSERT OR REPLACE INTO caption_lsh_members (source_table, caption_id, caption_hash, params) "
+            "VALUES (?, ?, ?, ?)",
+            [(self.source_table, caption_id, caption_hash, INDEX_PARAMS) for caption_id, caption_hash in keyed]
+        )
+        self.conn.executemany(
+            "INSERT OR IGNORE INTO caption_lsh_buckets (source_table, band, bucket, caption_id) VALUES (?, ?, ?, ?)",
+            [
+                (self.source_table, band, bucket, caption_id)
+                for caption_id, caption_hash in keyed
+                for band, bucket in enumerate(band_keys(signatures[caption_hash]))
+            ]
+        )
+
+    def _remove(self, caption_ids: list[Any]) -> None:
+        keys = [(self.source_table, c) for c in caption_ids]
+        self.conn.executemany("DELETE FROM caption_lsh_buckets WHERE source_table = ? AND caption_id = ?", keys)
+        self.conn.executemany("DELETE FROM caption_lsh_members WHERE source_table = ? AND caption_id = ?", keys)
+
+    def build(self) -> int:
+        """
+        Rebuild the whole index from the source table in one transaction.
+
+        Returns:
+            Number of captions indexed.
+        """
+        self.conn.execute("DELETE FROM caption_lsh_buckets WHERE source_table = ?", (self.source_table,))
+        self.conn.execute("DELETE FROM caption_lsh_members WHERE source_table = ?", (self.source_table,))
+        count = 0
+        batch: list[tuple[Any, str]] = []
+        for row in self._source_rows():
+            batch.append((row[0], row[1]))
+            if len(batch) >= BATCH_SIZE:
+                self._index_rows(batch)
+                count += len(batch)
+                batch = []
+        if batch:
+            self._index_rows(batch)
+            count += len(batch)
+        self.conn.commit()
+        logger.info(f"Indexed {count} captions from {self.source_table}")
+        return count
+
+    def update(self) -> dict[str, int]:
+        """
+        Bring the index in line with the source table.
+
+        Captions that are new, whose text changed, or that were indexed with
+        different parameters are (re)indexed; captions no longer in the
+        source are removed. Only a text hash per row is computed for
+        unchanged captions.
+
+        Returns:
+            Counts of added, updated and removed captions.
+        """
+        indexed = {
+            row[0]: (row[1], row[2])
+            for row in self.conn.execute(
+                "SELECT caption_id, caption_hash, params FROM caption_lsh_members WHERE source_table = ?",
+                (self.source_table,)
+            )
+        }
+        added: list[tuple[Any, str]] = []
+        changed: list[tuple[Any, str]] = []
+        seen: set = set()
+        for caption_id, text in self._source_rows():
+            seen.add(caption_id)
+            current = indexed.get(caption_id)
+            if current is None:
+                added.append((caption_id, text))
+            elif current != (text_key(text), INDEX_PARAMS):
+                changed.append((caption_id, text))
+        removed = [caption_id for caption_id in indexed if caption_id not in seen]
+
+        self._remove(removed + [caption_id for caption_id, _ in changed])
+        rows = added + changed
+        for start in range(0, len(rows), BATCH_SIZE):
+            self._index_rows(rows[start:start + BATCH_SIZE])
+        self.conn.commit()
+
+        result = {"added": len(added), "updated": len(changed), "removed": len(removed)}
+        logger.info(f"Similarity index update: {result}")
+        return result
+
+    def reindex(self, caption_ids: Iterable[Any]) -> int:
+        """
+        Re-index specific source rows without scanning the whole table.
+
+        Ids that are no longer in the source table (or have no text) are
+        dropped from the index.
+
+        Args:
+            caption_ids: Source ids to (re)index.
+
+        Returns:
+            Number of captions indexed.
+        """
+        ids = list(caption_ids)
+        rows: list[tuple[Any, str]] = []
+        for start in range(0, len(ids), 500):
+            chunk = ids[start:start + 500]
+            placeholders = ", ".join("?" for _ in chunk)
+            rows.extend(self.conn.execute(
+                f"SELECT {self.id_column}, {self.text_column} FROM {self.source_table} "
+                f"WHERE {self.text_column} IS NOT NULL AND {self.id_column} IN ({placeholders})",
+                chunk
+            ))
+
+        self._remove(ids)
+        for start in range(0, len(rows), BATCH_SIZE):
+            self._index_rows(rows[start:start + BATCH_SIZE])
+        self.conn.commit()
+        return len(rows)
+
+    def bucket_members(self, signatures: Iterable[tuple[int, ...]]) -> dict[Any, str]:
+        """
+        Find indexed captions sharing an LSH bucket with any of the signatures.
+
+        These are the only captions an LSH query for the signatures could
+        return; no similarity filtering is applied.
+
+        Args:
+            signatures: MinHash signatures to probe with.
+
+        Returns:
+            Mapping of caption_id to caption_hash.
+        """
+        probes = sorted({
+            (band, bucket)
+            for signature in signatures
+            for band, bucket in enumerate(band_keys(signature))
+        })
+        members: dict[Any, str] = {}
+        for start in range(0, len(probes), PROBE_CHUNK):
+            chunk = probes[start:start + PROBE_CHUNK]
+            values = ", ".join("(?, ?)" for _ in chunk)
+            # CROSS JOIN keeps the probe list outermost, so each pair is one
+            # primary-key lookup on caption_lsh_buckets
+            members.update(self.conn.execute(
+                f"WITH probe(band, bucket) AS (VALUES {values}) "
+                "SELECT DISTINCT b.caption_id, m.caption_hash FROM probe p "
+                "CROSS JOIN caption_lsh_buckets b "
+                "ON b.source_table = ? AND b.band = p.band AND b.bucket = p.bucket "
+                "JOIN caption_lsh_members m ON m.source_table = b.source_table AND m.caption_id = b.caption_id",
+                [*(value for probe in chunk for value in probe), self.source_table]
+            ))
+        return members
+
+    def query(
+        self,
+        text: str,
+        threshold: float = NEAR_DUPLICATE_THRESHOLD,
+        limit: Optional[int] = None,
+        exclude_id: Any = None,
+    ) -> list[tuple[Any, float]]:
+        """
+        Find indexed captions within similarity >= threshold of a text.
+
+        Args:
+            text: Caption text to look up.
+            threshold: Minimum estimated Jaccard similarity (0-1).
+            limit: Optional maximum number of results.
+            exclude_id: caption_id to leave out (e.g. the caption itself).
+
+        Returns:
+            (caption_id, similarity) pairs, most similar first.
+        """
+        signature = minhash_signature(text)
+        candidates = list(self.bucket_members([signature]).items())
+        if not candidates:
+            return []
+
+        stored: dict[str, tuple[int, ...]] = {}
+        hashes = list({caption_hash for _, caption_hash in candidates})
+        for start in range(0, len(hashes), 500):
+            chunk = hashes[start:start + 500]
+            placeholders = ", ".join("?" for _ in chunk)
+            for caption_hash, blob in self.conn.execute(
+                f"SELECT caption_hash, signature FROM minhash_signatures WHERE caption_hash IN ({placeholders})",
+                chunk
+            ):
+                stored[caption_hash] = unpack_signature(blob)
+
+        matches = []
+        for caption_id, caption_hash in candidates:
+            if caption_id == exclude_id or caption_hash not in stored:
+                continue
+            similarity = estimate_similarity(signature, stored[caption_hash])
+            if similarity >= threshold:
+                matches.append((caption_id, similarity))
+        matches.sort(key=lambda match: -match[1])
+        return matches[:limit] if limit else matches
+
+    def similar_to(self, caption_id: Any, threshold: float = NEAR_DUPLICATE_THRESHOLD) -> list[tuple[Any, float]]:
+        """Find indexed captions near-duplicating an existing caption."""
+        row = self.conn.execute(
+            f"SELECT {self.text_column} FROM {self.source_table} WHERE {self.id_column} = ?",
+            (caption_id,)
+        ).fetchone()
+        if row is None:
+            return []
+        return self.query(row[0], threshold, exclude_id=caption_id)
+
+
+def main():
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+
+    parser = argparse.ArgumentParser(description='Build or query the caption near-duplicate index')
+    parser.add_argument('--build', action='store_true', help='Rebuild the index from scratch')
+    parser.add_argument('--update', action='store_true', help='Index new/changed captions, drop deleted ones')
+    parser.add_argument('--query', type=str, help='Caption text to look up')
+    parser.add_argument('--threshold', type=float, default=NEAR_DUPLICATE_THRESHOLD, help='Minimum similarity')
+    parser.add_argument('--table', type=str, default='caption_bank',
+                        help='Caption table to index (each table has its own index)')
+    parser.add_argument('--id-column', type=str, default='caption_id', help='Caption id column')
+    parser.add_argument('--text-column', type=str, default='caption_text', help='Caption text column')
+    parser.add_argument('--db-path', type=str, help='Path to database file')
+
+    args = parser.parse_args()
+
+    db_path = Path(args.db_path) if args.db_path else DB_PATH
+    if not db_path.exists():
+        logger.error(f"Database not found: {db_path}")
+        sys.exit(1)
+
+    conn = sqlite3.connect(db_path)
+    try:
+        index = CaptionSimilarityIndex(
+            conn,
+            source_table=args.table,
+            id_column=args.id_column,
+            text_column=args.text_column,
+        )
+        if args.build:
+            index.build()
+        elif args.update:
+            index.update()
+        if args.query:
+            for caption_id, similarity in index.query(args.query, args.threshold):
+                print(f"{similarity:.3f}  {caption_id}")
+    finally:
+        conn.close()
+
+
+if __name__ == '__main__':
+    main()
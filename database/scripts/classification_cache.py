@@ -0,0 +1,150 @@
+#!/usr/bin/env python3
+"""
+Persistent Caption Classification Cache
+
+Stores classifier results in caption_classification_cache keyed by
+(caption_hash, classifier, variant, rules_fingerprint) so caption bank
+rebuilds only classify new or changed captions.
+
+The rules fingerprint is computed from a classifier's PATTERNS table plus
+the source of the module that defines it, so editing anything one
+classifier reads (its rules, scoring, module-level constants or helper
+functions) invalidates only that classifier's entries. The variant holds the inputs
+besides the text that a classifier depends on (e.g. the send type
+classifier's "priced" flag).
+
+Usage:
+    from classification_cache import ClassificationCache
+
+    cache = ClassificationCache(conn, "content_type", content_classifier)
+    cached = cache.load()                    # {(caption_hash, variant): (result, confidence)}
+    cache.store([(caption_hash, "", "16", 0.85)])
+
+Created: 2025-12-22
+"""
+
+import hashlib
+import inspect
+import json
+import logging
+import re
+import sqlite3
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+CACHE_TABLE_SQL = """
+CREATE TABLE IF NOT EXISTS caption_classification_cache (
+    caption_hash TEXT NOT NULL,
+    classifier TEXT NOT NULL,
+    variant TEXT NOT NULL DEFAULT '',
+    rules_fingerprint TEXT NOT NULL,
+    result TEXT NOT NULL,
+    confidence REAL NOT NULL,
+    classified_at TEXT NOT NULL DEFAULT (datetime('now')),
+    PRIMARY KEY (caption_hash, classifier, variant, rules_fingerprint)
+)
+"""
+
+
+def _flatten_rules(value: Any) -> Any:
+    """Convert a PATTERNS table (strings, tuples or compiled regexes) to JSON-able data."""
+    if isinstance(value, re.Pattern):
+        return [value.pattern, value.flags]
+    if isinstance(value, dict):
+        return {str(key): _flatten_rules(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_flatten_rules(item) for item in value]
+    return value
+
+
+def rules_fingerprint(classifier: Any) -> str:
+    """
+    Compute the rule-set fingerprint of a classifier instance.
+
+    Args:
+        classifier: A ContentTypeClassifier or SendTypeClassifier.
+
+    Returns:
+        Hex SHA256 digest (first 16 chars) of PATTERNS, the source of the
+        classifier's module and the module __version__ if it has one.
+    """
+    module = inspect.getmodule(type(classifier))
+    try:
+        source = inspect.getsource(module if module is not None else type(classifier))
+    except (OSError, TypeError):
+        source = ""
+    payload = json.dumps(
+        {
+            "patterns": _flatten_rules(getattr(classifier, "PATTERNS", {})),
+            "source": source,
+            "version": getattr(module, "__version__", None),
+        },
+        sort_keys=True,
+        default=str,
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()[:16]
+
+
+class ClassificationCache:
+    """Cache of one classifier's results under its current rule set."""
+
+    def __init__(self, conn: sqlite3.Connection, classifier_name: str, classifier: Any):
+        self.conn = conn
+        self.classifier_name = classifier_name
+        self.fingerprint = rules_fingerprint(classifier)
+        self.conn.execute(CACHE_TABLE_SQL)
+
+    def prune(self) -> int:
+        """
+        Delete this classifier's entries from older rule sets.
+
+        Returns:
+            Number of stale entries removed.
+        """
+        cursor = self.conn.execute(
+            """
+            DELETE FROM caption_classification_cache
+            WHERE classifier = ? AND rules_fingerprint != ?
+            """,
+            (self.classifier_name, self.fingerprint)
+        )
+        if cursor.rowcount:
+            logger.info(f"Pruned {cursor.rowcount} stale {self.classifier_name} cache entries")
+        return cursor.rowcount
+
+    def load(self) -> dict[tuple[str, str], tuple[str, float]]:
+        """
+        Load all entries valid for the current rule set.
+
+        Returns:
+            Mapping of (caption_hash, variant) to (result, confidence).
+        """
+        cursor = self.conn.execute(
+            """
+            SELECT caption_hash, variant, result, confidence
+            FROM caption_classification_cache
+            WHERE classifier = ? AND rules_fingerprint = ?
+            """,
+            (self.classifier_name, self.fingerprint)
+        )
+        return {(row[0], row[1]): (row[2], row[3]) for row in cursor}
+
+    def store(self, entries: list[tuple[str, str, Any, float]]) -> None:
+        """
+        Save freshly computed results. Does not commit.
+
+        Args:
+            entries: (caption_hash, variant, result, confidence) tuples.
+        """
+        self.conn.executemany(
+            """
+            INSERT OR REPLACE INTO caption_classification_cache (
+                caption_hash, classifier, variant, rules_fingerprint, result, confidence
+            ) VALUES (?, ?, ?, ?, ?, ?)
+            """,
+            [
+                (caption_hash, self.classifier_name, variant, self.fingerprint, str(result), confidence)
+                for caption_hash, variant, result, confidence in entries
+            ]
+        )
@@ -4,6 +4,8 @@ Content Type Classifier for EROS System
 
 Classifies caption text into one of 37 content types using keyword pattern matching.
 Supports both single caption classification and batch processing for efficiency.
+A keyword prefilter finds, in one scan of the text, every pattern that can
+possibly match, so only those patterns are run.
 
 Content Type Categories (37 total):
 - explicit (11 types): anal, creampie, squirt, boy_girl_girl, girl_girl_girl,
@@ -806,6 +808,72 @@ class ContentTypeClassifier:
                 for pattern, weight, is_phrase in patterns
             ]
 
+        self._build_prefilter()
+
+    def _build_prefilter(self) -> None:
+        """
+        Build the keyword prefilter used to skip patterns that cannot match.
+
+        Every pattern with a required literal (see _required_literal) is
+        indexed under that keyword; patterns without one are always checked.
+        All keywords are compiled into a single overlapping scanner, so one
+        pass over the text yields every keyword present, and only patterns
+        whose keyword was seen are confirmed with their own regex.
+        """
+        self._keyword_patterns: dict[str, list[tuple[str, int]]] = {}
+        self._unconditional_patterns: dict[str, list[int]] = {}
+
+        for content_type, patterns in self.PATTERNS.items():
+            for index, (pattern, _weight, _is_phrase) in enumerate(patterns):
+                keyword = _required_literal(pattern)
+                if keyword is None:
+                    self._unconditional_patterns.setdefault(content_type, []).append(index)
+                else:
+                    self._keyword_patterns.setdefault(keyword.lower(), []).append((content_type, index))
+
+        # At any position the scanner reports the longest keyword present;
+        # the shorter keywords starting there are exactly its prefixes,
+        # recovered via _keyword_prefixes.
+        keywords = sorted(self._keyword_patterns)
+        self._keyword_prefixes: dict[str, list[str]] = {
+            keyword: [other for other in keywords if keyword.startswith(other)]
+            for keyword in keywords
+        }
+        self._keyword_scanner: Optional[re.Pattern] = (
+            re.compile("(?=(" + _keyword_trie_regex(keywords) + "))", re.IGNORECASE)
+            if keywords else None
+        )
+
+    def _candidate_patterns(self, text_lower: str) -> dict[str, list[int]]:
+        """
+        Find the patterns worth confirming for a text in a single scan.
+
+        Args:
+            text_lower: Lowercased caption text.
+
+        Returns:
+            Mapping of content type to pattern indices (in PATTERNS order)
+            whose required keyword occurs in the text, plus patterns that
+            have no required keyword.
+        """
+        found: set[str] = set()
+        if self._keyword_scanner is not None:
+            for match in self._keyword_scanner.finditer(text_lower):
+                keyword = match.group(1).lower()
+                if keyword not in found:
+                    found.update(self._keyword_prefixes[keyword])
+
+        candidates: dict[str, list[int]] = {
+            content_type: list(indices)
+            for content_type, indices in self._unconditional_patterns.items()
+        }
+        for keyword in found:
+            for content_type, index in self._keyword_patterns[keyword]:
+                candidates.setdefault(content_type, []).append(index)
+        for indices in candidates.values():
+            indices.sort()
+        return candidates
+
     def classify(self, text: str) -> tuple[int, float]:
         """
         Classify a single caption text into a content type.
@@ -840,24 +908,28 @@ class ContentTypeClassifier:
 
         Processes content types in priority order (most specific first)
         to ensure explicit content is matched before general patterns.
+        Only patterns passing the keyword prefilter are searched.
         """
         if not text or not text.strip():
             return None
 
         text_lower = text.lower()
         best_match: Optional[ClassificationResult] = None
+        candidates = self._candidate_patterns(text_lower)
 
         # Process in priority order
         for content_type in self.TYPE_PRIORITY_ORDER:
-            patterns = self._compiled_patterns.get(content_type, [])
-            if not patterns:
+            indices = candidates.get(content_type)
+            if not indices:
                 continue
+            patterns = self._compiled_patterns[content_type]
 
             total_weight = 0.0
             matched_patterns: list[str] = []
             phrase_bonus = 0.0
 
-            for compiled_pattern, weight, is_phrase in patterns:
+            for index in indices:
+                compiled_pattern, weight, is_phrase = patterns[index]
                 if compiled_pattern.search(text_lower):
                     total_weight += weight
                     matched_patterns.append(compiled_pattern.pattern)
@@ -936,6 +1008,122 @@ class ContentTypeClassifier:
         return self.CONTENT_TYPE_IDS.get(content_type_name)
 
 
+def _required_literal(pattern: str) -> Optional[str]:
+    """
+    Extract the longest literal run every match of a pattern must contain.
+
+    Only the top level of the pattern is considered: groups, character
+    classes, escapes such as \\b or \\s, and optional (?, *, {m,n})
+    characters all end a run. Patterns with a top-level alternation have
+    no required literal.
+
+    Args:
+        pattern: Regex source from ContentTypeClassifier.PATTERNS.
+
+    Returns:
+        The longest required literal of at least two characters, or None.
+    """
+    runs: list[str] = []
+    current: list[str] = []
+    depth = 0
+    i = 0
+
+    while i < len(pattern):
+        ch = pattern[i]
+        literal: Optional[str] = None
+
+        if ch == "\\":
+            escaped = pattern[i + 1:i + 2]
+            i += 2
+            # \b, \s, \d, \w, backreferences... are not literals
+            if escaped and not escaped.isalnum():
+                literal = escaped
+        elif ch == "[":
+            i += 1
+            if pattern[i:i + 1] == "^":
+                i += 1
+            if pattern[i:i + 1] == "]":
+                i += 1
+            while i < len(pattern) and pattern[i] != "]":
+                i += 2 if pattern[i] == "\\" else 1
+            i += 1
+        elif ch == "(":
+            depth += 1
+            i += 1
+        elif ch == ")":
+            depth -= 1
+            i += 1
+        elif ch == "|":
+            if depth == 0:
+                return None
+            i += 1
+        elif ch == "{":
+            i = pattern.find("}", i) + 1 or len(pattern)
+        elif ch in ".^$*+?":
+            i += 1
+        else:
+            literal = ch
+            i += 1
+
+        if depth > 0 or literal is None:
+            if current:
+                runs.append("".join(current))
+                current = []
+            continue
+
+        quantifier = pattern[i:i + 1]
+        if quantifier in ("?", "*", "{"):
+            # Optional character: the run ends before it
+            if current:
+                runs.append("".join(current))
+                current = []
+        elif quantifier == "+":
+            current.append(literal)
+            runs.append("".join(current))
+            current = []
+        else:
+            current.append(literal)
+
+    if current:
+        runs.append("".join(current))
+
+    longest = max(runs, key=len, default="")
+    return longest if len(longest) >= 2 else None
+
+
+def _keyword_trie_regex(keywords: list[str]) -> str:
+    """
+    Render keywords as a prefix-factored (trie) regex alternation.
+
+    Shared prefixes are matched once, so scanning costs roughly one
+    character comparison per position instead of one per keyword. At each
+    node longer continuations are tried before ending, so a match is the
+    longest keyword starting at that position.
+
+    Args:
+        keywords: Literal keywords (non-empty).
+
+    Returns:
+        Regex source matching any of the keywords.
+    """
+    trie: dict[str, dict] = {}
+    for keyword in keywords:
+        node = trie
+        for ch in keyword:
+            node = node.setdefault(ch, {})
+        node[""] = {}
+
+    def render(node: dict[str, dict]) -> str:
+        branches = [re.escape(ch) + render(child) for ch, child in sorted(node.items()) if ch]
+        if "" in node:
+            branches.append("")
+        if len(branches) == 1:
+            return branches[0]
+        return "(?:" + "|".join(branches) + ")"
+
+    return render(trie)
+
+
 def test_classifier():
     """Test the classifier with sample captions."""
     classifier = ContentTypeClassifier()
@@ -68,14 +68,16 @@ class CaptionExtractor:
         3: 0.25,  # tier 3: view_rate >= 0.25
     }
 
-    def __init__(self, db_path: str, dry_run: bool = False):
+    def __init__(self, db_path: str, dry_run: bool = False, near_duplicate_threshold: Optional[float] = None):
         self.db_path = db_path
         self.dry_run = dry_run
+        self.near_duplicate_threshold = near_duplicate_threshold
         self.log_file = LOG_DIR / f"caption_extract_{datetime.now().strftime('%Y%m%d_%H%M%S')}.log"
         self.stats = {
             'ppv_extracted': 0,
             'free_extracted': 0,
             'duplicates_found': 0,
+            'near_duplicates_found': 0,
             'tier_distribution': {'ppv': defaultdict(int), 'free': defaultdict(int)},
             'content_type_distribution': defaultdict(int),
         }
@@ -395,8 +397,55 @@ class CaptionExtractor:
 
         self.stats['duplicates_found'] = duplicates_found
         self._log(f"Found {duplicates_found} duplicate captions")
+
+        if self.near_duplicate_threshold:
+            self.mark_near_duplicates(captions, self.near_duplicate_threshold)
         return captions
 
+    def mark_near_duplicates(self, captions: List[Dict[str, Any]], threshold: float = 0.85) -> int:
+        """
+        Mark near-duplicate captions using MinHash/LSH similarity.
+
+        Runs over captions not already flagged as exact duplicates; as with
+        exact duplicates, the first caption of each near-identical cluster
+        is kept. Each dropped caption is logged. Called by mark_duplicates
+        only when near_duplicate_threshold is set.
+
+        Args:
+            captions: List of all extracted captions (updated in place)
+            threshold: Minimum estimated similarity to count as a duplicate
+
+        Returns:
+            Number of near-duplicates marked
+        """
+        try:
+            from caption_similarity_index import collapse_near_duplicates, minhash_signature
+        except ImportError:
+            self._log("Similarity index not available, skipping near-duplicate detection", "WARNING")
+            return 0
+
+        remaining = [caption for caption in captions if not caption['is_duplicate']]
+        signatures = {}
+        for caption in remaining:
+            if caption['caption_hash'] not in signatures:
+                signatures[caption['caption_hash']] = minhash_signature(caption['message_content'])
+
+        duplicates = collapse_near_duplicates(
+            ((i, signatures[caption['caption_hash']]) for i, caption in enumerate(remaining)),
+            threshold
+        )
+        for i, kept in duplicates.items():
+            remaining[i]['is_duplicate'] = 1
+            self._log(
+                f"Dropped near-duplicate {remaining[i]['caption_hash'][:12]} "
+                f"(kept {remaining[kept]['caption_hash'][:12]}): "
+                f"{remaining[i]['message_content'][:80]!r}"
+            )
+
+        self.stats['near_duplicates_found'] = len(duplicates)
+        self._log(f"Found {len(duplicates)} near-duplicate captions (similarity >= {threshold})")
+        return len(duplicates)
+
     def insert_captions(self, conn: sqlite3.Connection, captions: List[Dict[str, Any]]) -> int:
         """
         Insert captions into staging table.
@@ -479,6 +528,7 @@ class CaptionExtractor:
         self._log(f"  - PPV captions: {self.stats['ppv_extracted']}")
         self._log(f"  - FREE captions: {self.stats['free_extracted']}")
         self._log(f"  - Duplicates found: {self.stats['duplicates_found']}")
+        self._log(f"  - Near-duplicates found: {self.stats['near_duplicates_found']}")
 
         # Tier distribution
         self._log("\nPPV Tier Distribution:")
@@ -584,6 +634,12 @@ def main():
         action='store_true',
         help='Preview extraction without making changes'
     )
+    parser.add_argument(
+        '--near-duplicate-threshold',
+        type=float,
+        default=None,
+        help='Collapse captions at or above this MinHash similarity, e.g. 0.85 (off by default)'
+    )
 
     args = parser.parse_args()
 
@@ -592,7 +648,11 @@ def main():
         print(f"ERROR: Database not found: {args.db_path}")
         sys.exit(1)
 
-    extractor = CaptionExtractor(args.db_path, dry_run=args.dry_run)
+    extractor = CaptionExtractor(
+        args.db_path,
+        dry_run=args.dry_run,
+        near_duplicate_threshold=args.near_duplicate_threshold
+    )
     success = extractor.run()
     sys.exit(0 if success else 1)
 
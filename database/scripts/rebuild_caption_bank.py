@@ -5,8 +5,28 @@ Caption Bank Rebuild - Master Orchestration Script
 This script orchestrates the complete rebuild of caption_bank from mass_messages.
 It coordinates the extraction, classification, and migration process.
 
+Incremental mode (--incremental) refreshes an existing bank from the
+mass_messages rows added since the last run, tracked by a high-water mark
+on the mass_messages rowid in caption_bank_refresh_state. Only captions
+whose text appears in new messages are re-aggregated, duplicates are
+re-ranked only inside the affected hash partitions, and the winners are
+upserted into caption_bank_v2. Apply migration 021 first: it adds the
+mass_messages(message_content) index the refresh relies on.
+
+Only appended rows are picked up: mass_messages has no update timestamp,
+so in-place UPDATEs (e.g. earnings backfills or edited captions) to rows at
+or below the high-water mark are not seen. Run a full rebuild after such
+edits.
+
+Near-duplicate collapsing (--near-duplicate-threshold) is opt-in. When
+enabled, a persisted MinHash/LSH index over caption_bank_v2 is kept up to
+date, and incremental refreshes compare new captions only with the bank
+captions that share an LSH bucket with them.
+
 Usage:
     python rebuild_caption_bank.py [--dry-run] [--skip-extraction] [--skip-classification]
+    python rebuild_caption_bank.py --incremental [--dry-run]
+    python rebuild_caption_bank.py --near-duplicate-threshold 0.85
 
 Created: 2025-12-22
 """
@@ -15,6 +35,7 @@ import argparse
 import hashlib
 import json
 import logging
+import re
 import sqlite3
 import sys
 from datetime import datetime
@@ -44,6 +65,21 @@ MIN_CHAR_LENGTH = 50
 MAX_CHAR_LENGTH_PPV = 1000
 MAX_CHAR_LENGTH_FREE = 800
 
+# Rows per executemany batch when Python-side work is unavoidable
+WRITE_BATCH_SIZE = 5000
+
+_WHITESPACE_RE = re.compile(r'\s+')
+
+# Source key for the mass_messages high-water mark
+REFRESH_SOURCE = 'mass_messages'
+
+# Restricts extraction/ranking to the captions touched by an incremental refresh
+REFRESH_CONTENT_FILTER = "AND message_content IN (SELECT message_content FROM temp.refresh_contents)"
+REFRESH_HASH_FILTER = "AND caption_hash IN (SELECT caption_hash FROM temp.refresh_hashes)"
+
+# Table indexed for near-duplicate lookups (see caption_similarity_index)
+SIMILARITY_INDEX_TABLE = 'caption_bank_v2'
+
 
 def normalize_text(text: str) -> str:
     """Normalize text for hashing and comparison."""
@@ -52,8 +88,7 @@ def normalize_text(text: str) -> str:
     # Strip whitespace
     text = text.strip()
     # Collapse multiple spaces
-    import re
-    text = re.sub(r'\s+', ' ', text)
+    text = _WHITESPACE_RE.sub(' ', text)
     return text
 
 
@@ -63,6 +98,17 @@ def compute_hash(text: str) -> str:
     return hashlib.sha256(normalized.encode('utf-8')).hexdigest()
 
 
+def register_text_functions(conn: sqlite3.Connection) -> None:
+    """
+    Register normalize_text and compute_hash as SQLite functions.
+
+    Makes eros_normalize(text) and eros_hash(text) available in SQL, so
+    hashing runs inside a single UPDATE instead of a per-row round trip.
+    """
+    conn.create_function('eros_normalize', 1, normalize_text, deterministic=True)
+    conn.create_function('eros_hash', 1, compute_hash, deterministic=True)
+
+
 def calculate_tier(is_ppv: bool, earnings: float = 0, view_rate: float = 0) -> int:
     """Calculate performance tier based on metrics."""
     if is_ppv:
@@ -84,14 +130,16 @@ def calculate_tier(is_ppv: bool, earnings: float = 0, view_rate: float = 0) -> i
 class CaptionBankRebuilder:
     """Main orchestrator for caption bank rebuild."""
 
-    def __init__(self, db_path: Path, dry_run: bool = False):
+    def __init__(self, db_path: Path, dry_run: bool = False, near_duplicate_threshold: Optional[float] = None):
         self.db_path = db_path
         self.dry_run = dry_run
+        self.near_duplicate_threshold = near_duplicate_threshold
         self.conn = None
         self.stats = {
             'ppv_extracted': 0,
             'free_extracted': 0,
             'duplicates_removed': 0,
+            'near_duplicates_removed': 0,
             'classified_keyword': 0,
             'classified_llm': 0,
             'tier_1': 0,
@@ -104,6 +152,7 @@ class CaptionBankRebuilder:
         """Connect to database."""
         self.conn = sqlite3.connect(self.db_path)
         self.conn.row_factory = sqlite3.Row
+        register_text_functions(self.conn)
         logger.info(f"Connected to database: {self.db_path}")
 
     def close(self):
@@ -179,6 +228,7 @@ class CaptionBankRebuilder:
         );
 
         CREATE INDEX idx_staging_hash ON caption_staging(caption_hash);
+        CREATE INDEX idx_staging_content ON caption_staging(message_content);
         CREATE INDEX idx_staging_type ON caption_staging(message_type);
         CREATE INDEX idx_staging_tier ON caption_staging(performance_tier);
         """
@@ -196,8 +246,14 @@ class CaptionBankRebuilder:
             logger.error(f"Failed to create staging table: {e}")
             return False
 
-    def extract_ppv_captions(self):
-        """Extract qualifying PPV captions from mass_messages."""
+    def extract_ppv_captions(self, content_filter: str = ""):
+        """
+        Extract qualifying PPV captions from mass_messages.
+
+        Args:
+            content_filter: Extra WHERE clause restricting the captions
+                (REFRESH_CONTENT_FILTER in incremental mode).
+        """
         logger.info(f"Extracting PPV captions (earnings >= ${PPV_MIN_EARNINGS}, sent >= {PPV_MIN_SENT})...")
 
         sql = f"""
@@ -232,6 +288,7 @@ class CaptionBankRebuilder:
           AND LENGTH(message_content) <= {MAX_CHAR_LENGTH_PPV}
           AND message_content IS NOT NULL
           AND TRIM(message_content) != ''
+          {content_filter}
         GROUP BY message_content
         """
 
@@ -247,6 +304,7 @@ class CaptionBankRebuilder:
               AND LENGTH(message_content) >= {MIN_CHAR_LENGTH}
               AND LENGTH(message_content) <= {MAX_CHAR_LENGTH_PPV}
               AND message_content IS NOT NULL
+              {content_filter}
             """
             cursor = self.conn.execute(count_sql)
             count = cursor.fetchone()[0]
@@ -265,8 +323,14 @@ class CaptionBankRebuilder:
             logger.error(f"Failed to extract PPV captions: {e}")
             return False
 
-    def extract_free_captions(self):
-        """Extract qualifying free captions from mass_messages."""
+    def extract_free_captions(self, content_filter: str = ""):
+        """
+        Extract qualifying free captions from mass_messages.
+
+        Args:
+            content_filter: Extra WHERE clause restricting the captions
+                (REFRESH_CONTENT_FILTER in incremental mode).
+        """
         logger.info(f"Extracting free captions (view_rate >= {FREE_MIN_VIEW_RATE}, sent >= {FREE_MIN_SENT})...")
 
         sql = f"""
@@ -300,6 +364,7 @@ class CaptionBankRebuilder:
           AND LENGTH(message_content) <= {MAX_CHAR_LENGTH_FREE}
           AND message_content IS NOT NULL
           AND TRIM(message_content) != ''
+          {content_filter}
         GROUP BY message_content
         """
 
@@ -314,6 +379,7 @@ class CaptionBankRebuilder:
               AND LENGTH(message_content) >= {MIN_CHAR_LENGTH}
               AND LENGTH(message_content) <= {MAX_CHAR_LENGTH_FREE}
               AND message_content IS NOT NULL
+              {content_filter}
             """
             cursor = self.conn.execute(count_sql)
             count = cursor.fetchone()[0]
@@ -340,24 +406,25 @@ class CaptionBankRebuilder:
             logger.info("[DRY RUN] Would compute hashes")
             return True
 
+        # One set-based UPDATE; eros_hash is compute_hash (see register_text_functions)
         cursor = self.conn.execute(
-            "SELECT staging_id, message_content FROM caption_staging WHERE caption_hash = ''"
+            "UPDATE caption_staging SET caption_hash = eros_hash(message_content) WHERE caption_hash = ''"
         )
-        rows = cursor.fetchall()
-
-        for row in rows:
-            caption_hash = compute_hash(row['message_content'])
-            self.conn.execute(
-                "UPDATE caption_staging SET caption_hash = ? WHERE staging_id = ?",
-                (caption_hash, row['staging_id'])
-            )
+        count = cursor.rowcount
 
         self.conn.commit()
-        logger.info(f"Computed hashes for {len(rows)} captions")
+        logger.info(f"Computed hashes for {count} captions")
         return True
 
-    def mark_duplicates(self):
-        """Mark duplicate captions based on hash."""
+    def mark_duplicates(self, hash_filter: str = ""):
+        """
+        Mark duplicate captions based on hash.
+
+        Args:
+            hash_filter: Extra WHERE clause limiting re-ranking to some hash
+                partitions (REFRESH_HASH_FILTER in incremental mode). Ranks
+                in those partitions are reset before re-ranking.
+        """
         logger.info("Marking duplicates...")
 
         if self.dry_run:
@@ -365,7 +432,7 @@ class CaptionBankRebuilder:
             return True
 
         # Find duplicate hashes and mark all but the best performer
-        sql = """
+        sql = f"""
         WITH RankedCaptions AS (
             SELECT
                 staging_id,
@@ -375,6 +442,7 @@ class CaptionBankRebuilder:
                     ORDER BY total_earnings DESC, avg_view_rate DESC
                 ) as rn
             FROM caption_staging
+            WHERE 1 = 1 {hash_filter}
         )
         UPDATE caption_staging
         SET is_duplicate = 1
@@ -384,7 +452,10 @@ class CaptionBankRebuilder:
         """
 
         try:
+            if hash_filter:
+                self.conn.execute(f"UPDATE caption_staging SET is_duplicate = 0 WHERE 1 = 1 {hash_filter}")
             cursor = self.conn.execute(sql)
+            self.mark_near_duplicates(hash_filter)
             self.conn.commit()
 
             # Count duplicates
@@ -397,6 +468,136 @@ class CaptionBankRebuilder:
             logger.error(f"Failed to mark duplicates: {e}")
             return False
 
+    def mark_near_duplicates(self, hash_filter: str = ""):
+        """
+        Mark near-duplicate captions using MinHash/LSH similarity.
+
+        Only runs when near_duplicate_threshold is set. Runs after
+        exact-hash ranking over the remaining captions, best performer
+        first, so each cluster of near-identical captions keeps its top
+        earner. Signatures are cached by caption_hash in minhash_signatures.
+        Every dropped caption is logged. Does not commit.
+
+        Args:
+            hash_filter: In incremental mode, only captions in these hash
+                partitions that are not yet in caption_bank_v2 may be
+                marked; existing bank captions are always kept. The new
+                captions are compared only with the bank captions sharing an
+                LSH bucket with them (from the persisted caption_bank_v2
+                index), so the cost tracks the new captions, not the bank.
+        """
+        if not self.near_duplicate_threshold:
+            return
+
+        try:
+            from caption_similarity_index import (
+                CaptionSimilarityIndex,
+                SignatureStore,
+                collapse_near_duplicates,
+            )
+        except ImportError:
+            logger.warning("Similarity index not available, skipping near-duplicate detection")
+            return
+
+        store = SignatureStore(self.conn)
+        scope = ""
+        candidates = None
+        if hash_filter:
+            candidate_rows = self.conn.execute(f"""
+                SELECT staging_id, caption_hash, message_content FROM caption_staging
+                WHERE is_duplicate = 0 {hash_filter}
+                AND caption_hash NOT IN (SELECT caption_hash FROM caption_bank_v2)
+            """).fetchall()
+            if not candidate_rows:
+                return
+            candidates = {row[0] for row in candidate_rows}
+
+            index = CaptionSimilarityIndex(self.conn, source_table=SIMILARITY_INDEX_TABLE)
+            if len(index):
+                signatures = store.get_many({row[1]: row[2] for row in candidate_rows})
+                neighbours = set(index.bucket_members(signatures.values()).values())
+                # execute(), not executescript(): the latter would commit the
+                # exact-duplicate ranking mid-transaction
+                self.conn.execute("DROP TABLE IF EXISTS temp.near_duplicate_scope")
+                self.conn.execute("CREATE TEMP TABLE near_duplicate_scope (caption_hash TEXT PRIMARY KEY)")
+                self.conn.executemany(
+                    "INSERT OR IGNORE INTO temp.near_duplicate_scope (caption_hash) VALUES (?)",
+                    [(caption_hash,) for caption_hash in neighbours | set(signatures)]
+                )
+                scope = "AND caption_hash IN (SELECT caption_hash FROM temp.near_duplicate_scope)"
+            else:
+                logger.info(
+                    f"No similarity index for {SIMILARITY_INDEX_TABLE} yet, "
+                    f"comparing new captions with all staged captions"
+                )
+
+        rows = self.conn.execute(f"""
+            SELECT staging_id, caption_hash, message_content
+            FROM caption_staging
+            WHERE is_duplicate = 0 {scope}
+            ORDER BY total_earnings DESC, avg_view_rate DESC, staging_id
+        """).fetchall()
+
+        signatures = store.get_many({row[1]: row[2] for row in rows})
+        duplicates = collapse_near_duplicates(
+            ((row[0], signatures[row[1]]) for row in rows),
+            self.near_duplicate_threshold,
+            candidates
+        )
+        self.conn.executemany(
+            "UPDATE caption_staging SET is_duplicate = 1 WHERE staging_id = ?",
+            [(staging_id,) for staging_id in duplicates]
+        )
+
+        texts = {row[0]: row[2] for row in rows}
+        for staging_id, kept_id in duplicates.items():
+            logger.info(
+                f"Dropped near-duplicate staging_id {staging_id} (kept {kept_id}): "
+                f"{texts[staging_id][:80]!r}"
+            )
+        self.stats['near_duplicates_removed'] = len(duplicates)
+        logger.info(
+            f"Marked {len(duplicates)} near-duplicates among {len(rows)} captions "
+            f"(similarity >= {self.near_duplicate_threshold})"
+        )
+
+    def refresh_similarity_index(self, hash_filter: str = ""):
+        """
+        Bring the caption_bank_v2 near-duplicate index up to date.
+
+        Only runs when near_duplicate_threshold is set. A full rebuild (or
+        a first incremental run) builds the index from scratch; otherwise
+        only the bank rows in the refreshed hash partitions are re-indexed.
+
+        Args:
+            hash_filter: REFRESH_HASH_FILTER in incremental mode.
+        """
+        if not self.near_duplicate_threshold or self.dry_run:
+            return True
+
+        try:
+            from caption_similarity_index import CaptionSimilarityIndex
+        except ImportError:
+            logger.warning("Similarity index not available, skipping index refresh")
+            return True
+
+        try:
+            index = CaptionSimilarityIndex(self.conn, source_table=SIMILARITY_INDEX_TABLE)
+            if hash_filter and len(index):
+                caption_ids = [
+                    row[0] for row in self.conn.execute(
+                        f"SELECT caption_id FROM caption_bank_v2 WHERE 1 = 1 {hash_filter}"
+                    )
+                ]
+                count = index.reindex(caption_ids)
+                logger.info(f"Re-indexed {count} captions for near-duplicate lookups")
+            else:
+                index.build()
+            return True
+        except Exception as e:
+            logger.error(f"Similarity index refresh failed: {e}")
+            return False
+
     def run_classification(self):
         """Run content type and send type classification."""
         logger.info("Running classification...")
@@ -405,6 +606,7 @@ class CaptionBankRebuilder:
         try:
             from classify_content_types import ContentTypeClassifier
             from classify_send_types import SendTypeClassifier
+            from classification_cache import ClassificationCache
         except ImportError:
             logger.warning("Classifiers not yet available, skipping classification step")
             return True
@@ -416,48 +618,121 @@ class CaptionBankRebuilder:
         content_classifier = ContentTypeClassifier()
         send_classifier = SendTypeClassifier()
 
+        # Results cached per caption_hash and rule set: only new captions,
+        # or captions whose classifier rules changed, are classified again
+        content_cache = ClassificationCache(self.conn, "content_type", content_classifier)
+        send_cache = ClassificationCache(self.conn, "send_type", send_classifier)
+        content_cache.prune()
+        send_cache.prune()
+        cached_content = content_cache.load()
+        cached_send = send_cache.load()
+
         cursor = self.conn.execute("""
-            SELECT staging_id, message_content, price
+            SELECT staging_id, caption_hash, message_content, price
             FROM caption_staging
             WHERE is_duplicate = 0 AND content_type_classified IS NULL
         """)
         rows = cursor.fetchall()
 
+        new_content: list[tuple] = []
+        new_send: list[tuple] = []
+        updates: list[tuple] = []
+        cache_hits = 0
+        update_sql = """
+            UPDATE caption_staging
+            SET content_type_classified = ?,
+                content_type_confidence = ?,
+                send_type_classified = ?,
+                send_type_confidence = ?
+            WHERE staging_id = ?
+        """
+
         for row in rows:
+            caption_hash = row['caption_hash']
+            # Send type only depends on the price through price > 0
+            send_variant = 'priced' if row['price'] is not None and row['price'] > 0 else ''
+
             # Classify content type
-            content_type_id, content_conf = content_classifier.classify(row['message_content'])
+            cached = cached_content.get((caption_hash, ''))
+            if cached is not None:
+                content_type_id, content_conf = int(cached[0]), cached[1]
+                cache_hits += 1
+            else:
+                content_type_id, content_conf = content_classifier.classify(row['message_content'])
+                new_content.append((caption_hash, '', content_type_id, content_conf))
+                cached_content[(caption_hash, '')] = (str(content_type_id), content_conf)
 
             # Classify send type
-            send_type, send_conf = send_classifier.classify(
-                row['message_content'],
-                price=row['price']
-            )
-
-            self.conn.execute("""
-                UPDATE caption_staging
-                SET content_type_classified = ?,
-                    content_type_confidence = ?,
-                    send_type_classified = ?,
-                    send_type_confidence = ?
-                WHERE staging_id = ?
-            """, (content_type_id, content_conf, send_type, send_conf, row['staging_id']))
+            cached = cached_send.get((caption_hash, send_variant))
+            if cached is not None:
+                send_type, send_conf = cached
+                cache_hits += 1
+            else:
+                send_type, send_conf = send_classifier.classify(
+                    row['message_content'],
+                    price=row['price']
+                )
+                new_send.append((caption_hash, send_variant, send_type, send_conf))
+                cached_send[(caption_hash, send_variant)] = (send_type, send_conf)
+
+            updates.append((content_type_id, content_conf, send_type, send_conf, row['staging_id']))
+            if len(updates) >= WRITE_BATCH_SIZE:
+                self.conn.executemany(update_sql, updates)
+                updates.clear()
 
             if content_conf >= 0.70:
                 self.stats['classified_keyword'] += 1
 
+        # All batches land in one transaction, committed once
+        self.conn.executemany(update_sql, updates)
+        content_cache.store(new_content)
+        send_cache.store(new_send)
         self.conn.commit()
-        logger.info(f"Classified {len(rows)} captions")
+        logger.info(
+            f"Classified {len(rows)} captions "
+            f"({len(new_content) + len(new_send)} classifier runs, {cache_hits} cache hits)"
+        )
         return True
 
-    def migrate_to_v2(self):
-        """Migrate classified captions from staging to caption_bank_v2."""
+    def migrate_to_v2(self, hash_filter: str = ""):
+        """
+        Migrate classified captions from staging to caption_bank_v2.
+
+        Args:
+            hash_filter: Extra WHERE clause limiting the migration to some
+                hash partitions (REFRESH_HASH_FILTER in incremental mode).
+                Captions already in the bank are then updated in place,
+                keeping their caption_id and usage history.
+        """
         logger.info("Migrating to caption_bank_v2...")
 
         if self.dry_run:
             logger.info("[DRY RUN] Would migrate to caption_bank_v2")
             return True
 
-        sql = """
+        # Incremental refreshes update existing bank rows in place
+        upsert = ""
+        if hash_filter:
+            upsert = """
+        ON CONFLICT(caption_hash) DO UPDATE SET
+            caption_text = excluded.caption_text,
+            caption_type = excluded.caption_type,
+            content_type_id = excluded.content_type_id,
+            schedulable_type = excluded.schedulable_type,
+            is_paid_page_only = excluded.is_paid_page_only,
+            performance_tier = excluded.performance_tier,
+            suggested_price = excluded.suggested_price,
+            price_range_min = excluded.price_range_min,
+            price_range_max = excluded.price_range_max,
+            classification_confidence = excluded.classification_confidence,
+            classification_method = excluded.classification_method,
+            total_earnings = excluded.total_earnings,
+            total_sends = excluded.total_sends,
+            avg_view_rate = excluded.avg_view_rate,
+            avg_purchase_rate = excluded.avg_purchase_rate
+            """
+
+        sql = f"""
         INSERT INTO caption_bank_v2 (
             caption_text, caption_hash, caption_type, content_type_id,
             schedulable_type, is_paid_page_only, is_active, performance_tier,
@@ -499,7 +774,8 @@ class CaptionBankRebuilder:
             COALESCE(s.avg_purchase_rate, 0),
             'mass_messages_rebuild'
         FROM caption_staging s
-        WHERE s.is_duplicate = 0
+        WHERE s.is_duplicate = 0 {hash_filter}
+        {upsert}
         """
 
         try:
@@ -526,6 +802,164 @@ class CaptionBankRebuilder:
             logger.error(f"Migration failed: {e}")
             return False
 
+    def _ensure_refresh_state(self):
+        """Create the high-water mark table if needed."""
+        self.conn.execute("""
+            CREATE TABLE IF NOT EXISTS caption_bank_refresh_state (
+                source TEXT PRIMARY KEY,
+                last_rowid INTEGER NOT NULL,
+                last_sending_time TEXT,
+                refreshed_at TEXT NOT NULL DEFAULT (datetime('now'))
+            )
+        """)
+
+    def get_high_water_mark(self) -> Optional[int]:
+        """Return the last mass_messages rowid folded into the bank, if any."""
+        self._ensure_refresh_state()
+        row = self.conn.execute(
+            "SELECT last_rowid FROM caption_bank_refresh_state WHERE source = ?",
+            (REFRESH_SOURCE,)
+        ).fetchone()
+        return row[0] if row else None
+
+    def current_high_water_mark(self) -> int:
+        """Return the newest mass_messages rowid (0 if the table is empty)."""
+        return self.conn.execute("SELECT COALESCE(MAX(rowid), 0) FROM mass_messages").fetchone()[0]
+
+    def save_high_water_mark(self, last_rowid: int):
+        """Record that mass_messages rows up to last_rowid are in the bank."""
+        if self.dry_run:
+            return
+        self._ensure_refresh_state()
+        self.conn.execute(
+            """
+            INSERT INTO caption_bank_refresh_state (source, last_rowid, last_sending_time, refreshed_at)
+            VALUES (?, ?, (SELECT sending_time FROM mass_messages WHERE rowid = ?), datetime('now'))
+            ON CONFLICT(source) DO UPDATE SET
+                last_rowid = excluded.last_rowid,
+                last_sending_time = excluded.last_sending_time,
+                refreshed_at = excluded.refreshed_at
+            """,
+            (REFRESH_SOURCE, last_rowid, last_rowid)
+        )
+        self.conn.commit()
+        logger.info(f"High-water mark set to mass_messages rowid {last_rowid}")
+
+    def has_content_index(self) -> bool:
+        """Check for the mass_messages(message_content) index from migration 021."""
+        row = self.conn.execute(
+            "SELECT 1 FROM sqlite_master WHERE type = 'index' AND name = 'idx_mass_messages_content'"
+        ).fetchone()
+        return row is not None
+
+    def prepare_refresh(self, after_rowid: int, up_to_rowid: int) -> int:
+        """
+        Collect the captions touched by new mass_messages rows.
+
+        Fills temp.refresh_contents with the distinct message_content of
+        rows in (after_rowid, up_to_rowid] and drops their current staging
+        rows, so the extraction steps can re-aggregate them over the full
+        history. Rows at or below after_rowid that were updated in place
+        are not included (see the module docstring).
+
+        Returns:
+            Number of distinct captions to refresh.
+        """
+        if not self.dry_run:
+            self.conn.execute(
+                "CREATE INDEX IF NOT EXISTS idx_staging_content ON caption_staging(message_content)"
+            )
+        self.conn.executescript("""
+            DROP TABLE IF EXISTS temp.refresh_contents;
+            DROP TABLE IF EXISTS temp.refresh_hashes;
+            CREATE TEMP TABLE refresh_contents (message_content TEXT PRIMARY KEY);
+            CREATE TEMP TABLE refresh_hashes (caption_hash TEXT PRIMARY KEY);
+        """)
+        self.conn.execute(
+            """
+            INSERT OR IGNORE INTO temp.refresh_contents (message_content)
+            SELECT message_content FROM mass_messages
+            WHERE rowid > ? AND rowid <= ? AND message_content IS NOT NULL
+            """,
+            (after_rowid, up_to_rowid)
+        )
+        count = self.conn.execute("SELECT COUNT(*) FROM temp.refresh_contents").fetchone()[0]
+
+        if not self.dry_run:
+            self.conn.execute(f"DELETE FROM caption_staging WHERE 1 = 1 {REFRESH_CONTENT_FILTER}")
+            self.conn.commit()
+        return count
+
+    def collect_refresh_hashes(self):
+        """Fill temp.refresh_hashes with the hash partitions of refreshed captions."""
+        self.conn.execute(f"""
+            INSERT OR IGNORE INTO temp.refresh_hashes (caption_hash)
+            SELECT caption_hash FROM caption_staging WHERE 1 = 1 {REFRESH_CONTENT_FILTER}
+        """)
+
+    def run_incremental(self):
+        """
+        Refresh the bank from mass_messages rows added since the last run.
+
+        Requires a previous full rebuild (which records the high-water mark).
+        Rows updated in place since then are not refreshed.
+        Only captions whose text occurs in new messages are re-extracted and
+        re-hashed; duplicate ranking, classification and the caption_bank_v2
+        upsert are limited to their hash partitions.
+        """
+        logger.info("Starting incremental Caption Bank refresh...")
+        logger.info(f"Dry run: {self.dry_run}")
+
+        self.connect()
+
+        try:
+            last_rowid = self.get_high_water_mark()
+            if last_rowid is None:
+                logger.error("No high-water mark recorded; run a full rebuild first")
+                return False
+
+            up_to_rowid = self.current_high_water_mark()
+            if up_to_rowid <= last_rowid:
+                logger.info(f"No new mass_messages since rowid {last_rowid}")
+                return True
+
+            if not self.has_content_index():
+                logger.warning(
+                    "idx_mass_messages_content is missing; apply migration "
+                    "021_caption_bank_refresh.sql or each refresh scans mass_messages"
+                )
+
+            captions = self.prepare_refresh(last_rowid, up_to_rowid)
+            logger.info(
+                f"{captions} captions touched by mass_messages rowid {last_rowid + 1}-{up_to_rowid}"
+            )
+
+            if not self.extract_ppv_captions(REFRESH_CONTENT_FILTER):
+                return False
+            if not self.extract_free_captions(REFRESH_CONTENT_FILTER):
+                return False
+            if not self.compute_hashes():
+                return False
+
+            self.collect_refresh_hashes()
+            if not self.mark_duplicates(REFRESH_HASH_FILTER):
+                return False
+            if not self.run_classification():
+                return False
+            if not self.migrate_to_v2(REFRESH_HASH_FILTER):
+                return False
+            if not self.refresh_similarity_index(REFRESH_HASH_FILTER):
+                return False
+
+            self.save_high_water_mark(up_to_rowid)
+            self.print_summary()
+
+            logger.info("Incremental Caption Bank refresh completed successfully!")
+            return True
+
+        finally:
+            self.close()
+
     def print_summary(self):
         """Print rebuild summary."""
         logger.info("=" * 60)
@@ -534,6 +968,7 @@ class CaptionBankRebuilder:
         logger.info(f"PPV captions extracted:     {self.stats['ppv_extracted']:,}")
         logger.info(f"Free captions extracted:    {self.stats['free_extracted']:,}")
         logger.info(f"Duplicates removed:         {self.stats['duplicates_removed']:,}")
+        logger.info(f"  Near-duplicates:          {self.stats['near_duplicates_removed']:,}")
         logger.info(f"Classified (keyword):       {self.stats['classified_keyword']:,}")
         logger.info(f"Classified (LLM):           {self.stats['classified_llm']:,}")
         logger.info("-" * 60)
@@ -552,6 +987,10 @@ class CaptionBankRebuilder:
         self.connect()
 
         try:
+            # Captured first so messages arriving mid-rebuild are picked up
+            # by the next incremental refresh
+            high_water_mark = self.current_high_water_mark()
+
             # Step 1: Run migration
             if not self.run_migration():
                 return False
@@ -586,6 +1025,13 @@ class CaptionBankRebuilder:
             if not self.migrate_to_v2():
                 return False
 
+            # Step 9: Index the bank for incremental near-duplicate checks
+            if not self.refresh_similarity_index():
+                return False
+
+            if not skip_extraction:
+                self.save_high_water_mark(high_water_mark)
+
             # Print summary
             self.print_summary()
 
@@ -601,6 +1047,11 @@ def main():
     parser.add_argument('--dry-run', action='store_true', help='Preview changes without executing')
     parser.add_argument('--skip-extraction', action='store_true', help='Skip extraction step')
     parser.add_argument('--skip-classification', action='store_true', help='Skip classification step')
+    parser.add_argument('--incremental', action='store_true',
+                        help='Refresh from mass_messages appended since the last run (needs migration 021)')
+    parser.add_argument('--near-duplicate-threshold', type=float, default=None,
+                        help='Collapse captions at or above this MinHash similarity, e.g. 0.85 '
+                             '(off by default)')
     parser.add_argument('--db-path', type=str, help='Path to database file')
 
     args = parser.parse_args()
@@ -611,11 +1062,18 @@ def main():
         logger.error(f"Database not found: {db_path}")
         sys.exit(1)
 
-    rebuilder = CaptionBankRebuilder(db_path, dry_run=args.dry_run)
-    success = rebuilder.run(
-        skip_extraction=args.skip_extraction,
-        skip_classification=args.skip_classification
+    rebuilder = CaptionBankRebuilder(
+        db_path,
+        dry_run=args.dry_run,
+        near_duplicate_threshold=args.near_duplicate_threshold
     )
+    if args.incremental:
+        success = rebuilder.run_incremental()
+    else:
+        success = rebuilder.run(
+            skip_extraction=args.skip_extraction,
+            skip_classification=args.skip_classification
+        )
 
     sys.exit(0 if success else 1)
 
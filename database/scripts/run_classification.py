@@ -3,14 +3,26 @@
 Run Classification Pipeline
 Classifies all staged captions and inserts into caption_bank_v2.
 
+caption_staging is streamed in keyset-paged chunks (staging_id > last seen)
+and chunks are classified in a process pool, with the classifiers built
+once per worker. Each chunk is written with a single executemany and
+committed together with its progress marker, so an interrupted run resumes
+after the last committed chunk and memory stays flat regardless of table
+size.
+
 Usage:
-    python3 run_classification.py
+    python3 run_classification.py [--workers N] [--chunk-size N] [--restart]
 """
 
+import argparse
 import hashlib
+import os
 import sqlite3
 import sys
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
 from pathlib import Path
+from typing import Any, Optional
 
 # Add project root to path
 project_root = Path(__file__).parent.parent.parent
@@ -21,6 +33,64 @@ from database.scripts.classify_send_types import SendTypeClassifier, Classificat
 
 DB_PATH = project_root / "database" / "eros_sd_main.db"
 
+# Staged captions read (and classified) per chunk
+DEFAULT_CHUNK_SIZE = 2000
+
+# Progress marker key in classification_progress
+PIPELINE_NAME = "run_classification"
+
+STAGING_COLUMNS = (
+    "staging_id",
+    "message_content",
+    "message_type",
+    "performance_tier",
+    "total_earnings",
+    "price",
+    "total_sends",
+    "avg_view_rate",
+    "avg_purchase_rate",
+    "is_duplicate",
+    "content_type_id",
+)
+
+INSERT_SQL = """
+    INSERT OR IGNORE INTO caption_bank_v2 (
+        caption_text,
+        caption_hash,
+        caption_type,
+        content_type_id,
+        schedulable_type,
+        is_paid_page_only,
+        is_active,
+        performance_tier,
+        suggested_price,
+        price_range_min,
+        price_range_max,
+        classification_confidence,
+        classification_method,
+        total_earnings,
+        total_sends,
+        avg_view_rate,
+        avg_purchase_rate,
+        source
+    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, 'mass_messages_rebuild')
+"""
+
+STAT_KEYS = (
+    "total",
+    "content_classified",
+    "content_high_conf",
+    "content_low_conf",
+    "content_no_match",
+    "send_classified",
+    "send_high_conf",
+    "send_low_conf",
+)
+
+# Classifiers owned by this process (built once per pool worker)
+_content_classifier: Optional[ContentTypeClassifier] = None
+_send_classifier: Optional[SendTypeClassifier] = None
+
 
 def create_caption_hash(text: str) -> str:
     """Create SHA256 hash of normalized caption text."""
@@ -51,72 +121,41 @@ def determine_schedulable_type(send_type: str, price: float | None) -> str | Non
     return None
 
 
-def run_classification():
-    """Run classification on all staged captions."""
-    print("=" * 70)
-    print("CAPTION CLASSIFICATION PIPELINE")
-    print("=" * 70)
+def _init_worker() -> None:
+    """Build the classifiers once for the current process."""
+    global _content_classifier, _send_classifier
+    _content_classifier = ContentTypeClassifier()
+    _send_classifier = SendTypeClassifier()
 
-    # Initialize classifiers
-    print("\n[1/5] Initializing classifiers...")
-    content_classifier = ContentTypeClassifier()
-    send_classifier = SendTypeClassifier()
-    print("  ✓ Content type classifier ready (37 types)")
-    print("  ✓ Send type classifier ready (22 types)")
 
-    # Connect to database
-    print("\n[2/5] Connecting to database...")
-    conn = sqlite3.connect(DB_PATH)
-    conn.row_factory = sqlite3.Row
-    cursor = conn.cursor()
+def classify_chunk(rows: list[tuple[Any, ...]]) -> tuple[list[tuple[Any, ...]], dict[str, int]]:
+    """
+    Classify one chunk of staged captions.
 
-    # Load staged captions
-    print("\n[3/5] Loading staged captions...")
-    cursor.execute("""
-        SELECT
-            staging_id,
-            message_content,
-            message_type,
-            performance_tier,
-            total_earnings,
-            price,
-            total_sends,
-            avg_view_rate,
-            avg_purchase_rate,
-            is_duplicate,
-            content_type_id
-        FROM caption_staging
-        WHERE is_duplicate = 0
-        ORDER BY staging_id
-    """)
-    staged_captions = cursor.fetchall()
-    print(f"  ✓ Loaded {len(staged_captions)} non-duplicate captions")
-
-    # Classify captions
-    print("\n[4/5] Classifying captions...")
-    results = []
-
-    # Track statistics
-    stats = {
-        "total": 0,
-        "content_classified": 0,
-        "content_high_conf": 0,
-        "content_low_conf": 0,
-        "content_no_match": 0,
-        "send_classified": 0,
-        "send_high_conf": 0,
-        "send_low_conf": 0,
-    }
+    Runs in a pool worker (or in-process when workers=1). Rows are plain
+    tuples in STAGING_COLUMNS order so they pickle cheaply.
+
+    Args:
+        rows: Staged caption rows.
+
+    Returns:
+        Tuple of (insert parameter tuples for INSERT_SQL, chunk statistics).
+    """
+    if _content_classifier is None or _send_classifier is None:
+        _init_worker()
 
-    for i, row in enumerate(staged_captions):
+    stats = dict.fromkeys(STAT_KEYS, 0)
+    params: list[tuple[Any, ...]] = []
+
+    for values in rows:
+        row = dict(zip(STAGING_COLUMNS, values))
         stats["total"] += 1
 
         text = row["message_content"]
-        message_type = row["message_type"]  # 'ppv' or 'free'
         price = row["price"]
 
         # Classify content type
-        content_result = content_classifier.classify_detailed(text)
+        content_result = _content_classifier.classify_detailed(text)
         if content_result:
             stats["content_classified"] += 1
             content_type_id = content_result.content_type_id
@@ -134,53 +173,194 @@ def run_classification():
 
         # Classify send type
         has_link = "http" in text.lower() or "link" in text.lower()
-        send_result = send_classifier.classify_detailed(text, price, has_link)
+        send_result = _send_classifier.classify_detailed(text, price, has_link)
         stats["send_classified"] += 1
 
         send_type_key = send_result.send_type_key
         send_confidence = send_result.confidence
-        caption_type_from_send = send_result.caption_type
 
         if send_confidence >= 0.70:
             stats["send_high_conf"] += 1
         else:
             stats["send_low_conf"] += 1
 
-        # Use send_type's caption_type
-        final_caption_type = caption_type_from_send
-
-        # Determine schedulable_type
-        schedulable_type = determine_schedulable_type(send_type_key, price)
-
         # Combine confidences
         combined_confidence = min((content_confidence + send_confidence) / 2, 1.0)
-        classification_method = f"{content_method}+structural"
-
-        # Prepare result
-        results.append({
-            "staging_id": row["staging_id"],
-            "caption_text": text,
-            "caption_hash": create_caption_hash(text),
-            "caption_type": final_caption_type,
-            "content_type_id": content_type_id,
-            "schedulable_type": schedulable_type,
-            "is_paid_page_only": 1 if send_type_key in ("renew_on_message", "renew_on_post", "ppv_followup", "expired_winback") else 0,
-            "is_active": 1,
-            "performance_tier": row["performance_tier"] or 3,
-            "suggested_price": price,
-            "price_range_min": price if price else None,
-            "price_range_max": price if price else None,
-            "classification_confidence": round(combined_confidence, 4),
-            "classification_method": classification_method,
-            "total_earnings": row["total_earnings"] or 0.0,
-            "total_sends": row["total_sends"] or 0,
-            "avg_view_rate": row["avg_view_rate"] or 0.0,
-            "avg_purchase_rate": row["avg_purchase_rate"] or 0.0,
-        })
-
-        # Progress update
-        if (i + 1) % 1000 == 0:
-            print(f"  Processed {i + 1}/{len(staged_captions)} captions...")
+
+        params.append((
+            text,
+            create_caption_hash(text),
+            send_result.caption_type,  # Use send_type's caption_type
+            content_type_id,
+            determine_schedulable_type(send_type_key, price),
+            1 if send_type_key in ("renew_on_message", "renew_on_post", "ppv_followup", "expired_winback") else 0,
+            1,
+            row["performance_tier"] or 3,
+            price,
+            price if price else None,
+            price if price else None,
+            round(combined_confidence, 4),
+            f"{content_method}+structural",
+            row["total_earnings"] or 0.0,
+            row["total_sends"] or 0,
+            row["avg_view_rate"] or 0.0,
+            row["avg_purchase_rate"] or 0.0,
+        ))
+
+    return params, stats
+
+
+def _ensure_progress_table(conn: sqlite3.Connection) -> None:
+    """Create the resumable progress table if needed."""
+    conn.execute("""
+        CREATE TABLE IF NOT EXISTS classification_progress (
+            pipeline TEXT PRIMARY KEY,
+            last_id INTEGER NOT NULL,
+            updated_at TEXT NOT NULL DEFAULT (datetime('now'))
+        )
+    """)
+    conn.commit()
+
+
+def _load_progress(conn: sqlite3.Connection) -> int:
+    """Return the last committed staging_id, or 0 for a fresh run."""
+    row = conn.execute(
+        "SELECT last_id FROM classification_progress WHERE pipeline = ?",
+        (PIPELINE_NAME,)
+    ).fetchone()
+    return row[0] if row else 0
+
+
+def _iter_chunks(conn: sqlite3.Connection, after_id: int, chunk_size: int):
+    """Yield non-duplicate staged captions in keyset-paged chunks."""
+    columns = ", ".join(STAGING_COLUMNS)
+    while True:
+        rows = conn.execute(
+            f"""
+            SELECT {columns}
+            FROM caption_staging
+            WHERE is_duplicate = 0 AND staging_id > ?
+            ORDER BY staging_id
+            LIMIT ?
+            """,
+            (after_id, chunk_size)
+        ).fetchall()
+        if not rows:
+            return
+        after_id = rows[-1][0]
+        yield [tuple(row) for row in rows]
+
+
+def run_classification(
+    db_path: Path = DB_PATH,
+    workers: Optional[int] = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    restart: bool = False,
+):
+    """
+    Run classification on all staged captions.
+
+    Args:
+        db_path: Path to the database file.
+        workers: Worker processes (default: CPU count). 1 runs in-process.
+        chunk_size: Staged captions per chunk.
+        restart: Ignore saved progress and start from the first caption.
+
+    Returns:
+        Tuple of (inserted, skipped) for this run.
+    """
+    workers = workers or os.cpu_count() or 1
+
+    print("=" * 70)
+    print("CAPTION CLASSIFICATION PIPELINE")
+    print("=" * 70)
+
+    # Connect to database
+    print("\n[1/4] Connecting to database...")
+    conn = sqlite3.connect(db_path)
+    conn.row_factory = sqlite3.Row
+    cursor = conn.cursor()
+    _ensure_progress_table(conn)
+
+    if restart:
+        conn.execute("DELETE FROM classification_progress WHERE pipeline = ?", (PIPELINE_NAME,))
+        conn.commit()
+    start_id = _load_progress(conn)
+
+    cursor.execute(
+        "SELECT COUNT(*) FROM caption_staging WHERE is_duplicate = 0 AND staging_id > ?",
+        (start_id,)
+    )
+    pending = cursor.fetchone()[0]
+    if start_id:
+        print(f"  ✓ Resuming after staging_id {start_id}")
+    print(f"  ✓ {pending} non-duplicate captions to classify")
+
+    # Initialize classifiers
+    print(f"\n[2/4] Initializing classifiers ({workers} worker{'s' if workers != 1 else ''})...")
+    pool: Optional[ProcessPoolExecutor] = None
+    if workers > 1:
+        pool = ProcessPoolExecutor(max_workers=workers, initializer=_init_worker)
+    else:
+        _init_worker()
+    print("  ✓ Content type classifier ready (37 types)")
+    print("  ✓ Send type classifier ready (22 types)")
+
+    # Classify and insert, one committed chunk at a time
+    print("\n[3/4] Classifying captions into caption_bank_v2...")
+    stats = dict.fromkeys(STAT_KEYS, 0)
+    inserted = 0
+    skipped = 0
+    processed = 0
+
+    def write_chunk(last_id: int, params: list[tuple[Any, ...]], chunk_stats: dict[str, int]) -> None:
+        nonlocal inserted, skipped, processed
+        before = conn.total_changes
+        # Duplicate hashes are ignored, as the per-row IntegrityError skip was
+        conn.executemany(INSERT_SQL, params)
+        chunk_inserted = conn.total_changes - before
+        conn.execute(
+            """
+            INSERT INTO classification_progress (pipeline, last_id, updated_at)
+            VALUES (?, ?, datetime('now'))
+            ON CONFLICT(pipeline) DO UPDATE SET
+                last_id = excluded.last_id,
+                updated_at = excluded.updated_at
+            """,
+            (PIPELINE_NAME, last_id)
+        )
+        conn.commit()
+
+        inserted += chunk_inserted
+        skipped += len(params) - chunk_inserted
+        processed += len(params)
+        for key, value in chunk_stats.items():
+            stats[key] += value
+        print(f"  Processed {processed}/{pending} captions...")
+
+    try:
+        if pool is None:
+            for rows in _iter_chunks(conn, start_id, chunk_size):
+                write_chunk(rows[-1][0], *classify_chunk(rows))
+        else:
+            # Bounded in-flight window keeps memory flat; results are written
+            # in submission order so progress always marks a contiguous prefix
+            in_flight: deque[tuple[int, Future]] = deque()
+            for rows in _iter_chunks(conn, start_id, chunk_size):
+                in_flight.append((rows[-1][0], pool.submit(classify_chunk, rows)))
+                if len(in_flight) >= workers * 2:
+                    last_id, future = in_flight.popleft()
+                    write_chunk(last_id, *future.result())
+            while in_flight:
+                last_id, future = in_flight.popleft()
+                write_chunk(last_id, *future.result())
+    finally:
+        if pool is not None:
+            pool.shutdown(cancel_futures=True)
+
+    # Run finished: the next run starts from the beginning
+    conn.execute("DELETE FROM classification_progress WHERE pipeline = ?", (PIPELINE_NAME,))
+    conn.commit()
 
     print(f"  ✓ Classified {stats['total']} captions")
     print(f"\n  Content Type Classification:")
@@ -190,67 +370,11 @@ def run_classification():
     print(f"\n  Send Type Classification:")
     print(f"    - High confidence (>=0.70): {stats['send_high_conf']}")
     print(f"    - Low confidence (<0.70): {stats['send_low_conf']}")
-
-    # Insert into caption_bank_v2
-    print("\n[5/5] Inserting into caption_bank_v2...")
-
-    insert_sql = """
-        INSERT INTO caption_bank_v2 (
-            caption_text,
-            caption_hash,
-            caption_type,
-            content_type_id,
-            schedulable_type,
-            is_paid_page_only,
-            is_active,
-            performance_tier,
-            suggested_price,
-            price_range_min,
-            price_range_max,
-            classification_confidence,
-            classification_method,
-            total_earnings,
-            total_sends,
-            avg_view_rate,
-            avg_purchase_rate,
-            source
-        ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, 'mass_messages_rebuild')
-    """
-
-    inserted = 0
-    skipped = 0
-
-    for result in results:
-        try:
-            cursor.execute(insert_sql, (
-                result["caption_text"],
-                result["caption_hash"],
-                result["caption_type"],
-                result["content_type_id"],
-                result["schedulable_type"],
-                result["is_paid_page_only"],
-                result["is_active"],
-                result["performance_tier"],
-                result["suggested_price"],
-                result["price_range_min"],
-                result["price_range_max"],
-                result["classification_confidence"],
-                result["classification_method"],
-                result["total_earnings"],
-                result["total_sends"],
-                result["avg_view_rate"],
-                result["avg_purchase_rate"],
-            ))
-            inserted += 1
-        except sqlite3.IntegrityError as e:
-            # Duplicate hash
-            skipped += 1
-
-    conn.commit()
-    print(f"  ✓ Inserted {inserted} captions")
+    print(f"\n  ✓ Inserted {inserted} captions")
     print(f"  ✓ Skipped {skipped} duplicates")
 
     # Final summary
+    print("\n[4/4] Summarizing caption_bank_v2...")
     print("\n" + "=" * 70)
     print("CLASSIFICATION COMPLETE")
     print("=" * 70)
@@ -295,6 +419,23 @@ def run_classification():
     return inserted, skipped
 
 
+def main():
+    parser = argparse.ArgumentParser(description='Classify staged captions into caption_bank_v2')
+    parser.add_argument('--db-path', type=str, help='Path to database file')
+    parser.add_argument('--workers', type=int, help='Worker processes (default: CPU count)')
+    parser.add_argument('--chunk-size', type=int, default=DEFAULT_CHUNK_SIZE, help='Captions per chunk')
+    parser.add_argument('--restart', action='store_true', help='Ignore saved progress and start over')
+
+    args = parser.parse_args()
+
+    return run_classification(
+        db_path=Path(args.db_path) if args.db_path else DB_PATH,
+        workers=args.workers,
+        chunk_size=args.chunk_size,
+        restart=args.restart,
+    )
+
+
 if __name__ == "__main__":
-    inserted, skipped = run_classification()
+    inserted, skipped = main()
     print(f"\n✅ Done! {inserted} captions ready for use.")
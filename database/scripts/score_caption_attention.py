@@ -0,0 +1,362 @@
+#!/usr/bin/env python3
+"""
+Score Caption Attention
+Computes attention metrics for every active caption and stores them in
+caption_attention_scores, so attention-aware ranking is an indexed read.
+
+Attention metrics depend only on caption text, so each caption is scored
+once into caption_attention_state (keyed by caption_id, with the hash of
+the text that was scored and the analysis version). Captions are streamed
+in keyset-paged chunks and scored in a process pool; a later run only
+rescores captions whose text or ATTENTION_ANALYSIS_VERSION changed.
+
+caption_attention_scores holds one row per (caption, creator) pair. Each
+scored chunk is fanned out to every active creator whose vault has the
+caption's content type in the same transaction that records its state, so
+an interrupted run never leaves scored captions without their pair rows.
+Rows whose caption or creator is no longer active or eligible are deleted
+at the end. Unchanged captions are not fanned out again unless --sync-pairs
+is given (e.g. after adding creators or changing vault_matrix).
+
+Usage:
+    python3 score_caption_attention.py [--workers N] [--chunk-size N] [--rescore-all] [--sync-pairs]
+"""
+
+import argparse
+import hashlib
+import os
+import sqlite3
+import sys
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Iterator, Optional
+
+# Add project root to path
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+DB_PATH = project_root / "database" / "eros_sd_main.db"
+
+# Active captions read (and scored) per chunk
+DEFAULT_CHUNK_SIZE = 2000
+
+STATE_TABLE_SQL = """
+CREATE TABLE IF NOT EXISTS caption_attention_state (
+    caption_id INTEGER PRIMARY KEY,
+    text_hash TEXT NOT NULL,
+    analysis_version TEXT NOT NULL,
+    hook_score REAL NOT NULL,
+    depth_score REAL NOT NULL,
+    cta_score REAL NOT NULL,
+    emotion_score REAL NOT NULL,
+    attention_score REAL NOT NULL,
+    quality_tier TEXT NOT NULL,
+    word_count INTEGER,
+    sentence_count INTEGER,
+    avg_sentence_length REAL,
+    analyzed_at TEXT NOT NULL DEFAULT (datetime('now'))
+)
+"""
+
+SCORE_COLUMNS = (
+    "hook_score",
+    "depth_score",
+    "cta_score",
+    "emotion_score",
+    "attention_score",
+    "quality_tier",
+    "analysis_version",
+    "word_count",
+    "sentence_count",
+    "avg_sentence_length",
+)
+
+STATE_UPSERT_SQL = f"""
+    INSERT INTO caption_attention_state (
+        caption_id, text_hash, {", ".join(SCORE_COLUMNS)}, analyzed_at
+    ) VALUES (?, ?, {", ".join("?" for _ in SCORE_COLUMNS)}, datetime('now'))
+    ON CONFLICT(caption_id) DO UPDATE SET
+        text_hash = excluded.text_hash,
+        {", ".join(f"{column} = excluded.{column}" for column in SCORE_COLUMNS)},
+        analyzed_at = excluded.analyzed_at
+"""
+
+# Captions in the chunk being written
+SCORED_TABLE_SQL = """
+CREATE TEMP TABLE IF NOT EXISTS attention_scored (caption_id INTEGER PRIMARY KEY)
+"""
+
+# Limits SCORES_UPSERT_SQL to the captions in the chunk being written
+SCORED_SCOPE = "JOIN temp.attention_scored t ON t.caption_id = s.caption_id"
+
+# Fan scored captions out to every eligible (caption, creator) pair; {scope}
+# is SCORED_SCOPE or empty (--sync-pairs). The WHERE clause skips pairs
+# whose stored values already match (analyzed_at alone has one-second
+# resolution, so it cannot tell a same-second rescore apart)
+SCORES_UPSERT_SQL = f"""
+    INSERT INTO caption_attention_scores (
+        caption_id, creator_id, {", ".join(SCORE_COLUMNS)}, analyzed_at
+    )
+    SELECT
+        s.caption_id, c.creator_id, {", ".join(f"s.{column}" for column in SCORE_COLUMNS)}, s.analyzed_at
+    FROM caption_attention_state s
+    {{scope}}
+    JOIN caption_bank cb ON cb.caption_id = s.caption_id AND cb.is_active = 1
+    JOIN vault_matrix vm ON vm.content_type_id = cb.content_type_id AND vm.has_content = 1
+    JOIN creators c ON c.creator_id = vm.creator_id AND c.is_active = 1
+    WHERE s.analysis_version = ?
+    ON CONFLICT(caption_id, creator_id) DO UPDATE SET
+        {", ".join(f"{column} = excluded.{column}" for column in SCORE_COLUMNS)},
+        analyzed_at = excluded.analyzed_at
+    WHERE {" OR ".join(f"caption_attention_scores.{column} IS NOT excluded.{column}" for column in SCORE_COLUMNS)}
+"""
+
+# Score rows whose caption or creator is no longer active or eligible
+STALE_SCORES_DELETE_SQL = """
+    DELETE FROM caption_attention_scores
+    WHERE NOT EXISTS (
+        SELECT 1
+        FROM caption_bank cb
+        JOIN vault_matrix vm ON vm.content_type_id = cb.content_type_id AND vm.has_content = 1
+        JOIN creators c ON c.creator_id = vm.creator_id AND c.is_active = 1
+        WHERE cb.caption_id = caption_attention_scores.caption_id
+        AND cb.is_active = 1
+        AND cb.caption_text IS NOT NULL AND TRIM(cb.caption_text) != ''
+        AND vm.creator_id = caption_attention_scores.creator_id
+    )
+"""
+
+# State rows for captions deleted from caption_bank
+STALE_STATE_DELETE_SQL = """
+    DELETE FROM caption_attention_state
+    WHERE caption_id NOT IN (SELECT caption_id FROM caption_bank)
+"""
+
+# Scoring function owned by this process (imported once per pool worker)
+_compute_attention_scores = None
+
+
+def text_hash(text: str) -> str:
+    """SHA256 of the caption text as stored (any edit triggers a rescore)."""
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+@contextmanager
+def _db_path_for_import(db_path: Optional[str]) -> Iterator[None]:
+    """
+    Point EROS_DB_PATH at db_path while the mcp package is first imported.
+
+    mcp.connection validates EROS_DB_PATH at import time even though the
+    scoring code never opens a pooled connection. The variable is restored
+    afterwards, and left alone when mcp is already imported.
+    """
+    if db_path is None or "mcp.connection" in sys.modules:
+        yield
+        return
+    previous = os.environ.get("EROS_DB_PATH")
+    os.environ["EROS_DB_PATH"] = db_path
+    try:
+        yield
+    finally:
+        if previous is None:
+            del os.environ["EROS_DB_PATH"]
+        else:
+            os.environ["EROS_DB_PATH"] = previous
+
+
+def _init_worker(db_path: Optional[str] = None) -> None:
+    """
+    Import the attention analysis once for the current process.
+
+    Args:
+        db_path: Database being scored, used to satisfy the mcp import-time
+            path check (pool workers receive it as an initializer argument).
+    """
+    global _compute_attention_scores
+    with _db_path_for_import(db_path):
+        from mcp.tools.caption import compute_attention_scores
+    _compute_attention_scores = compute_attention_scores
+
+
+def score_chunk(rows: list[tuple[int, str, str]]) -> list[tuple[Any, ...]]:
+    """
+    Score one chunk of captions.
+
+    Runs in a pool worker (or in-process when workers=1).
+
+    Args:
+        rows: (caption_id, caption_text, text_hash) tuples.
+
+    Returns:
+        Parameter tuples for STATE_UPSERT_SQL.
+    """
+    if _compute_attention_scores is None:
+        _init_worker()
+
+    params = []
+    for caption_id, caption_text, digest in rows:
+        scores = _compute_attention_scores(caption_text)
+        params.append((caption_id, digest, *(scores[column] for column in SCORE_COLUMNS)))
+    return params
+
+
+def _iter_stale_chunks(conn: sqlite3.Connection, chunk_size: int, version: str, rescore_all: bool):
+    """
+    Yield chunks of active captions that need (re)scoring.
+
+    Captions are keyset-paged by caption_id; each page is compared with
+    caption_attention_state and only new, edited or out-of-version captions
+    are yielded.
+    """
+    after_id = 0
+    while True:
+        rows = conn.execute(
+            """
+            SELECT cb.caption_id, cb.caption_text, s.text_hash, s.analysis_version
+            FROM caption_bank cb
+            LEFT JOIN caption_attention_state s ON s.caption_id = cb.caption_id
+            WHERE cb.is_active = 1 AND cb.caption_id > ?
+            AND cb.caption_text IS NOT NULL AND TRIM(cb.caption_text) != ''
+            ORDER BY cb.caption_id
+            LIMIT ?
+            """,
+            (after_id, chunk_size)
+        ).fetchall()
+        if not rows:
+            return
+        after_id = rows[-1][0]
+
+        stale = []
+        for caption_id, caption_text, stored_hash, stored_version in rows:
+            digest = text_hash(caption_text)
+            if rescore_all or stored_hash != digest or stored_version != version:
+                stale.append((caption_id, caption_text, digest))
+        if stale:
+            yield stale
+
+
+def score_caption_attention(
+    db_path: Path = DB_PATH,
+    workers: Optional[int] = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    rescore_all: bool = False,
+    sync_pairs: bool = False,
+) -> dict[str, int]:
+    """
+    Score new or changed captions and refresh caption_attention_scores.
+
+    Args:
+        db_path: Path to the database file.
+        workers: Worker processes (default: CPU count). 1 runs in-process.
+        chunk_size: Captions per chunk.
+        rescore_all: Rescore every active caption regardless of state.
+        sync_pairs: Fan every scored caption out to its eligible creators,
+            not only the captions scored in this run.
+
+    Returns:
+        Dictionary with captions scored, score rows written and stale
+        score rows deleted.
+    """
+    workers = workers or os.cpu_count() or 1
+
+    _init_worker(str(db_path))
+    from mcp.tools.caption import ATTENTION_ANALYSIS_VERSION
+
+    print("=" * 70)
+    print("CAPTION ATTENTION SCORING")
+    print("=" * 70)
+
+    conn = sqlite3.connect(db_path)
+    conn.execute(STATE_TABLE_SQL)
+    conn.execute(SCORED_TABLE_SQL)
+    conn.commit()
+
+    print(f"\n[1/3] Scoring new and changed captions ({workers} worker{'s' if workers != 1 else ''})...")
+    scored = 0
+    written = 0
+    scoped_upsert = SCORES_UPSERT_SQL.format(scope=SCORED_SCOPE)
+
+    def write_chunk(params: list[tuple[Any, ...]]) -> None:
+        # State and pair rows commit together: a caption whose state says it
+        # is scored at this version always has its score rows too
+        nonlocal scored, written
+        conn.executemany(STATE_UPSERT_SQL, params)
+        conn.execute("DELETE FROM temp.attention_scored")
+        conn.executemany(
+            "INSERT OR IGNORE INTO temp.attention_scored (caption_id) VALUES (?)",
+            [(row[0],) for row in params]
+        )
+        written += conn.execute(scoped_upsert, (ATTENTION_ANALYSIS_VERSION,)).rowcount
+        conn.commit()
+        scored += len(params)
+        print(f"  Scored {scored} captions...")
+
+    pool: Optional[ProcessPoolExecutor] = None
+    if workers > 1:
+        pool = ProcessPoolExecutor(
+            max_workers=workers, initializer=_init_worker, initargs=(str(db_path),)
+        )
+    try:
+        chunks = _iter_stale_chunks(conn, chunk_size, ATTENTION_ANALYSIS_VERSION, rescore_all)
+        if pool is None:
+            for rows in chunks:
+                write_chunk(score_chunk(rows))
+        else:
+            # Bounded in-flight window keeps memory flat
+            in_flight: deque[Future] = deque()
+            for rows in chunks:
+                in_flight.append(pool.submit(score_chunk, rows))
+                if len(in_flight) >= workers * 2:
+                    write_chunk(in_flight.popleft().result())
+            while in_flight:
+                write_chunk(in_flight.popleft().result())
+    finally:
+        if pool is not None:
+            pool.shutdown(cancel_futures=True)
+    print(f"  ✓ {scored} captions scored")
+
+    if sync_pairs:
+        print("\n[2/3] Syncing caption_attention_scores for all scored captions...")
+        written += conn.execute(
+            SCORES_UPSERT_SQL.format(scope=""), (ATTENTION_ANALYSIS_VERSION,)
+        ).rowcount
+        conn.commit()
+    else:
+        print("\n[2/3] Pair sync skipped (use --sync-pairs after creator or vault changes)")
+    print(f"  ✓ {written} caption/creator score rows written")
+
+    print("\n[3/3] Removing stale scores...")
+    deleted = conn.execute(STALE_SCORES_DELETE_SQL).rowcount
+    conn.execute(STALE_STATE_DELETE_SQL)
+    conn.commit()
+    print(f"  ✓ {deleted} caption/creator score rows deleted")
+
+    conn.close()
+    return {"scored": scored, "written": written, "deleted": deleted}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Score caption attention into caption_attention_scores")
+    parser.add_argument("--workers", type=int, default=None,
+                        help="Worker processes (default: CPU count, 1 = in-process)")
+    parser.add_argument("--chunk-size", type=int, default=DEFAULT_CHUNK_SIZE,
+                        help=f"Captions per chunk (default: {DEFAULT_CHUNK_SIZE})")
+    parser.add_argument("--rescore-all", action="store_true",
+                        help="Rescore every active caption, not only new or changed ones")
+    parser.add_argument("--sync-pairs", action="store_true",
+                        help="Write scores for unchanged captions too (after creator or vault changes)")
+    parser.add_argument("--db-path", type=str, help="Path to database file")
+    args = parser.parse_args()
+
+    db_path = Path(args.db_path) if args.db_path else DB_PATH
+    if not db_path.exists():
+        print(f"Database not found: {db_path}")
+        sys.exit(1)
+
+    score_caption_attention(db_path, args.workers, args.chunk_size, args.rescore_all, args.sync_pairs)
+
+
+if __name__ == "__main__":
+    main()
@@ -45,7 +45,7 @@ from mcp.tools.caption import (
     get_top_captions,
     get_send_type_captions,
 )
-from mcp.tools.schedule import save_schedule
+from mcp.tools.schedule import save_schedule, save_schedules_batch
 from mcp.tools.send_types import (
     get_send_types,
     get_send_type_details,
@@ -87,6 +87,7 @@ __all__ = [
     "get_send_type_captions",
     # Schedule tools
     "save_schedule",
+    "save_schedules_batch",
     # Send type tools
     "get_send_types",
     "get_send_type_details",
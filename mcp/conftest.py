@@ -0,0 +1,81 @@
+"""
+Pytest fixtures for EROS MCP server tests.
+
+Provides a factory for small on-disk tool databases that are patched in
+place of the server's pooled connections.
+"""
+
+import sqlite3
+from contextlib import ExitStack, contextmanager
+from pathlib import Path
+from typing import Callable, Generator, Iterator
+from unittest.mock import patch
+
+import pytest
+
+
+class ToolDatabase:
+    """
+    On-disk SQLite database handed to MCP tools during a test.
+
+    Calling the instance opens a new connection with sqlite3.Row rows, the
+    same shape get_db_connection() returns.
+
+    Attributes:
+        path: Location of the database file.
+    """
+
+    def __init__(self, path: Path):
+        self.path = path
+
+    def __call__(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(self.path)
+        conn.row_factory = sqlite3.Row
+        return conn
+
+    @contextmanager
+    def managed(self) -> Iterator[sqlite3.Connection]:
+        """Connection that is closed on exit, like db_connection()."""
+        conn = self()
+        try:
+            yield conn
+        finally:
+            conn.close()
+
+
+@pytest.fixture
+def make_tool_db(tmp_path: Path) -> Generator[Callable[..., ToolDatabase], None, None]:
+    """
+    Factory for tool databases built from a schema script.
+
+    Usage:
+        db = make_tool_db(SCHEMA, "mcp.tools.schedule.get_db_connection")
+
+    Args (of the returned factory):
+        schema: SQL script creating and seeding the tables.
+        *patch_targets: get_db_connection-style callables to patch.
+        context_targets: db_connection-style context managers to patch.
+        name: Database file name inside tmp_path.
+
+    Patches stay active until the test finishes.
+    """
+    with ExitStack() as stack:
+
+        def make(
+            schema: str,
+            *patch_targets: str,
+            context_targets: tuple[str, ...] = (),
+            name: str = "tool.db",
+        ) -> ToolDatabase:
+            db = ToolDatabase(tmp_path / name)
+            conn = sqlite3.connect(db.path)
+            conn.executescript(schema)
+            conn.commit()
+            conn.close()
+            for target in patch_targets:
+                stack.enter_context(patch(target, side_effect=db))
+            for target in context_targets:
+                stack.enter_context(patch(target, side_effect=db.managed))
+            return db
+
+        yield make
@@ -7,11 +7,23 @@ Provides structured JSON logging for all MCP requests and responses with:
 - Slow query detection and alerting
 - Configurable log levels
 - JSON-formatted output for log aggregation
+- Asynchronous, batched log pipeline (formatting and I/O off the request path)
+- Per-tool sampling of routine request/response records
 
 Configuration via environment variables:
 - EROS_LOG_LEVEL: Logging level (DEBUG, INFO, WARNING, ERROR)
 - EROS_LOG_FORMAT: Log format (json, text)
 - EROS_SLOW_QUERY_MS: Slow query threshold in milliseconds (default: 500)
+- EROS_LOG_ASYNC: Format and write records on a background thread (default: true)
+- EROS_LOG_QUEUE_SIZE: Maximum records buffered before dropping (default: 10000)
+- EROS_LOG_BATCH_SIZE: Maximum records written per flush (default: 256)
+- EROS_LOG_MAX_RECORD_BYTES: Formatted records longer than this are replaced by a
+  truncated stub entry (default: 16384)
+- EROS_LOG_MAX_ACTIVE_REQUESTS: Bound on in-flight request contexts (default: 1024)
+- EROS_LOG_SAMPLE_RATES: Per-tool sample rates, e.g. "get_top_captions=0.1,get_channels=0.5"
+
+Sampling only applies to successful request/response records. Errors,
+slow responses and DEBUG-level logging are never sampled.
 
 Log Levels:
 - DEBUG: Full request/response bodies
@@ -20,24 +32,127 @@ Log Levels:
 - ERROR: Failures with stack traces
 """
 
+import atexit
+import copy
 import json
 import logging
+import logging.handlers
 import os
+import queue
 import sys
+import threading
 import time
 import traceback
 import uuid
+from collections import OrderedDict
 from contextlib import contextmanager
 from dataclasses import asdict, dataclass, field
 from datetime import datetime, timezone
 from functools import wraps
-from typing import Any, Callable, Dict, Generator, Optional, TypeVar
+from typing import Any, Callable, Dict, Generator, List, Optional, TypeVar
 
 # Configuration
 LOG_LEVEL = os.environ.get("EROS_LOG_LEVEL", "INFO").upper()
 LOG_FORMAT = os.environ.get("EROS_LOG_FORMAT", "json").lower()
 SLOW_QUERY_THRESHOLD_MS = int(os.environ.get("EROS_SLOW_QUERY_MS", "500"))
 
+# Async pipeline configuration
+LOG_ASYNC = os.environ.get("EROS_LOG_ASYNC", "true").lower() in ("true", "1", "yes")
+LOG_QUEUE_SIZE = int(os.environ.get("EROS_LOG_QUEUE_SIZE", "10000"))
+LOG_BATCH_SIZE = int(os.environ.get("EROS_LOG_BATCH_SIZE", "256"))
+LOG_MAX_RECORD_BYTES = int(os.environ.get("EROS_LOG_MAX_RECORD_BYTES", "16384"))
+MAX_ACTIVE_REQUESTS = int(os.environ.get("EROS_LOG_MAX_ACTIVE_REQUESTS", "1024"))
+
+# Default sample rates for high-frequency read tools (fraction of routine
+# request/response records that are emitted). Tools not listed log everything.
+DEFAULT_SAMPLE_RATES: Dict[str, float] = {
+    "get_top_captions": 0.25,
+    "get_send_type_captions": 0.25,
+    "get_vault_availability": 0.25,
+}
+
+_SENSITIVE_KEYS = ("password", "token", "secret", "key", "credential", "auth")
+
+
+def _parse_sample_rates(raw: str) -> Dict[str, float]:
+    """
+    Parse a "tool=rate,tool=rate" sample rate specification.
+
+    Malformed entries are ignored; rates are clamped to [0.0, 1.0].
+
+    Args:
+        raw: Comma-separated tool=rate pairs.
+
+    Returns:
+        Mapping of tool name to sample rate.
+    """
+    rates: Dict[str, float] = {}
+    for entry in raw.split(","):
+        tool, sep, value = entry.partition("=")
+        if not sep:
+            continue
+        try:
+            rates[tool.strip()] = min(1.0, max(0.0, float(value)))
+        except ValueError:
+            continue
+    return rates
+
+
+SAMPLE_RATES: Dict[str, float] = {
+    **DEFAULT_SAMPLE_RATES,
+    **_parse_sample_rates(os.environ.get("EROS_LOG_SAMPLE_RATES", "")),
+}
+
+
+def sanitize_params(params: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Sanitize parameters for safe logging.
+
+    Removes or masks sensitive information like credentials, tokens, etc.
+    Nested containers are copied, so the result is a snapshot that later
+    mutation of the caller's params cannot change.
+
+    Args:
+        params: Raw parameters dictionary.
+
+    Returns:
+        Sanitized parameters safe for logging.
+    """
+    sanitized = {}
+
+    for key, value in params.items():
+        key_lower = key.lower()
+        if any(s in key_lower for s in _SENSITIVE_KEYS):
+            sanitized[key] = "[REDACTED]"
+        elif isinstance(value, str) and len(value) > 1000:
+            sanitized[key] = f"{value[:100]}... [truncated, {len(value)} chars]"
+        else:
+            sanitized[key] = _snapshot_value(value)
+
+    return sanitized
+
+
+def _snapshot_value(value: Any) -> Any:
+    """
+    Copy a parameter value into JSON-ready form.
+
+    Dicts, lists and tuples are copied recursively; other non-scalar values
+    are converted with str(), as json.dumps(default=str) would do later.
+
+    Args:
+        value: Parameter value.
+
+    Returns:
+        A value that shares no mutable state with the input.
+    """
+    if value is None or isinstance(value, (str, int, float, bool)):
+        return value
+    if isinstance(value, dict):
+        return {str(k): _snapshot_value(v) for k, v in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_snapshot_value(v) for v in value]
+    return str(value)
+
 # Type variable for generic function decorator
 F = TypeVar('F', bound=Callable[..., Any])
 
@@ -51,18 +166,42 @@ class RequestContext:
         request_id: Unique identifier for this request.
         tool: The MCP tool being called.
         start_time: When the request started (Unix timestamp).
-        params: Request parameters (sanitized for logging).
+        params: Request parameters (sanitized snapshot).
+        sampled: Whether routine records for this request are emitted.
     """
     request_id: str
     tool: str
     start_time: float = field(default_factory=time.time)
     params: Dict[str, Any] = field(default_factory=dict)
+    sampled: bool = True
 
     def elapsed_ms(self) -> float:
         """Calculate elapsed time in milliseconds."""
         return (time.time() - self.start_time) * 1000
 
 
+def _exception_details(exc_info: Any) -> Dict[str, Any]:
+    """
+    Describe an exception for the structured log entry.
+
+    Args:
+        exc_info: (type, value, traceback) tuple from a log record.
+
+    Returns:
+        Dictionary with the exception type, message and formatted traceback.
+    """
+    return {
+        "type": exc_info[0].__name__ if exc_info[0] else None,
+        "message": str(exc_info[1]) if exc_info[1] else None,
+        "traceback": traceback.format_exception(*exc_info)
+    }
+
+
+def _utc_timestamp(created: float) -> str:
+    """Format a record creation time as an ISO 8601 UTC timestamp."""
+    return datetime.fromtimestamp(created, timezone.utc).isoformat().replace("+00:00", "Z")
+
+
 class StructuredJsonFormatter(logging.Formatter):
     """
     Custom JSON formatter for structured logging.
@@ -81,8 +220,8 @@ class StructuredJsonFormatter(logging.Formatter):
         Returns:
             JSON-formatted log string.
         """
-        log_entry = {
-            "timestamp": datetime.now(timezone.utc).isoformat().replace("+00:00", "Z"),
+        log_entry: Dict[str, Any] = {
+            "timestamp": _utc_timestamp(record.created),
             "level": record.levelname,
             "logger": record.name,
             "message": record.getMessage(),
@@ -104,16 +243,266 @@ class StructuredJsonFormatter(logging.Formatter):
         if hasattr(record, "error_type"):
             log_entry["error_type"] = record.error_type
 
-        # Add exception info if present
+        # Add exception info if present (already resolved for queued records)
         if record.exc_info:
-            log_entry["exception"] = {
-                "type": record.exc_info[0].__name__ if record.exc_info[0] else None,
-                "message": str(record.exc_info[1]) if record.exc_info[1] else None,
-                "traceback": traceback.format_exception(*record.exc_info)
-            }
+            log_entry["exception"] = _exception_details(record.exc_info)
+        elif hasattr(record, "exception_details"):
+            log_entry["exception"] = record.exception_details
 
         return json.dumps(log_entry, default=str)
 
+    def format_truncated(self, record: logging.LogRecord, original_size: int, limit: int) -> str:
+        """
+        Format a stub entry for a record whose JSON exceeded the size cap.
+
+        The stub is still a valid JSON object, so JSON-lines consumers keep
+        working; only the message prefix is kept.
+
+        Args:
+            record: The oversized log record.
+            original_size: Length of the full formatted record.
+            limit: Maximum characters of the message to keep.
+
+        Returns:
+            JSON-formatted stub entry.
+        """
+        stub = {
+            "timestamp": _utc_timestamp(record.created),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage()[:limit],
+            "truncated": True,
+            "original_size": original_size,
+        }
+        if hasattr(record, "request_id"):
+            stub["request_id"] = record.request_id
+        if hasattr(record, "tool"):
+            stub["tool"] = record.tool
+        return json.dumps(stub, default=str)
+
+
+class _BatchQueueListener(logging.handlers.QueueListener):
+    """
+    QueueListener that formats records and writes them to a target in batches.
+
+    Records are collected as they are dequeued and written once the queue
+    runs empty, the batch is full, or the listener stops, so a burst of
+    records costs one write and one flush for stream targets.
+    """
+
+    def __init__(
+        self,
+        record_queue: "queue.Queue[Optional[logging.LogRecord]]",
+        target: logging.Handler,
+        batch_size: int,
+        max_record_bytes: int
+    ):
+        super().__init__(record_queue, target)
+        self.records = record_queue
+        self.target = target
+        self.batch_size = max(1, batch_size)
+        self.max_record_bytes = max_record_bytes
+        self.written_records = 0
+        self.batches_flushed = 0
+        self.pending: List[logging.LogRecord] = []
+
+    def dequeue(self, block: bool) -> logging.LogRecord:
+        """Dequeue a record, writing the pending batch before waiting or stopping."""
+        try:
+            record = self.records.get_nowait()
+        except queue.Empty:
+            self._write_pending()
+            record = self.records.get(block)
+        if record is None:
+            # Stop sentinel
+            self._write_pending()
+        return record  # type: ignore[return-value]
+
+    def enqueue_sentinel(self) -> None:
+        """Enqueue the stop sentinel, waiting briefly if the queue is full."""
+        try:
+            self.records.put(None, timeout=2.0)
+        except queue.Full:
+            pass
+
+    def handle(self, record: logging.LogRecord) -> None:
+        """Add a record to the pending batch, writing it once full."""
+        self.pending.append(record)
+        if len(self.pending) >= self.batch_size:
+            self._write_pending()
+
+    def _format_record(self, record: logging.LogRecord) -> str:
+        """Format a record with the target's formatter, applying the size cap."""
+        text = self.target.format(record)
+        if self.max_record_bytes and len(text) > self.max_record_bytes:
+            formatter = self.target.formatter
+            if isinstance(formatter, StructuredJsonFormatter):
+                return formatter.format_truncated(record, len(text), self.max_record_bytes)
+            text = f"{text[:self.max_record_bytes]}... [truncated, {len(text)} chars]"
+        return text
+
+    def _write_pending(self) -> None:
+        """
+        Format and write the pending batch to the target.
+
+        Stream targets receive a single write and flush per batch; other
+        handler types fall back to per-record handling.
+        """
+        batch = self.pending
+        if not batch:
+            return
+
+        if isinstance(self.target, logging.StreamHandler):
+            lines = []
+            for record in batch:
+                try:
+                    lines.append(self._format_record(record))
+                except Exception:
+                    self.target.handleError(record)
+            if lines:
+                self.target.acquire()
+                try:
+                    stream = self.target.stream
+                    stream.write(self.target.terminator.join(lines) + self.target.terminator)
+                    stream.flush()
+                except Exception:
+                    self.target.handleError(batch[-1])
+                finally:
+                    self.target.release()
+        else:
+            for record in batch:
+                self.target.handle(record)
+
+        self.written_records += len(batch)
+        self.batches_flushed += 1
+        # Cleared only after the write, so flush() can wait on it
+        self.pending = []
+
+
+class AsyncBatchHandler(logging.handlers.QueueHandler):
+    """
+    Queue-backed handler that moves formatting and I/O off the request path.
+
+    Built on the stdlib QueueHandler/QueueListener pair. ``emit`` prepares
+    the record on the calling thread (message args merged, exception
+    details resolved) and enqueues it; the listener thread formats records
+    with the target handler's formatter and writes them in batches (one
+    write and one flush per batch for stream targets). When the queue is
+    full, records are dropped and counted instead of blocking the caller,
+    so tool latency never depends on sink speed.
+
+    Example:
+        target = logging.StreamHandler(sys.stderr)
+        target.setFormatter(StructuredJsonFormatter())
+        handler = AsyncBatchHandler(target)
+        logging.getLogger("eros_db_server").addHandler(handler)
+    """
+
+    def __init__(
+        self,
+        target: logging.Handler,
+        queue_size: int = LOG_QUEUE_SIZE,
+        batch_size: int = LOG_BATCH_SIZE,
+        max_record_bytes: int = LOG_MAX_RECORD_BYTES
+    ):
+        """
+        Initialize the handler and start its listener thread.
+
+        Args:
+            target: Handler that formats and writes records (usually a StreamHandler).
+            queue_size: Maximum records buffered before new records are dropped.
+            batch_size: Maximum records written per flush.
+            max_record_bytes: Formatted records longer than this are truncated.
+        """
+        record_queue: "queue.Queue[Optional[logging.LogRecord]]" = queue.Queue(maxsize=queue_size)
+        super().__init__(record_queue)
+        self.setLevel(target.level)
+        self.target = target
+        self.dropped_records = 0
+        self._queue = record_queue
+        self._listener = _BatchQueueListener(record_queue, target, batch_size, max_record_bytes)
+        self._listener.start()
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        """
+        Resolve a record on the calling thread before it is enqueued.
+
+        Unlike the stdlib default, the message is not run through a
+        formatter here; the target's formatter still sees the record's
+        fields. Message args and exception info are resolved now, so the
+        listener never touches objects the caller may have changed since.
+
+        Args:
+            record: The log record to prepare.
+
+        Returns:
+            A copy of the record that is safe to format on another thread.
+        """
+        record = copy.copy(record)
+        record.message = record.getMessage()
+        record.msg = record.message
+        record.args = None
+        if record.exc_info:
+            details = _exception_details(record.exc_info)
+            record.exception_details = details
+            record.exc_text = "".join(details["traceback"]).rstrip("\n")
+        record.exc_info = None
+        record.stack_info = None
+        return record
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        """
+        Enqueue a prepared record, dropping it if the queue is full.
+
+        Args:
+            record: The prepared log record.
+        """
+        try:
+            self._queue.put_nowait(record)
+        except queue.Full:
+            self.dropped_records += 1
+
+    def flush(self, timeout: float = 2.0) -> None:
+        """
+        Wait until queued records have been written.
+
+        Args:
+            timeout: Maximum seconds to wait.
+        """
+        listener = self._listener
+        deadline = time.monotonic() + timeout
+        while (self._queue.unfinished_tasks or listener.pending) and time.monotonic() < deadline:
+            if listener._thread is None or not listener._thread.is_alive():
+                break
+            time.sleep(0.005)
+        try:
+            self.target.flush()
+        except (ValueError, OSError):
+            # Stream already closed (e.g. interpreter shutdown)
+            pass
+
+    def close(self) -> None:
+        """Drain remaining records, stop the listener and close the target."""
+        if self._listener._thread is not None:
+            self._listener.stop()
+        self.target.close()
+        super().close()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get pipeline statistics.
+
+        Returns:
+            Dictionary with queue depth and written/dropped record counts.
+        """
+        return {
+            "queue_depth": self._queue.qsize(),
+            "queue_capacity": self._queue.maxsize,
+            "written_records": self._listener.written_records,
+            "dropped_records": self.dropped_records,
+            "batches_flushed": self._listener.batches_flushed,
+        }
+
 
 class MCPLogger:
     """
@@ -143,7 +532,13 @@ class MCPLogger:
             name: Logger name (typically the tool or module name).
         """
         self.logger = logging.getLogger(name)
-        self._active_requests: Dict[str, RequestContext] = {}
+        self._active_requests: "OrderedDict[str, RequestContext]" = OrderedDict()
+        self._active_lock = threading.Lock()
+        self._max_active_requests = MAX_ACTIVE_REQUESTS
+        self._sample_rates = dict(SAMPLE_RATES)
+        self._sample_credit: Dict[str, float] = {}
+        self._sample_lock = threading.Lock()
+        self.evicted_requests = 0
 
     def generate_request_id(self) -> str:
         """
@@ -158,27 +553,72 @@ class MCPLogger:
         """
         Sanitize parameters for safe logging.
 
-        Removes or masks sensitive information like credentials, tokens, etc.
-
         Args:
             params: Raw parameters dictionary.
 
         Returns:
             Sanitized parameters safe for logging.
         """
-        sensitive_keys = {"password", "token", "secret", "key", "credential", "auth"}
-        sanitized = {}
+        return sanitize_params(params)
+
+    def set_sample_rate(self, tool: str, rate: float) -> None:
+        """
+        Set the fraction of routine records emitted for a tool.
 
-        for key, value in params.items():
-            key_lower = key.lower()
-            if any(s in key_lower for s in sensitive_keys):
-                sanitized[key] = "[REDACTED]"
-            elif isinstance(value, str) and len(value) > 1000:
-                sanitized[key] = f"{value[:100]}... [truncated, {len(value)} chars]"
-            else:
-                sanitized[key] = value
+        Args:
+            tool: Tool name.
+            rate: Sample rate between 0.0 (never) and 1.0 (always).
+        """
+        with self._sample_lock:
+            self._sample_rates[tool] = min(1.0, max(0.0, rate))
+            self._sample_credit.pop(tool, None)
+
+    def _should_sample(self, tool: str) -> bool:
+        """
+        Decide whether routine records for the next request of a tool are emitted.
+
+        Uses deterministic credit accumulation rather than random draws, so a
+        rate of 0.25 emits exactly every fourth request.
 
-        return sanitized
+        Args:
+            tool: Tool name.
+
+        Returns:
+            True if the request's records should be logged.
+        """
+        rate = self._sample_rates.get(tool, 1.0)
+        if rate >= 1.0:
+            return True
+        if rate <= 0.0:
+            return False
+        with self._sample_lock:
+            credit = self._sample_credit.get(tool, 1.0 - rate) + rate
+            if credit >= 1.0:
+                self._sample_credit[tool] = credit - 1.0
+                return True
+            self._sample_credit[tool] = credit
+            return False
+
+    def _track_request(self, context: RequestContext) -> None:
+        """
+        Register an in-flight request, evicting the oldest beyond the bound.
+
+        Requests that never log a response (e.g. abandoned by a timeout) would
+        otherwise accumulate forever.
+
+        Args:
+            context: The request context to track.
+        """
+        with self._active_lock:
+            self._active_requests[context.request_id] = context
+            while len(self._active_requests) > self._max_active_requests:
+                self._active_requests.popitem(last=False)
+                self.evicted_requests += 1
+
+    def _pop_request(self, request_id: str) -> Optional[RequestContext]:
+        """Remove and return an in-flight request context, if tracked."""
+        with self._active_lock:
+            return self._active_requests.pop(request_id, None)
 
     def log_request(
         self,
@@ -200,23 +640,32 @@ class MCPLogger:
         if request_id is None:
             request_id = self.generate_request_id()
 
-        sanitized_params = self._sanitize_params(params)
+        debug_enabled = self.logger.isEnabledFor(logging.DEBUG)
+        sampled = debug_enabled or self._should_sample(tool)
+
+        # Sanitize and snapshot on the calling thread: the record is formatted
+        # later on the writer thread, after the tool may have mutated params.
+        params_snapshot = sanitize_params(params)
 
         context = RequestContext(
             request_id=request_id,
             tool=tool,
-            params=sanitized_params
+            params=params_snapshot,
+            sampled=sampled
         )
-        self._active_requests[request_id] = context
+        self._track_request(context)
+
+        if not sampled:
+            return request_id
 
         extra = {
             "event": "request",
             "request_id": request_id,
             "tool": tool,
-            "params": sanitized_params
+            "params": params_snapshot
         }
 
-        if self.logger.isEnabledFor(logging.DEBUG):
+        if debug_enabled:
             self.logger.debug(
                 f"MCP request started: tool={tool}",
                 extra=extra
@@ -245,12 +694,16 @@ class MCPLogger:
             status: Response status (success, error, etc.).
             result_size: Optional size of the result in bytes.
         """
-        context = self._active_requests.pop(request_id, None)
+        context = self._pop_request(request_id)
 
         if context and duration_ms is None:
             duration_ms = context.elapsed_ms()
 
         tool = context.tool if context else "unknown"
+        is_slow = bool(duration_ms and duration_ms > SLOW_QUERY_THRESHOLD_MS)
+
+        if context and not context.sampled and status == "success" and not is_slow:
+            return
 
         extra = {
             "event": "response",
@@ -264,7 +717,7 @@ class MCPLogger:
             extra["result_size"] = result_size
 
         # Check for slow query
-        if duration_ms and duration_ms > SLOW_QUERY_THRESHOLD_MS:
+        if is_slow:
             self.logger.warning(
                 f"Slow response: {tool} took {duration_ms:.1f}ms "
                 f"(threshold: {SLOW_QUERY_THRESHOLD_MS}ms)",
@@ -290,7 +743,7 @@ class MCPLogger:
             error: The exception that occurred.
             include_traceback: Whether to include the full traceback.
         """
-        context = self._active_requests.pop(request_id, None)
+        context = self._pop_request(request_id)
         tool = context.tool if context else "unknown"
         duration_ms = context.elapsed_ms() if context else None
 
@@ -392,9 +845,14 @@ def get_mcp_logger() -> MCPLogger:
     return _mcp_logger
 
 
+# Active async handler (if any), kept for stats and shutdown flushing
+_async_handler: Optional[AsyncBatchHandler] = None
+
+
 def setup_logging(
     level: Optional[str] = None,
-    format_type: Optional[str] = None
+    format_type: Optional[str] = None,
+    async_mode: Optional[bool] = None
 ) -> None:
     """
     Configure logging for the MCP server.
@@ -405,9 +863,14 @@ def setup_logging(
     Args:
         level: Log level (DEBUG, INFO, WARNING, ERROR). Defaults to EROS_LOG_LEVEL env var.
         format_type: Log format (json, text). Defaults to EROS_LOG_FORMAT env var.
+        async_mode: Route records through AsyncBatchHandler. Defaults to EROS_LOG_ASYNC env var.
     """
+    global _async_handler
+
     level = level or LOG_LEVEL
     format_type = format_type or LOG_FORMAT
+    if async_mode is None:
+        async_mode = LOG_ASYNC
 
     # Convert level string to logging constant
     numeric_level = getattr(logging, level, logging.INFO)
@@ -419,6 +882,9 @@ def setup_logging(
     # Remove existing handlers
     for handler in logger.handlers[:]:
         logger.removeHandler(handler)
+        if handler is _async_handler:
+            handler.close()
+            _async_handler = None
 
     # Create handler
     handler = logging.StreamHandler(sys.stderr)
@@ -432,17 +898,55 @@ def setup_logging(
             '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
         ))
 
-    logger.addHandler(handler)
+    if async_mode:
+        _async_handler = AsyncBatchHandler(handler)
+        logger.addHandler(_async_handler)
+    else:
+        logger.addHandler(handler)
 
     # Don't propagate to root logger
     logger.propagate = False
 
     logger.info(
-        f"Logging configured: level={level}, format={format_type}",
+        f"Logging configured: level={level}, format={format_type}, async={async_mode}",
         extra={"event": "logging_configured"}
     )
 
 
+def flush_logging(timeout: float = 2.0) -> None:
+    """
+    Block until the async log pipeline has written all queued records.
+
+    Args:
+        timeout: Maximum seconds to wait.
+    """
+    if _async_handler is not None:
+        _async_handler.flush(timeout=timeout)
+
+
+def get_log_pipeline_stats() -> Dict[str, Any]:
+    """
+    Get statistics for the log pipeline.
+
+    Returns:
+        Dictionary with async queue stats (if enabled) and in-flight request tracking.
+    """
+    mcp_logger = get_mcp_logger()
+    stats: Dict[str, Any] = {
+        "async": _async_handler is not None,
+        "active_requests": len(mcp_logger._active_requests),
+        "max_active_requests": mcp_logger._max_active_requests,
+        "evicted_requests": mcp_logger.evicted_requests,
+        "sample_rates": dict(mcp_logger._sample_rates),
+    }
+    if _async_handler is not None:
+        stats.update(_async_handler.get_stats())
+    return stats
+
+
+atexit.register(flush_logging)
+
+
 @contextmanager
 def request_context(tool: str, params: Dict[str, Any]) -> Generator[str, None, None]:
     """
@@ -518,7 +1022,6 @@ def log_tool_call(tool_name: str) -> Callable[[F], F]:
 
 
 # Thread-local storage for current request context
-import threading
 _request_context = threading.local()
 
 
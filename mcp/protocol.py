@@ -9,6 +9,8 @@ import json
 import logging
 from typing import Any, Optional
 
+from mcp.utils.helpers import RESPONSE_FORMATS, dump_tool_json
+
 logger = logging.getLogger("eros_db_server")
 
 # MCP Protocol Version
@@ -107,7 +109,10 @@ class MCPProtocol:
         return {
             "protocolVersion": PROTOCOL_VERSION,
             "capabilities": {
-                "tools": {}
+                "tools": {},
+                "experimental": {
+                    "responseFormats": list(RESPONSE_FORMATS)
+                }
             },
             "serverInfo": {
                 "name": SERVER_NAME,
@@ -129,12 +134,13 @@ class MCPProtocol:
             "tools": tools
         }
 
-    def format_tool_call_result(self, result: Any) -> dict[str, Any]:
+    def format_tool_call_result(self, result: Any, compact: bool = False) -> dict[str, Any]:
         """
         Format the result for a tools/call request.
 
         Args:
             result: The result from the tool function.
+            compact: Serialize without indentation (used for columnar responses).
 
         Returns:
             Tool call result with content array.
@@ -143,7 +149,7 @@ class MCPProtocol:
             "content": [
                 {
                     "type": "text",
-                    "text": json.dumps(result, indent=2, default=str)
+                    "text": dump_tool_json(result, compact=compact)
                 }
             ]
         }
@@ -93,6 +93,7 @@ DEFAULT_TOOL_LIMITS: Dict[str, RateLimitConfig] = {
 
     # Low-frequency reads (30 RPM)
     "validate_caption_structure": RateLimitConfig(30, 40),
+    "validate_captions_batch": RateLimitConfig(10, 12),
     "execute_query": RateLimitConfig(30, 40),
 
     # Write operations - medium rate (20 RPM)
@@ -104,6 +105,7 @@ DEFAULT_TOOL_LIMITS: Dict[str, RateLimitConfig] = {
 
     # Write operations - low rate (10 RPM)
     "save_schedule": RateLimitConfig(10, 12),
+    "save_schedules_batch": RateLimitConfig(10, 12),
 
     # Critical writes - very low rate (5 RPM)
     "update_prediction_weights": RateLimitConfig(5, 6),
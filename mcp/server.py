@@ -26,6 +26,7 @@ Configuration:
 - EROS_METRICS_PORT: Prometheus metrics port (default: 9090)
 - EROS_LOG_LEVEL: Log level (DEBUG, INFO, WARNING, ERROR)
 - EROS_LOG_FORMAT: Log format (json, text)
+- EROS_LOG_ASYNC: Write logs from a background thread in batches (default: true)
 - EROS_STDIN_TIMEOUT: Stdin read timeout in seconds (default: 300)
 - EROS_REQUEST_TIMEOUT: Request execution timeout in seconds (default: 30)
 - EROS_MAX_REQUEST_SIZE: Maximum request size in bytes (default: 1MB)
@@ -52,7 +53,7 @@ if __name__ == "__main__":
         sys.path.insert(0, str(parent_dir))
 
 # Initialize logging first
-from mcp.logging_config import setup_logging, get_mcp_logger
+from mcp.logging_config import setup_logging, get_mcp_logger, flush_logging
 
 # Setup logging before other imports
 setup_logging()
@@ -79,7 +80,13 @@ from mcp.protocol import (
     create_error_response,
 )
 from mcp.tools import get_all_tools, dispatch_tool
-from mcp.tools.base import format_tool_result, get_tool_stats
+from mcp.tools.base import (
+    format_tool_result,
+    get_tool_stats,
+    resolve_response_format,
+    set_default_response_format,
+)
+from mcp.utils.helpers import RESPONSE_FORMATS
 from mcp.connection import close_pool, get_pool
 
 # Request timeout configuration
@@ -142,20 +149,35 @@ def shutdown_server() -> None:
         logger.error(f"Error closing connection pool: {e}")
 
     logger.info("Server shutdown complete")
+    flush_logging()
 
 
-def handle_initialize(request_id: Any) -> dict[str, Any]:
+def handle_initialize(request_id: Any, params: Optional[dict[str, Any]] = None) -> dict[str, Any]:
     """
     Handle the initialize MCP method.
 
+    A client may request a session-wide default response format via
+    ``capabilities.experimental.responseFormat`` ("objects" or "columnar").
+    Individual tool calls can still override it with a response_format argument.
+
     Args:
         request_id: The JSON-RPC request ID.
+        params: The initialize parameters sent by the client.
 
     Returns:
         JSON-RPC response with server info and capabilities.
     """
     protocol = MCPProtocol()
-    return create_response(protocol.format_initialize_result(), request_id)
+    result = protocol.format_initialize_result()
+
+    experimental = ((params or {}).get("capabilities") or {}).get("experimental") or {}
+    requested_format = experimental.get("responseFormat")
+    if requested_format in RESPONSE_FORMATS:
+        set_default_response_format(requested_format)
+        result["capabilities"]["experimental"]["responseFormat"] = requested_format
+        logger.info(f"Negotiated default response format: {requested_format}")
+
+    return create_response(result, request_id)
 
 
 def handle_health(request_id: Any) -> dict[str, Any]:
@@ -250,10 +272,21 @@ def handle_tools_call(request_id: Any, params: dict[str, Any]) -> dict[str, Any]
     tool_name = params.get("name")
     arguments = params.get("arguments", {})
 
+    response_format = resolve_response_format(arguments)
+    if response_format not in RESPONSE_FORMATS:
+        return create_error_response(
+            ERROR_INVALID_PARAMS,
+            f"Invalid response_format: {response_format}. Must be one of {list(RESPONSE_FORMATS)}",
+            request_id
+        )
+
     try:
-        result = dispatch_tool(tool_name, arguments)
+        result = dispatch_tool(tool_name, arguments, response_format=response_format)
         protocol = MCPProtocol()
-        return create_response(protocol.format_tool_call_result(result), request_id)
+        return create_response(
+            protocol.format_tool_call_result(result, compact=response_format == "columnar"),
+            request_id
+        )
     except KeyError as e:
         return create_error_response(ERROR_METHOD_NOT_FOUND, str(e), request_id)
     except TypeError as e:
@@ -277,7 +310,7 @@ def handle_request(request: dict[str, Any]) -> Optional[dict[str, Any]]:
     params = request.get("params", {})
 
     if method == "initialize":
-        return handle_initialize(request_id)
+        return handle_initialize(request_id, params)
     elif method == "tools/list":
         return handle_tools_list(request_id)
     elif method == "tools/call":
@@ -388,6 +421,10 @@ def main() -> None:
     signal.signal(signal.SIGTERM, handle_signal)
     signal.signal(signal.SIGINT, handle_signal)
 
+    # Reuse compiled algorithm configs across server restarts
+    from python.volume.config_loader import default_cache_dir
+    os.environ.setdefault("EROS_ALGORITHM_CONFIG_CACHE_DIR", str(default_cache_dir()))
+
     # Initialize server components
     initialize_server()
 
@@ -21,6 +21,8 @@ try:
 except ImportError:
     pytest.skip("jsonschema not installed", allow_module_level=True)
 
+from mcp.tools.query import execute_query
+
 
 # =============================================================================
 # RESPONSE SCHEMAS FOR ALL 17 MCP TOOLS
@@ -395,9 +397,21 @@ EXECUTE_QUERY_SCHEMA = {
                 "results": {"type": "array"},
                 "count": {"type": "integer", "minimum": 0},
                 "columns": {"type": "array", "items": {"type": "string"}},
+                "next_page_token": {"type": ["string", "null"]},
+                "has_more": {"type": "boolean"},
             },
             "required": ["results", "count", "columns"],
         },
+        {
+            "properties": {
+                "rows": {"type": "array", "items": {"type": "array"}},
+                "count": {"type": "integer", "minimum": 0},
+                "columns": {"type": "array", "items": {"type": "string"}},
+                "next_page_token": {"type": ["string", "null"]},
+                "has_more": {"type": "boolean"},
+            },
+            "required": ["rows", "count", "columns"],
+        },
     ],
 }
 
@@ -829,6 +843,32 @@ class TestExecuteQueryContract:
         response = {"error": "Only SELECT queries are allowed"}
         validate(response, EXECUTE_QUERY_SCHEMA)
 
+    @pytest.mark.unit
+    @pytest.mark.parametrize("response_format", ["objects", "columnar"])
+    def test_paged_query_response(self, make_tool_db, response_format):
+        """Test real paged execute_query output matches schema on every page."""
+        make_tool_db(
+            """
+            CREATE TABLE creators (creator_id TEXT PRIMARY KEY, page_name TEXT);
+            INSERT INTO creators VALUES ('test_001', 'one'), ('test_002', 'two'), ('test_003', 'three');
+            """,
+            "mcp.tools.query.get_db_connection",
+        )
+
+        first = execute_query(
+            "SELECT creator_id, page_name FROM creators ORDER BY creator_id",
+            page_size=2, response_format=response_format,
+        )
+        last = execute_query(
+            "SELECT creator_id, page_name FROM creators ORDER BY creator_id",
+            page_size=2, page_token=first["next_page_token"], response_format=response_format,
+        )
+
+        validate(first, EXECUTE_QUERY_SCHEMA)
+        validate(last, EXECUTE_QUERY_SCHEMA)
+        assert first["has_more"] is True
+        assert last["next_page_token"] is None
+
 
 class TestChannelsContract:
     """Contract tests for get_channels response."""
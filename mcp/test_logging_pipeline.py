@@ -0,0 +1,246 @@
+"""
+EROS MCP Server Logging Pipeline Tests
+
+Test suite for the asynchronous structured logging pipeline including:
+- Off-thread batched writes via AsyncBatchHandler
+- Queue overflow dropping instead of blocking
+- Record size capping
+- Parameter sanitization and snapshotting on the request path
+- Per-tool sampling of routine records
+- Bounded in-flight request tracking
+
+Usage:
+    python -m pytest mcp/test_logging_pipeline.py -v
+"""
+
+import io
+import json
+import logging
+import threading
+import time
+import unittest
+from datetime import datetime
+
+from mcp.logging_config import (
+    AsyncBatchHandler,
+    MCPLogger,
+    StructuredJsonFormatter,
+    sanitize_params,
+)
+
+
+class _BlockingStream(io.StringIO):
+    """Stream whose writes block until released, simulating a slow sink."""
+
+    def __init__(self):
+        super().__init__()
+        self.release = threading.Event()
+
+    def write(self, text):
+        self.release.wait(timeout=5)
+        return super().write(text)
+
+
+def _make_logger(name: str, handler: logging.Handler) -> logging.Logger:
+    logger = logging.getLogger(name)
+    logger.handlers = [handler]
+    logger.setLevel(logging.INFO)
+    logger.propagate = False
+    return logger
+
+
+class TestAsyncBatchHandler(unittest.TestCase):
+    """Test the queue-backed batching handler."""
+
+    def test_records_written_as_json_lines(self):
+        """Queued records are formatted and written by the worker."""
+        stream = io.StringIO()
+        target = logging.StreamHandler(stream)
+        target.setFormatter(StructuredJsonFormatter())
+        handler = AsyncBatchHandler(target, batch_size=8)
+        logger = _make_logger("test_async_pipeline.basic", handler)
+
+        for i in range(20):
+            logger.info(f"message {i}", extra={"event": "request", "tool": "t"})
+        handler.flush()
+
+        lines = stream.getvalue().strip().split("\n")
+        self.assertEqual(len(lines), 20)
+        self.assertEqual(json.loads(lines[0])["message"], "message 0")
+        self.assertEqual(json.loads(lines[-1])["tool"], "t")
+        self.assertEqual(handler.get_stats()["written_records"], 20)
+        handler.close()
+
+    def test_slow_sink_does_not_block_emit(self):
+        """A full queue drops records rather than blocking the caller."""
+        stream = _BlockingStream()
+        target = logging.StreamHandler(stream)
+        handler = AsyncBatchHandler(target, queue_size=5, batch_size=1)
+        logger = _make_logger("test_async_pipeline.slow", handler)
+
+        for i in range(50):
+            logger.info(f"message {i}")
+
+        self.assertGreater(handler.get_stats()["dropped_records"], 0)
+        stream.release.set()
+        handler.close()
+
+    def test_oversized_record_truncated(self):
+        """Formatted records beyond max_record_bytes are capped."""
+        stream = io.StringIO()
+        target = logging.StreamHandler(stream)
+        handler = AsyncBatchHandler(target, max_record_bytes=50)
+        logger = _make_logger("test_async_pipeline.cap", handler)
+
+        logger.info("x" * 500)
+        handler.flush()
+
+        line = stream.getvalue().strip()
+        self.assertTrue(line.startswith("x" * 50))
+        self.assertIn("[truncated, 500 chars]", line)
+        handler.close()
+
+    def test_oversized_json_record_stays_valid_json(self):
+        """JSON records beyond max_record_bytes become a valid stub entry."""
+        stream = io.StringIO()
+        target = logging.StreamHandler(stream)
+        target.setFormatter(StructuredJsonFormatter())
+        handler = AsyncBatchHandler(target, max_record_bytes=50)
+        logger = _make_logger("test_async_pipeline.json_cap", handler)
+
+        logger.info("x" * 500, extra={"tool": "t"})
+        handler.flush()
+
+        entry = json.loads(stream.getvalue().strip())
+        self.assertTrue(entry["truncated"])
+        self.assertGreater(entry["original_size"], 500)
+        self.assertEqual(entry["message"], "x" * 50)
+        self.assertEqual(entry["tool"], "t")
+        handler.close()
+
+    def test_record_prepared_on_calling_thread(self):
+        """Args, exceptions and timestamps are fixed when the record is logged."""
+        stream = io.StringIO()
+        target = logging.StreamHandler(stream)
+        target.setFormatter(StructuredJsonFormatter())
+        handler = AsyncBatchHandler(target)
+        logger = _make_logger("test_async_pipeline.prepare", handler)
+
+        state = {"step": 1}
+        before = time.time()
+        try:
+            raise ValueError("boom")
+        except ValueError:
+            logger.exception("state %s", state)
+        state["step"] = 2
+        time.sleep(0.05)
+        handler.flush()
+
+        entry = json.loads(stream.getvalue().strip())
+        self.assertEqual(entry["message"], "state {'step': 1}")
+        self.assertEqual(entry["exception"]["type"], "ValueError")
+        self.assertEqual(entry["exception"]["message"], "boom")
+        logged_at = datetime.fromisoformat(entry["timestamp"].replace("Z", "+00:00"))
+        self.assertLess(abs(logged_at.timestamp() - before), 0.04)
+        handler.close()
+
+
+class TestMCPLoggerPipeline(unittest.TestCase):
+    """Test MCPLogger hot-path behavior."""
+
+    def setUp(self):
+        self.records = []
+
+        class _Collector(logging.Handler):
+            def emit(inner_self, record):
+                self.records.append(record)
+
+        self.logger_name = f"test_mcp_logger.{self.id()}"
+        _make_logger(self.logger_name, _Collector())
+        self.mcp_logger = MCPLogger(self.logger_name)
+
+    def test_params_sanitized_before_enqueue(self):
+        """Sensitive params are redacted before the record leaves the caller."""
+        self.mcp_logger.log_request("get_creator_profile", {"api_token": "abc", "creator_id": "x"})
+
+        record = self.records[0]
+        self.assertEqual(record.params["api_token"], "[REDACTED]")
+        entry = json.loads(StructuredJsonFormatter().format(record))
+        self.assertEqual(entry["params"]["api_token"], "[REDACTED]")
+        self.assertEqual(entry["params"]["creator_id"], "x")
+
+    def test_params_snapshot_ignores_later_mutation(self):
+        """Mutating nested params after log_request does not change the record."""
+        params = {"filters": {"tags": ["a"]}, "conn": object()}
+        self.mcp_logger.log_request("get_creator_profile", params)
+        params["filters"]["tags"].append("b")
+        params["filters"]["new"] = 1
+
+        record = self.records[0]
+        self.assertEqual(record.params["filters"], {"tags": ["a"]})
+        self.assertIsInstance(record.params["conn"], str)
+        json.loads(StructuredJsonFormatter().format(record))
+
+    def test_sampling_is_thread_safe(self):
+        """Concurrent requests still emit exactly the sampled fraction."""
+        self.mcp_logger.set_sample_rate("hot_tool", 0.25)
+
+        emitted = []
+
+        def worker():
+            for _ in range(500):
+                if self.mcp_logger._should_sample("hot_tool"):
+                    emitted.append(1)
+
+        threads = [threading.Thread(target=worker) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(len(emitted), 1000)
+
+    def test_sanitize_params_truncates_long_values(self):
+        """Long string values are truncated."""
+        sanitized = sanitize_params({"query": "a" * 2000})
+        self.assertIn("[truncated, 2000 chars]", sanitized["query"])
+
+    def test_sampling_emits_fraction_of_routine_records(self):
+        """A 0.25 sample rate emits one in four request/response pairs."""
+        self.mcp_logger.set_sample_rate("hot_tool", 0.25)
+
+        for _ in range(8):
+            request_id = self.mcp_logger.log_request("hot_tool", {})
+            self.mcp_logger.log_response(request_id, duration_ms=1.0)
+
+        events = [r.event for r in self.records]
+        self.assertEqual(events.count("request"), 2)
+        self.assertEqual(events.count("response"), 2)
+
+    def test_sampling_never_drops_errors_or_slow_responses(self):
+        """Errors and slow responses are logged for unsampled requests."""
+        self.mcp_logger.set_sample_rate("hot_tool", 0.0)
+
+        request_id = self.mcp_logger.log_request("hot_tool", {})
+        self.mcp_logger.log_error(request_id, ValueError("boom"), include_traceback=False)
+        request_id = self.mcp_logger.log_request("hot_tool", {})
+        self.mcp_logger.log_response(request_id, duration_ms=10_000.0)
+
+        events = [r.event for r in self.records]
+        self.assertEqual(events, ["error", "response"])
+        self.assertEqual(self.records[1].levelno, logging.WARNING)
+
+    def test_active_requests_bounded(self):
+        """Abandoned requests are evicted oldest-first beyond the bound."""
+        self.mcp_logger._max_active_requests = 10
+
+        request_ids = [self.mcp_logger.log_request("t", {}) for _ in range(25)]
+
+        self.assertEqual(len(self.mcp_logger._active_requests), 10)
+        self.assertEqual(self.mcp_logger.evicted_requests, 15)
+        self.assertNotIn(request_ids[0], self.mcp_logger._active_requests)
+        self.assertIn(request_ids[-1], self.mcp_logger._active_requests)
+
+
+if __name__ == "__main__":
+    unittest.main()
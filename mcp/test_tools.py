@@ -26,9 +26,13 @@ Tools tested:
 16. get_volume_config
 """
 
+import difflib
 import json
+import os
 import sqlite3
+import sys
 from datetime import datetime, timedelta
+from pathlib import Path
 from typing import Any
 from unittest.mock import MagicMock, patch
 
@@ -41,7 +45,18 @@ from mcp.tools.creator import (
     get_persona_profile,
     get_vault_availability,
 )
-from mcp.tools.caption import get_top_captions, get_send_type_captions
+from mcp.tools.caption import (
+    MAX_BATCH_CAPTIONS,
+    DiversityEngine,
+    _analyze_attention,
+    _check_diversity,
+    _get_quality_tier,
+    compute_attention_scores,
+    get_send_type_captions,
+    get_top_captions,
+    validate_caption_structure,
+    validate_captions_batch,
+)
 from mcp.tools.performance import (
     get_best_timing,
     get_volume_assignment,
@@ -50,8 +65,9 @@ from mcp.tools.performance import (
 )
 from mcp.tools.send_types import get_send_types, get_send_type_details, get_volume_config
 from mcp.tools.targeting import get_channels
-from mcp.tools.schedule import save_schedule
+from mcp.tools.schedule import MAX_BATCH_SCHEDULES, save_schedule, save_schedules_batch
 from mcp.tools.query import execute_query
+from mcp.tools.experiments import save_experiment_results
 
 # Server handler functions
 from mcp.server import handle_request, handle_tools_call, handle_tools_list
@@ -60,7 +76,19 @@ from mcp.server import handle_request, handle_tools_call, handle_tools_list
 from mcp.connection import db_connection, get_db_connection
 
 # Utility helpers
-from mcp.utils.helpers import row_to_dict, rows_to_list, resolve_creator_id
+from mcp.utils.helpers import (
+    columnarize_result,
+    dump_tool_json,
+    row_to_dict,
+    rows_to_list,
+    resolve_creator_id,
+)
+from mcp.tools.base import (
+    TOOL_REGISTRY,
+    dispatch_tool,
+    get_default_response_format,
+    set_default_response_format,
+)
 
 # Security validation
 from mcp.utils.security import validate_creator_id, validate_key_input
@@ -605,6 +633,534 @@ class TestSaveSchedule:
         assert "error" in result
 
 
+SCHEDULE_TEST_SCHEMA = """
+    CREATE TABLE creators (creator_id TEXT PRIMARY KEY, page_name TEXT);
+    CREATE TABLE send_types (
+        send_type_id INTEGER PRIMARY KEY, send_type_key TEXT, requires_flyer INTEGER DEFAULT 0
+    );
+    CREATE TABLE channels (channel_id INTEGER PRIMARY KEY, channel_key TEXT);
+    CREATE TABLE schedule_templates (
+        template_id INTEGER PRIMARY KEY AUTOINCREMENT,
+        creator_id TEXT, week_start TEXT, week_end TEXT, generated_at TEXT,
+        generated_by TEXT, algorithm_version TEXT, total_items INTEGER,
+        total_ppvs INTEGER, total_bumps INTEGER, status TEXT,
+        UNIQUE (creator_id, week_start)
+    );
+    CREATE TABLE schedule_items (
+        item_id INTEGER PRIMARY KEY AUTOINCREMENT,
+        template_id INTEGER, creator_id TEXT, scheduled_date TEXT, scheduled_time TEXT,
+        item_type TEXT, channel TEXT, caption_id INTEGER, caption_text TEXT,
+        suggested_price REAL, content_type_id INTEGER, flyer_required INTEGER DEFAULT 0,
+        priority INTEGER DEFAULT 5, status TEXT DEFAULT 'pending',
+        send_type_id INTEGER, channel_id INTEGER, linked_post_url TEXT, expires_at TEXT,
+        followup_delay_minutes INTEGER, media_type TEXT, campaign_goal REAL,
+        parent_item_id INTEGER, is_follow_up INTEGER DEFAULT 0
+    );
+    INSERT INTO creators VALUES ('creator_a', 'pagea'), ('creator_b', 'pageb');
+    INSERT INTO send_types VALUES (1, 'ppv_unlock', 0), (2, 'bump_normal', 0);
+    INSERT INTO channels VALUES (1, 'mass_message'), (2, 'wall_post');
+"""
+
+
+@pytest.fixture
+def schedule_db(make_tool_db):
+    """Patch schedule tools onto an on-disk database with the schedule tables."""
+    return make_tool_db(SCHEDULE_TEST_SCHEMA, "mcp.tools.schedule.get_db_connection")
+
+
+def _schedule_items(count: int) -> list[dict[str, Any]]:
+    return [
+        {
+            "scheduled_date": "2025-01-06",
+            "scheduled_time": f"{10 + i:02d}:00",
+            "item_type": "ppv",
+            "channel": "mass_message",
+            "send_type_key": "ppv_unlock",
+            "channel_key": "mass_message",
+            "caption_text": f"caption {i}",
+            "suggested_price": 15.0,
+        }
+        for i in range(count)
+    ]
+
+
+class TestSaveScheduleDiff:
+    """Tests for diff-based schedule re-saves."""
+
+    @pytest.mark.unit
+    def test_first_save_inserts_all_items(self, schedule_db):
+        """An empty template receives every item as an insert."""
+        result = save_schedule("creator_a", "2025-01-06", _schedule_items(5))
+
+        assert result["success"] is True
+        assert result["items_created"] == 5
+        assert result["changes"] == {"inserted": 5, "updated": 0, "deleted": 0, "unchanged": 0}
+
+    @pytest.mark.unit
+    def test_resave_touches_only_changed_items(self, schedule_db):
+        """Re-saving with one edit, one removal and one addition writes three rows."""
+        items = _schedule_items(5)
+        save_schedule("creator_a", "2025-01-06", items)
+        conn = schedule_db()
+        conn.execute("UPDATE schedule_items SET status = 'queued'")
+        conn.commit()
+        before = {r["scheduled_time"]: r["item_id"] for r in conn.execute("SELECT * FROM schedule_items")}
+        conn.close()
+
+        revised = [dict(item) for item in items]
+        revised[1]["caption_text"] = "rewritten"
+        del revised[4]
+        revised.append({**items[0], "scheduled_time": "20:00"})
+
+        result = save_schedule("creator_a", "2025-01-06", revised)
+
+        assert result["changes"] == {"inserted": 1, "updated": 1, "deleted": 1, "unchanged": 3}
+        conn = schedule_db()
+        after = {r["scheduled_time"]: r for r in conn.execute("SELECT * FROM schedule_items")}
+        conn.close()
+        assert set(after) == {"10:00", "11:00", "12:00", "13:00", "20:00"}
+        assert after["10:00"]["item_id"] == before["10:00"]
+        assert after["10:00"]["status"] == "queued"
+        assert after["11:00"]["caption_text"] == "rewritten"
+        assert after["11:00"]["status"] == "pending"
+
+    @pytest.mark.unit
+    def test_duplicate_slots_matched_by_ordinal(self, schedule_db):
+        """Items sharing a slot are paired in order, so re-saving is a no-op."""
+        items = _schedule_items(1) * 3
+        save_schedule("creator_a", "2025-01-06", items)
+
+        result = save_schedule("creator_a", "2025-01-06", items)
+
+        assert result["changes"] == {"inserted": 0, "updated": 0, "deleted": 0, "unchanged": 3}
+
+
+class TestSaveSchedulesBatch:
+    """Tests for save_schedules_batch tool."""
+
+    @pytest.mark.unit
+    def test_saves_every_schedule(self, schedule_db):
+        """Every creator in the batch is saved in one call."""
+        result = save_schedules_batch([
+            {"creator_id": "creator_a", "week_start": "2025-01-06", "items": _schedule_items(3)},
+            {"creator_id": "creator_b", "week_start": "2025-01-06", "items": _schedule_items(2)},
+        ])
+
+        assert result["success"] is True
+        assert result["saved"] == 2
+        assert [r["items_created"] for r in result["results"]] == [3, 2]
+        conn = schedule_db()
+        counts = dict(conn.execute(
+            "SELECT creator_id, COUNT(*) FROM schedule_items GROUP BY creator_id"
+        ).fetchall())
+        conn.close()
+        assert counts == {"creator_a": 3, "creator_b": 2}
+
+    @pytest.mark.unit
+    def test_failed_entry_does_not_block_others(self, schedule_db):
+        """Invalid entries are reported per creator while the rest are saved."""
+        result = save_schedules_batch([
+            {"creator_id": "creator_a", "week_start": "2025-01-06", "items": _schedule_items(2)},
+            {"creator_id": "missing", "week_start": "2025-01-06", "items": _schedule_items(2)},
+            {"creator_id": "creator_b", "week_start": "06/01/2025", "items": _schedule_items(2)},
+            {"creator_id": "creator_a", "week_start": "2025-01-06", "items": _schedule_items(1)},
+        ])
+
+        assert result["success"] is False
+        assert result["saved"] == 1
+        assert result["failed"] == 3
+        errors = [r.get("error", "") for r in result["results"]]
+        assert errors[0] == ""
+        assert "Creator not found" in errors[1]
+        assert "YYYY-MM-DD" in errors[2]
+        assert "Duplicate" in errors[3]
+        conn = schedule_db()
+        assert conn.execute("SELECT COUNT(*) FROM schedule_items").fetchone()[0] == 2
+        conn.close()
+
+    @pytest.mark.unit
+    def test_resave_is_diff_based(self, schedule_db):
+        """Batch re-saves reuse the per-template diff sync."""
+        schedules = [{"creator_id": "creator_a", "week_start": "2025-01-06", "items": _schedule_items(4)}]
+        save_schedules_batch(schedules)
+
+        result = save_schedules_batch(schedules)
+
+        assert result["results"][0]["changes"] == {"inserted": 0, "updated": 0, "deleted": 0, "unchanged": 4}
+
+    @pytest.mark.unit
+    def test_non_string_fields_are_rejected(self, schedule_db):
+        """Missing creator_id or week_start is reported per entry."""
+        result = save_schedules_batch([
+            {"week_start": "2025-01-06", "items": _schedule_items(1)},
+            {"creator_id": "creator_a", "week_start": None, "items": _schedule_items(1)},
+        ])
+
+        errors = [r["error"] for r in result["results"]]
+        assert "Invalid creator_id" in errors[0]
+        assert "YYYY-MM-DD" in errors[1]
+
+    @pytest.mark.unit
+    def test_unexpected_error_rolls_back_batch(self, schedule_db):
+        """Non-database errors undo the savepoint and the batch before propagating."""
+        schedules = [{"creator_id": "creator_a", "week_start": "2025-01-06", "items": _schedule_items(2)}]
+
+        with patch("mcp.tools.schedule._build_item_rows", side_effect=ValueError("bad item")):
+            with pytest.raises(ValueError):
+                save_schedules_batch(schedules)
+
+        conn = schedule_db()
+        assert conn.execute("SELECT COUNT(*) FROM schedule_templates").fetchone()[0] == 0
+        conn.close()
+        assert save_schedules_batch(schedules)["saved"] == 1
+
+    @pytest.mark.unit
+    def test_batch_size_limit(self, schedule_db):
+        """Oversized batches are rejected before touching the database."""
+        schedules = [{"creator_id": "creator_a", "week_start": "2025-01-06", "items": []}] * (MAX_BATCH_SCHEDULES + 1)
+
+        result = save_schedules_batch(schedules)
+
+        assert "error" in result
+        assert save_schedules_batch([])["error"] == "schedules must be a non-empty list"
+
+
+EXPERIMENT_TEST_SCHEMA = """
+    CREATE TABLE ab_experiments (
+        experiment_id INTEGER PRIMARY KEY AUTOINCREMENT,
+        significance_level REAL NOT NULL DEFAULT 0.05,
+        minimum_detectable_effect REAL DEFAULT 0.05,
+        status TEXT NOT NULL DEFAULT 'RUNNING'
+    );
+    CREATE TABLE experiment_variants (
+        variant_id INTEGER PRIMARY KEY AUTOINCREMENT,
+        experiment_id INTEGER NOT NULL, is_control INTEGER NOT NULL DEFAULT 0,
+        sample_count INTEGER NOT NULL DEFAULT 0, conversions INTEGER NOT NULL DEFAULT 0
+    );
+    CREATE TABLE experiment_results (
+        result_id INTEGER PRIMARY KEY AUTOINCREMENT,
+        experiment_id INTEGER NOT NULL, variant_id INTEGER NOT NULL,
+        metric_name TEXT NOT NULL, metric_value REAL NOT NULL, sample_size INTEGER NOT NULL,
+        standard_error REAL, confidence_interval_low REAL, confidence_interval_high REAL,
+        vs_control_lift REAL, vs_control_p_value REAL, is_significant INTEGER,
+        measurement_date TEXT NOT NULL
+    );
+    CREATE TABLE experiment_sequential_state (
+        experiment_id INTEGER NOT NULL, variant_id INTEGER NOT NULL, metric_name TEXT NOT NULL,
+        p_value REAL NOT NULL, updated_at TEXT NOT NULL DEFAULT (datetime('now')),
+        PRIMARY KEY (experiment_id, variant_id, metric_name)
+    );
+    INSERT INTO ab_experiments VALUES (1, 0.05, 0.2, 'RUNNING');
+    INSERT INTO experiment_variants (variant_id, experiment_id, is_control) VALUES (1, 1, 1), (2, 1, 0);
+"""
+
+
+@pytest.fixture
+def experiments_db(make_tool_db):
+    """Patch experiment tools onto an on-disk database with the experiment tables."""
+    return make_tool_db(EXPERIMENT_TEST_SCHEMA, "mcp.tools.experiments.get_db_connection")
+
+
+def _running_stats(count: int, mean: float, std: float) -> dict[str, Any]:
+    return {"sample_size": count, "metric_value": mean, "m2": std ** 2 * (count - 1)}
+
+
+class TestSaveExperimentResultsSequential:
+    """Tests for sequential (mSPRT) checks in save_experiment_results."""
+
+    @pytest.mark.unit
+    def test_decisive_variant_is_flagged_to_stop(self, experiments_db):
+        """Running statistics for both arms produce an always-valid decision."""
+        result = save_experiment_results(1, [
+            {"variant_id": 1, "metric_name": "rps", **_running_stats(200, 10.0, 3.0)},
+            {"variant_id": 2, "metric_name": "rps", **_running_stats(200, 12.0, 3.0)},
+        ], measurement_date="2025-01-06")
+
+        assert result["success"] is True
+        decision = result["sequential_decisions"][0]
+        assert decision["variant_id"] == 2
+        assert decision["decision"] == "treatment_wins"
+        assert decision["should_stop"] is True
+
+        conn = experiments_db()
+        rows = {r["variant_id"]: r for r in conn.execute("SELECT * FROM experiment_results")}
+        conn.close()
+        assert rows[2]["vs_control_p_value"] == pytest.approx(decision["p_value"])
+        assert rows[2]["is_significant"] == 1
+        assert rows[2]["vs_control_lift"] == pytest.approx(20.0)
+        assert rows[1]["standard_error"] == pytest.approx(3.0 / 200 ** 0.5)
+        assert rows[1]["vs_control_p_value"] is None
+
+    @pytest.mark.unit
+    def test_inconclusive_variant_continues(self, experiments_db):
+        """Similar arms keep running and are not marked significant."""
+        result = save_experiment_results(1, [
+            {"variant_id": 1, "metric_name": "rps", **_running_stats(100, 10.0, 3.0)},
+            {"variant_id": 2, "metric_name": "rps", **_running_stats(100, 10.1, 3.0)},
+        ])
+
+        assert result["sequential_decisions"][0]["decision"] == "continue"
+        assert result["significant_findings"] is None
+
+    @pytest.mark.unit
+    def test_without_running_stats_keeps_fixed_horizon_fields(self, experiments_db):
+        """Results without m2 are saved exactly as provided."""
+        result = save_experiment_results(1, [
+            {"variant_id": 2, "metric_name": "rps", "metric_value": 11.0,
+             "sample_size": 50, "vs_control_p_value": 0.01},
+        ])
+
+        assert result["sequential_decisions"] is None
+        assert result["significant_findings"][0]["p_value"] == 0.01
+
+    @pytest.mark.unit
+    def test_p_value_continues_from_previous_check(self, experiments_db):
+        """The always-valid p-value never rises above the last stored one."""
+        first = save_experiment_results(1, [
+            {"variant_id": 1, "metric_name": "rps", **_running_stats(200, 10.0, 3.0)},
+            {"variant_id": 2, "metric_name": "rps", **_running_stats(200, 11.0, 3.0)},
+        ], measurement_date="2025-01-06")
+        second = save_experiment_results(1, [
+            {"variant_id": 1, "metric_name": "rps", **_running_stats(220, 10.0, 3.0)},
+            {"variant_id": 2, "metric_name": "rps", **_running_stats(220, 10.0, 3.0)},
+        ], measurement_date="2025-01-07")
+
+        first_p = first["sequential_decisions"][0]["p_value"]
+        assert first_p < 1.0
+        assert second["sequential_decisions"][0]["p_value"] == pytest.approx(first_p)
+
+    @pytest.mark.unit
+    def test_fixed_horizon_p_value_is_not_carried_over(self, experiments_db):
+        """A caller-supplied p-value never seeds the mSPRT running minimum."""
+        save_experiment_results(1, [
+            {"variant_id": 2, "metric_name": "rps", "metric_value": 10.0,
+             "sample_size": 300, "vs_control_p_value": 0.001},
+        ], measurement_date="2025-01-06")
+        result = save_experiment_results(1, [
+            {"variant_id": 1, "metric_name": "rps", **_running_stats(300, 10.0, 3.0)},
+            {"variant_id": 2, "metric_name": "rps", **_running_stats(300, 10.0, 3.0)},
+        ], measurement_date="2025-01-07")
+
+        decision = result["sequential_decisions"][0]
+        assert decision["decision"] == "continue"
+        assert decision["should_stop"] is False
+        assert decision["p_value"] == 1.0
+
+    @pytest.mark.unit
+    def test_relative_mde_is_scaled_by_control_mean(self, experiments_db):
+        """A 20% relative MDE sizes the mixture in metric units, not SDs."""
+        from python.analytics.volume_ab_test import ArmStatistics, run_mixture_sprt
+
+        control = _running_stats(200, 10.0, 3.0)
+        treatment = _running_stats(200, 11.0, 3.0)
+        result = save_experiment_results(1, [
+            {"variant_id": 1, "metric_name": "rps", **control},
+            {"variant_id": 2, "metric_name": "rps", **treatment},
+        ])
+
+        expected = run_mixture_sprt(
+            ArmStatistics(count=200, mean=10.0, m2=control["m2"]),
+            ArmStatistics(count=200, mean=11.0, m2=treatment["m2"]),
+            alpha=0.05,
+            mixture_variance=(0.2 * 10.0) ** 2,
+        )
+        assert result["sequential_decisions"][0]["p_value"] == pytest.approx(expected.p_value)
+
+
+# =============================================================================
+# Caption attention scoring TESTS
+# =============================================================================
+
+
+ATTENTION_TEST_SCHEMA = """
+    CREATE TABLE creators (creator_id TEXT PRIMARY KEY, is_active INTEGER);
+    CREATE TABLE caption_bank (
+        caption_id INTEGER PRIMARY KEY, caption_text TEXT,
+        content_type_id INTEGER, is_active INTEGER
+    );
+    CREATE TABLE vault_matrix (creator_id TEXT, content_type_id INTEGER, has_content INTEGER);
+    CREATE TABLE caption_attention_scores (
+        attention_id INTEGER PRIMARY KEY AUTOINCREMENT,
+        caption_id INTEGER NOT NULL, creator_id TEXT NOT NULL,
+        hook_score REAL NOT NULL, depth_score REAL NOT NULL,
+        cta_score REAL NOT NULL, emotion_score REAL NOT NULL,
+        attention_score REAL NOT NULL, quality_tier TEXT NOT NULL,
+        analysis_version TEXT NOT NULL, analyzed_at TEXT NOT NULL,
+        word_count INTEGER, sentence_count INTEGER, avg_sentence_length REAL,
+        UNIQUE(caption_id, creator_id)
+    );
+    INSERT INTO creators VALUES ('alexia', 1), ('luna', 1), ('retired', 0);
+    INSERT INTO caption_bank VALUES
+        (1, 'OMG babe you need to see this 10 min video, unlock it now!', 1, 1),
+        (2, 'Good morning, how was your night? Tell me everything', 2, 1),
+        (3, 'Old caption nobody sends anymore', 1, 0),
+        (4, '   ', 1, 1);
+    INSERT INTO vault_matrix VALUES
+        ('alexia', 1, 1), ('alexia', 2, 1), ('luna', 1, 1), ('luna', 2, 0), ('retired', 1, 1);
+"""
+
+
+@pytest.fixture
+def attention_db(make_tool_db):
+    """On-disk database with the tables read by the attention scoring job."""
+    return make_tool_db(ATTENTION_TEST_SCHEMA).path
+
+
+@pytest.fixture
+def score_attention():
+    """Run database/scripts/score_caption_attention.py in-process."""
+    scripts_dir = str(Path(__file__).parent.parent / "database" / "scripts")
+    if scripts_dir not in sys.path:
+        sys.path.insert(0, scripts_dir)
+    from score_caption_attention import score_caption_attention
+
+    def run(db_path, **kwargs):
+        return score_caption_attention(db_path, workers=1, **kwargs)
+
+    return run
+
+
+def _attention_rows(db_path) -> dict[tuple[int, str], sqlite3.Row]:
+    conn = sqlite3.connect(db_path)
+    conn.row_factory = sqlite3.Row
+    try:
+        return {
+            (row["caption_id"], row["creator_id"]): row
+            for row in conn.execute("SELECT * FROM caption_attention_scores")
+        }
+    finally:
+        conn.close()
+
+
+class TestComputeAttentionScores:
+    """Tests for the stored attention values of a caption."""
+
+    @pytest.mark.unit
+    def test_matches_attention_analysis(self):
+        """Stored values are the analysis metrics plus composite score and tier."""
+        text = "OMG babe you need to see this 10 min video, unlock it now!"
+        scores = compute_attention_scores(text)
+        analysis = _analyze_attention(text)
+
+        for key in ("hook_score", "depth_score", "cta_score", "emotion_score"):
+            assert scores[key] == analysis["metrics"][key]
+        expected = round(
+            scores["hook_score"] * 0.35 + scores["depth_score"] * 0.25
+            + scores["cta_score"] * 0.25 + scores["emotion_score"] * 0.15, 2
+        )
+        assert scores["attention_score"] == expected
+        assert scores["quality_tier"] == _get_quality_tier(expected)
+        assert scores["word_count"] == analysis["text_stats"]["word_count"]
+        assert scores["analysis_version"] == "v1.0.0"
+
+
+class TestScoreCaptionAttention:
+    """Tests for the bulk attention scoring job."""
+
+    @pytest.mark.unit
+    def test_scores_eligible_pairs(self, attention_db, score_attention):
+        """Active captions fan out to active creators whose vault has the content type."""
+        result = score_attention(attention_db)
+
+        rows = _attention_rows(attention_db)
+        assert set(rows) == {(1, "alexia"), (1, "luna"), (2, "alexia")}
+        assert result == {"scored": 2, "written": 3, "deleted": 0}
+        expected = compute_attention_scores(
+            "OMG babe you need to see this 10 min video, unlock it now!"
+        )
+        assert rows[(1, "luna")]["attention_score"] == expected["attention_score"]
+        assert rows[(1, "luna")]["quality_tier"] == expected["quality_tier"]
+
+    @pytest.mark.unit
+    def test_unchanged_captions_are_skipped(self, attention_db, score_attention):
+        """A second run scores and writes nothing."""
+        score_attention(attention_db)
+        before = _attention_rows(attention_db)
+
+        assert score_attention(attention_db) == {"scored": 0, "written": 0, "deleted": 0}
+        after = _attention_rows(attention_db)
+        assert {k: dict(v) for k, v in after.items()} == {k: dict(v) for k, v in before.items()}
+
+    @pytest.mark.unit
+    def test_edits_rescore_and_stale_rows_are_deleted(self, attention_db, score_attention):
+        """Edited captions are rescored; deactivated captions and creators lose their rows."""
+        score_attention(attention_db)
+        conn = sqlite3.connect(attention_db)
+        conn.execute("UPDATE caption_bank SET caption_text = 'Tell me about your day babe' WHERE caption_id = 2")
+        conn.execute("UPDATE creators SET is_active = 0 WHERE creator_id = 'luna'")
+        conn.commit()
+        conn.close()
+
+        result = score_attention(attention_db)
+
+        assert result == {"scored": 1, "written": 1, "deleted": 1}
+        rows = _attention_rows(attention_db)
+        assert set(rows) == {(1, "alexia"), (2, "alexia")}
+        expected = compute_attention_scores("Tell me about your day babe")
+        assert rows[(2, "alexia")]["attention_score"] == expected["attention_score"]
+
+    @pytest.mark.unit
+    def test_version_bump_rescores_everything(self, attention_db, score_attention, monkeypatch):
+        """Changing ATTENTION_ANALYSIS_VERSION rescores every active caption."""
+        score_attention(attention_db)
+        monkeypatch.setattr("mcp.tools.caption.ATTENTION_ANALYSIS_VERSION", "v2.0.0")
+
+        result = score_attention(attention_db)
+
+        assert result["scored"] == 2
+        assert result["written"] == 3
+        assert {row["analysis_version"] for row in _attention_rows(attention_db).values()} == {"v2.0.0"}
+
+    @pytest.mark.unit
+    def test_sync_pairs_fans_out_unchanged_captions(self, attention_db, score_attention):
+        """New eligible pairs for unchanged captions are written with sync_pairs."""
+        score_attention(attention_db)
+        conn = sqlite3.connect(attention_db)
+        conn.execute("UPDATE vault_matrix SET has_content = 1 WHERE creator_id = 'luna' AND content_type_id = 2")
+        conn.commit()
+        conn.close()
+
+        assert score_attention(attention_db)["written"] == 0
+        result = score_attention(attention_db, sync_pairs=True)
+
+        assert result == {"scored": 0, "written": 1, "deleted": 0}
+        assert (2, "luna") in _attention_rows(attention_db)
+
+    @pytest.mark.unit
+    def test_interrupted_run_keeps_pairs_for_scored_chunks(
+        self, attention_db, score_attention, monkeypatch
+    ):
+        """Chunks committed before a failure already have their pair rows."""
+        import score_caption_attention as job
+
+        original = job.score_chunk
+        calls = []
+
+        def flaky(rows):
+            calls.append(rows)
+            if len(calls) == 2:
+                raise RuntimeError("worker died")
+            return original(rows)
+
+        monkeypatch.setattr(job, "score_chunk", flaky)
+        with pytest.raises(RuntimeError):
+            score_attention(attention_db, chunk_size=1)
+        assert set(_attention_rows(attention_db)) == {(1, "alexia"), (1, "luna")}
+
+        monkeypatch.setattr(job, "score_chunk", original)
+        result = score_attention(attention_db)
+
+        assert result == {"scored": 1, "written": 1, "deleted": 0}
+        assert set(_attention_rows(attention_db)) == {(1, "alexia"), (1, "luna"), (2, "alexia")}
+
+    @pytest.mark.unit
+    def test_environment_is_not_modified(self, attention_db, score_attention):
+        """The job reads the database it is given without repointing EROS_DB_PATH."""
+        before = os.environ.get("EROS_DB_PATH")
+        score_attention(attention_db)
+        assert os.environ.get("EROS_DB_PATH") == before
+
+
 # =============================================================================
 # execute_query TESTS
 # =============================================================================
@@ -683,6 +1239,120 @@ class TestExecuteQuery:
         assert "subquery" in result["error"].lower()
 
 
+PAGED_TEST_SCHEMA = "CREATE TABLE items (item_id INTEGER PRIMARY KEY, label TEXT);\n" + "".join(
+    f"INSERT INTO items (item_id, label) VALUES ({i}, 'item_{i}');\n" for i in range(1, 26)
+)
+
+
+class TestExecuteQueryPagination:
+    """Tests for execute_query pagination and columnar encoding."""
+
+    @pytest.fixture
+    def paged_db(self, make_tool_db):
+        """Patch execute_query onto a small on-disk database."""
+        return make_tool_db(PAGED_TEST_SCHEMA, "mcp.tools.query.get_db_connection")
+
+    @pytest.mark.unit
+    def test_offset_paging_walks_all_rows(self, paged_db):
+        """Offset pages chain through next_page_token until exhausted."""
+        seen = []
+        token = None
+        while True:
+            result = execute_query(
+                "SELECT item_id FROM items ORDER BY item_id", page_size=10, page_token=token
+            )
+            seen.extend(row["item_id"] for row in result["results"])
+            token = result["next_page_token"]
+            if not result["has_more"]:
+                break
+
+        assert seen == list(range(1, 26))
+        assert token is None
+
+    @pytest.mark.unit
+    def test_keyset_paging_resumes_after_last_key(self, paged_db):
+        """Keyset pages resume strictly after the last key of the previous page."""
+        first = execute_query(
+            "SELECT item_id, label FROM items WHERE item_id > ?",
+            params=[5], page_size=7, keyset_column="item_id",
+        )
+        second = execute_query(
+            "SELECT item_id, label FROM items WHERE item_id > ?",
+            params=[5], page_size=7, keyset_column="item_id",
+            page_token=first["next_page_token"],
+        )
+
+        assert [r["item_id"] for r in first["results"]] == list(range(6, 13))
+        assert [r["item_id"] for r in second["results"]] == list(range(13, 20))
+        assert second["has_more"] is True
+
+    @pytest.mark.unit
+    def test_page_token_bound_to_query(self, paged_db):
+        """A token issued for one query is rejected for another."""
+        first = execute_query("SELECT item_id FROM items ORDER BY item_id", page_size=5)
+        result = execute_query(
+            "SELECT label FROM items ORDER BY item_id", page_size=5,
+            page_token=first["next_page_token"],
+        )
+
+        assert "error" in result
+        assert "page_token" in result["error"]
+
+    @pytest.mark.unit
+    def test_malformed_page_token_rejected(self, paged_db):
+        """Garbage tokens return an error instead of raising."""
+        result = execute_query(
+            "SELECT item_id FROM items ORDER BY item_id", page_size=5, page_token="!!!"
+        )
+        assert "error" in result
+
+    @pytest.mark.unit
+    def test_offset_paging_requires_order_by(self, paged_db):
+        """Offset paging over an unordered query is rejected."""
+        result = execute_query("SELECT item_id FROM items", page_size=5)
+        assert "ORDER BY" in result["error"]
+
+        nested = execute_query(
+            "SELECT item_id FROM (SELECT item_id FROM items ORDER BY item_id)", page_size=5
+        )
+        assert "ORDER BY" in nested["error"]
+
+    @pytest.mark.unit
+    def test_keyset_column_must_be_identifier(self, paged_db):
+        """keyset_column cannot smuggle SQL."""
+        result = execute_query(
+            "SELECT item_id FROM items", page_size=5, keyset_column='item_id" OR 1=1'
+        )
+        assert "error" in result
+
+    @pytest.mark.unit
+    def test_keyset_column_must_be_in_results(self, paged_db):
+        """keyset_column must name a result column."""
+        result = execute_query(
+            "SELECT label FROM items", page_size=5, keyset_column="item_id"
+        )
+        assert "error" in result
+
+    @pytest.mark.unit
+    def test_columnar_format(self, paged_db):
+        """Columnar results carry column names once and rows as arrays."""
+        result = execute_query(
+            "SELECT item_id, label FROM items ORDER BY item_id LIMIT 3",
+            response_format="columnar",
+        )
+
+        assert result["columns"] == ["item_id", "label"]
+        assert result["rows"] == [[1, "item_1"], [2, "item_2"], [3, "item_3"]]
+        assert result["count"] == 3
+        assert "results" not in result
+
+    @pytest.mark.unit
+    def test_invalid_response_format(self, paged_db):
+        """Unknown response formats are rejected."""
+        result = execute_query("SELECT 1", response_format="xml")
+        assert "error" in result
+
+
 # =============================================================================
 # get_send_types TESTS
 # =============================================================================
@@ -745,6 +1415,66 @@ class TestGetSendTypeDetails:
         assert "not found" in result["error"].lower()
 
 
+SEND_TYPES_TEST_SCHEMA = """
+    CREATE TABLE send_types (
+        send_type_id INTEGER PRIMARY KEY, send_type_key TEXT, category TEXT,
+        display_name TEXT, page_type_restriction TEXT DEFAULT 'both',
+        requires_flyer INTEGER DEFAULT 0, sort_order INTEGER, is_active INTEGER DEFAULT 1
+    );
+    CREATE TABLE send_type_caption_requirements (
+        id INTEGER PRIMARY KEY AUTOINCREMENT, send_type_id INTEGER,
+        caption_type TEXT, priority INTEGER, notes TEXT
+    );
+    INSERT INTO send_types VALUES
+        (1, 'ppv_unlock', 'revenue', 'PPV Unlock', 'both', 0, 20, 1),
+        (2, 'renew_on_post', 'retention', 'Renew on Post', 'paid', 0, 10, 1),
+        (3, 'ppv_message', 'revenue', 'PPV Message', 'both', 0, 5, 0);
+    INSERT INTO send_type_caption_requirements (send_type_id, caption_type, priority, notes)
+    VALUES (1, 'ppv_unlock', 1, 'primary'), (1, 'bundle', 3, NULL);
+"""
+
+
+@pytest.fixture
+def send_types_db(make_tool_db):
+    """Patch send type tools onto an on-disk database with send type tables."""
+    return make_tool_db(
+        SEND_TYPES_TEST_SCHEMA,
+        "mcp.tools.send_types.get_db_connection",
+        context_targets=("mcp.tools.send_types.db_connection",),
+    )
+
+
+class TestSendTypeSnapshotTools:
+    """Tests for send type tools served from the shared snapshot."""
+
+    @pytest.mark.unit
+    def test_get_send_types_filters_snapshot(self, send_types_db):
+        """Active send types are filtered by page type and ordered by sort_order."""
+        result = get_send_types()
+        assert [t["send_type_key"] for t in result["send_types"]] == ["renew_on_post", "ppv_unlock"]
+
+        result = get_send_types(category="revenue", page_type="free")
+        assert result["count"] == 1
+        assert result["send_types"][0]["display_name"] == "PPV Unlock"
+
+    @pytest.mark.unit
+    def test_details_include_requirements_and_pick_up_changes(self, send_types_db):
+        """Details come from the snapshot and reflect committed table changes."""
+        result = get_send_type_details("ppv_unlock")
+        assert result["caption_requirements"] == [
+            {"caption_type": "ppv_unlock", "priority": 1, "notes": "primary"},
+            {"caption_type": "bundle", "priority": 3, "notes": None},
+        ]
+
+        conn = send_types_db()
+        conn.execute("UPDATE send_types SET display_name = 'Unlock' WHERE send_type_id = 1")
+        conn.commit()
+        conn.close()
+
+        assert get_send_type_details("ppv_unlock")["send_type"]["display_name"] == "Unlock"
+        assert "not found" in get_send_type_details("bundle")["error"]
+
+
 # =============================================================================
 # get_send_type_captions TESTS
 # =============================================================================
@@ -770,6 +1500,127 @@ class TestGetSendTypeCaptions:
         assert "Invalid send_type_key" in result["error"]
 
 
+# =============================================================================
+# Caption diversity TESTS
+# =============================================================================
+
+
+def _difflib_max_similarity(caption_text: str, scheduled: list[str]) -> tuple[float, Any]:
+    """Reference linear scan with difflib, as _check_diversity used to do."""
+    best, best_text = 0.0, None
+    for text in scheduled:
+        if not text:
+            continue
+        ratio = difflib.SequenceMatcher(None, caption_text.strip().lower(), text.strip().lower()).ratio()
+        if ratio > best:
+            best, best_text = ratio, text
+    return round(best, 4), best_text
+
+
+class TestDiversityEngine:
+    """Tests for the pruned caption diversity check."""
+
+    CAPTIONS = [
+        "Hey babe, just filmed something special for you tonight",
+        "hey babe just filmed something SPECIAL for you tonight!!",
+        "Gym day done, who wants to see the post workout pics?",
+        "Unlock my newest video before it disappears",
+        "",
+        "Only for my favorite fans: unlock now and see everything",
+        "hey babe, just filmed something special for you",
+    ]
+
+    @pytest.mark.unit
+    def test_matches_difflib_scan(self):
+        """Test max_similarity and most_similar_to match a full difflib scan."""
+        for i, caption in enumerate(self.CAPTIONS):
+            scheduled = self.CAPTIONS[:i] + self.CAPTIONS[i + 1:]
+            result = _check_diversity(caption, [{"caption_text": t} for t in scheduled], "creator")
+
+            assert (result["max_similarity"], result["most_similar_to"]) == _difflib_max_similarity(caption, scheduled)
+            assert result["comparisons_made"] == len(scheduled)
+
+    @pytest.mark.unit
+    def test_ties_resolve_to_earliest_caption(self):
+        """Test equally similar captions report the first scheduled one."""
+        engine = DiversityEngine([{"caption_text": "abc one"}, {"caption_text": "abc two"}])
+
+        assert engine.check("abc")["most_similar_to"] == "abc one"
+
+    @pytest.mark.unit
+    def test_check_schedule_compares_against_earlier_items(self):
+        """Test a batch check equals checking each item against its predecessors."""
+        results = DiversityEngine().check_schedule(self.CAPTIONS)
+
+        assert results[0]["comparisons_made"] == 0
+        for i, result in enumerate(results):
+            expected = _difflib_max_similarity(self.CAPTIONS[i], self.CAPTIONS[:i])
+            assert (result["max_similarity"], result["most_similar_to"]) == expected
+        assert results[1]["diversity_compliant"] is False
+
+    @pytest.mark.unit
+    def test_no_scheduled_captions(self):
+        """Test an empty engine reports full diversity."""
+        result = DiversityEngine().check("anything")
+
+        assert result["max_similarity"] == 0.0
+        assert result["diversity_compliant"] is True
+
+
+class TestValidateCaptionsBatch:
+    """Tests for validate_captions_batch tool."""
+
+    ITEMS = [
+        {"caption_text": "Guess what I just filmed for you babe, unlock it now before it's gone", "send_type_key": "ppv_unlock", "caption_id": 1},
+        {"caption_text": "Guess what I just filmed for you babe! Unlock it now before its gone", "send_type_key": "ppv_unlock", "caption_id": 2},
+        {"caption_text": "Morning run done, who wants the sweaty selfie?", "send_type_key": "bump_normal", "caption_id": 3},
+        {"caption_text": "AMAZING INCREDIBLE content, mind-blowing 8:42 min video \U0001F525\U0001F525", "send_type_key": "ppv_wall"},
+    ]
+
+    @staticmethod
+    def _strip_volatile(result: dict[str, Any]) -> dict[str, Any]:
+        return {k: v for k, v in result.items() if k not in ("validation_timestamp", "index", "caption_id")}
+
+    @pytest.mark.unit
+    def test_matches_sequential_single_validations(self):
+        """Test each item equals validate_caption_structure against its predecessors."""
+        scheduled = [{"caption_text": "Just posted a new set on my wall, go look"}]
+        result = validate_captions_batch("creator_1", self.ITEMS, scheduled_captions=scheduled)
+
+        for index, item in enumerate(self.ITEMS):
+            expected = validate_caption_structure(
+                "creator_1",
+                item["caption_text"],
+                item["send_type_key"],
+                scheduled_captions=scheduled + [{"caption_text": i["caption_text"]} for i in self.ITEMS[:index]],
+            )
+            assert self._strip_volatile(result["results"][index]) == self._strip_volatile(expected)
+            assert result["results"][index]["caption_id"] == item.get("caption_id")
+
+        assert result["summary"]["total"] == len(self.ITEMS)
+        assert result["schedule_diversity"]["most_similar_index"] == 1
+        assert result["schedule_diversity"]["similarity_rejections"] == 1
+
+    @pytest.mark.unit
+    def test_invalid_item_does_not_fail_batch(self):
+        """Test a bad item is reported per item and skipped for diversity."""
+        items = [{"caption_text": "   ", "send_type_key": "bump_normal"}, self.ITEMS[2]]
+        result = validate_captions_batch("creator_1", items)
+
+        assert result["results"][0]["error"] == "caption_text cannot be empty"
+        assert result["results"][1]["checks"]["diversity"]["skipped"] is True
+        assert result["summary"]["errors"] == 1
+
+    @pytest.mark.unit
+    def test_invalid_creator_and_size_limits(self):
+        """Test batch-level validation errors."""
+        assert "Invalid creator_id" in validate_captions_batch("invalid@creator!", self.ITEMS)["error"]
+        assert "non-empty list" in validate_captions_batch("creator_1", [])["error"]
+
+        too_many = [self.ITEMS[2]] * (MAX_BATCH_CAPTIONS + 1)
+        assert "exceeds maximum" in validate_captions_batch("creator_1", too_many)["error"]
+
+
 # =============================================================================
 # get_channels TESTS
 # =============================================================================
@@ -908,6 +1759,118 @@ class TestMCPProtocol:
         assert response is None
 
 
+# =============================================================================
+# RESPONSE FORMAT TESTS
+# =============================================================================
+
+
+class TestResponseFormat:
+    """Tests for columnar response format negotiation."""
+
+    @pytest.fixture(autouse=True)
+    def restore_default_format(self):
+        """Reset the session default format after each test."""
+        yield
+        set_default_response_format("objects")
+
+    @pytest.mark.unit
+    def test_columnarize_result_converts_uniform_row_lists(self):
+        """Uniform lists of dicts become columns + rows; other values pass through."""
+        result = columnarize_result({
+            "captions": [{"id": 1, "text": "a"}, {"id": 2, "text": "b"}],
+            "mixed": [{"id": 1}, {"other": 2}],
+            "count": 2,
+        })
+
+        assert result["captions"] == {"columns": ["id", "text"], "rows": [[1, "a"], [2, "b"]]}
+        assert result["mixed"] == [{"id": 1}, {"other": 2}]
+        assert result["count"] == 2
+
+    @pytest.mark.unit
+    def test_dump_tool_json_compact_round_trips(self):
+        """Compact JSON has no indentation and decodes to the same value."""
+        payload = {"columns": ["a"], "rows": [[1], [2]], "when": datetime(2025, 1, 6)}
+
+        text = dump_tool_json(payload, compact=True)
+
+        assert "\n" not in text
+        assert json.loads(text)["rows"] == [[1], [2]]
+
+    @pytest.mark.unit
+    def test_all_tools_advertise_response_format(self):
+        """Every registered tool schema exposes the response_format argument."""
+        for tool_info in TOOL_REGISTRY.values():
+            assert "response_format" in tool_info["schema"]["properties"]
+
+    @pytest.mark.unit
+    def test_dispatch_strips_argument_for_non_native_tools(self):
+        """Tools without a response_format parameter get columnar post-encoding."""
+        calls = {}
+
+        def fake_tool(creator_id):
+            calls["creator_id"] = creator_id
+            return {"items": [{"a": 1}, {"a": 2}]}
+
+        TOOL_REGISTRY["_fake_tool"] = {"function": fake_tool, "native_response_format": False}
+        try:
+            result = dispatch_tool(
+                "_fake_tool", {"creator_id": "x", "response_format": "columnar"}
+            )
+        finally:
+            del TOOL_REGISTRY["_fake_tool"]
+
+        assert calls == {"creator_id": "x"}
+        assert result["items"] == {"columns": ["a"], "rows": [[1], [2]]}
+
+    @pytest.mark.unit
+    def test_dispatch_passes_format_to_native_tools(self):
+        """Tools declaring response_format receive the negotiated format."""
+        assert TOOL_REGISTRY["get_top_captions"]["native_response_format"] is True
+        assert TOOL_REGISTRY["execute_query"]["native_response_format"] is True
+
+    @pytest.mark.unit
+    def test_initialize_negotiates_session_default(self):
+        """initialize can set the default response format for later calls."""
+        request = {
+            "jsonrpc": "2.0",
+            "id": 1,
+            "method": "initialize",
+            "params": {"capabilities": {"experimental": {"responseFormat": "columnar"}}},
+        }
+
+        response = handle_request(request)
+
+        experimental = response["result"]["capabilities"]["experimental"]
+        assert experimental["responseFormat"] == "columnar"
+        assert "columnar" in experimental["responseFormats"]
+        assert get_default_response_format() == "columnar"
+
+    @pytest.mark.unit
+    def test_tools_call_rejects_unknown_format(self):
+        """An unsupported response_format is an invalid-params error."""
+        response = handle_tools_call(
+            request_id=1,
+            params={"name": "execute_query", "arguments": {"query": "SELECT 1", "response_format": "xml"}},
+        )
+
+        assert response["error"]["code"] == -32602
+
+    @pytest.mark.unit
+    def test_tools_call_columnar_is_compact(self):
+        """Columnar tools/call responses are serialized without indentation."""
+        response = handle_tools_call(
+            request_id=1,
+            params={
+                "name": "execute_query",
+                "arguments": {"query": "SELECT 1 AS one", "response_format": "columnar"},
+            },
+        )
+
+        text = response["result"]["content"][0]["text"]
+        assert json.loads(text) == {"columns": ["one"], "rows": [[1]], "count": 1}
+        assert "\n" not in text
+
+
 # =============================================================================
 # EDGE CASES AND BOUNDARY TESTS
 # =============================================================================
@@ -10,21 +10,83 @@ Features:
 - Structured request/response logging
 - Request tracing with unique IDs
 - Rate limiting (token bucket algorithm)
+- Response format negotiation (row objects or compact columnar encoding)
 
 Version: 3.0.0
 """
 
-import json
+import inspect
 import logging
 import time
 from functools import wraps
-from typing import Any, Callable
+from typing import Any, Callable, Optional
+
+from mcp.utils.helpers import RESPONSE_FORMATS, columnarize_result, dump_tool_json
 
 logger = logging.getLogger("eros_db_server.tools")
 
 # Global tool registry - maps tool name to tool metadata and function
 TOOL_REGISTRY: dict[str, dict[str, Any]] = {}
 
+# Reserved argument accepted by every tool to select the response encoding
+RESPONSE_FORMAT_ARG = "response_format"
+
+RESPONSE_FORMAT_SCHEMA: dict[str, Any] = {
+    "type": "string",
+    "enum": list(RESPONSE_FORMATS),
+    "description": "objects (default): rows as dicts; columnar: columns + row arrays with compact JSON"
+}
+
+# Session default, negotiated during initialize
+_default_response_format = "objects"
+
+
+def set_default_response_format(response_format: str) -> None:
+    """
+    Set the response format used when a call does not specify one.
+
+    Args:
+        response_format: One of RESPONSE_FORMATS.
+
+    Raises:
+        ValueError: If the format is not supported.
+    """
+    global _default_response_format
+    if response_format not in RESPONSE_FORMATS:
+        raise ValueError(
+            f"Invalid response_format: {response_format}. Must be one of {list(RESPONSE_FORMATS)}"
+        )
+    _default_response_format = response_format
+
+
+def get_default_response_format() -> str:
+    """Get the session default response format."""
+    return _default_response_format
+
+
+def resolve_response_format(arguments: dict[str, Any]) -> str:
+    """
+    Determine the response format for a tool call.
+
+    Args:
+        arguments: The tool call arguments.
+
+    Returns:
+        The per-call response_format if given, otherwise the session default.
+    """
+    return arguments.get(RESPONSE_FORMAT_ARG) or _default_response_format
+
+
+def _with_response_format_schema(schema: dict[str, Any]) -> dict[str, Any]:
+    """Return a copy of a tool schema that advertises the response_format argument."""
+    properties = schema.get("properties", {})
+    if RESPONSE_FORMAT_ARG in properties:
+        return schema
+    return {
+        **schema,
+        "properties": {**properties, RESPONSE_FORMAT_ARG: RESPONSE_FORMAT_SCHEMA}
+    }
+
 
 def mcp_tool(
     name: str,
@@ -195,8 +257,10 @@ def mcp_tool(
         TOOL_REGISTRY[name] = {
             "function": wrapper,
             "description": description,
-            "schema": schema,
-            "name": name
+            "schema": _with_response_format_schema(schema),
+            "name": name,
+            # Tools taking response_format encode rows straight from cursor tuples
+            "native_response_format": RESPONSE_FORMAT_ARG in inspect.signature(func).parameters
         }
 
         logger.debug(f"Registered MCP tool: {name}")
@@ -222,13 +286,23 @@ def get_all_tools() -> list[dict[str, Any]]:
     return tools
 
 
-def dispatch_tool(tool_name: str, arguments: dict[str, Any]) -> dict[str, Any]:
+def dispatch_tool(
+    tool_name: str,
+    arguments: dict[str, Any],
+    response_format: Optional[str] = None
+) -> dict[str, Any]:
     """
     Dispatch a tool call to the registered handler.
 
+    Tools that declare a response_format parameter receive it directly.
+    For all other tools the argument is stripped and, for the columnar
+    format, row lists in the result are re-encoded after the call.
+
     Args:
         tool_name: The name of the tool to call.
         arguments: The arguments to pass to the tool function.
+        response_format: Optional response format. Defaults to the call's
+            response_format argument, then the session default.
 
     Returns:
         The result from the tool function.
@@ -236,20 +310,38 @@ def dispatch_tool(tool_name: str, arguments: dict[str, Any]) -> dict[str, Any]:
     Raises:
         KeyError: If the tool is not registered.
         TypeError: If the arguments don't match the function signature.
+        ValueError: If the response format is not supported.
     """
     if tool_name not in TOOL_REGISTRY:
         raise KeyError(f"Unknown tool: {tool_name}")
 
-    handler = TOOL_REGISTRY[tool_name]["function"]
-    return handler(**arguments)
+    if response_format is None:
+        response_format = resolve_response_format(arguments)
+    if response_format not in RESPONSE_FORMATS:
+        raise ValueError(
+            f"Invalid response_format: {response_format}. Must be one of {list(RESPONSE_FORMATS)}"
+        )
+
+    tool_info = TOOL_REGISTRY[tool_name]
+    handler = tool_info["function"]
+    call_arguments = {k: v for k, v in arguments.items() if k != RESPONSE_FORMAT_ARG}
+
+    if tool_info.get("native_response_format"):
+        return handler(**call_arguments, response_format=response_format)
+
+    result = handler(**call_arguments)
+    if response_format == "columnar":
+        return columnarize_result(result)
+    return result
 
 
-def format_tool_result(result: Any) -> dict[str, Any]:
+def format_tool_result(result: Any, compact: bool = False) -> dict[str, Any]:
     """
     Format a tool result for the MCP response.
 
     Args:
         result: The result from a tool function.
+        compact: Serialize without indentation (used for columnar responses).
 
     Returns:
         Formatted result with content array containing text.
@@ -258,7 +350,7 @@ def format_tool_result(result: Any) -> dict[str, Any]:
         "content": [
             {
                 "type": "text",
-                "text": json.dumps(result, indent=2, default=str)
+                "text": dump_tool_json(result, compact=compact)
             }
         ]
     }
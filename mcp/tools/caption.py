@@ -9,11 +9,13 @@ Includes:
 - get_content_type_earnings_ranking: Content types ranked by total earnings (PPV-first selection)
 - get_top_captions_by_earnings: Top captions for a content type ranked by earnings
 - validate_caption_structure: Caption validation with anti-patterization checks
+- validate_captions_batch: Validation of a whole schedule's captions in one call
 
 Version: 3.0.0
 """
 
 import difflib
+import functools
 import logging
 import re
 import sqlite3
@@ -29,7 +31,13 @@ except ImportError:
 
 from mcp.connection import get_db_connection
 from mcp.tools.base import mcp_tool
-from mcp.utils.helpers import rows_to_list, resolve_creator_id
+from mcp.utils.helpers import (
+    cursor_columns,
+    encode_rows,
+    get_send_type_snapshot,
+    resolve_creator_id,
+    rows_to_list,
+)
 from mcp.utils.security import validate_creator_id, validate_key_input, validate_string_length
 
 logger = logging.getLogger("eros_db_server")
@@ -75,7 +83,8 @@ def get_top_captions(
     content_type: Optional[str] = None,
     min_performance: int = 3,
     limit: int = 20,
-    send_type_key: Optional[str] = None
+    send_type_key: Optional[str] = None,
+    response_format: str = "objects"
 ) -> dict[str, Any]:
     """
     Get top-performing captions for a creator with freshness scoring.
@@ -94,6 +103,7 @@ def get_top_captions(
             3=STANDARD, 4=UNPROVEN). Default 3 includes tiers 1-3.
         limit: Maximum number of captions to return (default 20).
         send_type_key: Optional send type to filter by compatible caption types.
+        response_format: "objects" (default) or "columnar" encoding for captions.
 
     Returns:
         Dictionary containing:
@@ -123,14 +133,9 @@ def get_top_captions(
         # If send_type_key is provided, validate it exists
         send_type_id = None
         if send_type_key is not None:
-            cursor = conn.execute(
-                "SELECT send_type_id FROM send_types WHERE send_type_key = ?",
-                (send_type_key,)
-            )
-            row = cursor.fetchone()
-            if not row:
+            send_type_id = get_send_type_snapshot(conn).send_type_id(send_type_key)
+            if send_type_id is None:
                 return {"error": f"Send type not found: {send_type_key}"}
-            send_type_id = row["send_type_id"]
 
         # Build query based on whether send_type_key is provided
         # CRITICAL: vault_matrix INNER JOIN filters to only allowed content types
@@ -271,7 +276,8 @@ def get_top_captions(
         params.append(limit)
 
         cursor = conn.execute(query, params)
-        captions = rows_to_list(cursor.fetchall())
+        rows = cursor.fetchall()
+        captions = encode_rows(rows, cursor_columns(cursor), response_format)
 
         # Get AVOID tier filtering metadata for audit trail
         avoid_cursor = conn.execute("""
@@ -284,7 +290,7 @@ def get_top_captions(
 
         result: dict[str, Any] = {
             "captions": captions,
-            "count": len(captions),
+            "count": len(rows),
             "filters_applied": {
                 "vault_compliance": True,
                 "avoid_tier_exclusion": True,
@@ -334,7 +340,8 @@ def get_send_type_captions(
     send_type_key: str,
     min_freshness: float = 30.0,
     min_performance: int = 3,
-    limit: int = 10
+    limit: int = 10,
+    response_format: str = "objects"
 ) -> dict[str, Any]:
     """
     Get captions compatible with a specific send type for a creator.
@@ -352,6 +359,7 @@ def get_send_type_captions(
         min_performance: Maximum performance_tier to include (1=ELITE, 2=PROVEN,
             3=STANDARD, 4=UNPROVEN). Default 3 includes tiers 1-3.
         limit: Maximum number of captions to return (default 10).
+        response_format: "objects" (default) or "columnar" encoding for captions.
 
     Returns:
         Dictionary containing:
@@ -378,14 +386,9 @@ def get_send_type_captions(
             return {"error": f"Creator not found: {creator_id}"}
 
         # Validate send_type_key exists
-        cursor = conn.execute(
-            "SELECT send_type_id FROM send_types WHERE send_type_key = ?",
-            (send_type_key,)
-        )
-        row = cursor.fetchone()
-        if not row:
+        send_type_id = get_send_type_snapshot(conn).send_type_id(send_type_key)
+        if send_type_id is None:
             return {"error": f"Send type not found: {send_type_key}"}
-        send_type_id = row["send_type_id"]
 
         # Query captions joined with send_type_caption_requirements
         # CRITICAL: vault_matrix INNER JOIN filters to only allowed content types
@@ -466,7 +469,8 @@ def get_send_type_captions(
         ]
 
         cursor = conn.execute(query, params)
-        captions = rows_to_list(cursor.fetchall())
+        rows = cursor.fetchall()
+        captions = encode_rows(rows, cursor_columns(cursor), response_format)
 
         # Get AVOID tier filtering metadata for audit trail
         avoid_cursor = conn.execute("""
@@ -479,7 +483,7 @@ def get_send_type_captions(
 
         return {
             "captions": captions,
-            "count": len(captions),
+            "count": len(rows),
             "send_type_key": send_type_key,
             "filters_applied": {
                 "vault_compliance": True,
@@ -686,7 +690,8 @@ def get_top_captions_by_earnings(
     exclude_caption_ids: Optional[list[int]] = None,
     limit: int = 5,
     min_freshness: float = 30.0,
-    min_performance: int = 3
+    min_performance: int = 3,
+    response_format: str = "objects"
 ) -> dict[str, Any]:
     """
     Get top-performing captions for a specific content type ranked by total earnings.
@@ -712,6 +717,7 @@ def get_top_captions_by_earnings(
         min_freshness: Minimum freshness score threshold (default 30.0).
         min_performance: Maximum performance_tier to include (1=ELITE, 2=PROVEN,
             3=STANDARD, 4=UNPROVEN). Default 3 includes tiers 1-3.
+        response_format: "objects" (default) or "columnar" encoding for captions.
 
     Returns:
         Dictionary containing:
@@ -770,14 +776,9 @@ def get_top_captions_by_earnings(
         # If send_type_key is provided, validate it exists
         send_type_id = None
         if send_type_key is not None:
-            cursor = conn.execute(
-                "SELECT send_type_id FROM send_types WHERE send_type_key = ?",
-                (send_type_key,)
-            )
-            row = cursor.fetchone()
-            if not row:
+            send_type_id = get_send_type_snapshot(conn).send_type_id(send_type_key)
+            if send_type_id is None:
                 return {"error": f"Send type not found: {send_type_key}"}
-            send_type_id = row["send_type_id"]
 
         # Build the base query
         # CRITICAL: vault_matrix INNER JOIN filters to only allowed content types
@@ -898,7 +899,8 @@ def get_top_captions_by_earnings(
         params.append(limit)
 
         cursor = conn.execute(query, params)
-        captions = rows_to_list(cursor.fetchall())
+        rows = cursor.fetchall()
+        captions = encode_rows(rows, cursor_columns(cursor), response_format)
 
         # Get AVOID tier filtering metadata for audit trail
         avoid_cursor = conn.execute("""
@@ -911,7 +913,7 @@ def get_top_captions_by_earnings(
 
         result: dict[str, Any] = {
             "captions": captions,
-            "count": len(captions),
+            "count": len(rows),
             "content_type": content_type,
             "creator_id": resolved_creator_id,
             "selection_method": "earnings_ranked_llm_curated",
@@ -946,7 +948,9 @@ MAX_AI_PATTERNS_BEFORE_WARNING = 3
 MAX_CAPTION_LENGTH = 5000
 MAX_SCHEDULED_CAPTIONS = 100
 MAX_SCHEDULED_CAPTION_LENGTH = 5000
+MAX_BATCH_CAPTIONS = 100
 PPV_MISSING_ELEMENT_PENALTY = 6.25
+PPV_SEND_TYPES = frozenset({"ppv_unlock", "ppv_wall", "bundle", "flash_bundle"})
 
 # Optimal character length ranges by send_type_key (from implementation plan)
 OPTIMAL_LENGTH_RANGES: dict[str, dict[str, tuple[int, int]]] = {
@@ -981,6 +985,92 @@ DEFAULT_LENGTH_RANGE: dict[str, tuple[int, int]] = {
 }
 
 
+# Validation patterns, compiled once at import and shared by
+# validate_caption_structure and validate_captions_batch
+_EMOJI_FALLBACK_PATTERN = re.compile(
+    "["
+    "\U0001F600-\U0001F64F"  # emoticons
+    "\U0001F300-\U0001F5FF"  # symbols & pictographs
+    "\U0001F680-\U0001F6FF"  # transport & map
+    "\U0001F1E0-\U0001F1FF"  # flags
+    "\U00002702-\U000027B0"
+    "\U000024C2-\U0001F251"
+    "\U0001F900-\U0001F9FF"  # supplemental symbols
+    "\U0001FA00-\U0001FA6F"  # chess symbols
+    "\U0001FA70-\U0001FAFF"  # symbols & pictographs extended-A
+    "]+",
+    flags=re.UNICODE
+)
+
+# PPV four-element patterns: element -> [(pattern, compiled)], checked in order
+_PPV_ELEMENT_PATTERNS: dict[str, list[tuple[str, re.Pattern]]] = {
+    element: [(pattern, re.compile(pattern)) for pattern in patterns]
+    for element, patterns in {
+        # 1. Clickbait opener - Questions, exclamations, "what if", "imagine", etc.
+        "clickbait_opener": [
+            r"^[!?]",  # Starts with exclamation/question
+            r"^(omg|oh my|wow|guess what|what if|imagine|pov|breaking)",
+            r"^.{0,30}[!?]",  # Short opener with punctuation
+            r"(wanna|want to|ready to|can you|would you|do you|did you)",
+            r"(secret|exclusive|private|special|just for|only for)",
+            r"(never before|first time|finally|just dropped)",
+        ],
+        # 2. Make special - Personal connection, exclusivity, intimacy
+        "make_special": [
+            r"(just for you|only you|you're the|you are the)",
+            r"(my favorite|i love|i want you|i need you)",
+            r"(personal|intimate|private|exclusive|vip)",
+            r"(between us|our secret|just us|only us)",
+            r"(specially|especially|particularly) for",
+            r"(miss you|thinking of you|been waiting)",
+        ],
+        # 3. Value proposition - What they get, duration, quality descriptors
+        "value_proposition": [
+            r"(\d+\s*(min|minute|sec|second|hour|vid|video|pic|photo|image))",
+            r"(full (video|length|clip)|hd|4k|uncensored|uncut)",
+            r"(you (get|see|watch|receive)|includes|featuring|with)",
+            r"(never (seen|shown|posted)|exclusive (content|video|clip))",
+            r"(orgasm|climax|cum|explicit|xxx|x-rated)",
+            r"(shower|bath|bed|outdoor|public|pov)",
+        ],
+        # 4. Call to action - Unlock, purchase, tip instructions
+        "call_to_action": [
+            r"(unlock|tip|purchase|buy|get it|grab it)",
+            r"(send|dm|message) (me|to unlock)",
+            r"(click|tap|press) (to|and|below)",
+            r"(available now|get yours|claim|access)",
+            r"(don't miss|limited time|hurry|act now|before)",
+            r"\$\d+",  # Price mention
+        ],
+    }.items()
+}
+
+# Anti-patterization patterns
+_ALERT_EMOJI_CHARS = ("\u26a0", "\u2757", "\u2755", "\u203c", "\u2049",
+                      "\U0001F6A8", "\U0001F514", "\U0001F4E2", "\U0001F4E3")
+_CAPS_WORD_PATTERN = re.compile(r'\b[A-Z]{5,}\b')
+_SUPERLATIVE_CAPS = frozenset({
+    "AMAZING", "INCREDIBLE", "EXCLUSIVE", "INSANE", "HOTTEST",
+    "SEXIEST", "NAUGHTIEST", "WILDEST", "CRAZIEST", "INTENSE",
+    "EXPLOSIVE", "ULTIMATE", "SPECIAL", "LIMITED", "PRIVATE"
+})
+_CLIMAX_TERM_PATTERNS: list[tuple[str, re.Pattern]] = [
+    (term, re.compile(term)) for term in [
+        r"mind.?blow", r"earth.?shatter", r"jaw.?drop", r"breath.?tak",
+        r"game.?chang", r"life.?chang", r"explosive", r"insane",
+        r"absolutely (wild|crazy|insane|incredible)", r"literally (the best|dying)"
+    ]
+]
+_DURATION_PATTERN = re.compile(r'(\d+):(\d{2})\s*(min|minute|sec)')
+# Non-greedy quantifiers with length limits to prevent ReDoS
+_ENUMERATION_PATTERN = re.compile(r'(1[\.\)]\s*.{1,100}?\n?\s*2[\.\)]\s*.{1,100}?)')
+_EMOJI_SEQUENCE_PATTERN = re.compile(
+    r'(\U0001F525.*\U0001F351.*\U0001F346)|'  # fire, peach, eggplant
+    r'(\U0001F351.*\U0001F525.*\U0001F346)|'  # peach, fire, eggplant
+    r'(\U0001F525{2,})|(\U0001F351{2,})|(\U0001F346{2,})'  # repeated same emoji
+)
+
+
 # Emoji color classifications for spam detection
 EMOJI_COLOR_GROUPS: dict[str, list[str]] = {
     "yellow_faces": [
@@ -1015,28 +1105,15 @@ def _extract_emojis(text: str) -> list[str]:
     """
     if not EMOJI_AVAILABLE:
         # Fallback regex for common emoji ranges
-        emoji_pattern = re.compile(
-            "["
-            "\U0001F600-\U0001F64F"  # emoticons
-            "\U0001F300-\U0001F5FF"  # symbols & pictographs
-            "\U0001F680-\U0001F6FF"  # transport & map
-            "\U0001F1E0-\U0001F1FF"  # flags
-            "\U00002702-\U000027B0"
-            "\U000024C2-\U0001F251"
-            "\U0001F900-\U0001F9FF"  # supplemental symbols
-            "\U0001FA00-\U0001FA6F"  # chess symbols
-            "\U0001FA70-\U0001FAFF"  # symbols & pictographs extended-A
-            "]+",
-            flags=re.UNICODE
-        )
-        return emoji_pattern.findall(text)
+        return _EMOJI_FALLBACK_PATTERN.findall(text)
 
     return [char for char in text if emoji.is_emoji(char)]
 
 
+@functools.lru_cache(maxsize=2048)
 def _get_emoji_color_group(emoji_char: str) -> Optional[str]:
     """
-    Get the color group for an emoji character.
+    Get the color group for an emoji character (memoized per character).
 
     Args:
         emoji_char: Single emoji character.
@@ -1165,73 +1242,14 @@ def _check_ppv_structure(caption_text: str, creator_id: str) -> dict[str, Any]:
     }
     element_details: dict[str, dict[str, Any]] = {}
 
-    # 1. Clickbait opener - Questions, exclamations, "what if", "imagine", etc.
-    opener_patterns = [
-        r"^[!?]",  # Starts with exclamation/question
-        r"^(omg|oh my|wow|guess what|what if|imagine|pov|breaking)",
-        r"^.{0,30}[!?]",  # Short opener with punctuation
-        r"(wanna|want to|ready to|can you|would you|do you|did you)",
-        r"(secret|exclusive|private|special|just for|only for)",
-        r"(never before|first time|finally|just dropped)",
-    ]
-    for pattern in opener_patterns:
-        if re.search(pattern, text_lower):
-            elements["clickbait_opener"] = True
-            element_details["clickbait_opener"] = {"detected": True, "pattern": pattern}
-            break
-    if not elements["clickbait_opener"]:
-        element_details["clickbait_opener"] = {"detected": False}
-
-    # 2. Make special - Personal connection, exclusivity, intimacy
-    special_patterns = [
-        r"(just for you|only you|you're the|you are the)",
-        r"(my favorite|i love|i want you|i need you)",
-        r"(personal|intimate|private|exclusive|vip)",
-        r"(between us|our secret|just us|only us)",
-        r"(specially|especially|particularly) for",
-        r"(miss you|thinking of you|been waiting)",
-    ]
-    for pattern in special_patterns:
-        if re.search(pattern, text_lower):
-            elements["make_special"] = True
-            element_details["make_special"] = {"detected": True, "pattern": pattern}
-            break
-    if not elements["make_special"]:
-        element_details["make_special"] = {"detected": False}
-
-    # 3. Value proposition - What they get, duration, quality descriptors
-    value_patterns = [
-        r"(\d+\s*(min|minute|sec|second|hour|vid|video|pic|photo|image))",
-        r"(full (video|length|clip)|hd|4k|uncensored|uncut)",
-        r"(you (get|see|watch|receive)|includes|featuring|with)",
-        r"(never (seen|shown|posted)|exclusive (content|video|clip))",
-        r"(orgasm|climax|cum|explicit|xxx|x-rated)",
-        r"(shower|bath|bed|outdoor|public|pov)",
-    ]
-    for pattern in value_patterns:
-        if re.search(pattern, text_lower):
-            elements["value_proposition"] = True
-            element_details["value_proposition"] = {"detected": True, "pattern": pattern}
-            break
-    if not elements["value_proposition"]:
-        element_details["value_proposition"] = {"detected": False}
-
-    # 4. Call to action - Unlock, purchase, tip instructions
-    cta_patterns = [
-        r"(unlock|tip|purchase|buy|get it|grab it)",
-        r"(send|dm|message) (me|to unlock)",
-        r"(click|tap|press) (to|and|below)",
-        r"(available now|get yours|claim|access)",
-        r"(don't miss|limited time|hurry|act now|before)",
-        r"\$\d+",  # Price mention
-    ]
-    for pattern in cta_patterns:
-        if re.search(pattern, text_lower):
-            elements["call_to_action"] = True
-            element_details["call_to_action"] = {"detected": True, "pattern": pattern}
-            break
-    if not elements["call_to_action"]:
-        element_details["call_to_action"] = {"detected": False}
+    for element, patterns in _PPV_ELEMENT_PATTERNS.items():
+        for pattern, compiled in patterns:
+            if compiled.search(text_lower):
+                elements[element] = True
+                element_details[element] = {"detected": True, "pattern": pattern}
+                break
+        if not elements[element]:
+            element_details[element] = {"detected": False}
 
     # Calculate results
     elements_present = sum(elements.values())
@@ -1313,6 +1331,158 @@ def _check_length_optimization(caption_text: str, send_type_key: str) -> dict[st
     }
 
 
+def _char_position_masks(text: str) -> dict[str, int]:
+    """Map each character of text to a bitmask of the positions it occurs at."""
+    masks: dict[str, int] = {}
+    for position, char in enumerate(text):
+        masks[char] = masks.get(char, 0) | (1 << position)
+    return masks
+
+
+def _lcs_length(text: str, other_masks: dict[str, int], other_length: int) -> int:
+    """
+    Length of the longest common subsequence of text and another string.
+
+    Bit-parallel LCS (Hyyro 2004): one pass over text with big-int bit
+    operations over the other string's position masks.
+    """
+    full = (1 << other_length) - 1
+    row = full
+    for char in text:
+        matches = row & other_masks.get(char, 0)
+        row = ((row + matches) | (row - matches)) & full
+    return other_length - bin(row).count("1")
+
+
+class DiversityEngine:
+    """
+    Similarity index over scheduled captions for diversity checks.
+
+    For each scheduled caption, caches the cleaned text, its character
+    position masks and a SequenceMatcher whose second sequence (and b2j
+    index) is built once. SequenceMatcher.ratio() is 2*M/T where the M
+    matched characters form a common subsequence, so 2*LCS/T is an upper
+    bound on it that costs a fraction of the ratio itself. A check ranks
+    scheduled captions by that bound and runs the exact ratio only until no
+    remaining bound can beat the best ratio found, so results are identical
+    to a full pairwise difflib scan.
+    """
+
+    def __init__(self, scheduled_captions: Optional[list[dict[str, Any]]] = None):
+        self._texts: list[str] = []
+        self._cleaned: list[str] = []
+        self._masks: list[dict[str, int]] = []
+        self._matchers: list[Optional[difflib.SequenceMatcher]] = []
+        self._comparisons = 0
+        for scheduled in scheduled_captions or []:
+            self.add(scheduled.get("caption_text", ""))
+
+    @property
+    def size(self) -> int:
+        """Number of scheduled captions added (including empty ones)."""
+        return self._comparisons
+
+    def add(self, caption_text: str) -> None:
+        """Add a scheduled caption to the index."""
+        self._comparisons += 1
+        if not caption_text:
+            return
+        cleaned = caption_text.strip().lower()
+        self._texts.append(caption_text)
+        self._cleaned.append(cleaned)
+        self._masks.append(_char_position_masks(cleaned))
+        self._matchers.append(None)
+
+    def _ratio(self, index: int, cleaned: str) -> float:
+        """Exact SequenceMatcher ratio of cleaned text against scheduled caption index."""
+        matcher = self._matchers[index]
+        if matcher is None:
+            matcher = difflib.SequenceMatcher(None, "", self._cleaned[index])
+            self._matchers[index] = matcher
+        matcher.set_seq1(cleaned)
+        return matcher.ratio()
+
+    def check(self, caption_text: str) -> dict[str, Any]:
+        """
+        Check a caption against every scheduled caption in the index.
+
+        Args:
+            caption_text: The caption text to check.
+
+        Returns:
+            Same dictionary as _check_diversity.
+        """
+        if not self._comparisons:
+            return {
+                "max_similarity": 0.0,
+                "most_similar_to": None,
+                "diversity_compliant": True,
+                "similarity_warning": False,
+                "comparisons_made": 0
+            }
+
+        cleaned = caption_text.strip().lower()
+        bounds = []
+        for i, other in enumerate(self._cleaned):
+            total = len(cleaned) + len(other)
+            if not total:
+                bounds.append((-1.0, i))
+                continue
+            common = _lcs_length(cleaned, self._masks[i], len(other))
+            bounds.append((-2.0 * common / total, i))
+        bounds.sort()
+
+        # Ties resolve to the earliest scheduled caption, as in a linear scan
+        max_similarity = 0.0
+        best_index: Optional[int] = None
+        for negative_bound, i in bounds:
+            bound = -negative_bound
+            if bound < max_similarity or (bound == max_similarity and (best_index is None or i > best_index)):
+                break
+            similarity = self._ratio(i, cleaned)
+            if similarity > max_similarity or (
+                similarity == max_similarity and best_index is not None and i < best_index
+            ):
+                max_similarity = similarity
+                best_index = i
+
+        most_similar_to: Optional[str] = None
+        if best_index is not None:
+            scheduled_text = self._texts[best_index]
+            most_similar_to = scheduled_text[:100] + "..." if len(scheduled_text) > 100 else scheduled_text
+
+        # Thresholds: >0.60 = rejection, >0.45 = warning
+        diversity_compliant = max_similarity <= SIMILARITY_REJECTION_THRESHOLD
+        similarity_warning = SIMILARITY_WARNING_THRESHOLD < max_similarity <= SIMILARITY_REJECTION_THRESHOLD
+
+        return {
+            "max_similarity": round(max_similarity, 4),
+            "most_similar_to": most_similar_to,
+            "diversity_compliant": diversity_compliant,
+            "similarity_warning": similarity_warning,
+            "comparisons_made": self._comparisons
+        }
+
+    def check_schedule(self, captions: list[str]) -> list[dict[str, Any]]:
+        """
+        Check a whole schedule in order.
+
+        Each caption is checked against the indexed captions plus every
+        caption before it in the list, then added to the index.
+
+        Args:
+            captions: Caption texts in schedule order.
+
+        Returns:
+            One _check_diversity result per caption.
+        """
+        results = []
+        for caption_text in captions:
+            results.append(self.check(caption_text))
+            self.add(caption_text)
+        return results
+
+
 def _check_diversity(
     caption_text: str,
     scheduled_captions: list[dict[str, Any]],
@@ -1321,7 +1491,8 @@ def _check_diversity(
     """
     Check caption diversity against already-scheduled items.
 
-    Uses difflib.SequenceMatcher for similarity calculation to detect
+    Uses difflib.SequenceMatcher similarity (through DiversityEngine,
+    which skips comparisons that cannot raise the maximum) to detect
     repetitive or near-duplicate captions.
 
     Args:
@@ -1337,48 +1508,7 @@ def _check_diversity(
             - similarity_warning: Boolean if close to rejection threshold
             - comparisons_made: Number of comparisons performed
     """
-    if not scheduled_captions:
-        return {
-            "max_similarity": 0.0,
-            "most_similar_to": None,
-            "diversity_compliant": True,
-            "similarity_warning": False,
-            "comparisons_made": 0
-        }
-
-    max_similarity = 0.0
-    most_similar_to: Optional[str] = None
-    caption_text_clean = caption_text.strip().lower()
-
-    for scheduled in scheduled_captions:
-        scheduled_text = scheduled.get("caption_text", "")
-        if not scheduled_text:
-            continue
-
-        scheduled_text_clean = scheduled_text.strip().lower()
-
-        # Calculate similarity using SequenceMatcher
-        similarity = difflib.SequenceMatcher(
-            None,
-            caption_text_clean,
-            scheduled_text_clean
-        ).ratio()
-
-        if similarity > max_similarity:
-            max_similarity = similarity
-            most_similar_to = scheduled_text[:100] + "..." if len(scheduled_text) > 100 else scheduled_text
-
-    # Thresholds: >0.60 = rejection, >0.45 = warning
-    diversity_compliant = max_similarity <= SIMILARITY_REJECTION_THRESHOLD
-    similarity_warning = SIMILARITY_WARNING_THRESHOLD < max_similarity <= SIMILARITY_REJECTION_THRESHOLD
-
-    return {
-        "max_similarity": round(max_similarity, 4),
-        "most_similar_to": most_similar_to,
-        "diversity_compliant": diversity_compliant,
-        "similarity_warning": similarity_warning,
-        "comparisons_made": len(scheduled_captions)
-    }
+    return DiversityEngine(scheduled_captions).check(caption_text)
 
 
 def _check_anti_patterization(
@@ -1414,55 +1544,33 @@ def _check_anti_patterization(
     text_lower = caption_text.lower()
 
     # Pattern 1: Alert emoji opener - check for actual alert emojis at start
-    alert_emoji_chars = ["\u26a0", "\u2757", "\u2755", "\u203c", "\u2049",
-                         "\U0001F6A8", "\U0001F514", "\U0001F4E2", "\U0001F4E3"]
-    caption_stripped = caption_text.strip()
-    for alert_char in alert_emoji_chars:
-        if caption_stripped.startswith(alert_char):
-            patterns_detected.append("alert_emoji_opener")
-            break
+    if caption_text.strip().startswith(_ALERT_EMOJI_CHARS):
+        patterns_detected.append("alert_emoji_opener")
 
     # Pattern 2: Superlative caps - ALL CAPS words > 4 chars
-    caps_pattern = re.findall(r'\b[A-Z]{5,}\b', caption_text)
     superlative_caps = [
-        word for word in caps_pattern
-        if word in ["AMAZING", "INCREDIBLE", "EXCLUSIVE", "INSANE", "HOTTEST",
-                    "SEXIEST", "NAUGHTIEST", "WILDEST", "CRAZIEST", "INTENSE",
-                    "EXPLOSIVE", "ULTIMATE", "SPECIAL", "LIMITED", "PRIVATE"]
+        word for word in _CAPS_WORD_PATTERN.findall(caption_text)
+        if word in _SUPERLATIVE_CAPS
     ]
     if superlative_caps:
         patterns_detected.append(f"superlative_caps:{','.join(superlative_caps[:3])}")
 
     # Pattern 3: Climax language - overused terms
-    climax_terms = [
-        r"mind.?blow", r"earth.?shatter", r"jaw.?drop", r"breath.?tak",
-        r"game.?chang", r"life.?chang", r"explosive", r"insane",
-        r"absolutely (wild|crazy|insane|incredible)", r"literally (the best|dying)"
-    ]
-    for term in climax_terms:
-        if re.search(term, text_lower):
+    for term, compiled in _CLIMAX_TERM_PATTERNS:
+        if compiled.search(text_lower):
             patterns_detected.append(f"climax_language:{term}")
             break
 
     # Pattern 4: Duration specific - very specific times (e.g., 8:42 min)
-    duration_pattern = re.search(r'(\d+):(\d{2})\s*(min|minute|sec)', text_lower)
-    if duration_pattern:
+    if _DURATION_PATTERN.search(text_lower):
         patterns_detected.append("duration_specific")
 
     # Pattern 5: Content enumeration - numbered lists
-    # Use non-greedy quantifiers with length limits to prevent ReDoS
-    enumeration_pattern = re.search(r'(1[\.\)]\s*.{1,100}?\n?\s*2[\.\)]\s*.{1,100}?)', caption_text)
-    if enumeration_pattern:
+    if _ENUMERATION_PATTERN.search(caption_text):
         patterns_detected.append("content_enumeration")
 
     # Also check for repeated emoji sequences (fire, peach, eggplant pattern)
-    emoji_seq_pattern = re.search(
-        r'(\U0001F525.*\U0001F351.*\U0001F346)|'  # fire, peach, eggplant
-        r'(\U0001F351.*\U0001F525.*\U0001F346)|'  # peach, fire, eggplant
-        r'(\U0001F525{2,})|(\U0001F351{2,})|(\U0001F346{2,})',  # repeated same emoji
-        caption_text
-    )
-    if emoji_seq_pattern:
+    if _EMOJI_SEQUENCE_PATTERN.search(caption_text):
         patterns_detected.append("emoji_enumeration")
 
     # Calculate pattern penalty
@@ -1582,17 +1690,58 @@ def validate_caption_structure(
         return {"error": "caption_text cannot be empty"}
 
     # Validate scheduled_captions if provided (security + performance)
+    diversity_check = None
     if scheduled_captions:
-        if len(scheduled_captions) > MAX_SCHEDULED_CAPTIONS:
-            return {"error": f"scheduled_captions exceeds maximum of {MAX_SCHEDULED_CAPTIONS} items"}
+        error = _validate_scheduled_captions(scheduled_captions)
+        if error:
+            return {"error": error}
+        diversity_check = _check_diversity(caption_text, scheduled_captions, creator_id)
+
+    return _score_caption(
+        creator_id, caption_text, send_type_key, diversity_check, check_global_saturation
+    )
+
+
+def _validate_scheduled_captions(scheduled_captions: list[dict[str, Any]]) -> Optional[str]:
+    """
+    Validate a scheduled_captions list (security + performance).
+
+    Returns:
+        Error message, or None if the list is acceptable.
+    """
+    if len(scheduled_captions) > MAX_SCHEDULED_CAPTIONS:
+        return f"scheduled_captions exceeds maximum of {MAX_SCHEDULED_CAPTIONS} items"
+
+    for i, scheduled in enumerate(scheduled_captions):
+        if not isinstance(scheduled, dict):
+            return f"scheduled_captions[{i}] must be a dictionary"
+        sched_caption_text = scheduled.get("caption_text", "")
+        if len(sched_caption_text) > MAX_SCHEDULED_CAPTION_LENGTH:
+            return f"scheduled_captions[{i}].caption_text exceeds maximum length of {MAX_SCHEDULED_CAPTION_LENGTH}"
+    return None
+
+
+def _score_caption(
+    creator_id: str,
+    caption_text: str,
+    send_type_key: str,
+    diversity_check: Optional[dict[str, Any]],
+    check_global_saturation: bool
+) -> dict[str, Any]:
+    """
+    Run the five structure checks on an already-validated caption.
 
-        for i, scheduled in enumerate(scheduled_captions):
-            if not isinstance(scheduled, dict):
-                return {"error": f"scheduled_captions[{i}] must be a dictionary"}
-            sched_caption_text = scheduled.get("caption_text", "")
-            if len(sched_caption_text) > MAX_SCHEDULED_CAPTION_LENGTH:
-                return {"error": f"scheduled_captions[{i}].caption_text exceeds maximum length of {MAX_SCHEDULED_CAPTION_LENGTH}"}
+    Args:
+        creator_id: The creator_id or page_name.
+        caption_text: The caption text to validate.
+        send_type_key: The send type key for context-specific validation.
+        diversity_check: Result of _check_diversity, or None when there was
+            nothing to compare against.
+        check_global_saturation: Whether to check global caption saturation.
 
+    Returns:
+        The validate_caption_structure result dictionary.
+    """
     # Initialize result containers
     warnings: list[str] = []
     rejections: list[str] = []
@@ -1606,8 +1755,7 @@ def validate_caption_structure(
         warnings.extend(emoji_check["issues"])
 
     # CHECK 2: Four-Element PPV Structure (scoring only, for PPV types)
-    ppv_types = ["ppv_unlock", "ppv_wall", "bundle", "flash_bundle"]
-    if send_type_key in ppv_types:
+    if send_type_key in PPV_SEND_TYPES:
         ppv_check = _check_ppv_structure(caption_text, creator_id)
         if not ppv_check["structure_complete"]:
             # Penalty based on missing elements (up to 25 points)
@@ -1643,8 +1791,7 @@ def validate_caption_structure(
     base_score -= length_check["deviation_penalty"]
 
     # CHECK 4: Diversity Check (HARD RULE if >0.60 similarity)
-    if scheduled_captions:
-        diversity_check = _check_diversity(caption_text, scheduled_captions, creator_id)
+    if diversity_check is not None:
         if not diversity_check["diversity_compliant"]:
             rejections.append(
                 f"Caption too similar to scheduled caption "
@@ -1704,6 +1851,154 @@ def validate_caption_structure(
     }
 
 
+@mcp_tool(
+    name="validate_captions_batch",
+    description="Validate every caption of a schedule in one call. Runs the validate_caption_structure checks per item, with each item's diversity measured against scheduled_captions plus the items before it, and returns schedule-level diversity.",
+    schema={
+        "type": "object",
+        "properties": {
+            "creator_id": {
+                "type": "string",
+                "description": "The creator_id or page_name"
+            },
+            "captions": {
+                "type": "array",
+                "items": {
+                    "type": "object",
+                    "properties": {
+                        "caption_text": {"type": "string"},
+                        "send_type_key": {"type": "string"},
+                        "caption_id": {"type": "integer"}
+                    },
+                    "required": ["caption_text", "send_type_key"]
+                },
+                "description": "Schedule items in schedule order (max 100)"
+            },
+            "scheduled_captions": {
+                "type": "array",
+                "items": {
+                    "type": "object",
+                    "properties": {
+                        "caption_text": {"type": "string"},
+                        "caption_id": {"type": "integer"},
+                        "send_type_key": {"type": "string"}
+                    }
+                },
+                "description": "Captions scheduled outside this batch (for diversity check)"
+            },
+            "check_global_saturation": {
+                "type": "boolean",
+                "description": "Whether to check global caption saturation across creators (default true)"
+            }
+        },
+        "required": ["creator_id", "captions"]
+    }
+)
+def validate_captions_batch(
+    creator_id: str,
+    captions: list[dict[str, Any]],
+    scheduled_captions: Optional[list[dict[str, Any]]] = None,
+    check_global_saturation: bool = True
+) -> dict[str, Any]:
+    """
+    Validate a whole schedule's captions in one call.
+
+    Equivalent to calling validate_caption_structure for each item in
+    order, passing scheduled_captions plus the items before it, but the
+    creator is validated once, the compiled check patterns are shared and
+    one DiversityEngine is extended item by item instead of re-comparing
+    every pair from scratch.
+
+    Args:
+        creator_id: The creator_id or page_name.
+        captions: Items with caption_text, send_type_key and optional caption_id.
+        scheduled_captions: Captions already scheduled outside this batch.
+        check_global_saturation: Whether to check global caption saturation.
+
+    Returns:
+        Dictionary containing:
+            - creator_id: The creator validated for
+            - results: Per-item validate_caption_structure results (or an
+              error) in input order, each with its index and caption_id
+            - summary: Counts of valid, rejected and errored items and the
+              mean score
+            - schedule_diversity: Highest item similarity, the item it
+              belongs to, and diversity warning/rejection counts
+    """
+    is_valid, error_msg = validate_creator_id(creator_id)
+    if not is_valid:
+        logger.warning(f"validate_captions_batch: Invalid creator_id - {error_msg}")
+        return {"error": f"Invalid creator_id: {error_msg}"}
+
+    if not isinstance(captions, list) or not captions:
+        return {"error": "captions must be a non-empty list"}
+    if len(captions) > MAX_BATCH_CAPTIONS:
+        return {"error": f"captions exceeds maximum of {MAX_BATCH_CAPTIONS} items"}
+
+    if scheduled_captions:
+        error = _validate_scheduled_captions(scheduled_captions)
+        if error:
+            return {"error": error}
+
+    engine = DiversityEngine(scheduled_captions)
+    results: list[dict[str, Any]] = []
+    for index, item in enumerate(captions):
+        if not isinstance(item, dict):
+            results.append({"index": index, "error": f"captions[{index}] must be a dictionary"})
+            continue
+
+        caption_text = item.get("caption_text", "")
+        send_type_key = item.get("send_type_key", "")
+        error = None
+        is_valid, error_msg = validate_key_input(send_type_key, "send_type_key")
+        if not is_valid:
+            error = f"Invalid send_type_key: {error_msg}"
+        else:
+            is_valid, error_msg = validate_string_length(caption_text, MAX_CAPTION_LENGTH, "caption_text")
+            if not is_valid:
+                error = f"Invalid caption_text: {error_msg}"
+            elif not caption_text.strip():
+                error = "caption_text cannot be empty"
+        if error:
+            results.append({"index": index, "caption_id": item.get("caption_id"), "error": error})
+            continue
+
+        diversity_check = engine.check(caption_text) if engine.size else None
+        engine.add(caption_text)
+
+        result = _score_caption(
+            creator_id, caption_text, send_type_key, diversity_check, check_global_saturation
+        )
+        result["index"] = index
+        result["caption_id"] = item.get("caption_id")
+        results.append(result)
+
+    scored = [result for result in results if "error" not in result]
+    diversity_checks = [result["checks"]["diversity"] for result in scored]
+    most_similar = max(
+        scored, key=lambda result: result["checks"]["diversity"]["max_similarity"], default=None
+    )
+
+    return {
+        "creator_id": creator_id,
+        "results": results,
+        "summary": {
+            "total": len(captions),
+            "valid": sum(1 for result in scored if result["valid"]),
+            "rejected": sum(1 for result in scored if not result["valid"]),
+            "errors": len(results) - len(scored),
+            "average_score": round(sum(result["score"] for result in scored) / len(scored), 2) if scored else None
+        },
+        "schedule_diversity": {
+            "max_similarity": most_similar["checks"]["diversity"]["max_similarity"] if most_similar else 0.0,
+            "most_similar_index": most_similar["index"] if most_similar and most_similar["checks"]["diversity"]["max_similarity"] else None,
+            "similarity_warnings": sum(1 for check in diversity_checks if check["similarity_warning"]),
+            "similarity_rejections": sum(1 for check in diversity_checks if not check["diversity_compliant"])
+        },
+        "validation_timestamp": datetime.utcnow().isoformat() + "Z"
+    }
+
+
 # =============================================================================
 # Caption Attention Scoring Tools (Pipeline Supercharge v3.0.0)
 # =============================================================================
@@ -1760,60 +2055,59 @@ def _get_quality_tier(attention_score: float) -> str:
         return "LOW"
 
 
-@mcp_tool(
-    name="get_attention_metrics",
-    description="Get raw attention engagement metrics for caption analysis. Returns hook strength, depth, CTA, and emotion indicators.",
-    schema={
-        "type": "object",
-        "properties": {
-            "caption_text": {
-                "type": "string",
-                "description": "The caption text to analyze"
-            },
-            "creator_id": {
-                "type": "string",
-                "description": "Optional creator_id for persona context"
-            }
-        },
-        "required": ["caption_text"]
-    }
+# Version recorded with stored scores; bump when the analysis below changes
+ATTENTION_ANALYSIS_VERSION = "v1.0.0"
+
+# Attention analysis patterns, compiled once at import
+_SENTENCE_SPLIT_PATTERN = re.compile(r'[.!?]+')
+_STRONG_OPENER_PATTERN = re.compile(r'^(omg|oh my|wow|guess what|pov|imagine|what if|breaking)')
+_DIRECT_ADDRESS_PATTERN = re.compile(r'\b(you|your|babe|baby|daddy)\b')
+_SPECIFIC_DURATION_PATTERN = re.compile(r'\d+\s*(min|minute|sec|second|hour|vid|video|pic|photo)')
+_DESCRIPTIVE_WORD_PATTERN = re.compile(
+    r'\b(new|exclusive|private|personal|special|rare|limited|unique|custom|just)\b'
 )
-def get_attention_metrics(
-    caption_text: str,
-    creator_id: Optional[str] = None
-) -> dict[str, Any]:
-    """
-    Get raw attention engagement metrics for caption analysis.
+_CONTENT_LIST_PATTERN = re.compile(r'(1\.|2\.|•|includes|featuring|with:)')
+# (pattern, indicator, bonus); only the first (strongest) CTA counts
+_CTA_PATTERNS = [
+    (re.compile(pattern), indicator, bonus) for pattern, indicator, bonus in [
+        (r'(unlock|tip|purchase|buy|get it|grab it)', "purchase_cta", 20),
+        (r'(click|tap|press)', "click_cta", 15),
+        (r'(available now|get yours|claim)', "availability_cta", 15),
+        (r'(don\'t miss|limited time|hurry)', "urgency_cta", 15),
+        (r'\$\d+', "price_anchor", 10),
+        (r'(dm me|message me|send me)', "message_cta", 10),
+    ]
+]
+# (pattern, indicator, bonus); every match counts
+_EMOTION_PATTERNS = [
+    (re.compile(pattern), indicator, bonus) for pattern, indicator, bonus in [
+        (r'\b(love|miss|want|need|crave)\b', "desire_language", 15),
+        (r'\b(excited|thrilled|can\'t wait)\b', "excitement_language", 12),
+        (r'\b(naughty|dirty|bad|wild)\b', "playful_language", 10),
+        (r'\b(special|personal|intimate|private)\b', "intimacy_language", 12),
+    ]
+]
+_PRONOUN_PATTERN = re.compile(r'\b(i|me|my|you|your|we|us)\b')
 
-    Analyzes caption text to extract attention quality indicators:
-    - Hook strength: Opening sentence impact
-    - Depth: Content substance and detail
-    - CTA: Call-to-action clarity
-    - Emotion: Emotional engagement potential
+
+def _analyze_attention(caption_text: str) -> dict[str, Any]:
+    """
+    Compute attention metrics for a caption (pure, no database access).
 
     Args:
-        caption_text: The caption text to analyze.
-        creator_id: Optional creator_id for persona context.
+        caption_text: Non-empty caption text.
 
     Returns:
-        Dictionary containing:
-            - metrics: Raw metric values
-            - indicators: Specific patterns detected
-            - text_stats: Basic text statistics
+        Dictionary with metrics, indicators and text_stats, as returned by
+        get_attention_metrics.
     """
-    if not caption_text or not caption_text.strip():
-        return {"error": "caption_text cannot be empty"}
-
-    if len(caption_text) > MAX_CAPTION_LENGTH:
-        return {"error": f"caption_text exceeds maximum length of {MAX_CAPTION_LENGTH}"}
-
     text = caption_text.strip()
     text_lower = text.lower()
 
     # Text statistics
     words = text.split()
     word_count = len(words)
-    sentences = re.split(r'[.!?]+', text)
+    sentences = _SENTENCE_SPLIT_PATTERN.split(text)
     sentences = [s.strip() for s in sentences if s.strip()]
     sentence_count = len(sentences)
     avg_sentence_length = word_count / sentence_count if sentence_count > 0 else 0
@@ -1824,9 +2118,10 @@ def get_attention_metrics(
 
     # First sentence analysis
     first_sentence = sentences[0] if sentences else text[:100]
+    first_sentence_lower = first_sentence.lower()
 
     # Strong opener patterns
-    if re.match(r'^(omg|oh my|wow|guess what|pov|imagine|what if|breaking)', first_sentence.lower()):
+    if _STRONG_OPENER_PATTERN.match(first_sentence_lower):
         hook_indicators.append("strong_opener")
         hook_score += 15
 
@@ -1847,7 +2142,7 @@ def get_attention_metrics(
         hook_score += 5
 
     # Direct address
-    if re.search(r'\b(you|your|babe|baby|daddy)\b', first_sentence.lower()):
+    if _DIRECT_ADDRESS_PATTERN.search(first_sentence_lower):
         hook_indicators.append("direct_address")
         hook_score += 10
 
@@ -1861,15 +2156,12 @@ def get_attention_metrics(
     depth_score = 50  # Base score
 
     # Specific details
-    if re.search(r'\d+\s*(min|minute|sec|second|hour|vid|video|pic|photo)', text_lower):
+    if _SPECIFIC_DURATION_PATTERN.search(text_lower):
         depth_indicators.append("specific_duration")
         depth_score += 15
 
     # Description richness
-    descriptive_words = len(re.findall(
-        r'\b(new|exclusive|private|personal|special|rare|limited|unique|custom|just)\b',
-        text_lower
-    ))
+    descriptive_words = len(_DESCRIPTIVE_WORD_PATTERN.findall(text_lower))
     if descriptive_words >= 3:
         depth_indicators.append("rich_description")
         depth_score += 10
@@ -1878,7 +2170,7 @@ def get_attention_metrics(
         depth_score += 5
 
     # Content enumeration
-    if re.search(r'(1\.|2\.|•|includes|featuring|with:)', text_lower):
+    if _CONTENT_LIST_PATTERN.search(text_lower):
         depth_indicators.append("content_list")
         depth_score += 10
 
@@ -1894,17 +2186,8 @@ def get_attention_metrics(
     cta_score = 50  # Base score
 
     # Explicit CTA
-    cta_patterns = [
-        (r'(unlock|tip|purchase|buy|get it|grab it)', "purchase_cta", 20),
-        (r'(click|tap|press)', "click_cta", 15),
-        (r'(available now|get yours|claim)', "availability_cta", 15),
-        (r'(don\'t miss|limited time|hurry)', "urgency_cta", 15),
-        (r'\$\d+', "price_anchor", 10),
-        (r'(dm me|message me|send me)', "message_cta", 10),
-    ]
-
-    for pattern, indicator, bonus in cta_patterns:
-        if re.search(pattern, text_lower):
+    for pattern, indicator, bonus in _CTA_PATTERNS:
+        if pattern.search(text_lower):
             cta_indicators.append(indicator)
             cta_score += bonus
             break  # Only count strongest CTA
@@ -1920,15 +2203,8 @@ def get_attention_metrics(
     emotion_score = 50  # Base score
 
     # Emotional language
-    emotion_patterns = [
-        (r'\b(love|miss|want|need|crave)\b', "desire_language", 15),
-        (r'\b(excited|thrilled|can\'t wait)\b', "excitement_language", 12),
-        (r'\b(naughty|dirty|bad|wild)\b', "playful_language", 10),
-        (r'\b(special|personal|intimate|private)\b', "intimacy_language", 12),
-    ]
-
-    for pattern, indicator, bonus in emotion_patterns:
-        if re.search(pattern, text_lower):
+    for pattern, indicator, bonus in _EMOTION_PATTERNS:
+        if pattern.search(text_lower):
             emotion_indicators.append(indicator)
             emotion_score += bonus
 
@@ -1939,7 +2215,7 @@ def get_attention_metrics(
         emotion_score += 8
 
     # Personal pronouns (connection)
-    pronoun_count = len(re.findall(r'\b(i|me|my|you|your|we|us)\b', text_lower))
+    pronoun_count = len(_PRONOUN_PATTERN.findall(text_lower))
     if pronoun_count >= 5:
         emotion_indicators.append("high_pronouns")
         emotion_score += 10
@@ -1976,6 +2252,86 @@ def get_attention_metrics(
     }
 
 
+def compute_attention_scores(caption_text: str) -> dict[str, Any]:
+    """
+    Compute the stored caption_attention_scores values for a caption.
+
+    Used by the bulk scoring job (database/scripts/score_caption_attention.py).
+
+    Args:
+        caption_text: Non-empty caption text.
+
+    Returns:
+        Dictionary with the component scores, composite attention_score,
+        quality_tier, analysis_version and cached text statistics.
+    """
+    analysis = _analyze_attention(caption_text)
+    metrics = analysis["metrics"]
+    attention_score = round(_calculate_attention_score(
+        metrics["hook_score"], metrics["depth_score"],
+        metrics["cta_score"], metrics["emotion_score"]
+    ), 2)
+    return {
+        **metrics,
+        "attention_score": attention_score,
+        "quality_tier": _get_quality_tier(attention_score),
+        "analysis_version": ATTENTION_ANALYSIS_VERSION,
+        "word_count": analysis["text_stats"]["word_count"],
+        "sentence_count": analysis["text_stats"]["sentence_count"],
+        "avg_sentence_length": analysis["text_stats"]["avg_sentence_length"],
+    }
+
+
+@mcp_tool(
+    name="get_attention_metrics",
+    description="Get raw attention engagement metrics for caption analysis. Returns hook strength, depth, CTA, and emotion indicators.",
+    schema={
+        "type": "object",
+        "properties": {
+            "caption_text": {
+                "type": "string",
+                "description": "The caption text to analyze"
+            },
+            "creator_id": {
+                "type": "string",
+                "description": "Optional creator_id for persona context"
+            }
+        },
+        "required": ["caption_text"]
+    }
+)
+def get_attention_metrics(
+    caption_text: str,
+    creator_id: Optional[str] = None
+) -> dict[str, Any]:
+    """
+    Get raw attention engagement metrics for caption analysis.
+
+    Analyzes caption text to extract attention quality indicators:
+    - Hook strength: Opening sentence impact
+    - Depth: Content substance and detail
+    - CTA: Call-to-action clarity
+    - Emotion: Emotional engagement potential
+
+    Args:
+        caption_text: The caption text to analyze.
+        creator_id: Optional creator_id for persona context.
+
+    Returns:
+        Dictionary containing:
+            - metrics: Raw metric values
+            - indicators: Specific patterns detected
+            - text_stats: Basic text statistics
+    """
+    if not caption_text or not caption_text.strip():
+        return {"error": "caption_text cannot be empty"}
+
+    if len(caption_text) > MAX_CAPTION_LENGTH:
+        return {"error": f"caption_text exceeds maximum length of {MAX_CAPTION_LENGTH}"}
+
+    return _analyze_attention(caption_text)
+
+
 @mcp_tool(
     name="get_caption_attention_scores",
     description="Get pre-computed attention scores for captions. Returns composite attention scores with quality tier classification.",
@@ -2013,7 +2369,8 @@ def get_caption_attention_scores(
     caption_ids: Optional[list[int]] = None,
     min_attention_score: float = 0.0,
     quality_tier: Optional[str] = None,
-    limit: int = 50
+    limit: int = 50,
+    response_format: str = "objects"
 ) -> dict[str, Any]:
     """
     Get pre-computed attention scores for captions.
@@ -2027,6 +2384,7 @@ def get_caption_attention_scores(
         min_attention_score: Minimum score threshold.
         quality_tier: Filter by specific quality tier.
         limit: Maximum results to return.
+        response_format: "objects" (default) or "columnar" encoding for scores.
 
     Returns:
         Dictionary containing:
@@ -2098,7 +2456,8 @@ def get_caption_attention_scores(
         params.append(limit)
 
         cursor = conn.execute(query, params)
-        scores = rows_to_list(cursor.fetchall())
+        rows = cursor.fetchall()
+        scores = encode_rows(rows, cursor_columns(cursor), response_format)
 
         # Calculate tier distribution
         tier_cursor = conn.execute(
@@ -2115,12 +2474,12 @@ def get_caption_attention_scores(
         # Find missing caption IDs if specific IDs were requested
         missing_ids = []
         if caption_ids:
-            found_ids = {s["caption_id"] for s in scores}
+            found_ids = {row["caption_id"] for row in rows}
             missing_ids = [cap_id for cap_id in caption_ids if cap_id not in found_ids]
 
         return {
             "scores": scores,
-            "count": len(scores),
+            "count": len(rows),
             "tier_distribution": tier_distribution,
             "missing_ids": missing_ids if missing_ids else None,
             "creator_id": resolved_creator_id,
@@ -279,6 +279,14 @@ def get_active_experiments(
                         "vs_control_p_value": {
                             "type": "number",
                             "description": "P-value for significance test"
+                        },
+                        "m2": {
+                            "type": "number",
+                            "description": "Running sum of squared deviations from the mean. When sent for a variant and the control, an always-valid sequential (mSPRT) p-value is computed"
+                        },
+                        "higher_is_better": {
+                            "type": "boolean",
+                            "description": "Metric direction for sequential decisions (default true)"
                         }
                     },
                     "required": ["variant_id", "metric_name", "metric_value", "sample_size"]
@@ -303,6 +311,18 @@ def save_experiment_results(
     Records metrics for each variant with statistical analysis
     against the control variant.
 
+    Results that carry running statistics (sample_size, metric_value as the
+    mean, and m2) for both a variant and the control are evaluated with a
+    mixture sequential probability ratio test. The always-valid p-value
+    replaces vs_control_p_value, so the experiment can be checked after
+    every batch of outcomes and stopped the first time a variant is
+    decisive, without rescanning outcome history. Each check continues from
+    the running p-value kept in experiment_sequential_state for the variant
+    and metric (fixed-horizon p-values supplied by callers are never carried
+    over), and the
+    experiment's relative minimum_detectable_effect is scaled by the control
+    mean to size the test's mixture.
+
     Args:
         experiment_id: The experiment ID.
         results: List of result measurements.
@@ -313,7 +333,15 @@ def save_experiment_results(
             - success: Boolean indicating success
             - results_saved: Number of results saved
             - significant_findings: List of statistically significant results
+            - sequential_decisions: mSPRT decisions for variants with running
+              statistics
     """
+    from python.analytics.volume_ab_test import (
+        DEFAULT_MDE,
+        ArmStatistics,
+        run_mixture_sprt,
+    )
+
     if not isinstance(experiment_id, int) or experiment_id <= 0:
         return {"error": "experiment_id must be a positive integer"}
 
@@ -337,7 +365,7 @@ def save_experiment_results(
         # Verify experiment exists and is active
         cursor = conn.execute(
             """
-            SELECT experiment_id, significance_level, status
+            SELECT experiment_id, significance_level, minimum_detectable_effect, status
             FROM ab_experiments
             WHERE experiment_id = ?
             """,
@@ -351,16 +379,37 @@ def save_experiment_results(
             return {"error": f"Experiment is not active (status: {experiment['status']})"}
 
         significance_level = experiment["significance_level"]
+        # Stored as a relative lift (0.05 = 5% over control)
+        relative_mde = experiment["minimum_detectable_effect"] or DEFAULT_MDE
 
         # Get valid variant IDs for this experiment
         cursor = conn.execute(
-            "SELECT variant_id FROM experiment_variants WHERE experiment_id = ?",
+            "SELECT variant_id, is_control FROM experiment_variants WHERE experiment_id = ?",
             (experiment_id,)
         )
-        valid_variant_ids = {row["variant_id"] for row in cursor.fetchall()}
+        variant_rows = cursor.fetchall()
+        valid_variant_ids = {row["variant_id"] for row in variant_rows}
+        control_variant_ids = {row["variant_id"] for row in variant_rows if row["is_control"]}
+
+        # Control arm running statistics by metric, for sequential tests
+        control_arms: dict[str, ArmStatistics] = {}
+        for result in results:
+            m2 = result.get("m2")
+            if (
+                result.get("variant_id") in control_variant_ids
+                and m2 is not None
+                and m2 >= 0
+                and result.get("metric_name")
+                and result.get("metric_value") is not None
+                and result.get("sample_size")
+            ):
+                control_arms[result["metric_name"]] = ArmStatistics(
+                    count=result["sample_size"], mean=result["metric_value"], m2=m2
+                )
 
         results_saved = 0
         significant_findings: list[dict[str, Any]] = []
+        sequential_decisions: list[dict[str, Any]] = []
 
         for result in results:
             variant_id = result.get("variant_id")
@@ -377,10 +426,69 @@ def save_experiment_results(
 
             # Calculate if significant
             p_value = result.get("vs_control_p_value")
+            lift = result.get("vs_control_lift")
             is_significant = 1 if p_value is not None and p_value < significance_level else 0
+            se = result.get("standard_error")
+
+            # Sequential test from running statistics
+            m2 = result.get("m2")
+            if m2 is not None and m2 >= 0 and sample_size > 0:
+                arm = ArmStatistics(count=sample_size, mean=metric_value, m2=m2)
+                if se is None:
+                    se = arm.standard_error
+                control_arm = control_arms.get(metric_name)
+                if control_arm is not None and variant_id not in control_variant_ids:
+                    # The mSPRT p-value is a running minimum across checks;
+                    # only p-values the mSPRT produced are carried over
+                    cursor = conn.execute(
+                        """
+                        SELECT p_value
+                        FROM experiment_sequential_state
+                        WHERE experiment_id = ? AND variant_id = ? AND metric_name = ?
+                        """,
+                        (experiment_id, variant_id, metric_name)
+                    )
+                    previous = cursor.fetchone()
+                    # Size the mixture from the relative MDE in metric units
+                    # (tau = relative_mde * control mean); with a zero control
+                    # mean fall back to treating it as standard deviation units
+                    mixture_variance = (relative_mde * control_arm.mean) ** 2 or None
+                    sequential = run_mixture_sprt(
+                        control_arm,
+                        arm,
+                        alpha=significance_level,
+                        mde=relative_mde,
+                        higher_is_better=result.get("higher_is_better", True),
+                        previous_p_value=previous["p_value"] if previous else 1.0,
+                        mixture_variance=mixture_variance,
+                    )
+                    conn.execute(
+                        """
+                        INSERT INTO experiment_sequential_state (
+                            experiment_id, variant_id, metric_name, p_value
+                        ) VALUES (?, ?, ?, ?)
+                        ON CONFLICT (experiment_id, variant_id, metric_name) DO UPDATE SET
+                            p_value = excluded.p_value,
+                            updated_at = datetime('now')
+                        """,
+                        (experiment_id, variant_id, metric_name, sequential.p_value)
+                    )
+                    p_value = sequential.p_value
+                    if lift is None and sequential.lift is not None:
+                        lift = sequential.lift * 100
+                    is_significant = 1 if sequential.should_stop else 0
+                    sequential_decisions.append({
+                        "variant_id": variant_id,
+                        "metric_name": metric_name,
+                        "decision": sequential.decision.value,
+                        "should_stop": sequential.should_stop,
+                        "p_value": sequential.p_value,
+                        "effect": sequential.effect,
+                        "control_n": sequential.control_n,
+                        "treatment_n": sequential.treatment_n,
+                    })
 
             # Calculate confidence intervals if standard error provided
-            se = result.get("standard_error")
             ci_low = None
             ci_high = None
             if se is not None:
@@ -407,7 +515,7 @@ def save_experiment_results(
                     se,
                     ci_low,
                     ci_high,
-                    result.get("vs_control_lift"),
+                    lift,
                     p_value,
                     is_significant,
                     measurement_date,
@@ -420,7 +528,7 @@ def save_experiment_results(
                 significant_findings.append({
                     "variant_id": variant_id,
                     "metric_name": metric_name,
-                    "lift": result.get("vs_control_lift"),
+                    "lift": lift,
                     "p_value": p_value,
                 })
 
@@ -448,6 +556,7 @@ def save_experiment_results(
             "results_saved": results_saved,
             "measurement_date": measurement_date,
             "significant_findings": significant_findings if significant_findings else None,
+            "sequential_decisions": sequential_decisions if sequential_decisions else None,
         }
 
     except sqlite3.Error as e:
@@ -3,8 +3,18 @@ EROS MCP Server Query Tool
 
 Provides secure read-only SQL query execution with comprehensive
 SQL injection protection and query complexity limits.
+
+Large result sets can be paged with an opaque continuation token. Paging uses
+a keyset (``keyset_column``) when the caller names a unique, non-null ordering
+column, and falls back to offset paging over queries with an ORDER BY
+otherwise. Results can be returned as
+row objects (default) or in a compact columnar encoding.
 """
 
+import base64
+import binascii
+import hashlib
+import json
 import logging
 import re
 import sqlite3
@@ -12,7 +22,7 @@ from typing import Any, Optional
 
 from mcp.connection import get_db_connection
 from mcp.tools.base import mcp_tool
-from mcp.utils.helpers import rows_to_list
+from mcp.utils.helpers import RESPONSE_FORMATS, cursor_columns, rows_to_columnar, rows_to_list
 from mcp.utils.security import (
     MAX_QUERY_JOINS,
     MAX_QUERY_SUBQUERIES,
@@ -21,6 +31,100 @@ from mcp.utils.security import (
 
 logger = logging.getLogger("eros_db_server")
 
+# Version stamp embedded in page tokens
+PAGE_TOKEN_VERSION = 1
+
+_IDENTIFIER_PATTERN = re.compile(r'^[A-Za-z_][A-Za-z0-9_]*$')
+
+_PARENTHESIZED_PATTERN = re.compile(r'\([^()]*\)')
+_ORDER_BY_PATTERN = re.compile(r'\bORDER\s+BY\b')
+
+
+def _has_top_level_order_by(normalized_query: str) -> bool:
+    """
+    Check whether a query orders its own result rows.
+
+    ORDER BY clauses inside subqueries or window definitions do not fix the
+    order of the outer result, so parenthesized text is stripped first.
+
+    Args:
+        normalized_query: Upper-cased query text.
+
+    Returns:
+        True if the outermost SELECT has an ORDER BY clause.
+    """
+    previous = None
+    while previous != normalized_query:
+        previous = normalized_query
+        normalized_query = _PARENTHESIZED_PATTERN.sub(" ", normalized_query)
+    return _ORDER_BY_PATTERN.search(normalized_query) is not None
+
+
+def _query_fingerprint(
+    query: str,
+    params: list[Any],
+    keyset_column: Optional[str]
+) -> str:
+    """
+    Compute a short fingerprint binding a page token to its query.
+
+    Args:
+        query: The SQL query text.
+        params: Query parameters.
+        keyset_column: Keyset column, if any.
+
+    Returns:
+        16-character hex digest.
+    """
+    payload = json.dumps([query, params, keyset_column], default=str)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()[:16]
+
+
+def _encode_page_token(fingerprint: str, position: dict[str, Any]) -> str:
+    """
+    Encode a continuation position as an opaque URL-safe token.
+
+    Args:
+        fingerprint: Query fingerprint from _query_fingerprint().
+        position: Either {"k": last_key} (keyset) or {"o": offset}.
+
+    Returns:
+        Opaque page token string.
+    """
+    payload = {"v": PAGE_TOKEN_VERSION, "f": fingerprint, **position}
+    raw = json.dumps(payload, separators=(",", ":")).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+
+def _decode_page_token(token: str, fingerprint: str) -> Optional[dict[str, Any]]:
+    """
+    Decode and validate a page token.
+
+    Args:
+        token: Token from a previous response's next_page_token.
+        fingerprint: Fingerprint of the current query.
+
+    Returns:
+        The decoded position, or None if the token is malformed or was
+        issued for a different query.
+    """
+    try:
+        padded = token + "=" * (-len(token) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+    except (binascii.Error, ValueError, UnicodeError):
+        return None
+
+    if not isinstance(payload, dict):
+        return None
+    if payload.get("v") != PAGE_TOKEN_VERSION or payload.get("f") != fingerprint:
+        return None
+    if "k" in payload:
+        return {"k": payload["k"]}
+    offset = payload.get("o")
+    if isinstance(offset, int) and offset >= 0:
+        return {"o": offset}
+    return None
+
 
 @mcp_tool(
     name="execute_query",
@@ -36,6 +140,25 @@ logger = logging.getLogger("eros_db_server")
                 "type": "array",
                 "description": "Optional list of parameters for the query",
                 "items": {}
+            },
+            "page_size": {
+                "type": "integer",
+                "description": "Rows per page; enables pagination with next_page_token",
+                "minimum": 1,
+                "maximum": MAX_QUERY_RESULT_ROWS
+            },
+            "page_token": {
+                "type": "string",
+                "description": "Continuation token from a previous page's next_page_token"
+            },
+            "keyset_column": {
+                "type": "string",
+                "description": "Unique, non-null result column to page by (keyset paging); offset paging if omitted"
+            },
+            "response_format": {
+                "type": "string",
+                "enum": list(RESPONSE_FORMATS),
+                "description": "objects (default): list of row dicts; columnar: columns + row arrays"
             }
         },
         "required": ["query"]
@@ -43,7 +166,11 @@ logger = logging.getLogger("eros_db_server")
 )
 def execute_query(
     query: str,
-    params: Optional[list[Any]] = None
+    params: Optional[list[Any]] = None,
+    page_size: Optional[int] = None,
+    page_token: Optional[str] = None,
+    keyset_column: Optional[str] = None,
+    response_format: str = "objects"
 ) -> dict[str, Any]:
     """
     Execute a read-only SQL query for custom analysis.
@@ -54,15 +181,29 @@ def execute_query(
     - Enforces query complexity limits
     - Limits result set size
 
+    PAGINATION: When page_size is given, rows are streamed from the cursor
+    one page at a time instead of materializing the whole result set. Pass
+    the returned next_page_token back (with the same query and params) to
+    fetch the next page. With keyset_column, each page resumes after the last
+    key seen; otherwise the token carries an offset, and the query must have
+    an ORDER BY so that consecutive pages see the rows in the same order.
+
     Args:
         query: SQL query string (must be SELECT).
         params: Optional list of parameters for the query.
+        page_size: Optional rows per page (1 to MAX_QUERY_RESULT_ROWS).
+        page_token: Optional continuation token from a previous page.
+        keyset_column: Optional unique, non-null result column to page by.
+        response_format: "objects" (default) or "columnar".
 
     Returns:
         Dictionary containing:
-            - results: List of result rows as dictionaries
+            - results: List of result rows as dictionaries ("objects" format)
+            - rows: List of row value arrays ("columnar" format)
             - count: Number of rows returned
             - columns: List of column names
+            - next_page_token: Token for the next page, or None (paged only)
+            - has_more: Whether more rows are available (paged only)
     """
     # Log query attempt (sanitized)
     query_preview = query[:100].replace('\n', ' ').replace('\r', '')
@@ -102,10 +243,28 @@ def execute_query(
         logger.warning(f"Blocked query exceeding subquery limit ({subquery_count} > {MAX_QUERY_SUBQUERIES}): {query_preview}")
         return {"error": f"Query exceeds maximum subquery limit of {MAX_QUERY_SUBQUERIES} (found {subquery_count})"}
 
-    # Inject LIMIT clause if not present to prevent massive result sets
+    if response_format not in RESPONSE_FORMATS:
+        return {"error": f"Invalid response_format: {response_format}. Must be one of {list(RESPONSE_FORMATS)}"}
+
+    paginate = page_size is not None or page_token is not None or keyset_column is not None
+    rows_per_page = MAX_QUERY_RESULT_ROWS if page_size is None else page_size
+    if paginate:
+        if not 1 <= rows_per_page <= MAX_QUERY_RESULT_ROWS:
+            return {"error": f"page_size must be between 1 and {MAX_QUERY_RESULT_ROWS}"}
+        if keyset_column is not None and not _IDENTIFIER_PATTERN.match(keyset_column):
+            return {"error": "keyset_column must be a plain column name"}
+        if keyset_column is None and not _has_top_level_order_by(normalized_query):
+            return {
+                "error": "Offset paging requires an ORDER BY clause on a unique "
+                         "column set; add one or pass keyset_column"
+            }
+
+    # Inject LIMIT clause if not present to prevent massive result sets.
+    # Paged queries are bounded per page instead.
     if "LIMIT" not in normalized_query:
-        query = f"{query.rstrip(';')} LIMIT {MAX_QUERY_RESULT_ROWS}"
-        logger.info(f"Injected LIMIT {MAX_QUERY_RESULT_ROWS} to protect against large result sets")
+        if not paginate:
+            query = f"{query.rstrip(';')} LIMIT {MAX_QUERY_RESULT_ROWS}"
+            logger.info(f"Injected LIMIT {MAX_QUERY_RESULT_ROWS} to protect against large result sets")
     else:
         # Validate existing LIMIT doesn't exceed maximum
         limit_match = re.search(r'LIMIT\s+(\d+)', normalized_query)
@@ -115,18 +274,27 @@ def execute_query(
                 logger.warning(f"Blocked query with excessive LIMIT ({limit_value} > {MAX_QUERY_RESULT_ROWS}): {query_preview}")
                 return {"error": f"Query LIMIT exceeds maximum of {MAX_QUERY_RESULT_ROWS} (requested {limit_value})"}
 
+    params = params or []
+
+    if paginate:
+        return _execute_paged_query(
+            query, params, rows_per_page, page_token, keyset_column,
+            response_format, query_preview
+        )
+
     conn = get_db_connection()
     try:
-        params = params or []
         cursor = conn.execute(query, params)
         rows = cursor.fetchall()
 
         # Get column names
-        columns = [description[0] for description in cursor.description] if cursor.description else []
+        columns = cursor_columns(cursor)
 
-        results = rows_to_list(rows)
+        logger.info(f"execute_query successful: returned {len(rows)} rows")
+        if response_format == "columnar":
+            return {**rows_to_columnar(rows, columns), "count": len(rows)}
 
-        logger.info(f"execute_query successful: returned {len(results)} rows")
+        results = rows_to_list(rows)
         return {
             "results": results,
             "count": len(results),
@@ -137,3 +305,103 @@ def execute_query(
         return {"error": f"Query execution error: {str(e)}"}
     finally:
         conn.close()
+
+
+def _execute_paged_query(
+    query: str,
+    params: list[Any],
+    page_size: int,
+    page_token: Optional[str],
+    keyset_column: Optional[str],
+    response_format: str,
+    query_preview: str
+) -> dict[str, Any]:
+    """
+    Execute one page of an already-validated SELECT query.
+
+    The caller's query is wrapped as a subquery and only page_size + 1 rows
+    are fetched from the cursor (the extra row detects whether another page
+    exists).
+
+    Args:
+        query: Validated SELECT query.
+        params: Query parameters.
+        page_size: Rows per page.
+        page_token: Optional continuation token.
+        keyset_column: Optional keyset column (already validated as an identifier).
+        response_format: "objects" or "columnar".
+        query_preview: Sanitized query preview for logging.
+
+    Returns:
+        Page result dictionary (see execute_query).
+    """
+    base_query = query.strip().rstrip(";")
+    fingerprint = _query_fingerprint(base_query, params, keyset_column)
+
+    position: dict[str, Any] = {}
+    if page_token:
+        decoded = _decode_page_token(page_token, fingerprint)
+        if decoded is None or (keyset_column is not None) != ("k" in decoded):
+            return {"error": "Invalid page_token for this query"}
+        position = decoded
+
+    if keyset_column is not None:
+        quoted = f'"{keyset_column}"'
+        if "k" in position:
+            paged_query = (
+                f"SELECT * FROM ({base_query}) AS _page "
+                f"WHERE {quoted} > ? ORDER BY {quoted} LIMIT ?"
+            )
+            paged_params = [*params, position["k"], page_size + 1]
+        else:
+            paged_query = f"SELECT * FROM ({base_query}) AS _page ORDER BY {quoted} LIMIT ?"
+            paged_params = [*params, page_size + 1]
+    else:
+        offset = position.get("o", 0)
+        paged_query = f"SELECT * FROM ({base_query}) AS _page LIMIT ? OFFSET ?"
+        paged_params = [*params, page_size + 1, offset]
+
+    conn = get_db_connection()
+    try:
+        cursor = conn.execute(paged_query, paged_params)
+        columns = cursor_columns(cursor)
+        if keyset_column is not None and keyset_column not in columns:
+            return {"error": f"keyset_column '{keyset_column}' is not in the result columns"}
+
+        rows = cursor.fetchmany(page_size + 1)
+        has_more = len(rows) > page_size
+        rows = rows[:page_size]
+
+        next_page_token = None
+        if has_more:
+            if keyset_column is not None:
+                last_key = rows[-1][columns.index(keyset_column)]
+                if not isinstance(last_key, (int, float, str)):
+                    return {"error": f"keyset_column '{keyset_column}' must hold non-null numbers or text"}
+                next_page_token = _encode_page_token(fingerprint, {"k": last_key})
+            else:
+                next_page_token = _encode_page_token(
+                    fingerprint, {"o": position.get("o", 0) + len(rows)}
+                )
+
+        logger.info(
+            f"execute_query successful: returned page of {len(rows)} rows "
+            f"(has_more={has_more})"
+        )
+
+        if response_format == "columnar":
+            result = {**rows_to_columnar(rows, columns), "count": len(rows)}
+        else:
+            result = {
+                "results": rows_to_list(rows),
+                "count": len(rows),
+                "columns": columns
+            }
+        result["next_page_token"] = next_page_token
+        result["has_more"] = has_more
+        return result
+    except sqlite3.Error as e:
+        logger.error(f"Query execution error: {str(e)} for query: {query_preview}")
+        return {"error": f"Query execution error: {str(e)}"}
+    finally:
+        conn.close()
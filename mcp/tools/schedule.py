@@ -3,6 +3,13 @@ EROS MCP Server Schedule Tools
 
 Tools for saving generated schedules to the database.
 
+Re-saving a schedule is diff-based: incoming items are matched against the
+stored items by a stable item key (date, time, type, channel, send type and
+channel ids, plus an ordinal for duplicates in the same slot) and only the
+inserts, updates and deletes needed are applied, each through executemany
+within a single transaction. save_schedules_batch applies the same sync
+to many creators' schedules under one write transaction and one commit.
+
 Version: 3.0.0
 - Added optional validation_certificate parameter for Four-Layer Defense (v3.1)
 - Phase 1: Certificate is optional with warning logging
@@ -16,7 +23,7 @@ from typing import Any, Optional
 
 from mcp.connection import get_db_connection
 from mcp.tools.base import mcp_tool
-from mcp.utils.helpers import resolve_creator_id
+from mcp.utils.helpers import get_send_type_snapshot, resolve_creator_id
 from mcp.utils.security import validate_creator_id
 
 logger = logging.getLogger("eros_db_server")
@@ -114,6 +121,367 @@ def _validate_certificate(
 # Maximum schedule items to prevent resource exhaustion
 MAX_SCHEDULE_ITEMS = 100
 
+# Maximum schedules accepted by a single save_schedules_batch call
+MAX_BATCH_SCHEDULES = 50
+
+# schedule_items columns identifying an item across saves
+ITEM_KEY_COLUMNS: tuple[str, ...] = (
+    "scheduled_date",
+    "scheduled_time",
+    "item_type",
+    "channel",
+    "send_type_id",
+    "channel_id",
+)
+
+# schedule_items columns compared to detect an updated item
+ITEM_VALUE_COLUMNS: tuple[str, ...] = (
+    "caption_id",
+    "caption_text",
+    "suggested_price",
+    "content_type_id",
+    "flyer_required",
+    "priority",
+    "linked_post_url",
+    "expires_at",
+    "followup_delay_minutes",
+    "media_type",
+    "campaign_goal",
+    "parent_item_id",
+    "is_follow_up",
+)
+
+
+def _certificate_summary(
+    certificate: Optional[dict[str, Any]],
+    cert_validation: dict[str, Any]
+) -> dict[str, Any]:
+    """
+    Build the certificate_validation block returned with a saved schedule.
+
+    Args:
+        certificate: ValidationCertificate as received (may be None).
+        cert_validation: Result of _validate_certificate().
+
+    Returns:
+        Certificate validation summary for the tool response.
+    """
+    if certificate:
+        return {
+            "valid": cert_validation["valid"],
+            "signature": cert_validation.get("certificate_signature"),
+            "quality_score": certificate.get("quality_score"),
+            "status": certificate.get("validation_status")
+        }
+    return {
+        "valid": True,  # Phase 1: No certificate is valid (with warning)
+        "phase_1_warning": "No certificate provided - schedule saved without validation proof"
+    }
+
+
+def _load_lookup_maps(
+    conn: sqlite3.Connection
+) -> tuple[dict[str, dict[str, Any]], dict[str, int]]:
+    """
+    Load send type and channel lookup tables for key resolution.
+
+    Send types come from the shared send type snapshot, so only the
+    channels table is queried.
+
+    Args:
+        conn: Database connection.
+
+    Returns:
+        Tuple of (send_types_map, channels_map). send_types_map maps
+        send_type_key to {"id", "requires_flyer"}; channels_map maps
+        channel_key to channel_id.
+    """
+    snapshot = get_send_type_snapshot(conn)
+    send_types_map = {
+        key: {"id": row["send_type_id"], "requires_flyer": row.get("requires_flyer")}
+        for key, row in snapshot.rows.items()
+    }
+
+    cursor = conn.execute("SELECT channel_id, channel_key FROM channels")
+    channels_map = {row["channel_key"]: row["channel_id"] for row in cursor.fetchall()}
+
+    return send_types_map, channels_map
+
+
+def _upsert_template(
+    conn: sqlite3.Connection,
+    creator_id: str,
+    week_start: str,
+    week_end: str,
+    items: list[dict[str, Any]]
+) -> int:
+    """
+    Insert or refresh the schedule_templates row for a creator week.
+
+    Args:
+        conn: Database connection.
+        creator_id: Resolved creator_id.
+        week_start: Week start (YYYY-MM-DD).
+        week_end: Week end (YYYY-MM-DD).
+        items: Schedule items (used for PPV/bump totals).
+
+    Returns:
+        The template_id.
+    """
+    # Count PPVs and bumps
+    total_ppvs = sum(1 for item in items if item.get("item_type") == "ppv" or (item.get("send_type_key") or "").startswith("ppv"))
+    total_bumps = sum(1 for item in items if item.get("item_type") in ("bump", "ppv_bump") or (item.get("send_type_key") or "").startswith("bump"))
+
+    conn.execute(
+        """
+        INSERT INTO schedule_templates (
+            creator_id, week_start, week_end, generated_at,
+            generated_by, algorithm_version, total_items,
+            total_ppvs, total_bumps, status
+        ) VALUES (?, ?, ?, datetime('now'), 'mcp_server', '2.0', ?, ?, ?, 'draft')
+        ON CONFLICT(creator_id, week_start) DO UPDATE SET
+            week_end = excluded.week_end,
+            generated_at = datetime('now'),
+            total_items = excluded.total_items,
+            total_ppvs = excluded.total_ppvs,
+            total_bumps = excluded.total_bumps,
+            status = 'draft'
+        """,
+        (creator_id, week_start, week_end, len(items), total_ppvs, total_bumps)
+    )
+
+    cursor = conn.execute(
+        """
+        SELECT template_id FROM schedule_templates
+        WHERE creator_id = ? AND week_start = ?
+        """,
+        (creator_id, week_start)
+    )
+    template_id: int = cursor.fetchone()["template_id"]
+    return template_id
+
+
+def _build_item_rows(
+    items: list[dict[str, Any]],
+    send_types_map: dict[str, dict[str, Any]],
+    channels_map: dict[str, int]
+) -> tuple[list[dict[str, Any]], list[str]]:
+    """
+    Resolve keys and defaults for incoming schedule items.
+
+    Args:
+        items: Incoming schedule items.
+        send_types_map: From _load_lookup_maps().
+        channels_map: From _load_lookup_maps().
+
+    Returns:
+        Tuple of (rows, warnings). Each row maps every column in
+        ITEM_KEY_COLUMNS and ITEM_VALUE_COLUMNS to its stored value.
+    """
+    rows: list[dict[str, Any]] = []
+    warnings: list[str] = []
+
+    for idx, item in enumerate(items):
+        # Resolve send_type_key to send_type_id
+        send_type_id = None
+        send_type_key = item.get("send_type_key")
+        if send_type_key:
+            if send_type_key in send_types_map:
+                send_type_info = send_types_map[send_type_key]
+                send_type_id = send_type_info["id"]
+                # Validate flyer requirement
+                if send_type_info["requires_flyer"] == 1 and item.get("flyer_required", 0) == 0:
+                    warnings.append(f"Item {idx}: send_type '{send_type_key}' requires flyer but flyer_required=0")
+            else:
+                warnings.append(f"Item {idx}: Unknown send_type_key '{send_type_key}'")
+
+        # Resolve channel_key to channel_id
+        channel_id = None
+        channel_key = item.get("channel_key")
+        if channel_key:
+            if channel_key in channels_map:
+                channel_id = channels_map[channel_key]
+            else:
+                warnings.append(f"Item {idx}: Unknown channel_key '{channel_key}'")
+
+        # Determine is_follow_up based on parent_item_id
+        parent_item_id = item.get("parent_item_id")
+        is_follow_up = 1 if parent_item_id is not None else 0
+
+        rows.append({
+            "scheduled_date": item.get("scheduled_date"),
+            "scheduled_time": item.get("scheduled_time"),
+            "item_type": item.get("item_type"),
+            "channel": item.get("channel", "mass_message"),
+            "send_type_id": send_type_id,
+            "channel_id": channel_id,
+            "caption_id": item.get("caption_id"),
+            "caption_text": item.get("caption_text"),
+            "suggested_price": item.get("suggested_price"),
+            "content_type_id": item.get("content_type_id"),
+            "flyer_required": item.get("flyer_required", 0),
+            "priority": item.get("priority", 5),
+            "linked_post_url": item.get("linked_post_url"),
+            "expires_at": item.get("expires_at"),
+            "followup_delay_minutes": item.get("followup_delay_minutes"),
+            "media_type": item.get("media_type"),
+            "campaign_goal": item.get("campaign_goal"),
+            "parent_item_id": parent_item_id,
+            "is_follow_up": is_follow_up,
+        })
+
+    return rows, warnings
+
+
+def _keyed(rows: list[Any]) -> dict[tuple[Any, ...], Any]:
+    """
+    Index rows by stable item key.
+
+    Rows sharing the same slot key are disambiguated by their ordinal
+    within that slot, in input (or item_id) order.
+
+    Args:
+        rows: Mappings exposing ITEM_KEY_COLUMNS.
+
+    Returns:
+        Dictionary of (slot key..., ordinal) -> row.
+    """
+    keyed: dict[tuple[Any, ...], Any] = {}
+    ordinals: dict[tuple[Any, ...], int] = {}
+    for row in rows:
+        slot = tuple(row[column] for column in ITEM_KEY_COLUMNS)
+        ordinal = ordinals.get(slot, 0)
+        ordinals[slot] = ordinal + 1
+        keyed[(*slot, ordinal)] = row
+    return keyed
+
+
+def _sync_schedule_items(
+    conn: sqlite3.Connection,
+    template_id: int,
+    creator_id: str,
+    rows: list[dict[str, Any]]
+) -> dict[str, int]:
+    """
+    Bring stored schedule_items for a template in line with incoming rows.
+
+    Only changed rows are written: new keys are inserted, keys whose values
+    differ are updated (and reset to 'pending'), and stored keys absent from
+    the incoming rows are deleted. Unchanged items are left untouched, keeping
+    their item_id and status. Does not commit.
+
+    Args:
+        conn: Database connection.
+        template_id: Template the items belong to.
+        creator_id: Resolved creator_id.
+        rows: Rows from _build_item_rows().
+
+    Returns:
+        Dictionary with inserted, updated, deleted and unchanged counts.
+    """
+    select_columns = ", ".join(("item_id",) + ITEM_KEY_COLUMNS + ITEM_VALUE_COLUMNS)
+    cursor = conn.execute(
+        f"SELECT {select_columns} FROM schedule_items WHERE template_id = ? ORDER BY item_id",
+        (template_id,)
+    )
+    stored = _keyed(cursor.fetchall())
+    incoming = _keyed(rows)
+
+    inserts: list[tuple[Any, ...]] = []
+    updates: list[tuple[Any, ...]] = []
+    unchanged = 0
+
+    for key, row in incoming.items():
+        existing = stored.pop(key, None)
+        if existing is None:
+            inserts.append(
+                (template_id, creator_id)
+                + tuple(row[column] for column in ITEM_KEY_COLUMNS + ITEM_VALUE_COLUMNS)
+            )
+        elif any(existing[column] != row[column] for column in ITEM_VALUE_COLUMNS):
+            updates.append(
+                tuple(row[column] for column in ITEM_VALUE_COLUMNS) + (existing["item_id"],)
+            )
+        else:
+            unchanged += 1
+
+    # Whatever is left in stored has no incoming counterpart
+    deletes = [(existing["item_id"],) for existing in stored.values()]
+
+    if deletes:
+        conn.executemany("DELETE FROM schedule_items WHERE item_id = ?", deletes)
+
+    if updates:
+        assignments = ", ".join(f"{column} = ?" for column in ITEM_VALUE_COLUMNS)
+        conn.executemany(
+            f"UPDATE schedule_items SET {assignments}, status = 'pending' WHERE item_id = ?",
+            updates
+        )
+
+    if inserts:
+        insert_columns = ("template_id", "creator_id") + ITEM_KEY_COLUMNS + ITEM_VALUE_COLUMNS
+        placeholders = ", ".join("?" for _ in insert_columns)
+        conn.executemany(
+            f"INSERT INTO schedule_items ({', '.join(insert_columns)}, status) "
+            f"VALUES ({placeholders}, 'pending')",
+            inserts
+        )
+
+    return {
+        "inserted": len(inserts),
+        "updated": len(updates),
+        "deleted": len(deletes),
+        "unchanged": unchanged,
+    }
+
+
+# JSON schema for one schedule item
+SCHEDULE_ITEM_SCHEMA: dict[str, Any] = {
+    "type": "object",
+    "properties": {
+        "scheduled_date": {"type": "string"},
+        "scheduled_time": {"type": "string"},
+        "item_type": {"type": "string"},
+        "channel": {"type": "string"},
+        "send_type_key": {"type": "string", "description": "Send type key (resolves to send_type_id)"},
+        "channel_key": {"type": "string", "description": "Channel key (resolves to channel_id)"},
+        "caption_id": {"type": "integer"},
+        "caption_text": {"type": "string"},
+        "suggested_price": {"type": "number"},
+        "content_type_id": {"type": "integer"},
+        "flyer_required": {"type": "integer"},
+        "priority": {"type": "integer"},
+        "linked_post_url": {"type": "string"},
+        "expires_at": {"type": "string"},
+        "followup_delay_minutes": {"type": "integer"},
+        "media_type": {"type": "string", "enum": ["none", "picture", "gif", "video", "flyer"]},
+        "campaign_goal": {"type": "number"},
+        "parent_item_id": {"type": "integer", "description": "Parent item ID for followups (auto-sets is_follow_up=1)"}
+    },
+    "required": ["scheduled_date", "scheduled_time", "item_type", "channel"]
+}
+
+# JSON schema for the optional ValidationCertificate
+VALIDATION_CERTIFICATE_SCHEMA: dict[str, Any] = {
+    "type": "object",
+    "description": "Optional ValidationCertificate from quality-validator (Four-Layer Defense v3.1). Phase 1: Optional with warning. Phase 2: Will be required.",
+    "properties": {
+        "certificate_version": {"type": "string"},
+        "creator_id": {"type": "string"},
+        "validation_timestamp": {"type": "string"},
+        "schedule_hash": {"type": "string"},
+        "avoid_types_hash": {"type": "string"},
+        "vault_types_hash": {"type": "string"},
+        "items_validated": {"type": "integer"},
+        "quality_score": {"type": "number"},
+        "validation_status": {"type": "string", "enum": ["APPROVED", "NEEDS_REVIEW", "REJECTED"]},
+        "checks_performed": {"type": "object"},
+        "violations_found": {"type": "object"},
+        "upstream_proof_verified": {"type": "boolean"},
+        "certificate_signature": {"type": "string"}
+    }
+}
+
 
 @mcp_tool(
     name="save_schedule",
@@ -132,50 +500,9 @@ MAX_SCHEDULE_ITEMS = 100
             "items": {
                 "type": "array",
                 "description": "List of schedule items",
-                "items": {
-                    "type": "object",
-                    "properties": {
-                        "scheduled_date": {"type": "string"},
-                        "scheduled_time": {"type": "string"},
-                        "item_type": {"type": "string"},
-                        "channel": {"type": "string"},
-                        "send_type_key": {"type": "string", "description": "Send type key (resolves to send_type_id)"},
-                        "channel_key": {"type": "string", "description": "Channel key (resolves to channel_id)"},
-                        "caption_id": {"type": "integer"},
-                        "caption_text": {"type": "string"},
-                        "suggested_price": {"type": "number"},
-                        "content_type_id": {"type": "integer"},
-                        "flyer_required": {"type": "integer"},
-                        "priority": {"type": "integer"},
-                        "linked_post_url": {"type": "string"},
-                        "expires_at": {"type": "string"},
-                        "followup_delay_minutes": {"type": "integer"},
-                        "media_type": {"type": "string", "enum": ["none", "picture", "gif", "video", "flyer"]},
-                        "campaign_goal": {"type": "number"},
-                        "parent_item_id": {"type": "integer", "description": "Parent item ID for followups (auto-sets is_follow_up=1)"}
-                    },
-                    "required": ["scheduled_date", "scheduled_time", "item_type", "channel"]
-                }
+                "items": SCHEDULE_ITEM_SCHEMA
             },
-            "validation_certificate": {
-                "type": "object",
-                "description": "Optional ValidationCertificate from quality-validator (Four-Layer Defense v3.1). Phase 1: Optional with warning. Phase 2: Will be required.",
-                "properties": {
-                    "certificate_version": {"type": "string"},
-                    "creator_id": {"type": "string"},
-                    "validation_timestamp": {"type": "string"},
-                    "schedule_hash": {"type": "string"},
-                    "avoid_types_hash": {"type": "string"},
-                    "vault_types_hash": {"type": "string"},
-                    "items_validated": {"type": "integer"},
-                    "quality_score": {"type": "number"},
-                    "validation_status": {"type": "string", "enum": ["APPROVED", "NEEDS_REVIEW", "REJECTED"]},
-                    "checks_performed": {"type": "object"},
-                    "violations_found": {"type": "object"},
-                    "upstream_proof_verified": {"type": "boolean"},
-                    "certificate_signature": {"type": "string"}
-                }
-            }
+            "validation_certificate": VALIDATION_CERTIFICATE_SCHEMA
         },
         "required": ["creator_id", "week_start", "items"]
     }
@@ -189,7 +516,9 @@ def save_schedule(
     """
     Save generated schedule to database.
 
-    Creates a schedule_template record and inserts all schedule_items.
+    Creates (or refreshes) a schedule_template record and synchronizes its
+    schedule_items. On re-save only new, changed and removed items are
+    written; unchanged items keep their item_id and status.
     Supports both legacy item_type/channel format and new send_type_key/channel_key format.
 
     Four-Layer Defense (v3.1):
@@ -227,7 +556,8 @@ def save_schedule(
         Dictionary containing:
             - success: Boolean indicating success
             - template_id: ID of created template
-            - items_created: Number of items inserted
+            - items_created: Number of items in the saved schedule
+            - changes: Counts of items inserted, updated, deleted and unchanged
             - warnings: List of validation warnings (if any)
             - certificate_validation: Certificate validation result (if provided)
     """
@@ -263,119 +593,12 @@ def save_schedule(
             return {"error": "week_start must be in YYYY-MM-DD format"}
 
         # Pre-load lookup tables for key resolution
-        cursor = conn.execute("SELECT send_type_id, send_type_key, requires_flyer FROM send_types")
-        send_types_map = {row["send_type_key"]: {"id": row["send_type_id"], "requires_flyer": row["requires_flyer"]} for row in cursor.fetchall()}
-
-        cursor = conn.execute("SELECT channel_id, channel_key FROM channels")
-        channels_map = {row["channel_key"]: row["channel_id"] for row in cursor.fetchall()}
-
-        # Count PPVs and bumps
-        total_ppvs = sum(1 for item in items if item.get("item_type") == "ppv" or (item.get("send_type_key") or "").startswith("ppv"))
-        total_bumps = sum(1 for item in items if item.get("item_type") in ("bump", "ppv_bump") or (item.get("send_type_key") or "").startswith("bump"))
-
-        # Insert template
-        cursor = conn.execute(
-            """
-            INSERT INTO schedule_templates (
-                creator_id, week_start, week_end, generated_at,
-                generated_by, algorithm_version, total_items,
-                total_ppvs, total_bumps, status
-            ) VALUES (?, ?, ?, datetime('now'), 'mcp_server', '2.0', ?, ?, ?, 'draft')
-            ON CONFLICT(creator_id, week_start) DO UPDATE SET
-                week_end = excluded.week_end,
-                generated_at = datetime('now'),
-                total_items = excluded.total_items,
-                total_ppvs = excluded.total_ppvs,
-                total_bumps = excluded.total_bumps,
-                status = 'draft'
-            """,
-            (resolved_creator_id, week_start, week_end, len(items), total_ppvs, total_bumps)
-        )
+        send_types_map, channels_map = _load_lookup_maps(conn)
 
-        # Get the template_id
-        cursor = conn.execute(
-            """
-            SELECT template_id FROM schedule_templates
-            WHERE creator_id = ? AND week_start = ?
-            """,
-            (resolved_creator_id, week_start)
-        )
-        template_row = cursor.fetchone()
-        template_id = template_row["template_id"]
+        template_id = _upsert_template(conn, resolved_creator_id, week_start, week_end, items)
 
-        # Delete existing items for this template (in case of update)
-        conn.execute(
-            "DELETE FROM schedule_items WHERE template_id = ?",
-            (template_id,)
-        )
-
-        # Insert schedule items
-        items_created = 0
-        warnings: list[str] = []
-
-        for idx, item in enumerate(items):
-            # Resolve send_type_key to send_type_id
-            send_type_id = None
-            send_type_key = item.get("send_type_key")
-            if send_type_key:
-                if send_type_key in send_types_map:
-                    send_type_info = send_types_map[send_type_key]
-                    send_type_id = send_type_info["id"]
-                    # Validate flyer requirement
-                    if send_type_info["requires_flyer"] == 1 and item.get("flyer_required", 0) == 0:
-                        warnings.append(f"Item {idx}: send_type '{send_type_key}' requires flyer but flyer_required=0")
-                else:
-                    warnings.append(f"Item {idx}: Unknown send_type_key '{send_type_key}'")
-
-            # Resolve channel_key to channel_id
-            channel_id = None
-            channel_key = item.get("channel_key")
-            if channel_key:
-                if channel_key in channels_map:
-                    channel_id = channels_map[channel_key]
-                else:
-                    warnings.append(f"Item {idx}: Unknown channel_key '{channel_key}'")
-
-            # Determine is_follow_up based on parent_item_id
-            parent_item_id = item.get("parent_item_id")
-            is_follow_up = 1 if parent_item_id is not None else 0
-
-            conn.execute(
-                """
-                INSERT INTO schedule_items (
-                    template_id, creator_id, scheduled_date, scheduled_time,
-                    item_type, channel, caption_id, caption_text,
-                    suggested_price, content_type_id, flyer_required, priority, status,
-                    send_type_id, channel_id,
-                    linked_post_url, expires_at, followup_delay_minutes,
-                    media_type, campaign_goal, parent_item_id, is_follow_up
-                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, 'pending', ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                """,
-                (
-                    template_id,
-                    resolved_creator_id,
-                    item.get("scheduled_date"),
-                    item.get("scheduled_time"),
-                    item.get("item_type"),
-                    item.get("channel", "mass_message"),
-                    item.get("caption_id"),
-                    item.get("caption_text"),
-                    item.get("suggested_price"),
-                    item.get("content_type_id"),
-                    item.get("flyer_required", 0),
-                    item.get("priority", 5),
-                    send_type_id,
-                    channel_id,
-                    item.get("linked_post_url"),
-                    item.get("expires_at"),
-                    item.get("followup_delay_minutes"),
-                    item.get("media_type"),
-                    item.get("campaign_goal"),
-                    parent_item_id,
-                    is_follow_up
-                )
-            )
-            items_created += 1
+        rows, warnings = _build_item_rows(items, send_types_map, channels_map)
+        changes = _sync_schedule_items(conn, template_id, resolved_creator_id, rows)
 
         conn.commit()
 
@@ -385,26 +608,15 @@ def save_schedule(
         result: dict[str, Any] = {
             "success": True,
             "template_id": template_id,
-            "items_created": items_created,
+            "items_created": len(rows),
+            "changes": changes,
             "week_start": week_start,
             "week_end": week_end
         }
         if all_warnings:
             result["warnings"] = all_warnings
 
-        # Include certificate validation info if certificate was provided
-        if validation_certificate:
-            result["certificate_validation"] = {
-                "valid": cert_validation["valid"],
-                "signature": cert_validation.get("certificate_signature"),
-                "quality_score": validation_certificate.get("quality_score"),
-                "status": validation_certificate.get("validation_status")
-            }
-        else:
-            result["certificate_validation"] = {
-                "valid": True,  # Phase 1: No certificate is valid (with warning)
-                "phase_1_warning": "No certificate provided - schedule saved without validation proof"
-            }
+        result["certificate_validation"] = _certificate_summary(validation_certificate, cert_validation)
 
         return result
     except sqlite3.Error as e:
@@ -412,3 +624,175 @@ def save_schedule(
         return {"error": f"Database error: {str(e)}"}
     finally:
         conn.close()
+
+
+@mcp_tool(
+    name="save_schedules_batch",
+    description="Save many creators' generated schedules in one transaction. Lookup tables are loaded once and all templates and items are written with a single commit; returns per-creator results.",
+    schema={
+        "type": "object",
+        "properties": {
+            "schedules": {
+                "type": "array",
+                "description": f"Schedules to save (max {MAX_BATCH_SCHEDULES}), each with the same fields as save_schedule",
+                "items": {
+                    "type": "object",
+                    "properties": {
+                        "creator_id": {"type": "string"},
+                        "week_start": {"type": "string"},
+                        "items": {"type": "array", "items": SCHEDULE_ITEM_SCHEMA},
+                        "validation_certificate": VALIDATION_CERTIFICATE_SCHEMA
+                    },
+                    "required": ["creator_id", "week_start", "items"]
+                }
+            }
+        },
+        "required": ["schedules"]
+    }
+)
+def save_schedules_batch(schedules: list[dict[str, Any]]) -> dict[str, Any]:
+    """
+    Save generated schedules for many creators in one write transaction.
+
+    Equivalent to calling save_schedule once per entry, but the send_types
+    and channels lookup tables are loaded once, and every template upsert
+    and item sync runs inside a single BEGIN IMMEDIATE ... COMMIT, so the
+    whole batch costs one commit (one WAL fsync) instead of one per creator.
+
+    Each entry is saved under its own savepoint: an entry that fails
+    validation or hits a database error is rolled back and reported
+    without affecting the rest of the batch.
+
+    Args:
+        schedules: List of schedules (max 50), each containing:
+            - creator_id: The creator_id for the schedule
+            - week_start: ISO format date for week start (YYYY-MM-DD)
+            - items: List of schedule items (max 100), as for save_schedule
+            - validation_certificate: Optional ValidationCertificate
+
+    Returns:
+        Dictionary containing:
+            - success: True if every schedule was saved
+            - saved: Number of schedules saved
+            - failed: Number of schedules rejected
+            - results: Per-schedule results in input order, each with
+              creator_id, week_start and either the save_schedule result
+              fields or an error
+    """
+    if not isinstance(schedules, list) or not schedules:
+        return {"error": "schedules must be a non-empty list"}
+
+    if len(schedules) > MAX_BATCH_SCHEDULES:
+        logger.warning(f"save_schedules_batch: Payload exceeds maximum. Received {len(schedules)} schedules, max is {MAX_BATCH_SCHEDULES}")
+        return {"error": f"Batch exceeds maximum of {MAX_BATCH_SCHEDULES} schedules. Received: {len(schedules)}"}
+
+    conn = get_db_connection()
+    try:
+        # One immediate write transaction for the whole batch
+        conn.execute("BEGIN IMMEDIATE")
+
+        # Pre-load lookup tables once for every schedule
+        send_types_map, channels_map = _load_lookup_maps(conn)
+
+        results: list[dict[str, Any]] = []
+        seen_weeks: set[tuple[str, str]] = set()
+
+        for index, entry in enumerate(schedules):
+            entry = entry if isinstance(entry, dict) else {}
+            creator_id = entry.get("creator_id")
+            week_start = entry.get("week_start")
+            items = entry.get("items")
+            validation_certificate = entry.get("validation_certificate")
+            result: dict[str, Any] = {"creator_id": creator_id, "week_start": week_start}
+            results.append(result)
+
+            if not isinstance(items, list):
+                result["error"] = "items must be a list"
+                continue
+
+            if len(items) > MAX_SCHEDULE_ITEMS:
+                result["error"] = f"Schedule exceeds maximum of {MAX_SCHEDULE_ITEMS} items. Received: {len(items)}"
+                continue
+
+            if not isinstance(creator_id, str):
+                result["error"] = "Invalid creator_id: creator_id must be a string"
+                continue
+
+            if not isinstance(week_start, str):
+                result["error"] = "week_start must be in YYYY-MM-DD format"
+                continue
+
+            is_valid, error_msg = validate_creator_id(creator_id)
+            if not is_valid:
+                logger.warning(f"save_schedules_batch: Invalid creator_id at index {index} - {error_msg}")
+                result["error"] = f"Invalid creator_id: {error_msg}"
+                continue
+
+            try:
+                week_start_dt = datetime.strptime(week_start, "%Y-%m-%d")
+                week_end = (week_start_dt + timedelta(days=6)).strftime("%Y-%m-%d")
+            except (TypeError, ValueError):
+                result["error"] = "week_start must be in YYYY-MM-DD format"
+                continue
+
+            cert_validation = _validate_certificate(validation_certificate, items, creator_id)
+            for warning in cert_validation["warnings"]:
+                logger.warning(f"save_schedules_batch certificate ({creator_id}): {warning}")
+
+            conn.execute("SAVEPOINT batch_schedule")
+            try:
+                resolved_creator_id = resolve_creator_id(conn, creator_id)
+                if not resolved_creator_id:
+                    result["error"] = f"Creator not found: {creator_id}"
+                    conn.execute("RELEASE SAVEPOINT batch_schedule")
+                    continue
+
+                if (resolved_creator_id, week_start) in seen_weeks:
+                    result["error"] = f"Duplicate schedule in batch for {creator_id} week {week_start}"
+                    conn.execute("RELEASE SAVEPOINT batch_schedule")
+                    continue
+
+                template_id = _upsert_template(conn, resolved_creator_id, week_start, week_end, items)
+                rows, warnings = _build_item_rows(items, send_types_map, channels_map)
+                changes = _sync_schedule_items(conn, template_id, resolved_creator_id, rows)
+                conn.execute("RELEASE SAVEPOINT batch_schedule")
+            except Exception as e:
+                # Undo this entry's partial writes whatever the failure, so
+                # the savepoint never stays open into the next entry
+                conn.execute("ROLLBACK TO SAVEPOINT batch_schedule")
+                conn.execute("RELEASE SAVEPOINT batch_schedule")
+                if not isinstance(e, sqlite3.Error):
+                    raise
+                result["error"] = f"Database error: {str(e)}"
+                continue
+
+            seen_weeks.add((resolved_creator_id, week_start))
+            result.update({
+                "success": True,
+                "template_id": template_id,
+                "items_created": len(rows),
+                "changes": changes,
+                "week_end": week_end,
+            })
+            all_warnings = warnings + cert_validation.get("warnings", [])
+            if all_warnings:
+                result["warnings"] = all_warnings
+            result["certificate_validation"] = _certificate_summary(validation_certificate, cert_validation)
+
+        conn.commit()
+
+        saved = sum(1 for result in results if result.get("success"))
+        return {
+            "success": saved == len(results),
+            "saved": saved,
+            "failed": len(results) - saved,
+            "results": results
+        }
+    except sqlite3.Error as e:
+        conn.rollback()
+        return {"error": f"Database error: {str(e)}"}
+    except Exception:
+        conn.rollback()
+        raise
+    finally:
+        conn.close()
@@ -11,11 +11,44 @@ from typing import Any, Optional
 
 from mcp.connection import db_connection, get_db_connection
 from mcp.tools.base import mcp_tool
-from mcp.utils.helpers import row_to_dict, rows_to_list, resolve_creator_id
+from mcp.utils.helpers import get_send_type_snapshot, resolve_creator_id
 from mcp.utils.security import validate_key_input
 
 logger = logging.getLogger("eros_db_server")
 
+# send_types columns returned by get_send_types and get_send_type_details
+SEND_TYPE_COLUMNS: tuple[str, ...] = (
+    "send_type_id",
+    "send_type_key",
+    "category",
+    "display_name",
+    "description",
+    "purpose",
+    "strategy",
+    "requires_media",
+    "requires_flyer",
+    "requires_price",
+    "requires_link",
+    "has_expiration",
+    "default_expiration_hours",
+    "can_have_followup",
+    "followup_delay_minutes",
+    "page_type_restriction",
+    "caption_length",
+    "emoji_recommendation",
+    "max_per_day",
+    "max_per_week",
+    "min_hours_between",
+    "sort_order",
+    "is_active",
+    "created_at",
+)
+
+
+def _send_type_record(row: Any) -> dict[str, Any]:
+    """Project a snapshot send_types row onto SEND_TYPE_COLUMNS."""
+    return {column: row[column] for column in SEND_TYPE_COLUMNS if column in row}
+
 
 @mcp_tool(
     name="get_send_types",
@@ -54,54 +87,25 @@ def get_send_types(
             - send_types: List of all send type records with all columns
             - count: Total number of send types returned
     """
+    if category is not None and category not in ("revenue", "engagement", "retention"):
+        return {"error": "category must be 'revenue', 'engagement', or 'retention'"}
+    if page_type is not None and page_type not in ("paid", "free"):
+        return {"error": "page_type must be 'paid' or 'free'"}
+
     with db_connection() as conn:
-        query = """
-            SELECT
-                send_type_id,
-                send_type_key,
-                category,
-                display_name,
-                description,
-                purpose,
-                strategy,
-                requires_media,
-                requires_flyer,
-                requires_price,
-                requires_link,
-                has_expiration,
-                default_expiration_hours,
-                can_have_followup,
-                followup_delay_minutes,
-                page_type_restriction,
-                caption_length,
-                emoji_recommendation,
-                max_per_day,
-                max_per_week,
-                min_hours_between,
-                sort_order,
-                is_active,
-                created_at
-            FROM send_types
-            WHERE is_active = 1
-        """
-        params: list[Any] = []
-
-        if category is not None:
-            if category not in ("revenue", "engagement", "retention"):
-                return {"error": "category must be 'revenue', 'engagement', or 'retention'"}
-            query += " AND category = ?"
-            params.append(category)
-
-        if page_type is not None:
-            if page_type not in ("paid", "free"):
-                return {"error": "page_type must be 'paid' or 'free'"}
-            query += " AND (page_type_restriction = ? OR page_type_restriction = 'both')"
-            params.append(page_type)
-
-        query += " ORDER BY sort_order ASC"
-
-        cursor = conn.execute(query, params)
-        send_types = rows_to_list(cursor.fetchall())
+        snapshot = get_send_type_snapshot(conn)
+
+        rows = [
+            row for row in snapshot.rows.values()
+            if row.get("is_active") == 1
+            and (category is None or row.get("category") == category)
+            and (
+                page_type is None
+                or row.get("page_type_restriction") in (page_type, "both")
+            )
+        ]
+        rows.sort(key=lambda row: row.get("sort_order") or 0)
+        send_types = [_send_type_record(row) for row in rows]
 
         return {
             "send_types": send_types,
@@ -146,58 +150,17 @@ def get_send_type_details(send_type_key: str) -> dict[str, Any]:
 
     conn = get_db_connection()
     try:
-        # Get send type record
-        cursor = conn.execute(
-            """
-            SELECT
-                send_type_id,
-                send_type_key,
-                category,
-                display_name,
-                description,
-                purpose,
-                strategy,
-                requires_media,
-                requires_flyer,
-                requires_price,
-                requires_link,
-                has_expiration,
-                default_expiration_hours,
-                can_have_followup,
-                followup_delay_minutes,
-                page_type_restriction,
-                caption_length,
-                emoji_recommendation,
-                max_per_day,
-                max_per_week,
-                min_hours_between,
-                sort_order,
-                is_active,
-                created_at
-            FROM send_types
-            WHERE send_type_key = ?
-            """,
-            (send_type_key,)
-        )
-        send_type = row_to_dict(cursor.fetchone())
+        snapshot = get_send_type_snapshot(conn)
 
-        if not send_type:
+        row = snapshot.rows.get(send_type_key)
+        if row is None:
             return {"error": f"Send type not found: {send_type_key}"}
 
-        # Get caption requirements
-        cursor = conn.execute(
-            """
-            SELECT
-                caption_type,
-                priority,
-                notes
-            FROM send_type_caption_requirements
-            WHERE send_type_id = ?
-            ORDER BY priority ASC
-            """,
-            (send_type["send_type_id"],)
-        )
-        caption_requirements = rows_to_list(cursor.fetchall())
+        send_type = _send_type_record(row)
+        caption_requirements = [
+            requirement.to_dict()
+            for requirement in snapshot.requirements_for(send_type_key)
+        ]
 
         return {
             "send_type": send_type,
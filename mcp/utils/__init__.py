@@ -4,7 +4,18 @@ EROS MCP Server Utilities
 Helper functions for database operations and security validation.
 """
 
-from mcp.utils.helpers import row_to_dict, rows_to_list, resolve_creator_id
+from mcp.utils.helpers import (
+    row_to_dict,
+    rows_to_list,
+    rows_to_columnar,
+    cursor_columns,
+    encode_rows,
+    columnarize_result,
+    dump_tool_json,
+    resolve_creator_id,
+    get_send_type_snapshot,
+    RESPONSE_FORMATS,
+)
 from mcp.utils.security import (
     validate_creator_id,
     validate_key_input,
@@ -20,7 +31,14 @@ __all__ = [
     # Helpers
     "row_to_dict",
     "rows_to_list",
+    "rows_to_columnar",
+    "cursor_columns",
+    "encode_rows",
+    "columnarize_result",
+    "dump_tool_json",
+    "RESPONSE_FORMATS",
     "resolve_creator_id",
+    "get_send_type_snapshot",
     # Security
     "validate_creator_id",
     "validate_key_input",
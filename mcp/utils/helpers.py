@@ -1,11 +1,26 @@
 """
 EROS MCP Server Helper Utilities
 
-Database row conversion and creator ID resolution functions.
+Database row conversion, response encoding, creator ID resolution and
+send type snapshot access functions.
 """
 
+import json
 import sqlite3
-from typing import Any, Optional
+from typing import TYPE_CHECKING, Any, Iterable, Optional, Sequence
+
+if TYPE_CHECKING:
+    from python.registry.send_type_registry import SendTypeSnapshot
+
+# Optional fast JSON encoder for compact responses
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# Supported tool response encodings
+RESPONSE_FORMATS = ("objects", "columnar")
 
 
 def row_to_dict(row: Optional[sqlite3.Row]) -> Optional[dict[str, Any]]:
@@ -36,6 +51,129 @@ def rows_to_list(rows: list[sqlite3.Row]) -> list[dict[str, Any]]:
     return [dict(row) for row in rows]
 
 
+def rows_to_columnar(
+    rows: Iterable[Sequence[Any]],
+    columns: list[str]
+) -> dict[str, Any]:
+    """
+    Convert rows to a compact columnar payload.
+
+    Column names are emitted once instead of being repeated as keys in every
+    row, and rows are copied straight from the row tuples without building
+    intermediate dictionaries.
+
+    Args:
+        rows: Iterable of sqlite3.Row objects or plain tuples.
+        columns: Column names in row order.
+
+    Returns:
+        Dictionary with "columns" (list of names) and "rows" (list of value lists).
+    """
+    return {
+        "columns": list(columns),
+        "rows": [list(row) for row in rows],
+    }
+
+
+def cursor_columns(cursor: sqlite3.Cursor) -> list[str]:
+    """
+    Get the column names of an executed cursor.
+
+    Args:
+        cursor: An executed sqlite3 cursor.
+
+    Returns:
+        List of column names (empty for statements without a result set).
+    """
+    return [description[0] for description in cursor.description] if cursor.description else []
+
+
+def encode_rows(
+    rows: Sequence[Sequence[Any]],
+    columns: list[str],
+    response_format: str = "objects"
+) -> Any:
+    """
+    Encode fetched rows in the requested response format.
+
+    Args:
+        rows: Fetched sqlite3.Row objects.
+        columns: Column names in row order (see cursor_columns()).
+        response_format: "objects" for a list of dicts, "columnar" for
+            a {"columns": [...], "rows": [[...]]} payload.
+
+    Returns:
+        List of dictionaries or columnar dictionary.
+    """
+    if response_format == "columnar":
+        return rows_to_columnar(rows, columns)
+    return rows_to_list(rows)
+
+
+def columnarize_result(result: Any) -> Any:
+    """
+    Re-encode row lists in a tool result as columnar payloads.
+
+    Applies to top-level values that are non-empty lists of dictionaries
+    sharing the same keys in the same order. Other values (including lists
+    with heterogeneous rows) are left unchanged. Used for tools that do not
+    build columnar output natively.
+
+    Args:
+        result: A tool result.
+
+    Returns:
+        The result with eligible row lists converted.
+    """
+    if not isinstance(result, dict):
+        return result
+
+    encoded: dict[str, Any] = {}
+    for key, value in result.items():
+        if (
+            isinstance(value, list)
+            and value
+            and all(isinstance(item, dict) for item in value)
+        ):
+            columns = list(value[0].keys())
+            if all(list(item.keys()) == columns for item in value):
+                encoded[key] = {
+                    "columns": columns,
+                    "rows": [list(item.values()) for item in value],
+                }
+                continue
+        encoded[key] = value
+    return encoded
+
+
+def dump_tool_json(result: Any, compact: bool = False) -> str:
+    """
+    Serialize a tool result to JSON text.
+
+    The default output is indented for readability. Compact output drops
+    whitespace, which lets the standard library use its C encoder, and uses
+    orjson when installed.
+
+    Args:
+        result: The tool result.
+        compact: Produce compact output.
+
+    Returns:
+        JSON string.
+    """
+    if not compact:
+        return json.dumps(result, indent=2, default=str)
+
+    if ORJSON_AVAILABLE:
+        try:
+            return orjson.dumps(
+                result, default=str, option=orjson.OPT_NON_STR_KEYS
+            ).decode("utf-8")
+        except TypeError:
+            pass  # Fall back to the standard library for unsupported values
+    return json.dumps(result, separators=(",", ":"), default=str)
+
+
 def resolve_creator_id(conn: sqlite3.Connection, creator_id: str) -> Optional[str]:
     """
     Resolve a creator_id or page_name to the actual creator_id.
@@ -56,3 +194,21 @@ def resolve_creator_id(conn: sqlite3.Connection, creator_id: str) -> Optional[st
     )
     row = cursor.fetchone()
     return row["creator_id"] if row else None
+
+
+def get_send_type_snapshot(conn: sqlite3.Connection) -> "SendTypeSnapshot":
+    """
+    Get the shared send type snapshot, reloading it if the tables changed.
+
+    Tools read send type rows, IDs and caption requirements from this
+    snapshot instead of querying send_types on every call.
+
+    Args:
+        conn: Database connection.
+
+    Returns:
+        The current python.registry.SendTypeSnapshot for the database.
+    """
+    from python.registry.send_type_registry import SendTypeRegistry
+
+    return SendTypeRegistry().refresh(conn)
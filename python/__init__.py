@@ -9,93 +9,90 @@ algorithms and machine learning.
 __version__ = "3.0.0"
 __author__ = "EROS Team"
 
-# Domain model exports (Wave 3)
-from python.models import (
-    Creator,
-    CreatorProfile,
-    Caption,
-    CaptionScore,
-    ScheduleItem,
-    ScheduleTemplate,
-    SendType,
-    SendTypeConfig,
-    VolumeConfig,
-    VolumeTier,
-    # PPV restructuring additions
-    TipGoalMode,
-    PPV_TYPES,
-    PPV_REVENUE_TYPES,
-    DEPRECATED_SEND_TYPES,
-    SEND_TYPE_ALIASES,
-    PAGE_TYPE_FREE_ONLY,
-    PAGE_TYPE_PAID_ONLY,
-    REVENUE_TYPES,
-    ENGAGEMENT_TYPES,
-    RETENTION_TYPES,
-    resolve_send_type_key,
-    is_valid_for_page_type,
-)
+from python.lazy_imports import lazy_exports
 
-# Registry exports (Wave 3)
-from python.registry import SendTypeRegistry
-
-# Configuration exports (Wave 3)
-from python.config import Settings
-
-# Core allocation exports
-from python.allocation import SendTypeAllocator
-
-# Caption matching exports
-from python.matching import CaptionMatcher
-
-# Optimization exports
-from python.optimization import ScheduleOptimizer
-
-# Validation exports
-from python.validation import (
-    VaultValidator,
-    VaultValidationResult,
-    ContentTypePreference,
-)
-
-# Exception exports
-from python.exceptions import (
-    EROSError,
-    CreatorNotFoundError,
-    InsufficientCaptionsError,
-    ValidationError,
-    InvalidCreatorIdError,
-    InvalidSendTypeError,
-    InvalidDateRangeError,
-    DatabaseError,
-    DatabaseConnectionError,
-    QueryError,
-    ConfigurationError,
-    MissingConfigError,
-    ScheduleError,
-    ScheduleCapacityError,
-    TimingConflictError,
-)
-
-# Logging exports
-from python.logging_config import (
-    configure_logging,
-    get_logger,
-    get_context_logger,
-    log_fallback,
-)
-
-# Validator exports
-from python.validators import (
-    validate_creator_id,
-    validate_send_type_key,
-    validate_date_range,
-    validate_page_type,
-    validate_category,
-    is_valid_creator_id,
-    is_valid_send_type_key,
-    VALID_SEND_TYPE_KEYS,
-)
+# Public names are imported from their submodules on first access (PEP 562),
+# so `import python` does not load every subpackage up front.
+__getattr__, __dir__ = lazy_exports(__name__, {
+    # Domain model exports (Wave 3)
+    "python.models": (
+        "Creator",
+        "CreatorProfile",
+        "Caption",
+        "CaptionScore",
+        "ScheduleItem",
+        "ScheduleTemplate",
+        "SendType",
+        "SendTypeConfig",
+        "VolumeConfig",
+        "VolumeTier",
+        # PPV restructuring additions
+        "TipGoalMode",
+        "PPV_TYPES",
+        "PPV_REVENUE_TYPES",
+        "DEPRECATED_SEND_TYPES",
+        "SEND_TYPE_ALIASES",
+        "PAGE_TYPE_FREE_ONLY",
+        "PAGE_TYPE_PAID_ONLY",
+        "REVENUE_TYPES",
+        "ENGAGEMENT_TYPES",
+        "RETENTION_TYPES",
+        "resolve_send_type_key",
+        "is_valid_for_page_type",
+    ),
+    # Registry exports (Wave 3)
+    "python.registry": ("SendTypeRegistry",),
+    # Configuration exports (Wave 3)
+    "python.config": ("Settings",),
+    # Core allocation exports
+    "python.allocation": ("SendTypeAllocator",),
+    # Caption matching exports
+    "python.matching": ("CaptionMatcher",),
+    # Optimization exports
+    "python.optimization": ("ScheduleOptimizer",),
+    # Validation exports
+    "python.validation": (
+        "VaultValidator",
+        "VaultValidationResult",
+        "ContentTypePreference",
+    ),
+    # Exception exports
+    "python.exceptions": (
+        "EROSError",
+        "CreatorNotFoundError",
+        "InsufficientCaptionsError",
+        "ValidationError",
+        "InvalidCreatorIdError",
+        "InvalidSendTypeError",
+        "InvalidDateRangeError",
+        "DatabaseError",
+        "DatabaseConnectionError",
+        "QueryError",
+        "ConfigurationError",
+        "MissingConfigError",
+        "ScheduleError",
+        "ScheduleCapacityError",
+        "TimingConflictError",
+    ),
+    # Logging exports
+    "python.logging_config": (
+        "configure_logging",
+        "get_logger",
+        "get_context_logger",
+        "log_fallback",
+    ),
+    # Validator exports
+    "python.validators": (
+        "validate_creator_id",
+        "validate_send_type_key",
+        "validate_date_range",
+        "validate_page_type",
+        "validate_category",
+        "is_valid_creator_id",
+        "is_valid_send_type_key",
+        "VALID_SEND_TYPE_KEYS",
+    ),
+})
 
 __all__ = [
     # Version info
@@ -20,6 +20,11 @@ from python.models.send_type import (
 )
 from python.models.creator_timing_profile import CreatorTimingProfile
 
+# Allocation modes accepted by SendTypeAllocator.allocate_week()
+# - repair: allocate days independently, then validate and rebalance diversity
+# - constraint: search slot assignments that satisfy every weekly rule up front
+ALLOCATION_MODES: tuple[str, ...] = ("repair", "constraint")
+
 
 class VolumeTier(Enum):
     """Volume tier classification based on fan count."""
@@ -93,6 +98,22 @@ class DiversityValidation:
     warnings: List[str] = field(default_factory=list)
 
 
+@dataclass(frozen=True, slots=True)
+class WeekPlan:
+    """Precompiled weekly allocation shared by creators with the same plan key.
+
+    Holds the day-by-day allocation templates after diversity rebalancing,
+    so allocate_week() only has to stamp dates onto copies of the items.
+
+    Attributes:
+        days: Allocation templates for the seven days, starting at week_start
+        validation: Diversity validation of the template week
+    """
+
+    days: tuple[tuple[dict[str, Any], ...], ...]
+    validation: DiversityValidation
+
+
 class SendTypeAllocator:
     """Allocates send types across weekly schedule based on volume configuration."""
 
@@ -260,6 +281,27 @@ class SendTypeAllocator:
         "expired_winback"
     ]
 
+    # Engagement rotation order used by _allocate_engagement()
+    ENGAGEMENT_ROTATION = [
+        "bump_normal",
+        "bump_descriptive",
+        "bump_text_only",
+        "bump_flyer",
+        "dm_farm",
+        "like_farm",
+        "link_drop",
+        "wall_link_drop",
+        "live_promo"
+    ]
+
+    # Node budget for the constraint-mode slot search
+    CONSTRAINT_SEARCH_LIMIT: int = 20000
+
+    # Bound on compiled week plans shared across allocator instances
+    PLAN_CACHE_SIZE: int = 512
+
+    _plan_cache: dict[tuple[Any, ...], WeekPlan] = {}
+
     def __init__(self, creator_id: str = "") -> None:
         """Initialize allocator with creator context.
 
@@ -447,61 +489,441 @@ class SendTypeAllocator:
         self,
         config: VolumeConfig,
         page_type: str,
-        week_start: datetime
+        week_start: datetime,
+        mode: str = "repair"
     ) -> dict[str, list[dict[str, Any]]]:
         """Allocate send types for entire week with diversity enforcement.
 
-        Creates a weekly schedule and validates it meets diversity requirements.
-        If diversity is insufficient, attempts to rebalance the schedule.
+        In "repair" mode, creates a weekly schedule and validates it meets
+        diversity requirements. If diversity is insufficient, attempts to
+        rebalance the schedule.
+
+        In "constraint" mode, diversity requirements, weekly send type
+        limits, the daily followup cap and the no back-to-back PPV type rule
+        are enforced while slots are filled (see _solve_constrained_week),
+        so the week is valid by construction and needs no repair passes.
 
         Args:
             config: Volume configuration
             page_type: 'paid' or 'free'
             week_start: Starting date of week (Monday)
+            mode: 'repair' (default) or 'constraint'
 
         Returns:
             Dictionary mapping dates to lists of send type allocations
 
         Raises:
-            ValueError: If schedule fails diversity requirements after fix attempt
+            ValueError: If mode is unknown, or no schedule meets the
+                diversity requirements (after the fix attempt in repair mode)
         """
+        if mode not in ALLOCATION_MODES:
+            raise ValueError(
+                f"mode must be one of {ALLOCATION_MODES}, got '{mode}'"
+            )
+
+        plan = self.compile_week_plan(config, page_type, week_start.weekday(), mode)
+
+        validation = plan.validation
+        if not validation.is_valid:
+            error_details = "; ".join(validation.errors)
+            failure = (
+                "after fix attempt" if mode == "repair"
+                else "under allocation constraints"
+            )
+            raise ValueError(
+                f"Schedule failed diversity requirements {failure}. "
+                f"Errors: {error_details}. "
+                f"Unique types: {validation.unique_type_count}, "
+                f"Revenue: {validation.revenue_type_count}, "
+                f"Engagement: {validation.engagement_type_count}, "
+                f"Retention: {validation.retention_type_count}"
+            )
+
         weekly_schedule: dict[str, list[dict[str, Any]]] = {}
 
-        for day_offset in range(7):
+        for day_offset, template in enumerate(plan.days):
             current_date = week_start + timedelta(days=day_offset)
+            date_str = current_date.strftime("%Y-%m-%d")
             day_of_week = current_date.weekday()
 
-            daily_items = self.allocate_day(config, day_of_week, page_type)
+            # Add date and scheduling metadata to fresh copies of the template
+            weekly_schedule[date_str] = [
+                {**item, "scheduled_date": date_str, "day_of_week": day_of_week}
+                for item in template
+            ]
+
+        return weekly_schedule
+
+    def plan_key(
+        self,
+        config: VolumeConfig,
+        page_type: str,
+        first_day_of_week: int,
+        mode: str = "repair"
+    ) -> tuple[Any, ...]:
+        """Key identifying every input a weekly allocation depends on.
 
-            # Add date and scheduling metadata
-            for item in daily_items:
-                item["scheduled_date"] = current_date.strftime("%Y-%m-%d")
-                item["day_of_week"] = day_of_week
+        The week depends only on the daily category counts, the page type,
+        the weekday the week starts on, and the creator's strategy rotation
+        (offset 0 when no creator_id is set), so creators sharing these
+        share a compiled plan.
 
-            weekly_schedule[current_date.strftime("%Y-%m-%d")] = daily_items
+        Args:
+            config: Volume configuration
+            page_type: 'paid' or 'free'
+            first_day_of_week: Weekday of week_start (0=Monday)
+            mode: 'repair' or 'constraint'
 
-        # Validate diversity requirements
-        validation = self.validate_diversity(weekly_schedule, page_type)
+        Returns:
+            Hashable plan cache key
+        """
+        strategy_offset = (
+            self._timing_profile.strategy_rotation_offset if self._creator_id else 0
+        )
+        return (
+            type(self),
+            config.revenue_per_day,
+            config.engagement_per_day,
+            config.retention_per_day,
+            page_type,
+            first_day_of_week,
+            strategy_offset,
+            mode,
+        )
 
-        if not validation.is_valid:
-            # Attempt to fix diversity issues
-            weekly_schedule = self._ensure_diversity(weekly_schedule, page_type)
+    def compile_week_plan(
+        self,
+        config: VolumeConfig,
+        page_type: str,
+        first_day_of_week: int,
+        mode: str = "repair"
+    ) -> WeekPlan:
+        """Build (or fetch) the diversity-checked weekly allocation template.
+
+        In repair mode, runs allocate_day() for each of the seven days,
+        validates diversity and rebalances with _ensure_diversity() when
+        needed. In constraint mode, fills the week with
+        _solve_constrained_week(). The result is memoized by plan_key(), so
+        allocating a week for many creators only pays for this once per
+        distinct key.
 
-            # Re-validate after fix attempt
-            validation = self.validate_diversity(weekly_schedule, page_type)
+        Args:
+            config: Volume configuration
+            page_type: 'paid' or 'free'
+            first_day_of_week: Weekday of week_start (0=Monday)
+            mode: 'repair' (default) or 'constraint'
+
+        Returns:
+            WeekPlan with day templates and their diversity validation
+        """
+        key = self.plan_key(config, page_type, first_day_of_week, mode)
+        cache = SendTypeAllocator._plan_cache
+        plan = cache.get(key)
+        if plan is not None:
+            return plan
+
+        if mode == "constraint":
+            solved = self._solve_constrained_week(config, page_type, first_day_of_week)
+            if solved is None:
+                validation = DiversityValidation(
+                    is_valid=False,
+                    unique_type_count=0,
+                    revenue_type_count=0,
+                    engagement_type_count=0,
+                    retention_type_count=0,
+                    errors=[
+                        "No allocation satisfies diversity, weekly limit, "
+                        "followup cap and back-to-back PPV constraints"
+                    ],
+                )
+                template_week: dict[str, list[dict[str, Any]]] = {}
+            else:
+                template_week = solved
+                validation = self.validate_diversity(template_week, page_type)
+        else:
+            template_week = {}
+            for day_offset in range(7):
+                day_of_week = (first_day_of_week + day_offset) % 7
+                template_week[str(day_offset)] = self.allocate_day(config, day_of_week, page_type)
+
+            # Validate diversity requirements
+            validation = self.validate_diversity(template_week, page_type)
 
             if not validation.is_valid:
-                error_details = "; ".join(validation.errors)
-                raise ValueError(
-                    f"Schedule failed diversity requirements after fix attempt. "
-                    f"Errors: {error_details}. "
-                    f"Unique types: {validation.unique_type_count}, "
-                    f"Revenue: {validation.revenue_type_count}, "
-                    f"Engagement: {validation.engagement_type_count}, "
-                    f"Retention: {validation.retention_type_count}"
+                # Attempt to fix diversity issues, then re-validate
+                template_week = self._ensure_diversity(template_week, page_type)
+                validation = self.validate_diversity(template_week, page_type)
+
+        plan = WeekPlan(
+            days=tuple(tuple(items) for items in template_week.values()),
+            validation=validation,
+        )
+
+        if len(cache) >= self.PLAN_CACHE_SIZE:
+            # Evict the oldest plan (dicts preserve insertion order)
+            del cache[next(iter(cache))]
+        cache[key] = plan
+        return plan
+
+    @classmethod
+    def clear_plan_cache(cls) -> None:
+        """Drop compiled week plans (e.g. after changing class-level tables)."""
+        SendTypeAllocator._plan_cache.clear()
+
+    def _daily_counts(self, config: VolumeConfig, day_of_week: int) -> dict[str, int]:
+        """Day-adjusted sends per category, as used by allocate_day().
+
+        Args:
+            config: Volume configuration
+            day_of_week: 0=Monday, 6=Sunday
+
+        Returns:
+            Mapping of category to number of sends for the day
+        """
+        adjustment = self.DAY_ADJUSTMENTS.get(day_of_week, 0)
+        counts: dict[str, int] = {}
+        for category, base in (
+            ("revenue", config.revenue_per_day),
+            ("engagement", config.engagement_per_day),
+            ("retention", config.retention_per_day),
+        ):
+            # A base count of 0 stays at 0 regardless of the day adjustment
+            adjusted = max(0, base + adjustment) if base > 0 else 0
+            counts[category] = min(adjusted, self.DAILY_MAXIMUMS[category])
+        return counts
+
+    def _category_pool(self, category: str, page_type: str, day_of_week: int) -> list[str]:
+        """Page-type-valid send types for a category, in daily flavor order.
+
+        Args:
+            category: 'revenue', 'engagement' or 'retention'
+            page_type: 'paid' or 'free'
+            day_of_week: 0=Monday, 6=Sunday
+
+        Returns:
+            Candidate send type keys, preferred first
+        """
+        if category == "revenue":
+            pool = self.get_revenue_types_for_page(page_type)
+        elif category == "engagement":
+            pool = self.ENGAGEMENT_ROTATION.copy()
+        elif page_type == "free":
+            pool = self.FREE_PAGE_RETENTION_TYPES.copy()
+        else:
+            pool = self.RETENTION_TYPES.copy()
+
+        pool = self.filter_by_page_type(pool, page_type)
+        if category == "retention":
+            return pool
+        return self.apply_daily_flavor(day_of_week, pool)
+
+    def _build_item(self, send_type: str, category: str, day_of_week: int) -> dict[str, Any]:
+        """Build the allocation item for one send type in a category.
+
+        Args:
+            send_type: Send type key
+            category: 'revenue', 'engagement' or 'retention'
+            day_of_week: 0=Monday, 6=Sunday
+
+        Returns:
+            Allocation item dictionary
+        """
+        flavor = self.DAILY_FLAVORS.get(day_of_week, {}).get("emphasis")
+        if category == "revenue":
+            return {
+                "send_type_key": send_type,
+                "category": "revenue",
+                "priority": 1,
+                "requires_caption": True,
+                "requires_media": send_type in [
+                    "ppv_unlock", "ppv_wall", "bundle", "flash_bundle", "snapchat_bundle"
+                ],
+                "requires_price": send_type in [
+                    "ppv_unlock", "ppv_wall", "tip_goal", "bundle", "flash_bundle"
+                ],
+                "_daily_flavor": flavor,
+            }
+        if category == "engagement":
+            return {
+                "send_type_key": send_type,
+                "category": "engagement",
+                "priority": 2,
+                "requires_caption": True,
+                "requires_media": send_type in ["bump_flyer", "wall_link_drop"],
+                "_daily_flavor": flavor,
+            }
+        return {
+            "send_type_key": send_type,
+            "category": "retention",
+            "priority": 3,
+            "requires_caption": True,
+            "requires_media": send_type in ["renew_on_post"],
+        }
+
+    def _solve_constrained_week(
+        self,
+        config: VolumeConfig,
+        page_type: str,
+        first_day_of_week: int
+    ) -> dict[str, list[dict[str, Any]]] | None:
+        """Fill a week slot by slot under all weekly rules (constraint mode).
+
+        The slot skeleton (categories per day, in daily strategy order) is
+        the same as in repair mode. Send types are then chosen slot by slot
+        with backtracking, forward-checking after each choice that:
+        - weekly limits (weekly_limits.WEEKLY_LIMITS) are not exceeded
+        - ppv_followup stays within followup_limiter.MAX_FOLLOWUPS_PER_DAY
+        - consecutive revenue (PPV) sends in a day use different send types,
+          the allocator-level form of the back-to-back style rule
+        - the remaining slots can still reach every DIVERSITY_REQUIREMENTS
+          minimum
+
+        Candidates are tried in rotation order starting from the type repair
+        mode would pick, so schedules keep the daily flavor variety.
+
+        Args:
+            config: Volume configuration
+            page_type: 'paid' or 'free'
+            first_day_of_week: Weekday of week_start (0=Monday)
+
+        Returns:
+            Template week keyed by day offset ('0'-'6'), or None when no
+            assignment satisfies the constraints within
+            CONSTRAINT_SEARCH_LIMIT search nodes
+        """
+        from python.orchestration.followup_limiter import MAX_FOLLOWUPS_PER_DAY
+        from python.orchestration.weekly_limits import WEEKLY_LIMITS
+
+        categories = ("revenue", "engagement", "retention")
+        retention_key = (
+            "min_retention_types_free" if page_type == "free" else "min_retention_types_paid"
+        )
+        min_types = {
+            "revenue": self.DIVERSITY_REQUIREMENTS["min_revenue_types"],
+            "engagement": self.DIVERSITY_REQUIREMENTS["min_engagement_types"],
+            "retention": self.DIVERSITY_REQUIREMENTS[retention_key],
+        }
+        min_unique = self.DIVERSITY_REQUIREMENTS["min_unique_types"]
+
+        # Slot skeleton: (day offset, day_of_week, category, rotation index)
+        slots: list[tuple[int, int, str, int]] = []
+        pools: dict[tuple[int, str], list[str]] = {}
+        for day_offset in range(7):
+            day_of_week = (first_day_of_week + day_offset) % 7
+            counts = self._daily_counts(config, day_of_week)
+            placeholders = {
+                category: [{"category": category} for _ in range(counts[category])]
+                for category in categories
+            }
+            rotation = {category: 0 for category in categories}
+            for item in self._interleave_categories(
+                placeholders["revenue"],
+                placeholders["engagement"],
+                placeholders["retention"],
+                day_of_week,
+            ):
+                category = item["category"]
+                slots.append((day_offset, day_of_week, category, rotation[category]))
+                rotation[category] += 1
+            for category in categories:
+                pools[(day_offset, category)] = self._category_pool(
+                    category, page_type, day_of_week
                 )
 
-        return weekly_schedule
+        all_types = {
+            category: {t for (_, c), pool in pools.items() if c == category for t in pool}
+            for category in categories
+        }
+        remaining = {category: 0 for category in categories}
+        for _, _, category, _ in slots:
+            remaining[category] += 1
+
+        weekly_counts: dict[str, int] = {}
+        used: dict[str, set[str]] = {category: set() for category in categories}
+        followups: dict[int, int] = {}
+        assignment: list[str] = []
+        nodes = 0
+
+        def available(send_type: str) -> bool:
+            limit = WEEKLY_LIMITS.get(send_type)
+            return limit is None or weekly_counts.get(send_type, 0) < limit
+
+        def feasible() -> bool:
+            # Can the unfilled slots still reach every diversity minimum?
+            shortfall_total = max(0, min_unique - sum(len(u) for u in used.values()))
+            open_total = 0
+            for category in categories:
+                unused = sum(
+                    1 for t in all_types[category] - used[category] if available(t)
+                )
+                reachable = min(remaining[category], unused)
+                if len(used[category]) + reachable < min_types[category]:
+                    return False
+                open_total += reachable
+            return shortfall_total <= open_total
+
+        def search(index: int) -> bool:
+            nonlocal nodes
+            if index == len(slots):
+                return True
+            nodes += 1
+            if nodes > self.CONSTRAINT_SEARCH_LIMIT:
+                return False
+
+            day_offset, _, category, rank = slots[index]
+            pool = pools[(day_offset, category)]
+            previous_revenue = None
+            if category == "revenue":
+                for j in range(index - 1, -1, -1):
+                    if slots[j][0] != day_offset:
+                        break
+                    if slots[j][2] == "revenue":
+                        previous_revenue = assignment[j]
+                        break
+
+            start = rank % len(pool) if pool else 0
+            remaining[category] -= 1
+            for send_type in pool[start:] + pool[:start]:
+                if not available(send_type) or send_type == previous_revenue:
+                    continue
+                if (
+                    send_type == "ppv_followup"
+                    and followups.get(day_offset, 0) >= MAX_FOLLOWUPS_PER_DAY
+                ):
+                    continue
+
+                newly_used = send_type not in used[category]
+                used[category].add(send_type)
+                weekly_counts[send_type] = weekly_counts.get(send_type, 0) + 1
+                if send_type == "ppv_followup":
+                    followups[day_offset] = followups.get(day_offset, 0) + 1
+                assignment.append(send_type)
+
+                if feasible() and search(index + 1):
+                    return True
+
+                assignment.pop()
+                if send_type == "ppv_followup":
+                    followups[day_offset] -= 1
+                weekly_counts[send_type] -= 1
+                if newly_used:
+                    used[category].discard(send_type)
+                if nodes > self.CONSTRAINT_SEARCH_LIMIT:
+                    break
+            remaining[category] += 1
+            return False
+
+        if not feasible() or not search(0):
+            return None
+
+        template_week: dict[str, list[dict[str, Any]]] = {
+            str(day_offset): [] for day_offset in range(7)
+        }
+        for (day_offset, day_of_week, category, _), send_type in zip(slots, assignment):
+            item = self._build_item(send_type, category, day_of_week)
+            item["_strategy_used"] = self.get_daily_strategy(day_of_week)
+            template_week[str(day_offset)].append(item)
+        return template_week
 
     def allocate_day(
         self,
@@ -580,26 +1002,7 @@ class SendTypeAllocator:
         # Allocate revenue sends with varied type selection
         for i in range(count):
             send_type = revenue_types[i % len(revenue_types)]
-
-            # Determine media requirements
-            requires_media = send_type in [
-                "ppv_unlock", "ppv_wall", "bundle", "flash_bundle", "snapchat_bundle"
-            ]
-
-            # Determine price requirements
-            requires_price = send_type in [
-                "ppv_unlock", "ppv_wall", "tip_goal", "bundle", "flash_bundle"
-            ]
-
-            items.append({
-                "send_type_key": send_type,
-                "category": "revenue",
-                "priority": 1,
-                "requires_caption": True,
-                "requires_media": requires_media,
-                "requires_price": requires_price,
-                "_daily_flavor": self.DAILY_FLAVORS.get(day_of_week, {}).get("emphasis"),
-            })
+            items.append(self._build_item(send_type, "revenue", day_of_week))
 
         return items
 
@@ -622,35 +1025,14 @@ class SendTypeAllocator:
         items = []
 
         # Engagement types pool
-        engagement_types = [
-            "bump_normal",
-            "bump_descriptive",
-            "bump_text_only",
-            "bump_flyer",
-            "dm_farm",
-            "like_farm",
-            "link_drop",
-            "wall_link_drop",
-            "live_promo"
-        ]
+        engagement_types = self.ENGAGEMENT_ROTATION.copy()
 
         # Apply daily flavor to reorder types
         engagement_types = self.apply_daily_flavor(day_of_week, engagement_types)
 
         for i in range(count):
             send_type = engagement_types[i % len(engagement_types)]
-
-            # Determine media requirements
-            requires_media = send_type in ["bump_flyer", "wall_link_drop"]
-
-            items.append({
-                "send_type_key": send_type,
-                "category": "engagement",
-                "priority": 2,
-                "requires_caption": True,
-                "requires_media": requires_media,
-                "_daily_flavor": self.DAILY_FLAVORS.get(day_of_week, {}).get("emphasis"),
-            })
+            items.append(self._build_item(send_type, "engagement", day_of_week))
 
         return items
 
@@ -689,17 +1071,7 @@ class SendTypeAllocator:
 
         for i in range(count):
             send_type = retention_types[i % len(retention_types)]
-
-            # Determine media requirements
-            requires_media = send_type in ["renew_on_post"]
-
-            items.append({
-                "send_type_key": send_type,
-                "category": "retention",
-                "priority": 3,
-                "requires_caption": True,
-                "requires_media": requires_media,
-            })
+            items.append(self._build_item(send_type, "retention", day_of_week))
 
         return items
 
@@ -1056,9 +1428,11 @@ def filter_non_converters(
 
 # Module exports
 __all__ = [
+    'ALLOCATION_MODES',
     'VolumeTier',
     'VolumeConfig',
     'DiversityValidation',
+    'WeekPlan',
     'SendTypeAllocator',
     'filter_non_converters',
 ]
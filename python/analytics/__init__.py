@@ -65,96 +65,110 @@ Statistical Methods:
     - Normal-Inverse-Gamma Bayesian updating for game tracking
 """
 
-from python.analytics.trait_detector import (
-    # Type definitions
-    TraitAnalysisResult,
-    TraitRecommendation,
-    SharedTraitInfo,
-    # Constants
-    DEFAULT_TOP_N,
-    DEFAULT_THRESHOLD_PERCENT,
-    MIN_SAMPLE_FOR_CONFIDENCE,
-    DEFAULT_ALPHA,
-    OPTIMAL_LENGTH_MIN,
-    OPTIMAL_LENGTH_MAX,
-    # Main analysis function
-    analyze_top_performer_traits,
-    # Application function
-    apply_volume_increases,
-    # Helper functions
-    chi_square_test,
-    is_optimal_length,
-)
+from python.lazy_imports import lazy_exports
 
-from python.analytics.volume_ab_test import (
-    # Enums
-    TestStatus,
-    MetricType,
-    # Data classes
-    VolumeConfig,
-    Metric,
-    VolumeABTest,
-    # Pre-configured tests
-    VOLUME_AB_TESTS,
-    # Common metrics
-    REVENUE_PER_SUBSCRIBER,
-    PPV_UNLOCK_RATE,
-    SUBSCRIBER_CHURN_RATE,
-    MESSAGE_OPEN_RATE,
-    TIP_RATE,
-    # Constants
-    DEFAULT_CONFIDENCE_LEVEL,
-    DEFAULT_STATISTICAL_POWER,
-    DEFAULT_MDE,
-    DEFAULT_DURATION_DAYS,
-    # Statistical functions
-    calculate_achieved_power,
-    # Validation functions
-    validate_test_completion,
-    # Helper functions
-    get_test_by_id,
-    list_available_tests,
-    create_custom_test,
-)
-
-from python.analytics.game_tracker import (
-    # Data classes
-    GamePerformance,
-    GameBenchmark,
-    # Type definitions
-    BayesianEstimate,
-    GameRecommendation,
-    RecommendationResult,
-    # Constants
-    GAME_BENCHMARKS,
-    MIN_OBSERVATIONS_HIGH_CONFIDENCE,
-    MIN_OBSERVATIONS_FOR_OVERRIDE,
-    AVOID_THRESHOLD_RATIO,
-    RECOMMENDED_THRESHOLD_RATIO,
-    PRIOR_STRENGTH,
-    CREDIBLE_INTERVAL_PROB,
-    # Main tracker class
-    GameTypeTracker,
-    # Utility functions
-    get_game_frequency,
-    create_tracker_from_history,
-)
-
-from python.analytics.daily_digest import (
-    # Main class
-    DailyStatisticsAnalyzer,
-    # Constants
-    TIMEFRAME_SHORT,
-    TIMEFRAME_MEDIUM,
-    TIMEFRAME_LONG,
-    OPTIMAL_LENGTH_MIN as DIGEST_OPTIMAL_LENGTH_MIN,
-    OPTIMAL_LENGTH_MAX as DIGEST_OPTIMAL_LENGTH_MAX,
-    TOP_N_CONTENT_TYPES,
-    TOP_N_HOURS,
-    TOP_N_RESULTS,
-    BOTTOM_PERCENTILE,
-    MIN_DATA_POINTS,
-)
+# Exports resolve on first access (PEP 562), so numpy/scipy-backed
+# submodules load only when one of their names is used. Those submodules
+# import numpy/scipy inside the functions that need them, for the same reason.
+__getattr__, __dir__ = lazy_exports(__name__, {
+    "python.analytics.trait_detector": (
+        # Type definitions
+        "TraitAnalysisResult",
+        "TraitRecommendation",
+        "SharedTraitInfo",
+        # Constants
+        "DEFAULT_TOP_N",
+        "DEFAULT_THRESHOLD_PERCENT",
+        "MIN_SAMPLE_FOR_CONFIDENCE",
+        "DEFAULT_ALPHA",
+        "OPTIMAL_LENGTH_MIN",
+        "OPTIMAL_LENGTH_MAX",
+        # Main analysis function
+        "analyze_top_performer_traits",
+        # Application function
+        "apply_volume_increases",
+        # Helper functions
+        "chi_square_test",
+        "is_optimal_length",
+    ),
+    "python.analytics.volume_ab_test": (
+        # Enums
+        "TestStatus",
+        "SequentialDecision",
+        "MetricType",
+        # Data classes
+        "VolumeConfig",
+        "Metric",
+        "ArmStatistics",
+        "SequentialTestResult",
+        "VolumeABTest",
+        # Pre-configured tests
+        "VOLUME_AB_TESTS",
+        # Common metrics
+        "REVENUE_PER_SUBSCRIBER",
+        "PPV_UNLOCK_RATE",
+        "SUBSCRIBER_CHURN_RATE",
+        "MESSAGE_OPEN_RATE",
+        "TIP_RATE",
+        # Constants
+        "DEFAULT_CONFIDENCE_LEVEL",
+        "DEFAULT_STATISTICAL_POWER",
+        "DEFAULT_MDE",
+        "DEFAULT_DURATION_DAYS",
+        "SEQUENTIAL_BURN_IN",
+        # Statistical functions
+        "calculate_achieved_power",
+        # Validation functions
+        "validate_test_completion",
+        # Sequential testing
+        "run_mixture_sprt",
+        "evaluate_sequential_test",
+        # Helper functions
+        "get_test_by_id",
+        "list_available_tests",
+        "create_custom_test",
+    ),
+    "python.analytics.game_tracker": (
+        # Data classes
+        "GamePerformance",
+        "GameBenchmark",
+        "GamePosteriorState",
+        # Type definitions
+        "BayesianEstimate",
+        "GameRecommendation",
+        "RecommendationResult",
+        # Constants
+        "GAME_BENCHMARKS",
+        "MIN_OBSERVATIONS_HIGH_CONFIDENCE",
+        "MIN_OBSERVATIONS_FOR_OVERRIDE",
+        "AVOID_THRESHOLD_RATIO",
+        "RECOMMENDED_THRESHOLD_RATIO",
+        "PRIOR_STRENGTH",
+        "CREDIBLE_INTERVAL_PROB",
+        # Main tracker class
+        "GameTypeTracker",
+        # Utility functions
+        "get_game_frequency",
+        "create_tracker_from_history",
+    ),
+    "python.analytics.daily_digest": (
+        # Main class
+        "DailyStatisticsAnalyzer",
+        # Streaming input
+        "iter_mass_message_records",
+        # Constants
+        "TIMEFRAME_SHORT",
+        "TIMEFRAME_MEDIUM",
+        "TIMEFRAME_LONG",
+        "OPTIMAL_LENGTH_MIN as DIGEST_OPTIMAL_LENGTH_MIN",
+        "OPTIMAL_LENGTH_MAX as DIGEST_OPTIMAL_LENGTH_MAX",
+        "TOP_N_CONTENT_TYPES",
+        "TOP_N_HOURS",
+        "TOP_N_RESULTS",
+        "BOTTOM_PERCENTILE",
+        "MIN_DATA_POINTS",
+    ),
+})
 
 __all__ = [
     # === Trait Detector ===
@@ -179,10 +193,13 @@ __all__ = [
     # === Volume A/B Testing ===
     # Enums
     "TestStatus",
+    "SequentialDecision",
     "MetricType",
     # Data classes
     "VolumeConfig",
     "Metric",
+    "ArmStatistics",
+    "SequentialTestResult",
     "VolumeABTest",
     # Pre-configured tests
     "VOLUME_AB_TESTS",
@@ -197,10 +214,14 @@ __all__ = [
     "DEFAULT_STATISTICAL_POWER",
     "DEFAULT_MDE",
     "DEFAULT_DURATION_DAYS",
+    "SEQUENTIAL_BURN_IN",
     # Statistical functions
     "calculate_achieved_power",
     # Validation functions
     "validate_test_completion",
+    # Sequential testing
+    "run_mixture_sprt",
+    "evaluate_sequential_test",
     # Helper functions
     "get_test_by_id",
     "list_available_tests",
@@ -209,6 +230,7 @@ __all__ = [
     # Data classes
     "GamePerformance",
     "GameBenchmark",
+    "GamePosteriorState",
     # Type definitions
     "BayesianEstimate",
     "GameRecommendation",
@@ -229,6 +251,8 @@ __all__ = [
     # === Daily Digest ===
     # Main class
     "DailyStatisticsAnalyzer",
+    # Streaming input
+    "iter_mass_message_records",
     # Constants
     "TIMEFRAME_SHORT",
     "TIMEFRAME_MEDIUM",
@@ -28,6 +28,9 @@ Usage:
 
     digest = analyzer.generate_daily_digest(performance_data)
 
+    # Or stream the creator's mass_messages rows straight from the database
+    digest = analyzer.generate_daily_digest_from_db(conn, lookback_days=365)
+
     # Access digest components
     print(f"Creator: {digest['creator_id']}")
     print(f"Patterns: {digest['patterns']}")
@@ -40,11 +43,21 @@ Statistical Methods:
     - Timing pattern analysis
     - Frequency gap identification
     - Underperformer detection
+
+Performance:
+    Records are consumed in a single pass: each date is parsed once, every
+    timeframe's totals are accumulated together and top performers are
+    kept in bounded heaps, so a digest is O(n) and any iterable (including
+    a database cursor) can be used as input.
 """
 
 from __future__ import annotations
 
+import heapq
+import re
+import sqlite3
 from collections import Counter
+from collections.abc import Iterable, Iterator, Sequence
 from datetime import datetime, timedelta
 from typing import Any
 
@@ -73,6 +86,33 @@ BOTTOM_PERCENTILE: float = 0.20
 # Minimum data points for meaningful analysis
 MIN_DATA_POINTS: int = 5
 
+# Date strings in exactly the shapes _parse_date accepts, which
+# datetime.fromisoformat parses identically and much faster than strptime
+_ISO_DATE_SHAPE = re.compile(
+    r"[0-9]{4}-[0-9]{2}-[0-9]{2}"
+    r"(?:T[0-9]{2}:[0-9]{2}:[0-9]{2}(?:\.[0-9]{1,6})?| [0-9]{2}:[0-9]{2}:[0-9]{2})?"
+)
+
+# Rows fetched per round trip when streaming mass_messages
+STREAM_BATCH_SIZE: int = 500
+
+# mass_messages rows as digest records (date, earnings, content_type,
+# caption_length, hour); {sending_time_filter} is the optional lookback
+# predicate, left empty so rows without a sending_time are kept
+MASS_MESSAGES_DIGEST_SQL = """
+    SELECT
+        mm.sending_time AS date,
+        mm.earnings AS earnings,
+        ct.type_name AS content_type,
+        LENGTH(mm.message_content) AS caption_length,
+        mm.sending_hour AS hour
+    FROM mass_messages mm
+    LEFT JOIN content_types ct ON ct.content_type_id = mm.content_type_id
+    WHERE mm.creator_id = ?
+    {sending_time_filter}
+    ORDER BY mm.sending_time DESC, mm.message_id
+"""
+
 
 # =============================================================================
 # Type Definitions
@@ -154,7 +194,7 @@ class DailyStatisticsAnalyzer:
 
     def generate_daily_digest(
         self,
-        performance_data: list[dict],
+        performance_data: Iterable[dict[str, Any]],
     ) -> dict[str, Any]:
         """Generate comprehensive daily statistics digest.
 
@@ -162,8 +202,11 @@ class DailyStatisticsAnalyzer:
         identifies patterns, and generates actionable recommendations following
         the 7-step optimization process.
 
+        The data is read exactly once, so it may be a list or any iterable of
+        records, e.g. the generator from iter_mass_message_records().
+
         Args:
-            performance_data: List of performance records. Each record should
+            performance_data: Iterable of performance records. Each record should
                 contain at minimum:
                 - date: Date of performance (datetime, ISO string, or None)
                 - earnings: Revenue generated (float)
@@ -199,16 +242,18 @@ class DailyStatisticsAnalyzer:
         # Generate current timestamp
         digest_date = datetime.now().isoformat()
 
-        # Analyze each timeframe
-        timeframe_summaries: dict[int, dict] = {}
-        for days in [TIMEFRAME_SHORT, TIMEFRAME_MEDIUM, TIMEFRAME_LONG]:
-            timeframe_summaries[days] = self._analyze_timeframe(
-                performance_data, days
-            )
+        # Analyze every timeframe, the overall top performers and the
+        # content type distribution in one pass
+        timeframe_summaries, top_performers, content_type_counts = self._summarize(
+            performance_data,
+            [TIMEFRAME_SHORT, TIMEFRAME_MEDIUM, TIMEFRAME_LONG],
+        )
 
         # Identify patterns using 30-day analysis as primary
         primary_analysis = timeframe_summaries.get(TIMEFRAME_SHORT, {})
-        patterns = self._identify_patterns(primary_analysis, performance_data)
+        patterns = self._identify_patterns(
+            primary_analysis, overall_distribution=content_type_counts
+        )
 
         # Generate recommendations based on patterns
         recommendations = self._generate_recommendations(patterns)
@@ -216,9 +261,6 @@ class DailyStatisticsAnalyzer:
         # Prioritize actions
         action_items = self._prioritize_actions(recommendations)
 
-        # Get overall top performers
-        top_performers = self._get_overall_top_performers(performance_data)
-
         return {
             "date": digest_date,
             "creator_id": self.creator_id,
@@ -231,7 +273,7 @@ class DailyStatisticsAnalyzer:
 
     def _analyze_timeframe(
         self,
-        data: list[dict],
+        data: list[dict[str, Any]],
         days: int,
     ) -> dict[str, Any]:
         """Analyze performance data within a specific timeframe.
@@ -262,56 +304,74 @@ class DailyStatisticsAnalyzer:
             >>> result["record_count"]
             1
         """
-        if not data:
-            return {
-                "timeframe_days": days,
-                "total_earnings": 0.0,
-                "avg_earnings": 0.0,
-                "record_count": 0,
-                "top_10": [],
-            }
+        timeframe_summaries, _, _ = self._summarize(data, [days])
+        return timeframe_summaries[days]
 
-        # Calculate cutoff date
-        cutoff_date = datetime.now() - timedelta(days=days)
+    def _summarize(
+        self,
+        data: Iterable[dict[str, Any]],
+        timeframes: Sequence[int],
+    ) -> tuple[dict[int, dict[str, Any]], list[dict[str, Any]], Counter[str]]:
+        """Compute all timeframe summaries in a single pass over the data.
 
-        # Filter data by date
-        filtered_data: list[dict] = []
-        for record in data:
-            record_date = self._parse_date(record.get("date"))
-            if record_date and record_date >= cutoff_date:
-                filtered_data.append(record)
+        Each record's date and earnings are parsed once and the record is
+        added to every window it falls in. Top performers are kept in
+        bounded min-heaps of TOP_N_RESULTS entries, so the pass is O(n) and
+        holds only the retained records in memory.
 
-        # Calculate statistics
-        record_count = len(filtered_data)
-        if record_count == 0:
-            return {
-                "timeframe_days": days,
-                "total_earnings": 0.0,
-                "avg_earnings": 0.0,
-                "record_count": 0,
-                "top_10": [],
-            }
+        Args:
+            data: Iterable of performance records (consumed once).
+            timeframes: Window sizes in days.
 
-        total_earnings = sum(
-            float(r.get("earnings", 0) or 0) for r in filtered_data
-        )
-        avg_earnings = total_earnings / record_count
+        Returns:
+            Tuple of (timeframe_summaries, overall_top_performers,
+            content_type_counts). Summaries have the _analyze_timeframe()
+            structure; overall top performers include undated records.
+        """
+        now = datetime.now()
+        cutoffs = [(days, now - timedelta(days=days)) for days in timeframes]
+        totals = dict.fromkeys(timeframes, 0.0)
+        counts = dict.fromkeys(timeframes, 0)
+        window_heaps: dict[int, list[tuple[float, int, dict[str, Any]]]] = {
+            days: [] for days in timeframes
+        }
+        overall_heap: list[tuple[float, int, dict[str, Any]]] = []
+        content_type_counts: Counter[str] = Counter()
 
-        # Get top 10 performers
-        sorted_data = sorted(
-            filtered_data,
-            key=lambda x: float(x.get("earnings", 0) or 0),
-            reverse=True,
-        )
-        top_10 = sorted_data[:TOP_N_RESULTS]
+        for index, record in enumerate(data):
+            earnings = float(record.get("earnings", 0) or 0)
+            # Negated index: on equal earnings the earlier record ranks
+            # higher, matching a stable sort in descending order
+            entry = (earnings, -index, record)
+            _push_top_n(overall_heap, entry)
 
-        return {
-            "timeframe_days": days,
-            "total_earnings": round(total_earnings, 2),
-            "avg_earnings": round(avg_earnings, 2),
-            "record_count": record_count,
-            "top_10": top_10,
-        }
+            content_type = record.get("content_type")
+            if content_type:
+                content_type_counts[content_type] += 1
+
+            record_date = self._parse_date(record.get("date"))
+            if not record_date:
+                continue
+            for days, cutoff in cutoffs:
+                if record_date >= cutoff:
+                    totals[days] += earnings
+                    counts[days] += 1
+                    _push_top_n(window_heaps[days], entry)
+
+        timeframe_summaries: dict[int, dict[str, Any]] = {}
+        for days in timeframes:
+            record_count = counts[days]
+            timeframe_summaries[days] = {
+                "timeframe_days": days,
+                "total_earnings": round(totals[days], 2) if record_count else 0.0,
+                "avg_earnings": (
+                    round(totals[days] / record_count, 2) if record_count else 0.0
+                ),
+                "record_count": record_count,
+                "top_10": _ranked(window_heaps[days]),
+            }
+
+        return timeframe_summaries, _ranked(overall_heap), content_type_counts
 
     def _parse_date(self, date_value: Any) -> datetime | None:
         """Safely parse a date value into a datetime object.
@@ -339,6 +399,12 @@ class DailyStatisticsAnalyzer:
             return date_value
 
         if isinstance(date_value, str):
+            if _ISO_DATE_SHAPE.fullmatch(date_value):
+                try:
+                    return datetime.fromisoformat(date_value)
+                except ValueError:
+                    return None
+
             # Try common date formats
             formats = [
                 "%Y-%m-%d",
@@ -357,7 +423,8 @@ class DailyStatisticsAnalyzer:
     def _identify_patterns(
         self,
         analysis: dict[str, Any],
-        full_data: list[dict],
+        full_data: Iterable[dict[str, Any]] = (),
+        overall_distribution: Counter[str] | None = None,
     ) -> dict[str, Any]:
         """Identify performance patterns from analysis results.
 
@@ -371,6 +438,8 @@ class DailyStatisticsAnalyzer:
         Args:
             analysis: Timeframe analysis result containing top_10.
             full_data: Complete performance dataset for frequency analysis.
+            overall_distribution: Precomputed content type counts of the
+                full dataset; when given, full_data is not scanned.
 
         Returns:
             Dictionary containing identified patterns:
@@ -392,7 +461,9 @@ class DailyStatisticsAnalyzer:
             "optimal_length_ratio": self._calculate_length_ratio(analysis),
             "best_hours": self._analyze_timing(analysis),
             "underperformers": self._identify_underperformers(analysis),
-            "frequency_gaps": self._analyze_frequency_gaps(analysis, full_data),
+            "frequency_gaps": self._analyze_frequency_gaps(
+                analysis, full_data, overall_distribution
+            ),
         }
 
     def _get_top_types(self, analysis: dict[str, Any]) -> list[str]:
@@ -575,7 +646,8 @@ class DailyStatisticsAnalyzer:
     def _analyze_frequency_gaps(
         self,
         analysis: dict[str, Any],
-        full_data: list[dict],
+        full_data: Iterable[dict[str, Any]] = (),
+        overall_distribution: Counter[str] | None = None,
     ) -> dict[str, Any]:
         """Identify high-performing types that are underrepresented.
 
@@ -586,6 +658,8 @@ class DailyStatisticsAnalyzer:
         Args:
             analysis: Timeframe analysis result containing top_10 list.
             full_data: Complete performance dataset for frequency comparison.
+            overall_distribution: Precomputed content type counts of the
+                full dataset; when given, full_data is not scanned.
 
         Returns:
             Dictionary containing:
@@ -614,16 +688,16 @@ class DailyStatisticsAnalyzer:
         top_10_distribution = Counter(top_10_types)
 
         # Get overall distribution
-        all_types = [
-            r.get("content_type")
-            for r in full_data
-            if r.get("content_type")
-        ]
-        overall_distribution = Counter(all_types)
+        if overall_distribution is None:
+            overall_distribution = Counter(
+                content_type
+                for r in full_data
+                if (content_type := r.get("content_type"))
+            )
 
         # Find gaps: types in top 10 that are underrepresented overall
         gap_types: list[str] = []
-        total_records = len(all_types) if all_types else 1
+        total_records = overall_distribution.total() or 1
 
         for content_type in top_10_distribution:
             top_10_freq = top_10_distribution[content_type] / len(top_10_types) if top_10_types else 0
@@ -778,8 +852,8 @@ class DailyStatisticsAnalyzer:
 
     def _get_overall_top_performers(
         self,
-        data: list[dict],
-    ) -> list[dict]:
+        data: list[dict[str, Any]],
+    ) -> list[dict[str, Any]]:
         """Get overall top performers from all data.
 
         Sorts all performance data by earnings and returns the top performers
@@ -805,13 +879,92 @@ class DailyStatisticsAnalyzer:
         if not data:
             return []
 
-        sorted_data = sorted(
+        return heapq.nlargest(
+            TOP_N_RESULTS,
             data,
             key=lambda x: float(x.get("earnings", 0) or 0),
-            reverse=True,
         )
 
-        return sorted_data[:TOP_N_RESULTS]
+    def generate_daily_digest_from_db(
+        self,
+        conn: sqlite3.Connection,
+        lookback_days: int | None = None,
+    ) -> dict[str, Any]:
+        """Generate the daily digest straight from the mass_messages table.
+
+        Rows are streamed through a cursor into the single-pass digest, so
+        the creator's history is never materialized as a list.
+
+        Args:
+            conn: Open database connection.
+            lookback_days: Only read messages from the last N days (None
+                reads the full history, matching a digest over all records).
+
+        Returns:
+            Digest dictionary as returned by generate_daily_digest().
+        """
+        return self.generate_daily_digest(
+            iter_mass_message_records(conn, self.creator_id, lookback_days)
+        )
+
+
+# =============================================================================
+# Helpers
+# =============================================================================
+
+
+def _push_top_n(heap: list[tuple[float, int, dict[str, Any]]], entry: tuple[float, int, dict[str, Any]]) -> None:
+    """Keep entry in a min-heap holding the TOP_N_RESULTS largest entries."""
+    if len(heap) < TOP_N_RESULTS:
+        heapq.heappush(heap, entry)
+    elif entry > heap[0]:
+        heapq.heapreplace(heap, entry)
+
+
+def _ranked(heap: list[tuple[float, int, dict[str, Any]]]) -> list[dict[str, Any]]:
+    """Records of a top-N heap, best first."""
+    return [record for _, _, record in sorted(heap, reverse=True)]
+
+
+def iter_mass_message_records(
+    conn: sqlite3.Connection,
+    creator_id: str,
+    lookback_days: int | None = None,
+    batch_size: int = STREAM_BATCH_SIZE,
+) -> Iterator[dict[str, Any]]:
+    """Stream a creator's mass_messages rows as digest records.
+
+    Rows are fetched in batches from one cursor and yielded one at a time
+    as dicts with date, earnings, content_type, caption_length and hour.
+
+    Args:
+        conn: Open database connection.
+        creator_id: Creator whose messages to read.
+        lookback_days: Only read messages from the last N days (None reads all).
+        batch_size: Rows fetched per round trip.
+
+    Yields:
+        Performance record dicts accepted by generate_daily_digest().
+
+    Examples:
+        >>> records = iter_mass_message_records(conn, "alexia", lookback_days=365)
+        >>> digest = DailyStatisticsAnalyzer("alexia").generate_daily_digest(records)
+    """
+    params: list[Any] = [creator_id]
+    sending_time_filter = ""
+    if lookback_days is not None:
+        sending_time_filter = "AND mm.sending_time >= ?"
+        params.append((datetime.now() - timedelta(days=lookback_days)).strftime("%Y-%m-%d"))
+
+    query = MASS_MESSAGES_DIGEST_SQL.format(sending_time_filter=sending_time_filter)
+    cursor = conn.execute(query, params)
+    try:
+        columns = [description[0] for description in cursor.description]
+        while rows := cursor.fetchmany(batch_size):
+            for row in rows:
+                yield dict(zip(columns, row))
+    finally:
+        cursor.close()
 
 
 # =============================================================================
@@ -821,6 +974,8 @@ class DailyStatisticsAnalyzer:
 __all__ = [
     # Main class
     "DailyStatisticsAnalyzer",
+    # Streaming input
+    "iter_mass_message_records",
     # Constants
     "TIMEFRAME_SHORT",
     "TIMEFRAME_MEDIUM",
@@ -832,4 +987,5 @@ __all__ = [
     "TOP_N_RESULTS",
     "BOTTOM_PERCENTILE",
     "MIN_DATA_POINTS",
+    "STREAM_BATCH_SIZE",
 ]
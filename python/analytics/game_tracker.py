@@ -35,19 +35,26 @@ Usage:
     print(f"Best game: {recommendations['best_game_type']}")
     print(f"Avoid: {recommendations['avoid_list']}")
 
+    # Persist per-game sufficient statistics and restore them later
+    saved = tracker.to_dict()
+    tracker = GameTypeTracker.from_dict(saved)
+
 Statistical Methods:
     - Normal-Inverse-Gamma conjugate prior for earnings distribution
     - Posterior mean with credible intervals
     - Thompson sampling for exploration/exploitation
     - Confidence-weighted recommendations
+    - Welford running statistics (count, mean, M2) per game type, so
+      estimates never replay the observation history
 """
 
+import math
+from collections import deque
 from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Any, Dict, List, Optional, Tuple, TypedDict
-
-import numpy as np
-from scipy import stats
+from functools import lru_cache
+from statistics import NormalDist
+from typing import Any, Deque, Dict, List, Optional, Tuple, TypedDict
 
 from python.logging_config import get_logger
 
@@ -157,6 +164,85 @@ class GameBenchmark:
     performance_tier: str
 
 
+@dataclass(slots=True)
+class GamePosteriorState:
+    """Running sufficient statistics for one game type's earnings.
+
+    Updated in O(1) per observation with Welford's algorithm, so the
+    posterior can be computed without keeping or replaying the history.
+
+    Attributes:
+        count: Number of observations.
+        mean: Running mean of earnings.
+        m2: Sum of squared deviations from the mean (Welford's M2).
+        total: Sum of earnings.
+        min_earnings: Smallest observed earnings (0.0 when empty).
+        max_earnings: Largest observed earnings (0.0 when empty).
+
+    Examples:
+        >>> state = GamePosteriorState()
+        >>> state.update(5000.0)
+        >>> state.update(5500.0)
+        >>> state.mean, state.sample_variance
+        (5250.0, 125000.0)
+    """
+
+    count: int = 0
+    mean: float = 0.0
+    m2: float = 0.0
+    total: float = 0.0
+    min_earnings: float = 0.0
+    max_earnings: float = 0.0
+
+    def update(self, earnings: float) -> None:
+        """Add one observation."""
+        self.count += 1
+        delta = earnings - self.mean
+        self.mean += delta / self.count
+        self.m2 += delta * (earnings - self.mean)
+        self.total += earnings
+        if self.count == 1:
+            self.min_earnings = self.max_earnings = earnings
+        else:
+            self.min_earnings = min(self.min_earnings, earnings)
+            self.max_earnings = max(self.max_earnings, earnings)
+
+    @property
+    def sample_variance(self) -> float:
+        """Unbiased sample variance (ddof=1); 0.0 with fewer than 2 observations."""
+        return self.m2 / (self.count - 1) if self.count > 1 else 0.0
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert state to a JSON-serializable dictionary for persistence."""
+        return {
+            "count": self.count,
+            "mean": self.mean,
+            "m2": self.m2,
+            "total": self.total,
+            "min_earnings": self.min_earnings,
+            "max_earnings": self.max_earnings,
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "GamePosteriorState":
+        """Create GamePosteriorState from a to_dict() dictionary.
+
+        Raises:
+            ValueError: If count is negative or m2 is negative.
+        """
+        state = cls(
+            count=int(data["count"]),
+            mean=float(data["mean"]),
+            m2=float(data["m2"]),
+            total=float(data.get("total", data["mean"] * data["count"])),
+            min_earnings=float(data.get("min_earnings", 0.0)),
+            max_earnings=float(data.get("max_earnings", 0.0)),
+        )
+        if state.count < 0 or state.m2 < 0:
+            raise ValueError(f"Invalid posterior state: count={state.count}, m2={state.m2}")
+        return state
+
+
 class BayesianEstimate(TypedDict):
     """Result of Bayesian posterior estimation.
 
@@ -363,16 +449,41 @@ def _compute_normal_inverse_gamma_posterior(
         >>> 4800 < post_mean < 5200
         True
     """
-    n_obs = len(observations)
+    state = GamePosteriorState()
+    for earnings in observations:
+        state.update(earnings)
+    return _posterior_from_state(prior_mean, prior_var, prior_n, state)
+
+
+def _posterior_from_state(
+    prior_mean: float,
+    prior_var: float,
+    prior_n: float,
+    state: GamePosteriorState,
+) -> Tuple[float, float, float, float]:
+    """Compute Normal-Inverse-Gamma posterior parameters from running statistics.
+
+    Constant-time equivalent of _compute_normal_inverse_gamma_posterior.
+
+    Args:
+        prior_mean: Prior mean (mu_0).
+        prior_var: Prior variance (sigma^2_0).
+        prior_n: Prior strength (equivalent sample size, kappa_0).
+        state: Sufficient statistics of the observed earnings.
+
+    Returns:
+        Tuple of (posterior_mean, posterior_var, posterior_n, marginal_var).
+    """
+    n_obs = state.count
 
     if n_obs == 0:
         # No observations, return prior
         return prior_mean, prior_var, prior_n, prior_var
 
-    # Calculate sample statistics
-    obs_array = np.array(observations)
-    sample_mean = float(np.mean(obs_array))
-    sample_var = float(np.var(obs_array, ddof=1)) if n_obs > 1 else prior_var
+    # Sample statistics (total / n rounds like a batch mean; the running
+    # mean only feeds the M2 update)
+    sample_mean = state.total / n_obs
+    sample_var = state.sample_variance if n_obs > 1 else prior_var
 
     # Update parameters (Normal-Inverse-Gamma update equations)
     posterior_n = prior_n + n_obs
@@ -395,6 +506,13 @@ def _compute_normal_inverse_gamma_posterior(
     return posterior_mean, posterior_var, posterior_n, marginal_var
 
 
+@lru_cache(maxsize=16)
+def _two_sided_z_score(probability: float) -> float:
+    """Standard normal quantile for a two-sided interval of the given mass."""
+    alpha = 1 - probability
+    return NormalDist().inv_cdf(1 - alpha / 2)
+
+
 def _calculate_credible_interval(
     mean: float,
     std: float,
@@ -422,8 +540,7 @@ def _calculate_credible_interval(
         1959.96...
     """
     # Z-score for desired probability
-    alpha = 1 - probability
-    z_score = stats.norm.ppf(1 - alpha / 2)
+    z_score = _two_sided_z_score(probability)
 
     lower = mean - z_score * std
     upper = mean + z_score * std
@@ -459,7 +576,7 @@ def _calculate_confidence_score(
         25.0
     """
     # Base confidence from observation count (asymptotic to 70)
-    obs_factor = 70 * (1 - np.exp(-observation_count / 5))
+    obs_factor = 70 * (1 - math.exp(-observation_count / 5))
 
     # Uncertainty reduction factor (max 30 points)
     if prior_std > 0:
@@ -484,10 +601,16 @@ class GameTypeTracker:
     creator-specific performance data. This enables personalized
     recommendations that improve as more data is collected.
 
+    Estimates come from per-game GamePosteriorState statistics updated on
+    each record_performance() call, so they cost O(1) regardless of how
+    much history has been recorded. The raw history is kept only for
+    inspection and can be capped with history_limit.
+
     Attributes:
         creator_id: Identifier for the creator being tracked.
-        performance_history: List of all recorded performances.
-        game_observations: Dict mapping game types to earnings lists.
+        performance_history: Recorded performances (the most recent
+            history_limit records when a limit is set).
+        game_states: Dict mapping game types to running statistics.
 
     Examples:
         >>> tracker = GameTypeTracker("alexia")
@@ -498,11 +621,14 @@ class GameTypeTracker:
         'spin_the_wheel'
     """
 
-    def __init__(self, creator_id: str) -> None:
+    def __init__(self, creator_id: str, history_limit: Optional[int] = None) -> None:
         """Initialize GameTypeTracker for a creator.
 
         Args:
             creator_id: Unique identifier for the creator.
+            history_limit: Maximum performance records to retain (None keeps
+                all). Estimates use the running statistics, so a limit
+                bounds memory without changing any result.
 
         Raises:
             ValueError: If creator_id is empty.
@@ -514,10 +640,13 @@ class GameTypeTracker:
         """
         if not creator_id:
             raise ValueError("creator_id cannot be empty")
+        if history_limit is not None and history_limit < 0:
+            raise ValueError(f"history_limit cannot be negative: {history_limit}")
 
         self.creator_id: str = creator_id
-        self.performance_history: List[GamePerformance] = []
-        self.game_observations: Dict[str, List[float]] = {}
+        self.history_limit: Optional[int] = history_limit
+        self.performance_history: Deque[GamePerformance] = deque(maxlen=history_limit)
+        self.game_states: Dict[str, GamePosteriorState] = {}
 
         logger.info(
             "GameTypeTracker initialized",
@@ -568,10 +697,11 @@ class GameTypeTracker:
         # Add to history
         self.performance_history.append(performance)
 
-        # Update observations index
-        if game_type not in self.game_observations:
-            self.game_observations[game_type] = []
-        self.game_observations[game_type].append(earnings)
+        # Update running statistics
+        state = self.game_states.get(game_type)
+        if state is None:
+            state = self.game_states[game_type] = GamePosteriorState()
+        state.update(earnings)
 
         logger.debug(
             "Recorded game performance",
@@ -580,12 +710,25 @@ class GameTypeTracker:
                 "game_type": game_type,
                 "earnings": earnings,
                 "date": date,
-                "total_observations": len(self.game_observations.get(game_type, [])),
+                "total_observations": state.count,
             }
         )
 
         return performance
 
+    @property
+    def game_observations(self) -> Dict[str, List[float]]:
+        """Earnings per game type from the retained performance history."""
+        observations: Dict[str, List[float]] = {}
+        for performance in self.performance_history:
+            observations.setdefault(performance.game_type, []).append(performance.earnings)
+        return observations
+
+    @property
+    def total_observations(self) -> int:
+        """Number of performances recorded (including any no longer retained)."""
+        return sum(state.count for state in self.game_states.values())
+
     def get_bayesian_estimate(self, game_type: str) -> BayesianEstimate:
         """Compute Bayesian posterior estimate for a game type.
 
@@ -608,8 +751,8 @@ class GameTypeTracker:
             True
         """
         game_type = game_type.lower().strip()
-        observations = self.game_observations.get(game_type, [])
-        n_obs = len(observations)
+        state = self.game_states.get(game_type) or GamePosteriorState()
+        n_obs = state.count
 
         # Get prior from benchmarks or use default
         if game_type in GAME_BENCHMARKS:
@@ -629,15 +772,15 @@ class GameTypeTracker:
 
         # Compute Bayesian posterior
         posterior_mean, posterior_var, posterior_n, marginal_var = (
-            _compute_normal_inverse_gamma_posterior(
+            _posterior_from_state(
                 prior_mean=prior_mean,
                 prior_var=prior_var,
                 prior_n=PRIOR_STRENGTH,
-                observations=observations,
+                state=state,
             )
         )
 
-        posterior_std = float(np.sqrt(marginal_var))
+        posterior_std = math.sqrt(marginal_var)
 
         # Calculate credible interval
         credible_lower, credible_upper = _calculate_credible_interval(
@@ -789,10 +932,10 @@ class GameTypeTracker:
         avoid_list: List[str] = []
         best_game_type: Optional[str] = None
         best_game_earnings: float = 0.0
-        total_observations: int = len(self.performance_history)
+        total_observations: int = self.total_observations
 
         # Get unique game types (observed + benchmarks)
-        all_game_types = set(self.game_observations.keys()) | set(GAME_BENCHMARKS.keys())
+        all_game_types = set(self.game_states.keys()) | set(GAME_BENCHMARKS.keys())
 
         # Compute recommendations for each game type
         for game_type in all_game_types:
@@ -834,7 +977,8 @@ class GameTypeTracker:
         for game_type in GAME_BENCHMARKS:
             if game_type in avoid_list:
                 continue
-            obs = len(self.game_observations.get(game_type, []))
+            state = self.game_states.get(game_type)
+            obs = state.count if state else 0
             benchmark = GAME_BENCHMARKS[game_type]
             # Suggest high-tier games that need more data
             if (
@@ -851,7 +995,7 @@ class GameTypeTracker:
             for rec in recommendations.values()
             if rec["bayesian_estimate"]["observation_count"] > 0
         ]
-        avg_confidence = np.mean(confidence_scores) if confidence_scores else 0
+        avg_confidence = math.fsum(confidence_scores) / len(confidence_scores) if confidence_scores else 0
 
         if avg_confidence >= 70:
             overall_confidence = "HIGH"
@@ -899,23 +1043,23 @@ class GameTypeTracker:
         """
         summary: Dict[str, Any] = {}
 
-        for game_type, observations in self.game_observations.items():
-            if not observations:
+        for game_type, state in self.game_states.items():
+            if not state.count:
                 continue
 
-            obs_array = np.array(observations)
             benchmark = GAME_BENCHMARKS.get(game_type)
+            mean = state.total / state.count
 
             summary[game_type] = {
-                "count": len(observations),
-                "mean": round(float(np.mean(obs_array)), 2),
-                "std": round(float(np.std(obs_array, ddof=1)), 2) if len(observations) > 1 else 0.0,
-                "min": round(float(np.min(obs_array)), 2),
-                "max": round(float(np.max(obs_array)), 2),
-                "total": round(float(np.sum(obs_array)), 2),
+                "count": state.count,
+                "mean": round(mean, 2),
+                "std": round(math.sqrt(state.sample_variance), 2) if state.count > 1 else 0.0,
+                "min": round(state.min_earnings, 2),
+                "max": round(state.max_earnings, 2),
+                "total": round(state.total, 2),
                 "benchmark_avg": benchmark.avg_earnings if benchmark else None,
                 "vs_benchmark": (
-                    round(float(np.mean(obs_array)) / benchmark.avg_earnings, 3)
+                    round(mean / benchmark.avg_earnings, 3)
                     if benchmark else None
                 ),
             }
@@ -937,12 +1081,66 @@ class GameTypeTracker:
             0
         """
         self.performance_history.clear()
-        self.game_observations.clear()
+        self.game_states.clear()
         logger.warning(
             "Cleared game performance history",
             extra={"creator_id": self.creator_id}
         )
 
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert the tracker's statistics to a dictionary for persistence.
+
+        Only the per-game sufficient statistics are saved, so the stored
+        size depends on the number of game types, not on history length.
+
+        Returns:
+            JSON-serializable dictionary for from_dict().
+
+        Examples:
+            >>> tracker = GameTypeTracker("alexia")
+            >>> tracker.record_performance("mystery_box", 3000.0, "2025-01-15")
+            >>> tracker.to_dict()["game_states"]["mystery_box"]["count"]
+            1
+        """
+        return {
+            "creator_id": self.creator_id,
+            "game_states": {
+                game_type: state.to_dict()
+                for game_type, state in self.game_states.items()
+            },
+        }
+
+    @classmethod
+    def from_dict(
+        cls,
+        data: Dict[str, Any],
+        history_limit: Optional[int] = None,
+    ) -> "GameTypeTracker":
+        """Restore a tracker from to_dict() output without replaying history.
+
+        Args:
+            data: Dictionary produced by to_dict().
+            history_limit: Maximum new performance records to retain.
+
+        Returns:
+            GameTypeTracker with restored statistics and empty history.
+
+        Raises:
+            ValueError: If required fields are missing or invalid.
+        """
+        if "creator_id" not in data:
+            raise ValueError("Tracker state missing 'creator_id'")
+
+        tracker = cls(data["creator_id"], history_limit=history_limit)
+        try:
+            tracker.game_states = {
+                game_type: GamePosteriorState.from_dict(state)
+                for game_type, state in data.get("game_states", {}).items()
+            }
+        except (KeyError, TypeError) as e:
+            raise ValueError(f"Invalid game state for creator {data['creator_id']}: {e}") from e
+        return tracker
+
 
 # =============================================================================
 # Factory Functions
@@ -1013,6 +1211,7 @@ __all__ = [
     # Data classes
     "GamePerformance",
     "GameBenchmark",
+    "GamePosteriorState",
     # Type definitions
     "BayesianEstimate",
     "GameRecommendation",
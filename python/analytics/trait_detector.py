@@ -30,22 +30,27 @@ Usage:
     # Apply to allocation
     adjusted = apply_volume_increases(allocation, result['recommendations'])
 
+    # Fleet sweep: one columnar pass over every creator's records
+    frame = TraitFrame.from_records({"alexia": alexia_records, "luna": luna_records})
+    results = analyze_fleet_traits(frame, top_n=10)
+
 Statistical Methods:
     - Chi-square test (when all expected counts >= 5)
     - Fisher's exact test (for small samples)
     - Bonferroni correction (alpha / num_traits_tested)
+    - Batch variants run every creator's tests in one vectorized call
 """
 
 import warnings
 from collections import Counter
 from dataclasses import dataclass
-from typing import Any, Dict, List, Optional, Tuple, TypedDict
-
-import numpy as np
-from scipy import stats
+from typing import TYPE_CHECKING, Any, Dict, List, Mapping, Optional, Tuple, TypedDict
 
 from python.logging_config import get_logger
 
+if TYPE_CHECKING:
+    import numpy as np
+
 logger = get_logger(__name__)
 
 
@@ -69,6 +74,17 @@ DEFAULT_ALPHA: float = 0.05
 OPTIMAL_LENGTH_MIN: int = 250
 OPTIMAL_LENGTH_MAX: int = 449
 
+# Categorical traits: (trait name, performance record field)
+CATEGORICAL_TRAITS: Tuple[Tuple[str, str], ...] = (
+    ("content_type", "content_type"),
+    ("tone", "detected_tone"),
+    ("price", "price"),
+)
+
+# Traits tested per creator (optimal_length + categorical traits), the
+# Bonferroni divisor
+NUM_TRAITS_TESTED: int = 1 + len(CATEGORICAL_TRAITS)
+
 # Volume increase range for significant traits
 MULTIPLIER_MIN: float = 1.20  # +20%
 MULTIPLIER_MAX: float = 1.30  # +30%
@@ -183,6 +199,9 @@ def chi_square_test(
         >>> print(f"Test: {test}")  # Small sample uses Fisher's
         Test: fisher
     """
+    import numpy as np
+    from scipy import stats
+
     # Validate inputs
     if top_total <= 0 or non_top_total <= 0:
         raise ValueError("Total counts must be positive")
@@ -311,6 +330,76 @@ def _get_most_common(items: List[Any]) -> Tuple[Any, int]:
     return None, 0
 
 
+def _add_trait_result(
+    result: TraitAnalysisResult,
+    trait: str,
+    count: int,
+    top_total: int,
+    p_value: float,
+    value: Any = None,
+) -> None:
+    """Record a tested trait in result, with a recommendation if significant.
+
+    Args:
+        result: Analysis result to update; its bonferroni_alpha must be set.
+        trait: 'optimal_length', 'content_type', 'tone' or 'price'.
+        count: Number of top performers with the trait (or dominant value).
+        top_total: Number of top performers analyzed.
+        p_value: P-value from the trait's contingency test.
+        value: Dominant value for categorical traits.
+    """
+    percentage = count / top_total if top_total > 0 else 0
+    is_significant = (
+        percentage >= DEFAULT_THRESHOLD_PERCENT and
+        p_value < result["bonferroni_alpha"]
+    )
+    multiplier = _calculate_multiplier(percentage)
+    increase = int((multiplier - 1) * 100)
+
+    # Trait-specific fields come first, then the fields every trait shares
+    extra: SharedTraitInfo
+    if trait == "optimal_length":
+        key = "optimal_length"
+        recommendation = f"Increase descriptive captions (250-449 chars) by {increase}%"
+        trait_value = f"{OPTIMAL_LENGTH_MIN}-{OPTIMAL_LENGTH_MAX}"
+        extra = {}
+    elif trait == "content_type":
+        key = "dominant_content_type"
+        recommendation = f"Increase '{value}' content by {increase}%"
+        trait_value = value
+        extra = {"type": value}
+    elif trait == "tone":
+        key = "dominant_tone"
+        recommendation = f"Increase '{value}' tone captions by {increase}%"
+        trait_value = value
+        extra = {"tone": value}
+    else:
+        key = "dominant_price"
+        recommendation = f"Increase price point ${value} usage by {increase}%"
+        trait_value = str(value)
+        extra = {"price": value}
+
+    info: SharedTraitInfo = {
+        **extra,
+        "count": count,
+        "percentage": percentage,
+        "p_value": p_value,
+        "is_significant": is_significant,
+        "recommendation": recommendation if is_significant else "",
+    }
+
+    result["shared_traits"][key] = info
+
+    if is_significant:
+        result["recommendations"].append(TraitRecommendation(
+            trait=trait,
+            action="increase_weight",
+            multiplier=multiplier,
+            p_value=p_value,
+            trait_value=trait_value,
+        ))
+
+
 # =============================================================================
 # Main Analysis Function
 # =============================================================================
@@ -434,9 +523,8 @@ def analyze_top_performer_traits(
         logger.warning("Trait analysis: no non-top performers for comparison")
         return result
 
-    # Number of traits we're testing (for Bonferroni correction)
-    num_traits_tested = 4  # optimal_length, content_type, tone, price
-    bonferroni_alpha = alpha / num_traits_tested
+    # Bonferroni correction over the traits tested
+    bonferroni_alpha = alpha / NUM_TRAITS_TESTED
     result["bonferroni_alpha"] = bonferroni_alpha
 
     logger.info(
@@ -461,198 +549,472 @@ def analyze_top_performer_traits(
         if is_optimal_length(r.get("caption_text", ""))
     )
 
-    top_len_pct = top_optimal_length / top_n if top_n > 0 else 0
     p_value_len, test_type_len = chi_square_test(
         top_optimal_length, top_n,
         non_top_optimal_length, non_top_count,
     )
-
-    is_significant_len = (
-        top_len_pct >= DEFAULT_THRESHOLD_PERCENT and
-        p_value_len < bonferroni_alpha
-    )
-
-    result["shared_traits"]["optimal_length"] = SharedTraitInfo(
-        count=top_optimal_length,
-        percentage=top_len_pct,
-        p_value=p_value_len,
-        is_significant=is_significant_len,
-        recommendation=(
-            f"Increase descriptive captions (250-449 chars) by "
-            f"{int((_calculate_multiplier(top_len_pct) - 1) * 100)}%"
-            if is_significant_len else ""
-        ),
-    )
-
-    if is_significant_len:
-        result["recommendations"].append(TraitRecommendation(
-            trait="optimal_length",
-            action="increase_weight",
-            multiplier=_calculate_multiplier(top_len_pct),
-            p_value=p_value_len,
-            trait_value=f"{OPTIMAL_LENGTH_MIN}-{OPTIMAL_LENGTH_MAX}",
-        ))
+    _add_trait_result(result, "optimal_length", top_optimal_length, top_n, p_value_len)
 
     # =================================================================
-    # Trait 2: Dominant Content Type
+    # Traits 2-4: Dominant Content Type, Tone/Style and Price Point
     # =================================================================
-    top_content_types = [
-        r.get("content_type") for r in top_performers
-        if r.get("content_type")
-    ]
-    dominant_type, type_count = _get_most_common(top_content_types)
-
-    if dominant_type and top_n > 0:
-        type_pct = type_count / top_n
-        non_top_type_count = sum(
+    for trait, field_name in CATEGORICAL_TRAITS:
+        if field_name == "price":
+            top_values = [
+                r.get(field_name) for r in top_performers
+                if r.get(field_name) is not None
+            ]
+        else:
+            top_values = [
+                r.get(field_name) for r in top_performers
+                if r.get(field_name)
+            ]
+        dominant_value, value_count = _get_most_common(top_values)
+
+        if dominant_value is None:
+            continue
+
+        non_top_value_count = sum(
             1 for r in non_top_performers
-            if r.get("content_type") == dominant_type
+            if r.get(field_name) == dominant_value
         )
 
-        p_value_type, test_type_type = chi_square_test(
-            type_count, top_n,
-            non_top_type_count, non_top_count,
+        p_value, test_type = chi_square_test(
+            value_count, top_n,
+            non_top_value_count, non_top_count,
         )
+        _add_trait_result(result, trait, value_count, top_n, p_value, dominant_value)
 
-        is_significant_type = (
-            type_pct >= DEFAULT_THRESHOLD_PERCENT and
-            p_value_type < bonferroni_alpha
-        )
+    # =================================================================
+    # Final Summary
+    # =================================================================
+    result["has_recommendations"] = len(result["recommendations"]) > 0
 
-        result["shared_traits"]["dominant_content_type"] = SharedTraitInfo(
-            type=dominant_type,
-            count=type_count,
-            percentage=type_pct,
-            p_value=p_value_type,
-            is_significant=is_significant_type,
-            recommendation=(
-                f"Increase '{dominant_type}' content by "
-                f"{int((_calculate_multiplier(type_pct) - 1) * 100)}%"
-                if is_significant_type else ""
-            ),
-        )
+    logger.info(
+        "Trait analysis complete",
+        extra={
+            "has_recommendations": result["has_recommendations"],
+            "recommendation_count": len(result["recommendations"]),
+            "significant_traits": [r["trait"] for r in result["recommendations"]],
+            "statistical_confidence": result["statistical_confidence"],
+        }
+    )
 
-        if is_significant_type:
-            result["recommendations"].append(TraitRecommendation(
-                trait="content_type",
-                action="increase_weight",
-                multiplier=_calculate_multiplier(type_pct),
-                p_value=p_value_type,
-                trait_value=dominant_type,
-            ))
+    return result
 
-    # =================================================================
-    # Trait 3: Dominant Tone/Style
-    # =================================================================
-    top_tones = [
-        r.get("detected_tone") for r in top_performers
-        if r.get("detected_tone")
-    ]
-    dominant_tone, tone_count = _get_most_common(top_tones)
-
-    if dominant_tone and top_n > 0:
-        tone_pct = tone_count / top_n
-        non_top_tone_count = sum(
-            1 for r in non_top_performers
-            if r.get("detected_tone") == dominant_tone
-        )
 
-        p_value_tone, test_type_tone = chi_square_test(
-            tone_count, top_n,
-            non_top_tone_count, non_top_count,
-        )
+# =============================================================================
+# Fleet-wide (Batch) Analysis
+# =============================================================================
 
-        is_significant_tone = (
-            tone_pct >= DEFAULT_THRESHOLD_PERCENT and
-            p_value_tone < bonferroni_alpha
-        )
 
-        result["shared_traits"]["dominant_tone"] = SharedTraitInfo(
-            tone=dominant_tone,
-            count=tone_count,
-            percentage=tone_pct,
-            p_value=p_value_tone,
-            is_significant=is_significant_tone,
-            recommendation=(
-                f"Increase '{dominant_tone}' tone captions by "
-                f"{int((_calculate_multiplier(tone_pct) - 1) * 100)}%"
-                if is_significant_tone else ""
-            ),
-        )
+@dataclass(frozen=True)
+class TraitFrame:
+    """Columnar performance records for many creators.
 
-        if is_significant_tone:
-            result["recommendations"].append(TraitRecommendation(
-                trait="tone",
-                action="increase_weight",
-                multiplier=_calculate_multiplier(tone_pct),
-                p_value=p_value_tone,
-                trait_value=dominant_tone,
-            ))
+    One row per performance record. Categorical traits are integer codes
+    into the matching label tuple, with -1 marking a missing value, so a
+    fleet sweep can group and count with NumPy instead of Python loops.
 
-    # =================================================================
-    # Trait 4: Dominant Price Point
-    # =================================================================
-    top_prices = [
-        r.get("price") for r in top_performers
-        if r.get("price") is not None
-    ]
-    dominant_price, price_count = _get_most_common(top_prices)
-
-    if dominant_price is not None and top_n > 0:
-        price_pct = price_count / top_n
-        non_top_price_count = sum(
-            1 for r in non_top_performers
-            if r.get("price") == dominant_price
-        )
+    Attributes:
+        creator_ids: Creator labels; creator_codes index into this tuple.
+            Creators with no rows get the empty-data result.
+        creator_codes: Creator of each row.
+        earnings: Earnings of each row (missing earnings as 0).
+        optimal_length: Whether each row's caption is 250-449 characters.
+        content_type_codes: Content type code of each row.
+        content_types: Content type labels.
+        tone_codes: Detected tone code of each row.
+        tones: Tone labels.
+        price_codes: Price point code of each row.
+        prices: Price point labels.
+    """
 
-        p_value_price, test_type_price = chi_square_test(
-            price_count, top_n,
-            non_top_price_count, non_top_count,
+    creator_ids: Tuple[str, ...]
+    creator_codes: "np.ndarray"
+    earnings: "np.ndarray"
+    optimal_length: "np.ndarray"
+    content_type_codes: "np.ndarray"
+    content_types: Tuple[Any, ...]
+    tone_codes: "np.ndarray"
+    tones: Tuple[Any, ...]
+    price_codes: "np.ndarray"
+    prices: Tuple[Any, ...]
+
+    def __post_init__(self) -> None:
+        """Validate that every column has one entry per row."""
+        rows = len(self.creator_codes)
+        for name in (
+            "earnings", "optimal_length", "content_type_codes", "tone_codes", "price_codes"
+        ):
+            if len(getattr(self, name)) != rows:
+                raise ValueError(
+                    f"TraitFrame column '{name}' has {len(getattr(self, name))} rows, expected {rows}"
+                )
+
+    @classmethod
+    def from_records(
+        cls,
+        performance_by_creator: Mapping[str, List[Dict[str, Any]]],
+    ) -> "TraitFrame":
+        """Build a TraitFrame from per-creator performance record lists.
+
+        Args:
+            performance_by_creator: Creator ID to the performance records
+                analyze_top_performer_traits() accepts.
+
+        Returns:
+            TraitFrame with one row per record.
+        """
+        import numpy as np
+
+        content_types: Dict[Any, int] = {}
+        tones: Dict[Any, int] = {}
+        prices: Dict[Any, int] = {}
+        creator_codes: List[int] = []
+        earnings: List[float] = []
+        lengths: List[int] = []
+        content_type_codes: List[int] = []
+        tone_codes: List[int] = []
+        price_codes: List[int] = []
+
+        for creator_code, records in enumerate(performance_by_creator.values()):
+            for record in records:
+                creator_codes.append(creator_code)
+                earnings.append(record.get("earnings", 0) or 0)
+                lengths.append(len(record.get("caption_text") or ""))
+                content_type = record.get("content_type")
+                content_type_codes.append(
+                    content_types.setdefault(content_type, len(content_types)) if content_type else -1
+                )
+                tone = record.get("detected_tone")
+                tone_codes.append(tones.setdefault(tone, len(tones)) if tone else -1)
+                price = record.get("price")
+                price_codes.append(
+                    prices.setdefault(price, len(prices)) if price is not None else -1
+                )
+
+        length_array = np.array(lengths, dtype=np.int64)
+        return cls(
+            creator_ids=tuple(performance_by_creator),
+            creator_codes=np.array(creator_codes, dtype=np.int64),
+            earnings=np.array(earnings, dtype=np.float64),
+            optimal_length=(length_array >= OPTIMAL_LENGTH_MIN) & (length_array <= OPTIMAL_LENGTH_MAX),
+            content_type_codes=np.array(content_type_codes, dtype=np.int64),
+            content_types=tuple(content_types),
+            tone_codes=np.array(tone_codes, dtype=np.int64),
+            tones=tuple(tones),
+            price_codes=np.array(price_codes, dtype=np.int64),
+            prices=tuple(prices),
         )
 
-        is_significant_price = (
-            price_pct >= DEFAULT_THRESHOLD_PERCENT and
-            p_value_price < bonferroni_alpha
-        )
 
-        result["shared_traits"]["dominant_price"] = SharedTraitInfo(
-            price=dominant_price,
-            count=price_count,
-            percentage=price_pct,
-            p_value=p_value_price,
-            is_significant=is_significant_price,
-            recommendation=(
-                f"Increase price point ${dominant_price} usage by "
-                f"{int((_calculate_multiplier(price_pct) - 1) * 100)}%"
-                if is_significant_price else ""
-            ),
+def _fisher_exact_batch(
+    top_counts: "np.ndarray",
+    top_totals: "np.ndarray",
+    non_top_totals: "np.ndarray",
+    trait_totals: "np.ndarray",
+) -> "np.ndarray":
+    """Two-sided Fisher's exact p-values for many 2x2 tables.
+
+    Same definition as scipy.stats.fisher_exact: the total probability of
+    tables (with the observed margins) no more likely than the observed one.
+    Hypergeometric probabilities are evaluated on one shared grid of
+    top-performer counts, which is small because top_totals <= top_n.
+    """
+    import numpy as np
+    from scipy import stats
+
+    population = top_totals + non_top_totals
+    grid = np.arange(int(top_totals.max()) + 1)
+    pmf = stats.hypergeom.pmf(
+        grid[None, :], population[:, None], top_totals[:, None], trait_totals[:, None]
+    )
+    rows = np.arange(len(top_counts))
+    p_exact = pmf[rows, top_counts]
+
+    # Relative tolerance scipy uses when comparing table probabilities
+    gamma = 1 + 1e-14
+    p_values = np.minimum(
+        np.where(pmf <= p_exact[:, None] * gamma, pmf, 0.0).sum(axis=1), 1.0
+    )
+
+    # The most likely table, or a zero margin, has p = 1
+    mode = (trait_totals + 1) * (top_totals + 1) // (population + 2)
+    p_mode = pmf[rows, mode]
+    at_mode = np.abs(p_exact - p_mode) <= 1e-14 * np.maximum(p_exact, p_mode)
+    no_variation = (trait_totals == 0) | (trait_totals == population)
+    return np.where(at_mode | no_variation, 1.0, p_values)
+
+
+def chi_square_test_batch(
+    top_counts: "np.ndarray",
+    top_totals: "np.ndarray",
+    non_top_counts: "np.ndarray",
+    non_top_totals: "np.ndarray",
+) -> Tuple["np.ndarray", "np.ndarray"]:
+    """Vectorized chi_square_test() over many 2x2 tables.
+
+    Entry i is the test chi_square_test(top_counts[i], top_totals[i],
+    non_top_counts[i], non_top_totals[i]) would run, with the same choice
+    of Fisher's exact test (any expected count < 5) or chi-square with
+    Yates' continuity correction, but every table is evaluated in one call.
+
+    Args:
+        top_counts: Top performers with the trait, per table.
+        top_totals: Top performers, per table.
+        non_top_counts: Non-top performers with the trait, per table.
+        non_top_totals: Non-top performers, per table.
+
+    Returns:
+        Tuple of (p_values, test_types) arrays, test_types holding
+        'fisher' or 'chi2'.
+
+    Raises:
+        ValueError: If any count is negative, exceeds its total, or a
+            total is zero.
+    """
+    import numpy as np
+    from scipy import stats
+
+    a = np.asarray(top_counts, dtype=np.int64)
+    n1 = np.asarray(top_totals, dtype=np.int64)
+    b = np.asarray(non_top_counts, dtype=np.int64)
+    n2 = np.asarray(non_top_totals, dtype=np.int64)
+
+    if np.any(n1 <= 0) or np.any(n2 <= 0):
+        raise ValueError("Total counts must be positive")
+    if np.any(a < 0) or np.any(b < 0):
+        raise ValueError("Counts cannot be negative")
+    if np.any(a > n1) or np.any(b > n2):
+        raise ValueError("Counts cannot exceed totals")
+
+    p_values = np.ones(len(a))
+    if len(a) == 0:
+        return p_values, np.array([], dtype="<U6")
+
+    # Tables as rows of [top has, top lacks, non-top has, non-top lacks]
+    observed = np.stack([a, n1 - a, b, n2 - b], axis=1).astype(np.float64)
+    trait_totals = a + b
+    total = n1 + n2
+    expected = np.stack([
+        n1 * trait_totals, n1 * (total - trait_totals),
+        n2 * trait_totals, n2 * (total - trait_totals),
+    ], axis=1) / total[:, None]
+
+    use_fisher = expected.min(axis=1) < 5
+
+    chi2_rows = ~use_fisher
+    if chi2_rows.any():
+        # Yates' continuity correction, as scipy.stats.chi2_contingency
+        exp = expected[chi2_rows]
+        diff = exp - observed[chi2_rows]
+        corrected = observed[chi2_rows] + np.sign(diff) * np.minimum(0.5, np.abs(diff))
+        statistic = ((corrected - exp) ** 2 / exp).sum(axis=1)
+        p_values[chi2_rows] = stats.chi2.sf(statistic, 1)
+
+    if use_fisher.any():
+        p_values[use_fisher] = _fisher_exact_batch(
+            a[use_fisher], n1[use_fisher], n2[use_fisher], trait_totals[use_fisher]
         )
 
-        if is_significant_price:
-            result["recommendations"].append(TraitRecommendation(
-                trait="price",
-                action="increase_weight",
-                multiplier=_calculate_multiplier(price_pct),
-                p_value=p_value_price,
-                trait_value=str(dominant_price),
-            ))
+    return p_values, np.where(use_fisher, "fisher", "chi2")
+
+
+def _dominant_codes(
+    creators: "np.ndarray",
+    codes: "np.ndarray",
+    ranks: "np.ndarray",
+    is_top: "np.ndarray",
+    num_creators: int,
+) -> Tuple["np.ndarray", "np.ndarray"]:
+    """Most common code among each creator's top performers.
+
+    Ties go to the value that appears first in earnings order, matching
+    _get_most_common() on the sorted top performers.
+
+    Returns:
+        Tuple of (dominant_code, dominant_count) per creator; dominant_code
+        is -1 when no top performer has a value.
+    """
+    import numpy as np
+
+    dominant = np.full(num_creators, -1, dtype=np.int64)
+    dominant_counts = np.zeros(num_creators, dtype=np.int64)
+
+    valid = is_top & (codes >= 0)
+    if not valid.any():
+        return dominant, dominant_counts
+
+    width = int(codes[valid].max()) + 1
+    keys = creators[valid] * width + codes[valid]
+    pairs, inverse, counts = np.unique(keys, return_inverse=True, return_counts=True)
+    first_rank = np.full(len(pairs), np.iinfo(np.int64).max)
+    np.minimum.at(first_rank, inverse, ranks[valid])
+
+    pair_creators = pairs // width
+    order = np.lexsort((first_rank, -counts, pair_creators))
+    sorted_creators = pair_creators[order]
+    leaders = order[np.r_[True, sorted_creators[1:] != sorted_creators[:-1]]]
+
+    dominant[pair_creators[leaders]] = pairs[leaders] % width
+    dominant_counts[pair_creators[leaders]] = counts[leaders]
+    return dominant, dominant_counts
 
-    # =================================================================
-    # Final Summary
-    # =================================================================
-    result["has_recommendations"] = len(result["recommendations"]) > 0
+
+def analyze_fleet_traits(
+    frame: TraitFrame,
+    top_n: int = DEFAULT_TOP_N,
+    min_sample_for_confidence: int = MIN_SAMPLE_FOR_CONFIDENCE,
+    alpha: float = DEFAULT_ALPHA,
+) -> Dict[str, TraitAnalysisResult]:
+    """Analyze shared top-performer traits for every creator in one pass.
+
+    Batch equivalent of calling analyze_top_performer_traits() per creator:
+    top-N membership, dominant values and contingency tables are computed
+    for all creators and traits with NumPy grouping, and every test runs in
+    a single chi_square_test_batch() call with the same per-creator
+    Bonferroni correction (alpha / NUM_TRAITS_TESTED).
+
+    Args:
+        frame: Columnar performance records for all creators.
+        top_n: Number of top performers per creator (default 10).
+        min_sample_for_confidence: Minimum records per creator for HIGH
+            confidence classification (default 50).
+        alpha: Base significance level before Bonferroni correction.
+
+    Returns:
+        Dict mapping creator ID to its TraitAnalysisResult.
+
+    Examples:
+        >>> frame = TraitFrame.from_records({"alexia": records_a, "luna": records_b})
+        >>> results = analyze_fleet_traits(frame)
+        >>> results["alexia"]["has_recommendations"]
+        True
+    """
+    import numpy as np
+
+    num_creators = len(frame.creator_ids)
+    bonferroni_alpha = alpha / NUM_TRAITS_TESTED
+
+    # Rows grouped by creator, earnings descending; lexsort is stable, so
+    # equal earnings keep input order like sorted() does
+    order = np.lexsort((-frame.earnings, frame.creator_codes))
+    creators = frame.creator_codes[order]
+    totals = np.bincount(creators, minlength=num_creators)
+    starts = np.cumsum(totals) - totals
+    ranks = np.arange(len(order)) - starts[creators]
+    top_totals = np.minimum(totals, top_n)
+    non_top_totals = totals - top_totals
+    is_top = ranks < top_totals[creators]
+    is_non_top = ~is_top
+    testable = (totals > 0) & (non_top_totals > 0)
+
+    def count_by_creator(mask: "np.ndarray") -> "np.ndarray":
+        return np.bincount(creators[mask], minlength=num_creators)
+
+    # Per trait: (top count, non-top count, dominant code or None, testable)
+    optimal_length = frame.optimal_length[order]
+    trait_counts: Dict[
+        str, Tuple["np.ndarray", "np.ndarray", Optional["np.ndarray"], "np.ndarray"]
+    ] = {
+        "optimal_length": (
+            count_by_creator(is_top & optimal_length),
+            count_by_creator(is_non_top & optimal_length),
+            None,
+            testable,
+        ),
+    }
+    categorical_codes = {
+        "content_type": frame.content_type_codes,
+        "tone": frame.tone_codes,
+        "price": frame.price_codes,
+    }
+    for trait, _ in CATEGORICAL_TRAITS:
+        codes = categorical_codes[trait][order]
+        dominant, dominant_counts = _dominant_codes(creators, codes, ranks, is_top, num_creators)
+        row_dominant = dominant[creators]
+        non_top_matches = count_by_creator(is_non_top & (codes == row_dominant) & (row_dominant >= 0))
+        trait_counts[trait] = (dominant_counts, non_top_matches, dominant, testable & (dominant >= 0))
+
+    # One vectorized call for every (creator, trait) test
+    tested = {trait: np.flatnonzero(counts[3]) for trait, counts in trait_counts.items()}
+    test_creators = np.concatenate(list(tested.values()))
+    p_values, _ = chi_square_test_batch(
+        np.concatenate([trait_counts[t][0][idx] for t, idx in tested.items()]),
+        top_totals[test_creators],
+        np.concatenate([trait_counts[t][1][idx] for t, idx in tested.items()]),
+        non_top_totals[test_creators],
+    )
+    trait_p_values: Dict[str, Dict[int, float]] = {}
+    offset = 0
+    for trait, idx in tested.items():
+        trait_p_values[trait] = dict(zip(idx.tolist(), p_values[offset:offset + len(idx)].tolist()))
+        offset += len(idx)
+
+    labels = {"content_type": frame.content_types, "tone": frame.tones, "price": frame.prices}
+    results: Dict[str, TraitAnalysisResult] = {}
+    low_sample_creators = 0
+
+    for creator, creator_id in enumerate(frame.creator_ids):
+        total_records = int(totals[creator])
+        result: TraitAnalysisResult = {
+            "has_recommendations": False,
+            "shared_traits": {},
+            "recommendations": [],
+            "analyzed_count": int(top_totals[creator]),
+            "statistical_confidence": "HIGH" if total_records >= min_sample_for_confidence else "LOW",
+            "bonferroni_alpha": alpha,
+            "warning": None,
+        }
+        results[creator_id] = result
+
+        if total_records == 0:
+            result["statistical_confidence"] = "LOW"
+            result["warning"] = "No performance data provided"
+            continue
+        if total_records < top_n:
+            result["warning"] = (
+                f"Insufficient data: {total_records} records, need at least {top_n}"
+            )
+        if total_records < min_sample_for_confidence:
+            low_sample_creators += 1
+        if not testable[creator]:
+            result["warning"] = "No comparison group available (all records are top performers)"
+            continue
+
+        result["bonferroni_alpha"] = bonferroni_alpha
+        top_total = int(top_totals[creator])
+        for trait, (top_counts, _, dominant_codes, _) in trait_counts.items():
+            p_value = trait_p_values[trait].get(creator)
+            if p_value is None:
+                continue
+            value = labels[trait][dominant_codes[creator]] if dominant_codes is not None else None
+            _add_trait_result(result, trait, int(top_counts[creator]), top_total, p_value, value)
+        result["has_recommendations"] = len(result["recommendations"]) > 0
+
+    if low_sample_creators:
+        warnings.warn(
+            f"Low sample size for {low_sample_creators} of {num_creators} creators "
+            f"(< {min_sample_for_confidence} records): results may not be statistically reliable",
+            UserWarning,
+            stacklevel=2,
+        )
 
     logger.info(
-        "Trait analysis complete",
+        "Fleet trait analysis complete",
         extra={
-            "has_recommendations": result["has_recommendations"],
-            "recommendation_count": len(result["recommendations"]),
-            "significant_traits": [r["trait"] for r in result["recommendations"]],
-            "statistical_confidence": result["statistical_confidence"],
+            "creators": num_creators,
+            "records": len(order),
+            "tests_run": len(test_creators),
+            "creators_with_recommendations": sum(
+                1 for r in results.values() if r["has_recommendations"]
+            ),
+            "low_sample_creators": low_sample_creators,
         }
     )
 
-    return result
+    return results
 
 
 # =============================================================================
@@ -768,9 +1130,13 @@ __all__ = [
     "OPTIMAL_LENGTH_MAX",
     # Main analysis function
     "analyze_top_performer_traits",
+    # Fleet-wide batch analysis
+    "TraitFrame",
+    "analyze_fleet_traits",
     # Application function
     "apply_volume_increases",
     # Helper functions (exposed for testing)
     "chi_square_test",
+    "chi_square_test_batch",
     "is_optimal_length",
 ]
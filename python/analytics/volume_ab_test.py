@@ -27,20 +27,33 @@ Usage:
     if result['is_complete']:
         print(f"Test ready for analysis, power: {result['actual_power']:.2%}")
 
+    # Hourly sequential check on running per-arm statistics
+    control, treatment = ArmStatistics(), ArmStatistics()
+    control.update_many(control_outcomes)
+    treatment.update_many(treatment_outcomes)
+    check = evaluate_sequential_test(test, control, treatment)
+    if check.should_stop:
+        print(f"Stop early: {check.decision.value}")
+
 Statistical Methods:
-    - Power analysis using z-scores from scipy.stats
+    - Power analysis using cached z-scores from statistics.NormalDist
     - Two-sided significance testing (default alpha=0.05)
     - Standard power threshold (default beta=0.20, power=0.80)
     - Effect size (Cohen's d) estimation for minimum detectable effects
+    - Mixture sequential probability ratio test (mSPRT) on running
+      per-arm statistics, giving always-valid p-values that can be
+      checked after every batch of outcomes
 """
 
+import math
+from collections.abc import Iterable
 from dataclasses import dataclass, field
 from datetime import date
 from enum import Enum
+from functools import lru_cache
+from statistics import NormalDist
 from typing import Any
 
-from scipy import stats
-
 from python.logging_config import get_logger
 
 logger = get_logger(__name__)
@@ -62,6 +75,13 @@ DEFAULT_DURATION_DAYS: int = 14
 # Based on typical OnlyFans creator revenue variance
 DEFAULT_SIGMA: float = 1.0
 
+# Minimum outcomes per arm before a sequential check may stop a test.
+# The mSPRT plugs in the sample variance, which is unreliable on a
+# handful of outcomes.
+SEQUENTIAL_BURN_IN: int = 30
+
+_STANDARD_NORMAL = NormalDist()
+
 
 # =============================================================================
 # Enums
@@ -86,6 +106,20 @@ class TestStatus(str, Enum):
     CANCELLED = "cancelled"
 
 
+class SequentialDecision(str, Enum):
+    """Outcome of a sequential (always-valid) test check.
+
+    Attributes:
+        CONTINUE: Evidence is not yet conclusive; keep collecting data.
+        TREATMENT_WINS: Treatment is significantly better on the primary metric.
+        CONTROL_WINS: Control is significantly better on the primary metric.
+    """
+
+    CONTINUE = "continue"
+    TREATMENT_WINS = "treatment_wins"
+    CONTROL_WINS = "control_wins"
+
+
 class MetricType(str, Enum):
     """Types of metrics tracked in A/B tests.
 
@@ -183,6 +217,191 @@ class Metric:
     higher_is_better: bool = True
 
 
+@dataclass(slots=True)
+class ArmStatistics:
+    """Running statistics for one experiment arm.
+
+    Maintains count, mean and M2 (sum of squared deviations from the mean)
+    with Welford's algorithm, so each outcome is folded in with O(1) work
+    and no outcome history has to be kept or rescanned.
+
+    Attributes:
+        count: Number of outcomes observed.
+        mean: Running mean of the outcomes.
+        m2: Sum of squared deviations from the running mean.
+
+    Examples:
+        >>> arm = ArmStatistics()
+        >>> arm.update_many([1.0, 2.0, 3.0])
+        >>> arm.mean, arm.variance
+        (2.0, 1.0)
+    """
+
+    count: int = 0
+    mean: float = 0.0
+    m2: float = 0.0
+
+    def update(self, value: float) -> None:
+        """Fold a single outcome into the running statistics.
+
+        Args:
+            value: Observed metric value for one sample.
+        """
+        self.count += 1
+        delta = value - self.mean
+        self.mean += delta / self.count
+        self.m2 += delta * (value - self.mean)
+
+    def update_many(self, values: Iterable[float]) -> None:
+        """Fold a batch of outcomes into the running statistics.
+
+        Args:
+            values: Observed metric values, in any order.
+        """
+        for value in values:
+            self.update(value)
+
+    def merge(self, other: "ArmStatistics") -> "ArmStatistics":
+        """Combine two sets of running statistics (Chan et al.).
+
+        Args:
+            other: Statistics for a disjoint set of outcomes of the same arm.
+
+        Returns:
+            New ArmStatistics covering both sets of outcomes.
+        """
+        count = self.count + other.count
+        if count == 0:
+            return ArmStatistics()
+        delta = other.mean - self.mean
+        return ArmStatistics(
+            count=count,
+            mean=self.mean + delta * other.count / count,
+            m2=self.m2 + other.m2 + delta * delta * self.count * other.count / count,
+        )
+
+    @property
+    def variance(self) -> float:
+        """Sample variance (n - 1 denominator); 0.0 with fewer than 2 outcomes."""
+        if self.count < 2:
+            return 0.0
+        return self.m2 / (self.count - 1)
+
+    @property
+    def standard_error(self) -> float:
+        """Standard error of the mean; 0.0 with fewer than 2 outcomes."""
+        if self.count < 2:
+            return 0.0
+        return math.sqrt(self.variance / self.count)
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert statistics to dictionary.
+
+        Returns:
+            Dictionary representation suitable for JSON persistence.
+        """
+        return {"count": self.count, "mean": self.mean, "m2": self.m2}
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "ArmStatistics":
+        """Restore statistics saved with to_dict().
+
+        Args:
+            data: Dictionary with count, mean and m2 keys.
+
+        Returns:
+            Restored ArmStatistics.
+
+        Raises:
+            ValueError: If count or m2 is negative.
+        """
+        stats = cls(
+            count=int(data["count"]),
+            mean=float(data["mean"]),
+            m2=float(data["m2"]),
+        )
+        if stats.count < 0 or stats.m2 < 0:
+            raise ValueError(f"count and m2 must be non-negative, got {data}")
+        return stats
+
+    @classmethod
+    def from_summary(
+        cls, count: int, mean: float, standard_error: float
+    ) -> "ArmStatistics":
+        """Rebuild statistics from a persisted mean and standard error.
+
+        Inverse of the (sample_size, metric_value, standard_error) triple
+        stored in experiment_results, so a sequential check can resume
+        from the latest measurement instead of the outcome history.
+
+        Args:
+            count: Number of outcomes (sample_size).
+            mean: Mean outcome (metric_value).
+            standard_error: Standard error of the mean.
+
+        Returns:
+            Restored ArmStatistics.
+
+        Raises:
+            ValueError: If count or standard_error is negative.
+        """
+        if count < 0 or standard_error < 0:
+            raise ValueError(
+                f"count and standard_error must be non-negative, "
+                f"got {count}, {standard_error}"
+            )
+        m2 = standard_error**2 * count * (count - 1) if count > 1 else 0.0
+        return cls(count=count, mean=mean, m2=m2)
+
+
+@dataclass(frozen=True)
+class SequentialTestResult:
+    """Result of a mixture SPRT check on two arms.
+
+    Attributes:
+        decision: Whether to stop, and which arm won.
+        p_value: Always-valid p-value (valid under continuous monitoring).
+        log_likelihood_ratio: Log of the mixture likelihood ratio.
+        effect: Treatment mean minus control mean.
+        lift: Effect relative to the control mean (None if control mean is 0).
+        confidence_interval: Always-valid (1 - alpha) interval for the effect.
+        control_n: Outcomes observed in the control arm.
+        treatment_n: Outcomes observed in the treatment arm.
+    """
+
+    decision: SequentialDecision
+    p_value: float
+    log_likelihood_ratio: float
+    effect: float
+    lift: float | None
+    confidence_interval: tuple[float, float]
+    control_n: int
+    treatment_n: int
+
+    @property
+    def should_stop(self) -> bool:
+        """Whether the test can be stopped now."""
+        return self.decision is not SequentialDecision.CONTINUE
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert result to dictionary.
+
+        Returns:
+            Dictionary representation of the sequential check.
+        """
+        return {
+            "decision": self.decision.value,
+            "should_stop": self.should_stop,
+            "p_value": self.p_value,
+            "log_likelihood_ratio": self.log_likelihood_ratio,
+            "effect": self.effect,
+            "lift": self.lift,
+            "confidence_interval": list(self.confidence_interval),
+            "control_n": self.control_n,
+            "treatment_n": self.treatment_n,
+        }
+
+
 # =============================================================================
 # Core A/B Test Dataclass
 # =============================================================================
@@ -462,6 +681,17 @@ class VolumeABTest:
 # =============================================================================
 
 
+@lru_cache(maxsize=64)
+def _z_quantile(probability: float) -> float:
+    """Standard normal quantile, cached per probability.
+
+    Power analysis only ever asks for a handful of quantiles (one per
+    confidence level and power target), so every VolumeABTest after the
+    first reuses the cached value.
+    """
+    return _STANDARD_NORMAL.inv_cdf(probability)
+
+
 def _calculate_min_sample_size(
     alpha: float = 0.05,
     power: float = 0.80,
@@ -510,11 +740,10 @@ def _calculate_min_sample_size(
     if sigma <= 0.0:
         raise ValueError(f"sigma must be positive, got {sigma}")
 
-    # Calculate z-scores using scipy.stats
     # z_alpha: two-sided test, so use alpha/2
-    z_alpha = stats.norm.ppf(1 - alpha / 2)
+    z_alpha = _z_quantile(1 - alpha / 2)
     # z_beta: one-sided for power
-    z_beta = stats.norm.ppf(power)
+    z_beta = _z_quantile(power)
 
     # Sample size formula for two-sample t-test with equal variance
     # n = 2 * ((z_alpha + z_beta) / delta)^2 * sigma^2
@@ -582,7 +811,7 @@ def calculate_achieved_power(
     n_effective = 2 * control_n * treatment_n / (control_n + treatment_n)
 
     # Calculate z_alpha for the specified significance level
-    z_alpha = stats.norm.ppf(1 - alpha / 2)
+    z_alpha = _z_quantile(1 - alpha / 2)
 
     # Calculate the non-centrality parameter
     # Under the alternative hypothesis, the test statistic follows a
@@ -595,7 +824,7 @@ def calculate_achieved_power(
     # This equals P(Z > z_alpha - ncp) for one-sided, or
     # P(|Z - ncp| > z_alpha) for two-sided
     # Simplified: P(Z > z_alpha - ncp)
-    power: float = 1 - stats.norm.cdf(z_alpha - ncp)
+    power: float = 1 - _STANDARD_NORMAL.cdf(z_alpha - ncp)
 
     return power
 
@@ -729,6 +958,176 @@ def validate_test_completion(
     return result
 
 
+# =============================================================================
+# Sequential Testing
+# =============================================================================
+
+
+def run_mixture_sprt(
+    control: ArmStatistics,
+    treatment: ArmStatistics,
+    alpha: float = 1.0 - DEFAULT_CONFIDENCE_LEVEL,
+    mde: float = DEFAULT_MDE,
+    higher_is_better: bool = True,
+    previous_p_value: float = 1.0,
+    mixture_variance: float | None = None,
+    burn_in: int = SEQUENTIAL_BURN_IN,
+) -> SequentialTestResult:
+    """Run a mixture sequential probability ratio test (mSPRT).
+
+    Tests H0: equal means against a normal mixture N(0, tau^2) over the
+    difference in means. With V = s_c^2/n_c + s_t^2/n_t and effect d, the
+    mixture likelihood ratio is:
+
+        Lambda = sqrt(V / (V + tau^2)) * exp(tau^2 * d^2 / (2 * V * (V + tau^2)))
+
+    and 1/Lambda is a p-value that stays valid however often it is checked,
+    so a test may be stopped the first time p <= alpha. Each check is O(1)
+    in the running arm statistics.
+
+    Args:
+        control: Running statistics for the control arm.
+        treatment: Running statistics for the treatment arm.
+        alpha: Significance level. Default 0.05.
+        mde: Minimum detectable effect in standard deviation units, used to
+            size the mixture (tau = mde * pooled standard deviation).
+        higher_is_better: Whether higher metric values indicate success.
+        previous_p_value: Always-valid p-value from the previous check; the
+            reported p-value is the running minimum. Default 1.0.
+        mixture_variance: Explicit tau^2, overriding the mde-based default.
+        burn_in: Minimum outcomes per arm before the test may stop.
+
+    Returns:
+        SequentialTestResult for the current statistics.
+
+    Raises:
+        ValueError: If alpha, mde or mixture_variance are out of range.
+
+    Examples:
+        >>> result = run_mixture_sprt(control, treatment, alpha=0.05)
+        >>> if result.should_stop:
+        ...     print(result.decision.value, f"p={result.p_value:.4f}")
+    """
+    if not 0.0 < alpha < 1.0:
+        raise ValueError(f"alpha must be between 0 and 1, got {alpha}")
+    if mde <= 0.0:
+        raise ValueError(f"mde must be positive, got {mde}")
+    if mixture_variance is not None and mixture_variance <= 0.0:
+        raise ValueError(f"mixture_variance must be positive, got {mixture_variance}")
+
+    effect = treatment.mean - control.mean
+    lift = effect / control.mean if control.mean else None
+    p_value = min(1.0, previous_p_value)
+
+    v = (
+        control.variance / control.count + treatment.variance / treatment.count
+        if control.count >= 2 and treatment.count >= 2
+        else 0.0
+    )
+    if v <= 0.0:
+        # Not enough outcomes (or no spread) to estimate the variance yet
+        return SequentialTestResult(
+            decision=SequentialDecision.CONTINUE,
+            p_value=p_value,
+            log_likelihood_ratio=0.0,
+            effect=effect,
+            lift=lift,
+            confidence_interval=(-math.inf, math.inf),
+            control_n=control.count,
+            treatment_n=treatment.count,
+        )
+
+    if mixture_variance is None:
+        pooled_variance = (control.m2 + treatment.m2) / (control.count + treatment.count - 2)
+        mixture_variance = (mde**2) * pooled_variance
+
+    tau2 = mixture_variance
+    log_lr = 0.5 * math.log(v / (v + tau2)) + tau2 * effect**2 / (2 * v * (v + tau2))
+    if log_lr > 0.0:
+        p_value = min(p_value, math.exp(-log_lr))
+
+    half_width = math.sqrt(
+        v * (v + tau2) / tau2 * (math.log((v + tau2) / v) - 2 * math.log(alpha))
+    )
+
+    decision = SequentialDecision.CONTINUE
+    # A zero effect has no winner, whatever the carried-over p-value says
+    if p_value <= alpha and effect != 0.0 and min(control.count, treatment.count) >= burn_in:
+        if (effect > 0) == higher_is_better:
+            decision = SequentialDecision.TREATMENT_WINS
+        else:
+            decision = SequentialDecision.CONTROL_WINS
+
+    return SequentialTestResult(
+        decision=decision,
+        p_value=p_value,
+        log_likelihood_ratio=log_lr,
+        effect=effect,
+        lift=lift,
+        confidence_interval=(effect - half_width, effect + half_width),
+        control_n=control.count,
+        treatment_n=treatment.count,
+    )
+
+
+def evaluate_sequential_test(
+    test: VolumeABTest,
+    control: ArmStatistics,
+    treatment: ArmStatistics,
+    previous_p_value: float = 1.0,
+    mixture_variance: float | None = None,
+    burn_in: int = SEQUENTIAL_BURN_IN,
+) -> SequentialTestResult:
+    """Check a running test for an early, always-valid decision.
+
+    Sequential counterpart of validate_test_completion(): instead of
+    waiting for min_sample_size per arm, the test can stop as soon as the
+    primary metric is decisive. Safe to call after every batch of outcomes.
+
+    Args:
+        test: The VolumeABTest specification being run.
+        control: Running statistics for the control arm.
+        treatment: Running statistics for the treatment arm.
+        previous_p_value: Always-valid p-value from the previous check.
+        mixture_variance: Explicit mixture variance (tau^2) for the mSPRT.
+        burn_in: Minimum outcomes per arm before the test may stop.
+
+    Returns:
+        SequentialTestResult for the test's primary metric.
+
+    Examples:
+        >>> test = get_test_by_id('bump_ratio_2x_vs_3x')
+        >>> check = evaluate_sequential_test(test, control, treatment)
+        >>> if check.should_stop:
+        ...     test.complete()
+    """
+    result = run_mixture_sprt(
+        control,
+        treatment,
+        alpha=1.0 - test.confidence_level,
+        mde=test.minimum_detectable_effect,
+        higher_is_better=test.primary_metric.higher_is_better,
+        previous_p_value=previous_p_value,
+        mixture_variance=mixture_variance,
+        burn_in=burn_in,
+    )
+
+    # Checks run after every batch of outcomes; only a stop is worth INFO
+    log = logger.info if result.should_stop else logger.debug
+    log(
+        "Sequential test evaluated",
+        extra={
+            "test_id": test.test_id,
+            "decision": result.decision.value,
+            "p_value": result.p_value,
+            "control_n": result.control_n,
+            "treatment_n": result.treatment_n,
+        },
+    )
+
+    return result
+
+
 # =============================================================================
 # Pre-configured Test Specifications
 # =============================================================================
@@ -1021,10 +1420,13 @@ def create_custom_test(
 __all__ = [
     # Enums
     "TestStatus",
+    "SequentialDecision",
     "MetricType",
     # Data classes
     "VolumeConfig",
     "Metric",
+    "ArmStatistics",
+    "SequentialTestResult",
     "VolumeABTest",
     # Pre-configured tests
     "VOLUME_AB_TESTS",
@@ -1039,11 +1441,15 @@ __all__ = [
     "DEFAULT_STATISTICAL_POWER",
     "DEFAULT_MDE",
     "DEFAULT_DURATION_DAYS",
+    "SEQUENTIAL_BURN_IN",
     # Statistical functions
     "_calculate_min_sample_size",
     "calculate_achieved_power",
     # Validation functions
     "validate_test_completion",
+    # Sequential testing
+    "run_mixture_sprt",
+    "evaluate_sequential_test",
     # Helper functions
     "get_test_by_id",
     "list_available_tests",
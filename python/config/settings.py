@@ -5,16 +5,14 @@ Provides centralized configuration management with YAML-based defaults
 and environment variable overrides.
 """
 
+import importlib.util
+import json  # Fallback to JSON if YAML not available
 import os
 from pathlib import Path
 from typing import Any
 
-try:
-    import yaml
-    YAML_AVAILABLE = True
-except ImportError:
-    YAML_AVAILABLE = False
-    import json  # Fallback to JSON if YAML not available
+# yaml is imported when a config file is first loaded, not at module import
+YAML_AVAILABLE = importlib.util.find_spec("yaml") is not None
 
 from python.logging_config import get_logger
 
@@ -94,6 +92,8 @@ class Settings:
         """
         with open(path, "r") as f:
             if YAML_AVAILABLE and path.suffix in (".yaml", ".yml"):
+                import yaml
+
                 result = yaml.safe_load(f)
                 return dict(result) if result else {}
             else:
@@ -0,0 +1,72 @@
+"""
+Lazy package exports (PEP 562) for EROS Schedule Generator.
+
+Package __init__ modules re-export names from many submodules. Importing
+them all eagerly makes `import python` (and every short-lived CLI or MCP
+process) pay for modules it never uses. lazy_exports() builds the module
+level __getattr__ and __dir__ hooks that import a submodule the first time
+one of its exported names is accessed.
+
+Usage:
+    # python/volume/__init__.py
+    from python.lazy_imports import lazy_exports
+
+    __getattr__, __dir__ = lazy_exports(__name__, {
+        "python.volume.dynamic_calculator": (
+            "PerformanceContext",
+            "calculate_dynamic_volume",
+        ),
+        "python.volume.day_of_week": (
+            "DEFAULT_MULTIPLIERS as DOW_DEFAULT_MULTIPLIERS",
+        ),
+    })
+"""
+
+import importlib
+import sys
+from collections.abc import Callable, Mapping, Sequence
+
+
+def lazy_exports(
+    package_name: str,
+    exports: Mapping[str, Sequence[str]],
+) -> tuple[Callable[[str], object], Callable[[], list[str]]]:
+    """
+    Build PEP 562 __getattr__/__dir__ hooks for a package.
+
+    Args:
+        package_name: The package's __name__
+        exports: Mapping of submodule name to exported names. A name may be
+            written "attr as alias" to re-export under a different name,
+            like an import statement.
+
+    Returns:
+        (__getattr__, __dir__) functions to assign in the package module.
+        Resolved names are cached in the package namespace, so each name
+        goes through __getattr__ at most once.
+
+    Raises:
+        ValueError: If the same exported name is declared twice.
+    """
+    targets: dict[str, tuple[str, str]] = {}
+    for module_name, names in exports.items():
+        for entry in names:
+            attr, _, alias = entry.partition(" as ")
+            alias = alias or attr
+            if alias in targets:
+                raise ValueError(f"{package_name} exports {alias!r} twice")
+            targets[alias] = (module_name, attr)
+
+    def __getattr__(name: str) -> object:
+        try:
+            module_name, attr = targets[name]
+        except KeyError:
+            raise AttributeError(f"module {package_name!r} has no attribute {name!r}") from None
+        value = getattr(importlib.import_module(module_name), attr)
+        setattr(sys.modules[package_name], name, value)
+        return value
+
+    def __dir__() -> list[str]:
+        return sorted(set(vars(sys.modules[package_name])) | set(targets))
+
+    return __getattr__, __dir__
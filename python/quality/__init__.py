@@ -10,6 +10,8 @@ Modules:
     drip_outfit_validator: Drip content outfit consistency validation
     bundle_validator: Bundle value framing validation (Gap 7.3)
     price_validator: Price-length alignment validation (Gap 10.11/10.12)
+    unicode_classes: Shared Unicode range tables (emoji, styled text, lookalike folding)
+    batch_validation: Shared per-caption loop for validators' validate_batch methods
 """
 
 from .ppv_structure import PPVStructureValidator
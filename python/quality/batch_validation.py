@@ -0,0 +1,50 @@
+"""
+Shared Batch Validation for Caption Validators.
+
+The emoji, font and scam validators all validate a whole schedule's captions
+in one call. validate_captions() runs a single-caption validator over every
+caption and re-raises the first ValidationError with the caption's index, so
+the error points at the offending entry.
+
+Usage:
+    from python.quality.batch_validation import validate_captions
+
+    results = validate_captions(EmojiValidator().validate, captions)
+"""
+
+from typing import Callable, List, Sequence, TypeVar
+
+from python.exceptions import ValidationError
+
+ResultT = TypeVar("ResultT")
+
+
+def validate_captions(
+    validate: Callable[[str], ResultT],
+    captions: Sequence[str]
+) -> List[ResultT]:
+    """
+    Validate each caption in order with a single-caption validator.
+
+    Args:
+        validate: Validator for one caption
+        captions: The caption texts to validate
+
+    Returns:
+        Validator results, one per caption, in input order
+
+    Raises:
+        ValidationError: If any caption is rejected, with the caption index
+            in the message and field
+    """
+    results = []
+    for index, caption in enumerate(captions):
+        try:
+            results.append(validate(caption))
+        except ValidationError as e:
+            raise ValidationError(
+                message=f"Caption {index}: {e.message}",
+                field=f"captions[{index}]",
+                value=e.value
+            ) from e
+    return results
@@ -9,10 +9,12 @@ Rule: NEVER 3+ yellow face emojis in a row
 """
 import re
 from dataclasses import dataclass
-from typing import Dict, List
+from typing import Dict, List, Sequence
 
 from python.logging_config import get_logger
 from python.exceptions import ValidationError
+from python.quality.batch_validation import validate_captions
+from python.quality.unicode_classes import SKIN_TONE, find_emojis, is_emoji
 
 logger = get_logger(__name__)
 
@@ -48,6 +50,9 @@ class EmojiValidator:
         '\U0001F633', '\U0001F644', '\U0001F62C', '\U0001F910', '\U0001F974',
     }
 
+    # Three yellow faces back to back (any other character breaks the run)
+    YELLOW_RUN_PATTERN = re.compile("[%s]{3}" % "".join(sorted(YELLOW_FACE_EMOJIS)))
+
     # Pattern to match emojis
     EMOJI_PATTERN = re.compile(
         "["
@@ -88,10 +93,7 @@ class EmojiValidator:
             )
 
         # Extract all emojis from caption
-        emojis_found = []
-        for char in caption:
-            if self._is_emoji(char):
-                emojis_found.append(char)
+        emojis_found = find_emojis(caption)
 
         # Calculate emoji density for all captions
         emoji_density = len(emojis_found) / len(caption) if caption else 0
@@ -107,32 +109,15 @@ class EmojiValidator:
         issues = []
 
         # Check for 3+ consecutive yellow faces in the original text
-        # We need to check character by character in the original caption
-        consecutive_yellow = 0
-        yellow_sequence = []
-
-        for char in caption:
-            if self._is_emoji(char):
-                if char in self.YELLOW_FACE_EMOJIS:
-                    consecutive_yellow += 1
-                    yellow_sequence.append(char)
-                    if consecutive_yellow >= 3:
-                        issues.append({
-                            'type': 'emoji_vomit',
-                            'severity': 'MEDIUM',
-                            'message': f"3+ yellow face emojis in a row detected",
-                            'emojis': yellow_sequence[-3:],
-                            'recommendation': 'Vary emoji colors for better visual blend'
-                        })
-                        break
-                else:
-                    # Non-yellow emoji breaks the sequence
-                    consecutive_yellow = 0
-                    yellow_sequence = []
-            else:
-                # Non-emoji character breaks the sequence
-                consecutive_yellow = 0
-                yellow_sequence = []
+        yellow_run = self.YELLOW_RUN_PATTERN.search(caption)
+        if yellow_run:
+            issues.append({
+                'type': 'emoji_vomit',
+                'severity': 'MEDIUM',
+                'message': f"3+ yellow face emojis in a row detected",
+                'emojis': list(yellow_run.group()),
+                'recommendation': 'Vary emoji colors for better visual blend'
+            })
 
         # Check emoji density - dynamic based on caption length
         # Dynamic density based on length
@@ -159,6 +144,21 @@ class EmojiValidator:
             'issues': issues
         }
 
+    def validate_batch(self, captions: Sequence[str]) -> List[Dict]:
+        """
+        Validate emoji blending rules for a whole schedule's captions.
+
+        Args:
+            captions: The caption texts to validate
+
+        Returns:
+            Validation result dicts, one per caption, in input order
+
+        Raises:
+            ValidationError: If any caption is empty or not a string
+        """
+        return validate_captions(self.validate, captions)
+
     def _is_emoji(self, char: str) -> bool:
         """
         Check if character is an emoji.
@@ -171,54 +171,11 @@ class EmojiValidator:
 
         Note: Excludes bare digits (0-9), # and * as these are only emojis
         when combined with variation selectors in keycap sequences.
+
+        Ranges are defined in python.quality.unicode_classes.EMOJI_RANGES.
         """
-        code = ord(char)
-        # Cover all major emoji ranges (updated for Unicode 15.0+)
-        return (
-            # Core emoji ranges
-            0x1F600 <= code <= 0x1F64F or  # Emoticons
-            0x1F300 <= code <= 0x1F5FF or  # Symbols & Pictographs
-            0x1F680 <= code <= 0x1F6FF or  # Transport & Map
-            0x1F1E0 <= code <= 0x1F1FF or  # Flags (regional indicators)
-
-            # Misc symbols and dingbats
-            0x2600 <= code <= 0x26FF or    # Misc symbols
-            0x2700 <= code <= 0x27BF or    # Dingbats
-
-            # Variation selectors (used to modify emoji presentation)
-            0xFE00 <= code <= 0xFE0F or    # Variation selectors
-
-            # Supplemental symbols and pictographs
-            0x1F900 <= code <= 0x1F9FF or  # Supplemental symbols
-
-            # Extended emoji (Unicode 13.0+)
-            0x1FA00 <= code <= 0x1FA6F or  # Chess symbols, extended-A
-            0x1FA70 <= code <= 0x1FAFF or  # Extended-B (Unicode 14.0/15.0)
-
-            # Skin tone modifiers (Fitzpatrick scale)
-            0x1F3FB <= code <= 0x1F3FF or  # Skin tones (light to dark)
-
-            # Additional miscellaneous symbols
-            0x231A <= code <= 0x231B or    # Watch, hourglass
-            0x23E9 <= code <= 0x23F3 or    # Various media controls
-            0x23F8 <= code <= 0x23FA or    # Various media controls
-
-            # People and body parts
-            0x1F385 <= code <= 0x1F3C4 or  # Holiday and sports figures
-            0x1F466 <= code <= 0x1F487 or  # People
-
-            # Animals and nature extended
-            0x1FAB0 <= code <= 0x1FAB6 or  # Animals (Unicode 13.0+)
-            0x1FAC0 <= code <= 0x1FAC2 or  # Face partials (Unicode 13.0+)
-            0x1FAD0 <= code <= 0x1FAD6 or  # Food items (Unicode 13.0+)
-            0x1FAE0 <= code <= 0x1FAE7 or  # Face emojis (Unicode 14.0+)
-            0x1FAF0 <= code <= 0x1FAF6     # Hand gestures (Unicode 14.0+)
-
-            # Note: Keycap sequences (0-9, #, *) excluded as they need
-            # variation selectors to be considered emojis
-        )
+        return is_emoji(char)
 
     def _is_skin_tone_modifier(self, char: str) -> bool:
         """Check if character is a skin tone modifier (Fitzpatrick scale)."""
-        code = ord(char)
-        return 0x1F3FB <= code <= 0x1F3FF  # Light to dark skin tones
+        return char in SKIN_TONE
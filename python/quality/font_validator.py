@@ -11,10 +11,12 @@ Rule: Max 2 highlighted elements in long captions (250+ chars)
 
 import re
 from dataclasses import dataclass
-from typing import Dict, List
+from typing import Dict, List, Sequence
 
 from python.logging_config import get_logger
 from python.exceptions import ValidationError
+from python.quality import unicode_classes
+from python.quality.batch_validation import validate_captions
 
 logger = get_logger(__name__)
 
@@ -51,17 +53,14 @@ class FontFormatValidator:
         (r'\[[^\]]+\]\([^)]+\)', 'link'),         # [link](url)
     ]
 
-    # Unicode special formatting (mathematical alphanumeric symbols)
-    UNICODE_BOLD_RANGES = [
-        (0x1D400, 0x1D433),  # Mathematical Bold
-        (0x1D5D4, 0x1D607),  # Mathematical Sans-Serif Bold
-        (0x1D63C, 0x1D66F),  # Mathematical Sans-Serif Bold Italic
-    ]
+    # Compiled once for all captions
+    COMPILED_HIGHLIGHT_PATTERNS = tuple(
+        (re.compile(pattern), format_type) for pattern, format_type in HIGHLIGHT_PATTERNS
+    )
 
-    UNICODE_ITALIC_RANGES = [
-        (0x1D434, 0x1D467),  # Mathematical Italic
-        (0x1D608, 0x1D63B),  # Mathematical Sans-Serif Italic
-    ]
+    # Unicode special formatting (mathematical alphanumeric symbols)
+    UNICODE_BOLD_RANGES = list(unicode_classes.UNICODE_BOLD_RANGES)
+    UNICODE_ITALIC_RANGES = list(unicode_classes.UNICODE_ITALIC_RANGES)
 
     def validate(self, caption: str) -> FontValidationResult:
         """
@@ -94,8 +93,8 @@ class FontFormatValidator:
         issues: List[Dict] = []
 
         # Check markdown-style formatting
-        for pattern, format_type in self.HIGHLIGHT_PATTERNS:
-            matches = re.findall(pattern, caption)
+        for pattern, format_type in self.COMPILED_HIGHLIGHT_PATTERNS:
+            matches = pattern.findall(caption)
             for match in matches:
                 highlighted_elements.append({
                     'type': format_type,
@@ -141,57 +140,24 @@ class FontFormatValidator:
             recommendation=recommendation
         )
 
+    def validate_batch(self, captions: Sequence[str]) -> List[FontValidationResult]:
+        """
+        Validate font formatting for a whole schedule's captions.
+
+        Args:
+            captions: The caption texts to validate
+
+        Returns:
+            FontValidationResult per caption, in input order
+
+        Raises:
+            ValidationError: If any caption is empty or not a string
+        """
+        return validate_captions(self.validate, captions)
+
     def _count_unicode_formatting(self, text: str) -> List[Dict]:
         """Count Unicode mathematical/styled characters."""
-        elements = []
-        current_run = []
-        current_type = None
-
-        for char in text:
-            code = ord(char)
-            char_type = None
-
-            # Check if in bold ranges
-            for start, end in self.UNICODE_BOLD_RANGES:
-                if start <= code <= end:
-                    char_type = 'unicode_bold'
-                    break
-
-            # Check if in italic ranges
-            if char_type is None:
-                for start, end in self.UNICODE_ITALIC_RANGES:
-                    if start <= code <= end:
-                        char_type = 'unicode_italic'
-                        break
-
-            if char_type:
-                if char_type == current_type:
-                    current_run.append(char)
-                else:
-                    if current_run:
-                        elements.append({
-                            'type': current_type,
-                            'text': ''.join(current_run),
-                            'source': 'unicode'
-                        })
-                    current_run = [char]
-                    current_type = char_type
-            else:
-                if current_run:
-                    elements.append({
-                        'type': current_type,
-                        'text': ''.join(current_run),
-                        'source': 'unicode'
-                    })
-                    current_run = []
-                    current_type = None
-
-        # Don't forget the last run
-        if current_run:
-            elements.append({
-                'type': current_type,
-                'text': ''.join(current_run),
-                'source': 'unicode'
-            })
-
-        return elements
+        return [
+            {'type': run_type, 'text': run, 'source': 'unicode'}
+            for run_type, run in unicode_classes.find_styled_runs(text)
+        ]
@@ -23,19 +23,36 @@ Usage:
         print(f"Action: {result.scam_risks[0].action_required}")
 """
 
+import functools
 import re
-import unicodedata
 from dataclasses import dataclass
-from typing import Set
+from typing import Sequence, Set
 
 from python.logging_config import get_logger
 from python.exceptions import ValidationError
+from python.quality.batch_validation import validate_captions
+from python.quality.unicode_classes import fold_to_ascii
 
 logger = get_logger(__name__)
 
 # Severity level constants for blocking decisions
 BLOCKING_SEVERITIES = {'MEDIUM', 'HIGH', 'CRITICAL'}
 
+# Leet-speak substitutions, whitespace removal and lowercasing in one pass
+# (applied to ASCII text; the whitespace set is what re's \s matches there)
+_LEET_TABLE = str.maketrans(
+    {
+        **{char: 'a' for char in '@4'},
+        '0': 'o',
+        **{char: 'i' for char in '1!|'},  # 1 -> i (prevents "fac1al" -> "faclal")
+        '3': 'e',
+        **{char: 's' for char in '5$'},
+        '7': 't',
+        **{char: None for char in ' \t\n\r\x0b\x0c\x1c\x1d\x1e\x1f'},
+        **{chr(code): chr(code + 32) for code in range(ord('A'), ord('Z') + 1)},
+    }
+)
+
 
 def normalize_text(text: str) -> str:
     """
@@ -69,50 +86,18 @@ def normalize_text(text: str) -> str:
         >>> normalize_text("аnаl")  # Cyrillic 'а'
         'anal'
     """
-    # 1. Cyrillic and Greek lookalike mapping (must be done BEFORE ASCII conversion)
-    # These characters look identical to Latin but have different Unicode points
-    lookalike_map = str.maketrans({
-        # Cyrillic lookalikes (most common)
-        'а': 'a', 'А': 'a',  # U+0430, U+0410
-        'е': 'e', 'Е': 'e',  # U+0435, U+0415
-        'і': 'i', 'І': 'i',  # U+0456, U+0406
-        'о': 'o', 'О': 'o',  # U+043E, U+041E
-        'р': 'p', 'Р': 'p',  # U+0440, U+0420
-        'с': 'c', 'С': 'c',  # U+0441, U+0421
-        'у': 'y', 'У': 'y',  # U+0443, U+0423
-        'х': 'x', 'Х': 'x',  # U+0445, U+0425
-        # Greek lookalikes
-        'α': 'a', 'Α': 'a',  # U+03B1, U+0391
-        'ο': 'o', 'Ο': 'o',  # U+03BF, U+039F
-        'ρ': 'p', 'Ρ': 'p',  # U+03C1, U+03A1
-    })
-    normalized = text.translate(lookalike_map)
-
-    # 2. NFKD decomposition (separates base chars from combining marks)
-    normalized = unicodedata.normalize('NFKD', normalized)
-
-    # 3. Remove zero-width characters (invisible bypass attempts)
-    zero_width = '\u200b\u200c\u200d\ufeff\u00ad'
-    normalized = ''.join(c for c in normalized if c not in zero_width)
-
-    # 4. Remove combining characters (diacritical marks)
-    normalized = ''.join(c for c in normalized if not unicodedata.combining(c))
-
-    # 5. ASCII conversion (strips remaining non-ASCII characters)
-    ascii_text = normalized.encode('ascii', errors='ignore').decode('ascii')
-
-    # 6. Common leet-speak substitution handling
-    ascii_text = re.sub(r'[@4]', 'a', ascii_text)
-    ascii_text = re.sub(r'[0]', 'o', ascii_text)
-    ascii_text = re.sub(r'[1!|]', 'i', ascii_text)  # Fixed: 1 → i (prevents "fac1al" → "faclal")
-    ascii_text = re.sub(r'[3]', 'e', ascii_text)
-    ascii_text = re.sub(r'[5$]', 's', ascii_text)
-    ascii_text = re.sub(r'[7]', 't', ascii_text)
-
-    # 7. Collapse multiple spaces (catches "a n a l" spacing bypass)
-    ascii_text = re.sub(r'\s+', '', ascii_text)
-
-    return ascii_text.lower()
+    # Steps 1-5: lookalike mapping, NFKD and ASCII conversion (zero-width
+    # and combining characters are non-ASCII, so the conversion drops them)
+    ascii_text = fold_to_ascii(text)
+
+    # Steps 6-7 and lowercasing as a single translation table
+    return ascii_text.translate(_LEET_TABLE)
+
+
+@functools.lru_cache(maxsize=512)
+def _normalize_keyword(keyword: str) -> str:
+    """Normalize a keyword once; keyword lists are fixed per validator class."""
+    return normalize_text(keyword)
 
 
 @dataclass(frozen=True, slots=True)
@@ -289,7 +274,7 @@ class ContentAuthenticityValidator:
 
         for act, keywords in self.EXPLICIT_ACT_KEYWORDS.items():
             # Normalize keywords as well for consistent matching
-            normalized_keywords = [normalize_text(kw) for kw in keywords]
+            normalized_keywords = [_normalize_keyword(kw) for kw in keywords]
 
             # Check if caption mentions this act (using normalized text)
             matched = [
@@ -358,6 +343,29 @@ class ContentAuthenticityValidator:
             recommendation='SAFE TO SCHEDULE' if len(scam_risks) == 0 else 'REQUIRES MANUAL REVIEW'
         )
 
+    def validate_batch(
+        self,
+        captions: Sequence[str],
+        vault_content: Set[str]
+    ) -> list[ContentValidationResult]:
+        """
+        Check a whole schedule's captions against one creator's vault.
+
+        Args:
+            captions: The caption texts to validate
+            vault_content: Set of content types available in vault
+
+        Returns:
+            ContentValidationResult per caption, in input order
+
+        Raises:
+            ValidationError: If any caption is empty or not a string
+        """
+        return validate_captions(
+            functools.partial(self.validate, vault_content=vault_content),
+            captions
+        )
+
 
 def validate_caption_vault_match(
     caption: str,
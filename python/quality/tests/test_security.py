@@ -114,6 +114,19 @@ class TestInputValidation:
             validator.validate(123, set())  # type: ignore
         assert exc_info.value.field == "caption"
 
+    def test_batch_invalid_caption_raises_with_index(self, validator):
+        """Batch validation should name the invalid caption's position."""
+        with pytest.raises(ValidationError) as exc_info:
+            validator.validate_batch(["solo tease", None], set())  # type: ignore
+        assert exc_info.value.field == "captions[1]"
+
+    def test_batch_matches_single(self, validator):
+        """Batch validation should equal per-caption validation, in order."""
+        captions = ["watch me squirt", "\u0430n\u0430l tonight", "just a tease"]
+        results = validator.validate_batch(captions, {'squirt'})
+        assert results == [validator.validate(c, {'squirt'}) for c in captions]
+        assert [r.blocked for r in results] == [False, True, False]
+
 
 class TestNormalizeText:
     """Test the normalize_text utility function."""
@@ -0,0 +1,211 @@
+"""
+Shared Unicode Character Classification for Quality Validators.
+
+Precomputed range tables for the character classes the caption validators
+scan for (emoji, Unicode bold/italic styling, lookalike folding). Each class
+is built once at import as a sorted range table, used for bisect lookups of
+single characters, and as a compiled character-class regex, so a whole
+caption is scanned in one regex call instead of char by char in Python.
+
+Usage:
+    from python.quality.unicode_classes import find_emojis, find_styled_runs
+
+    find_emojis("hey 😍🔥")               # ['😍', '🔥']
+    find_styled_runs("𝐁𝐎𝐋𝐃 text")        # [('unicode_bold', '𝐁𝐎𝐋𝐃')]
+"""
+
+import re
+import unicodedata
+from bisect import bisect_right
+from dataclasses import dataclass
+from itertools import groupby
+from typing import Sequence
+
+# Emoji code point ranges (Unicode 15.0+)
+# Note: Keycap sequences (0-9, #, *) are excluded as they need
+# variation selectors to be considered emojis
+EMOJI_RANGES: tuple[tuple[int, int], ...] = (
+    # Core emoji ranges
+    (0x1F600, 0x1F64F),  # Emoticons
+    (0x1F300, 0x1F5FF),  # Symbols & Pictographs
+    (0x1F680, 0x1F6FF),  # Transport & Map
+    (0x1F1E0, 0x1F1FF),  # Flags (regional indicators)
+    # Misc symbols and dingbats
+    (0x2600, 0x26FF),    # Misc symbols
+    (0x2700, 0x27BF),    # Dingbats
+    # Variation selectors (used to modify emoji presentation)
+    (0xFE00, 0xFE0F),
+    # Supplemental symbols and pictographs
+    (0x1F900, 0x1F9FF),
+    # Extended emoji (Unicode 13.0+)
+    (0x1FA00, 0x1FA6F),  # Chess symbols, extended-A
+    (0x1FA70, 0x1FAFF),  # Extended-B (Unicode 14.0/15.0)
+    # Skin tone modifiers (Fitzpatrick scale)
+    (0x1F3FB, 0x1F3FF),
+    # Additional miscellaneous symbols
+    (0x231A, 0x231B),    # Watch, hourglass
+    (0x23E9, 0x23F3),    # Various media controls
+    (0x23F8, 0x23FA),    # Various media controls
+    # People and body parts
+    (0x1F385, 0x1F3C4),  # Holiday and sports figures
+    (0x1F466, 0x1F487),  # People
+    # Animals and nature extended
+    (0x1FAB0, 0x1FAB6),  # Animals (Unicode 13.0+)
+    (0x1FAC0, 0x1FAC2),  # Face partials (Unicode 13.0+)
+    (0x1FAD0, 0x1FAD6),  # Food items (Unicode 13.0+)
+    (0x1FAE0, 0x1FAE7),  # Face emojis (Unicode 14.0+)
+    (0x1FAF0, 0x1FAF6),  # Hand gestures (Unicode 14.0+)
+)
+
+SKIN_TONE_RANGES: tuple[tuple[int, int], ...] = (
+    (0x1F3FB, 0x1F3FF),  # Light to dark skin tones
+)
+
+# Unicode special formatting (mathematical alphanumeric symbols)
+UNICODE_BOLD_RANGES: tuple[tuple[int, int], ...] = (
+    (0x1D400, 0x1D433),  # Mathematical Bold
+    (0x1D5D4, 0x1D607),  # Mathematical Sans-Serif Bold
+    (0x1D63C, 0x1D66F),  # Mathematical Sans-Serif Bold Italic
+)
+
+UNICODE_ITALIC_RANGES: tuple[tuple[int, int], ...] = (
+    (0x1D434, 0x1D467),  # Mathematical Italic
+    (0x1D608, 0x1D63B),  # Mathematical Sans-Serif Italic
+)
+
+# Cyrillic and Greek characters that render identically to Latin letters
+LOOKALIKE_TABLE = str.maketrans({
+    # Cyrillic lookalikes (most common)
+    'а': 'a', 'А': 'a',  # U+0430, U+0410
+    'е': 'e', 'Е': 'e',  # U+0435, U+0415
+    'і': 'i', 'І': 'i',  # U+0456, U+0406
+    'о': 'o', 'О': 'o',  # U+043E, U+041E
+    'р': 'p', 'Р': 'p',  # U+0440, U+0420
+    'с': 'c', 'С': 'c',  # U+0441, U+0421
+    'у': 'y', 'У': 'y',  # U+0443, U+0423
+    'х': 'x', 'Х': 'x',  # U+0445, U+0425
+    # Greek lookalikes
+    'α': 'a', 'Α': 'a',  # U+03B1, U+0391
+    'ο': 'o', 'Ο': 'o',  # U+03BF, U+039F
+    'ρ': 'p', 'Ρ': 'p',  # U+03C1, U+03A1
+})
+
+
+@dataclass(frozen=True, slots=True)
+class RangeTable:
+    """
+    Immutable character class built from code point ranges.
+
+    Attributes:
+        starts: Sorted start code points of the merged ranges
+        ends: End code points (inclusive), parallel to starts
+        char_class: Regex character class source, e.g. '[\\U00002600-\\U000026FF]'
+        pattern: Compiled regex matching one character of the class
+    """
+    starts: tuple[int, ...]
+    ends: tuple[int, ...]
+    char_class: str
+    pattern: re.Pattern
+
+    def __contains__(self, char: str) -> bool:
+        code = ord(char)
+        index = bisect_right(self.starts, code) - 1
+        return index >= 0 and code <= self.ends[index]
+
+
+def build_range_table(ranges: Sequence[tuple[int, int]]) -> RangeTable:
+    """
+    Merge overlapping or adjacent ranges into a RangeTable.
+
+    Args:
+        ranges: (start, end) code point pairs, inclusive, in any order
+
+    Returns:
+        RangeTable for bisect lookups and regex scanning
+    """
+    merged: list[list[int]] = []
+    for start, end in sorted(ranges):
+        if merged and start <= merged[-1][1] + 1:
+            merged[-1][1] = max(merged[-1][1], end)
+        else:
+            merged.append([start, end])
+
+    char_class = "[" + "".join(f"\\U{start:08X}-\\U{end:08X}" for start, end in merged) + "]"
+    return RangeTable(
+        starts=tuple(start for start, _ in merged),
+        ends=tuple(end for _, end in merged),
+        char_class=char_class,
+        pattern=re.compile(char_class),
+    )
+
+
+EMOJI = build_range_table(EMOJI_RANGES)
+SKIN_TONE = build_range_table(SKIN_TONE_RANGES)
+UNICODE_BOLD = build_range_table(UNICODE_BOLD_RANGES)
+UNICODE_ITALIC = build_range_table(UNICODE_ITALIC_RANGES)
+UNICODE_STYLED = build_range_table(UNICODE_BOLD_RANGES + UNICODE_ITALIC_RANGES)
+
+# Runs of styled characters (bold and italic mixed; split by find_styled_runs)
+STYLED_RUN_PATTERN = re.compile(UNICODE_STYLED.char_class + "+")
+
+
+def is_emoji(char: str) -> bool:
+    """Check if a single character is an emoji code point."""
+    return char in EMOJI
+
+
+def find_emojis(text: str) -> list[str]:
+    """
+    Extract every emoji code point from text, in order.
+
+    Args:
+        text: Text to scan
+
+    Returns:
+        List of emoji characters (one entry per code point)
+    """
+    if text.isascii():
+        return []
+    return EMOJI.pattern.findall(text)
+
+
+def find_styled_runs(text: str) -> list[tuple[str, str]]:
+    """
+    Find runs of Unicode bold/italic styled characters.
+
+    Consecutive characters of the same styling form one run; a change of
+    styling or any unstyled character ends it.
+
+    Args:
+        text: Text to scan
+
+    Returns:
+        List of (type, run_text) tuples, type being 'unicode_bold' or 'unicode_italic'
+    """
+    if text.isascii():
+        return []
+    runs = []
+    for match in STYLED_RUN_PATTERN.finditer(text):
+        for is_bold, chars in groupby(match.group(), key=UNICODE_BOLD.__contains__):
+            runs.append(('unicode_bold' if is_bold else 'unicode_italic', ''.join(chars)))
+    return runs
+
+
+def fold_to_ascii(text: str) -> str:
+    """
+    Fold text to plain ASCII for keyword matching.
+
+    Maps Cyrillic/Greek lookalikes to Latin, applies NFKD decomposition and
+    drops every remaining non-ASCII code point. Zero-width characters and
+    combining marks are all non-ASCII, so they are removed by the same step.
+
+    Args:
+        text: Raw input text
+
+    Returns:
+        ASCII-only text (case preserved)
+    """
+    if text.isascii():
+        return text
+    normalized = unicodedata.normalize('NFKD', text.translate(LOOKALIKE_TABLE))
+    return normalized.encode('ascii', errors='ignore').decode('ascii')
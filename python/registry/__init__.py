@@ -6,8 +6,16 @@ loaded from the database. Registries cache configuration data for fast
 runtime lookups without repeated database queries.
 """
 
-from .send_type_registry import SendTypeRegistry
+from .send_type_registry import (
+    CaptionRequirement,
+    SendTypeRegistry,
+    SendTypeSnapshot,
+    load_send_type_snapshot,
+)
 
 __all__ = [
+    "CaptionRequirement",
     "SendTypeRegistry",
+    "SendTypeSnapshot",
+    "load_send_type_snapshot",
 ]
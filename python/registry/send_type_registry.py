@@ -4,16 +4,322 @@ Send Type Registry - Singleton configuration cache.
 Provides centralized access to send type configuration loaded from the database.
 Eliminates hardcoded taxonomy lists and provides consistent timing/caption
 requirements across the application.
+
+The registry holds an immutable SendTypeSnapshot built from one joined query
+over send_types and send_type_caption_requirements. Reloads build a new
+snapshot and swap it in with a single reference assignment, so readers never
+see a half-loaded registry. refresh() only reloads when the database has
+committed changes, which lets the MCP tools and the Python pipeline share one
+snapshot instead of querying the send type tables on every call.
 """
 
+import hashlib
 import sqlite3
-from typing import ClassVar, Any
+import threading
+from dataclasses import dataclass, field, fields
+from types import MappingProxyType
+from typing import ClassVar, Any, Mapping
 
 from python.models.send_type import SendType, SendTypeConfig
 from python.logging_config import get_logger
 
 logger = get_logger(__name__)
 
+CATEGORIES: tuple[str, ...] = ("revenue", "engagement", "retention")
+
+# SendType fields, in declaration order, used to build raw models from rows
+_SEND_TYPE_FIELDS: tuple[str, ...] = tuple(f.name for f in fields(SendType))
+
+
+@dataclass(frozen=True, slots=True)
+class CaptionRequirement:
+    """Caption type mapped to a send type (send_type_caption_requirements row).
+
+    Attributes:
+        caption_type: Caption type (matches caption_bank.caption_type)
+        priority: 1=primary (best match) through 5=fallback
+        notes: Optional mapping notes
+    """
+
+    caption_type: str
+    priority: int
+    notes: str | None = None
+
+    def to_dict(self) -> dict[str, Any]:
+        """Serialize to the send_type_caption_requirements column layout."""
+        return {
+            "caption_type": self.caption_type,
+            "priority": self.priority,
+            "notes": self.notes,
+        }
+
+
+@dataclass(frozen=True, slots=True)
+class SendTypeSnapshot:
+    """Immutable view of the send type tables at one data version.
+
+    Attributes:
+        version: Digest of the loaded rows; equal versions mean equal data
+        rows: Every send_types row (active or not) by send_type_key, with all
+            table columns
+        configs: Runtime configuration for active send types
+        raw_types: Raw SendType models for active send types
+        by_category: Active send type keys per category, in sort order
+        caption_requirements: Caption requirements per send_type_key,
+            ordered by priority
+    """
+
+    version: str
+    rows: Mapping[str, Mapping[str, Any]] = field(
+        default_factory=lambda: MappingProxyType({})
+    )
+    configs: Mapping[str, SendTypeConfig] = field(
+        default_factory=lambda: MappingProxyType({})
+    )
+    raw_types: Mapping[str, SendType] = field(
+        default_factory=lambda: MappingProxyType({})
+    )
+    by_category: Mapping[str, tuple[str, ...]] = field(
+        default_factory=lambda: MappingProxyType({c: () for c in CATEGORIES})
+    )
+    caption_requirements: Mapping[str, tuple[CaptionRequirement, ...]] = field(
+        default_factory=lambda: MappingProxyType({})
+    )
+
+    def send_type_id(self, key: str) -> int | None:
+        """Database ID for a send type key, or None if the key is unknown."""
+        row = self.rows.get(key)
+        return None if row is None else row["send_type_id"]
+
+    def requirements_for(self, key: str) -> tuple[CaptionRequirement, ...]:
+        """Caption requirements for a send type key (empty if none)."""
+        return self.caption_requirements.get(key, ())
+
+
+def _build_config(send_type: SendType) -> SendTypeConfig:
+    """Build runtime configuration from database send type.
+
+    Args:
+        send_type: Raw send type from database
+
+    Returns:
+        Runtime-optimized configuration
+    """
+    # Build timing preferences
+    timing_preferences = _build_timing_preferences(send_type)
+
+    # Build caption requirements
+    caption_requirements = _build_caption_requirements(send_type)
+
+    return SendTypeConfig(
+        key=send_type.send_type_key,
+        name=send_type.display_name,
+        category=send_type.category,
+        page_type=send_type.page_type_restriction,
+        timing_preferences=timing_preferences,
+        caption_requirements=caption_requirements,
+        max_per_day=send_type.max_per_day,
+        max_per_week=send_type.max_per_week,
+        requires_media=bool(send_type.requires_media),
+        requires_price=bool(send_type.requires_price),
+        can_have_followup=bool(send_type.can_have_followup),
+        followup_delay_minutes=send_type.followup_delay_minutes,
+    )
+
+
+def _build_timing_preferences(send_type: SendType) -> dict[str, Any]:
+    """Build timing preferences from send type data.
+
+    Args:
+        send_type: Raw send type
+
+    Returns:
+        Timing configuration dictionary
+    """
+    # Timing preferences are defined by category with type-specific overrides.
+    # Category defaults provide sensible timing for revenue (evening peaks),
+    # engagement (spread throughout day), and retention (business hours).
+    # Creator-specific optimal times come from get_best_timing() historical analysis.
+    preferences: dict[str, Any] = {
+        "min_spacing": send_type.min_hours_between * 60,  # Convert to minutes
+        "boost": 1.0,
+    }
+
+    # Category-specific defaults
+    if send_type.category == "revenue":
+        preferences["preferred_hours"] = [19, 21]
+        preferences["preferred_days"] = [4, 5, 6]  # Fri, Sat, Sun
+        preferences["avoid_hours"] = [3, 4, 5, 6, 7]
+        preferences["boost"] = 1.2
+    elif send_type.category == "engagement":
+        preferences["preferred_hours"] = [10, 14, 19]
+        preferences["preferred_days"] = [0, 1, 2, 3, 4, 5, 6]  # All days
+        preferences["avoid_hours"] = [3, 4, 5, 6, 7]
+        preferences["boost"] = 1.0
+    elif send_type.category == "retention":
+        preferences["preferred_hours"] = [10, 14, 19]
+        preferences["preferred_days"] = [0, 1, 2, 3, 4, 5, 6]  # All days
+        preferences["avoid_hours"] = [3, 4, 5, 6, 7, 22, 23, 0, 1, 2]
+        preferences["boost"] = 1.0
+
+    # Type-specific overrides
+    if send_type.send_type_key == "ppv_unlock":
+        preferences["preferred_hours"] = [19, 21]
+        preferences["boost"] = 1.3
+    elif send_type.send_type_key == "vip_program":
+        preferences["min_spacing"] = 120
+        preferences["boost"] = 1.2
+    elif send_type.send_type_key == "ppv_followup":
+        preferences["offset_from_parent"] = send_type.followup_delay_minutes
+
+    return preferences
+
+
+def _build_caption_requirements(send_type: SendType) -> list[str]:
+    """Build caption requirements list from send type data.
+
+    Args:
+        send_type: Raw send type
+
+    Returns:
+        List of requirement strings
+    """
+    requirements = []
+
+    if send_type.caption_length:
+        requirements.append(f"length_{send_type.caption_length}")
+
+    if send_type.emoji_recommendation:
+        requirements.append(f"emoji_{send_type.emoji_recommendation}")
+
+    if send_type.requires_media:
+        requirements.append("requires_media")
+
+    if send_type.requires_price:
+        requirements.append("requires_price")
+
+    if send_type.requires_link:
+        requirements.append("requires_link")
+
+    return requirements
+
+
+def load_send_type_snapshot(conn: sqlite3.Connection) -> SendTypeSnapshot:
+    """Build a SendTypeSnapshot from one joined query.
+
+    Works with partial schemas: when send_type_caption_requirements does not
+    exist only send_types is read, and runtime configs are only built when
+    send_types has the category and display_name columns.
+
+    Args:
+        conn: SQLite database connection (any row_factory)
+
+    Returns:
+        Snapshot stamped with a digest of the loaded rows
+
+    Raises:
+        sqlite3.Error: If database query fails
+    """
+    requirement_columns = {
+        row[1]
+        for row in conn.execute("PRAGMA table_info(send_type_caption_requirements)")
+    }
+    if {"send_type_id", "caption_type", "priority"} <= requirement_columns:
+        notes = "stcr.notes" if "notes" in requirement_columns else "NULL"
+        cursor = conn.execute(f"""
+            SELECT
+                st.*,
+                stcr.caption_type AS _requirement_caption_type,
+                stcr.priority AS _requirement_priority,
+                {notes} AS _requirement_notes
+            FROM send_types st
+            LEFT JOIN send_type_caption_requirements stcr
+                ON stcr.send_type_id = st.send_type_id
+            ORDER BY st.send_type_id, stcr.priority, stcr.caption_type
+        """)
+    else:
+        cursor = conn.execute("SELECT st.* FROM send_types st ORDER BY st.send_type_id")
+
+    columns = [description[0] for description in cursor.description]
+    row_width = sum(1 for column in columns if not column.startswith("_requirement_"))
+    records = [tuple(row) for row in cursor.fetchall()]
+
+    rows: dict[str, dict[str, Any]] = {}
+    requirements: dict[str, list[CaptionRequirement]] = {}
+    for record in records:
+        row = dict(zip(columns[:row_width], record[:row_width]))
+        key = row["send_type_key"]
+        if key not in rows:
+            rows[key] = row
+        if len(record) > row_width and record[row_width] is not None:
+            requirements.setdefault(key, []).append(
+                CaptionRequirement(*record[row_width:row_width + 3])
+            )
+
+    configs: dict[str, SendTypeConfig] = {}
+    raw_types: dict[str, SendType] = {}
+    by_category: dict[str, list[str]] = {category: [] for category in CATEGORIES}
+    if {"category", "display_name"} <= set(columns):
+        active = sorted(
+            (row for row in rows.values() if row.get("is_active", 1)),
+            key=lambda row: (row["category"], row.get("sort_order") or 0),
+        )
+        for row in active:
+            send_type = SendType(
+                **{name: row[name] for name in _SEND_TYPE_FIELDS if name in row}
+            )
+            raw_types[send_type.send_type_key] = send_type
+            configs[send_type.send_type_key] = _build_config(send_type)
+            by_category[send_type.category].append(send_type.send_type_key)
+
+    version = hashlib.blake2b(repr(records).encode(), digest_size=8).hexdigest()
+    return SendTypeSnapshot(
+        version=version,
+        rows=MappingProxyType({key: MappingProxyType(row) for key, row in rows.items()}),
+        configs=MappingProxyType(configs),
+        raw_types=MappingProxyType(raw_types),
+        by_category=MappingProxyType({c: tuple(keys) for c, keys in by_category.items()}),
+        caption_requirements=MappingProxyType(
+            {key: tuple(reqs) for key, reqs in requirements.items()}
+        ),
+    )
+
+
+def _read_header(path: str, size: int) -> bytes:
+    """First size bytes of a file, or b'' if it cannot be read."""
+    try:
+        with open(path, "rb") as handle:
+            return handle.read(size)
+    except OSError:
+        return b""
+
+
+def _database_stamp(conn: sqlite3.Connection) -> tuple[Any, ...] | None:
+    """Change stamp for the connection's main database.
+
+    Combines the file change counter in the database header (bumped on every
+    commit in rollback journal mode) with the WAL-index header in the -shm
+    file (bumped on every commit in WAL mode). An unchanged stamp means the
+    send type tables are unchanged too.
+
+    Args:
+        conn: SQLite database connection
+
+    Returns:
+        (path, change counter, WAL-index header), or None for in-memory and
+        temporary databases
+    """
+    path = next(
+        (row[2] for row in conn.execute("PRAGMA database_list") if row[1] == "main"),
+        "",
+    )
+    if not path:
+        return None
+    change_counter = _read_header(path, 28)[24:28]
+    if not change_counter:
+        return None
+    return (path, change_counter, _read_header(f"{path}-shm", 48))
+
 
 class SendTypeRegistry:
     """Singleton registry for send type configuration.
@@ -22,11 +328,18 @@ class SendTypeRegistry:
     runtime lookups. Provides methods to query send types by key, category,
     and other attributes.
 
+    Lookups read the current SendTypeSnapshot; loading swaps in a new
+    snapshot atomically. Callers that hold a connection can use refresh()
+    to pick up table changes without reloading on every call.
+
     Usage:
         registry = SendTypeRegistry()
         registry.load_from_database(conn)
         ppv_config = registry.get("ppv_unlock")
         revenue_types = registry.get_by_category("revenue")
+
+        snapshot = registry.refresh(conn)  # reloads only if the data changed
+        send_type_id = snapshot.send_type_id("ppv_unlock")
     """
 
     _instance: ClassVar["SendTypeRegistry | None"] = None
@@ -41,15 +354,21 @@ class SendTypeRegistry:
     def __init__(self) -> None:
         """Initialize registry storage (only once)."""
         if not self._initialized:
-            self._types: dict[str, SendTypeConfig] = {}
-            self._raw_types: dict[str, SendType] = {}
-            self._by_category: dict[str, list[str]] = {
-                "revenue": [],
-                "engagement": [],
-                "retention": [],
-            }
+            self._snapshot = SendTypeSnapshot(version="")
+            self._stamp: tuple[Any, ...] | None = None
+            self._lock = threading.Lock()
             self._initialized = True
 
+    @property
+    def snapshot(self) -> SendTypeSnapshot:
+        """The current immutable send type snapshot."""
+        return self._snapshot
+
+    @property
+    def version(self) -> str:
+        """Data version of the current snapshot ('' when nothing is loaded)."""
+        return self._snapshot.version
+
     def load_from_database(self, conn: sqlite3.Connection) -> None:
         """Load all send type configuration from database.
 
@@ -60,185 +379,49 @@ class SendTypeRegistry:
             sqlite3.Error: If database query fails
         """
         logger.info("Loading send type registry from database")
+        with self._lock:
+            stamp = _database_stamp(conn)
+            self._swap(load_send_type_snapshot(conn), stamp)
 
-        cursor = conn.cursor()
-        cursor.execute("""
-            SELECT
-                send_type_id,
-                send_type_key,
-                category,
-                display_name,
-                description,
-                purpose,
-                strategy,
-                requires_media,
-                requires_flyer,
-                requires_price,
-                requires_link,
-                has_expiration,
-                default_expiration_hours,
-                can_have_followup,
-                followup_delay_minutes,
-                page_type_restriction,
-                caption_length,
-                emoji_recommendation,
-                max_per_day,
-                max_per_week,
-                min_hours_between,
-                sort_order,
-                is_active
-            FROM send_types
-            WHERE is_active = 1
-            ORDER BY category, sort_order
-        """)
-
-        rows = cursor.fetchall()
-        logger.info(f"Loaded {len(rows)} active send types")
+    def refresh(self, conn: sqlite3.Connection) -> SendTypeSnapshot:
+        """Return a snapshot that is current for the connection's database.
 
-        for row in rows:
-            # Create raw SendType model
-            send_type = SendType(
-                send_type_id=row[0],
-                send_type_key=row[1],
-                category=row[2],
-                display_name=row[3],
-                description=row[4],
-                purpose=row[5],
-                strategy=row[6],
-                requires_media=row[7],
-                requires_flyer=row[8],
-                requires_price=row[9],
-                requires_link=row[10],
-                has_expiration=row[11],
-                default_expiration_hours=row[12],
-                can_have_followup=row[13],
-                followup_delay_minutes=row[14],
-                page_type_restriction=row[15],
-                caption_length=row[16],
-                emoji_recommendation=row[17],
-                max_per_day=row[18],
-                max_per_week=row[19],
-                min_hours_between=row[20],
-                sort_order=row[21],
-                is_active=row[22],
-            )
-
-            # Create runtime config
-            config = self._build_config(send_type)
-
-            # Store both forms
-            self._raw_types[send_type.send_type_key] = send_type
-            self._types[send_type.send_type_key] = config
-            self._by_category[send_type.category].append(send_type.send_type_key)
-
-            logger.debug(
-                f"Registered send type: {send_type.send_type_key} ({send_type.category})"
-            )
-
-    def _build_config(self, send_type: SendType) -> SendTypeConfig:
-        """Build runtime configuration from database send type.
+        Reloads only when the database has committed changes since the last
+        load (always for in-memory databases, which cannot be stamped). A reload
+        that yields the same data version keeps the existing snapshot.
 
         Args:
-            send_type: Raw send type from database
+            conn: SQLite database connection
 
         Returns:
-            Runtime-optimized configuration
-        """
-        # Build timing preferences
-        timing_preferences = self._build_timing_preferences(send_type)
-
-        # Build caption requirements
-        caption_requirements = self._build_caption_requirements(send_type)
-
-        return SendTypeConfig(
-            key=send_type.send_type_key,
-            name=send_type.display_name,
-            category=send_type.category,
-            page_type=send_type.page_type_restriction,
-            timing_preferences=timing_preferences,
-            caption_requirements=caption_requirements,
-            max_per_day=send_type.max_per_day,
-            max_per_week=send_type.max_per_week,
-            requires_media=bool(send_type.requires_media),
-            requires_price=bool(send_type.requires_price),
-            can_have_followup=bool(send_type.can_have_followup),
-            followup_delay_minutes=send_type.followup_delay_minutes,
-        )
-
-    def _build_timing_preferences(self, send_type: SendType) -> dict[str, Any]:
-        """Build timing preferences from send type data.
+            The current snapshot
 
-        Args:
-            send_type: Raw send type
-
-        Returns:
-            Timing configuration dictionary
+        Raises:
+            sqlite3.Error: If database query fails
         """
-        # Timing preferences are defined by category with type-specific overrides.
-        # Category defaults provide sensible timing for revenue (evening peaks),
-        # engagement (spread throughout day), and retention (business hours).
-        # Creator-specific optimal times come from get_best_timing() historical analysis.
-        preferences: dict[str, Any] = {
-            "min_spacing": send_type.min_hours_between * 60,  # Convert to minutes
-            "boost": 1.0,
-        }
+        stamp = _database_stamp(conn)
+        if stamp is not None and stamp == self._stamp:
+            return self._snapshot
 
-        # Category-specific defaults
-        if send_type.category == "revenue":
-            preferences["preferred_hours"] = [19, 21]
-            preferences["preferred_days"] = [4, 5, 6]  # Fri, Sat, Sun
-            preferences["avoid_hours"] = [3, 4, 5, 6, 7]
-            preferences["boost"] = 1.2
-        elif send_type.category == "engagement":
-            preferences["preferred_hours"] = [10, 14, 19]
-            preferences["preferred_days"] = [0, 1, 2, 3, 4, 5, 6]  # All days
-            preferences["avoid_hours"] = [3, 4, 5, 6, 7]
-            preferences["boost"] = 1.0
-        elif send_type.category == "retention":
-            preferences["preferred_hours"] = [10, 14, 19]
-            preferences["preferred_days"] = [0, 1, 2, 3, 4, 5, 6]  # All days
-            preferences["avoid_hours"] = [3, 4, 5, 6, 7, 22, 23, 0, 1, 2]
-            preferences["boost"] = 1.0
-
-        # Type-specific overrides
-        if send_type.send_type_key == "ppv_unlock":
-            preferences["preferred_hours"] = [19, 21]
-            preferences["boost"] = 1.3
-        elif send_type.send_type_key == "vip_program":
-            preferences["min_spacing"] = 120
-            preferences["boost"] = 1.2
-        elif send_type.send_type_key == "ppv_followup":
-            preferences["offset_from_parent"] = send_type.followup_delay_minutes
-
-        return preferences
-
-    def _build_caption_requirements(self, send_type: SendType) -> list[str]:
-        """Build caption requirements list from send type data.
+        with self._lock:
+            if stamp is None or stamp != self._stamp:
+                self._swap(load_send_type_snapshot(conn), stamp)
+            return self._snapshot
 
-        Args:
-            send_type: Raw send type
+    def _swap(self, snapshot: SendTypeSnapshot, stamp: tuple[Any, ...] | None) -> None:
+        """Install a snapshot unless it matches the current data version.
 
-        Returns:
-            List of requirement strings
+        Args:
+            snapshot: Newly loaded snapshot
+            stamp: Database stamp taken before the snapshot was loaded
         """
-        requirements = []
-
-        if send_type.caption_length:
-            requirements.append(f"length_{send_type.caption_length}")
-
-        if send_type.emoji_recommendation:
-            requirements.append(f"emoji_{send_type.emoji_recommendation}")
-
-        if send_type.requires_media:
-            requirements.append("requires_media")
-
-        if send_type.requires_price:
-            requirements.append("requires_price")
-
-        if send_type.requires_link:
-            requirements.append("requires_link")
-
-        return requirements
+        if snapshot.version != self._snapshot.version:
+            self._snapshot = snapshot
+            logger.info(
+                f"Loaded {len(snapshot.configs)} active send types "
+                f"(version {snapshot.version})"
+            )
+        self._stamp = stamp
 
     def get(self, key: str) -> SendTypeConfig:
         """Get send type configuration by key.
@@ -252,9 +435,10 @@ class SendTypeRegistry:
         Raises:
             KeyError: If send type not found
         """
-        if key not in self._types:
+        configs = self._snapshot.configs
+        if key not in configs:
             raise KeyError(f"Send type not found: {key}")
-        return self._types[key]
+        return configs[key]
 
     def get_raw(self, key: str) -> SendType:
         """Get raw send type model by key.
@@ -268,9 +452,10 @@ class SendTypeRegistry:
         Raises:
             KeyError: If send type not found
         """
-        if key not in self._raw_types:
+        raw_types = self._snapshot.raw_types
+        if key not in raw_types:
             raise KeyError(f"Send type not found: {key}")
-        return self._raw_types[key]
+        return raw_types[key]
 
     def get_by_category(self, category: str) -> list[SendTypeConfig]:
         """Get all send types in a category.
@@ -284,10 +469,11 @@ class SendTypeRegistry:
         Raises:
             ValueError: If invalid category
         """
-        if category not in self._by_category:
+        snapshot = self._snapshot
+        if category not in snapshot.by_category:
             raise ValueError(f"Invalid category: {category}")
 
-        return [self._types[key] for key in self._by_category[category]]
+        return [snapshot.configs[key] for key in snapshot.by_category[category]]
 
     def get_keys_by_category(self, category: str) -> list[str]:
         """Get send type keys for a category.
@@ -301,10 +487,11 @@ class SendTypeRegistry:
         Raises:
             ValueError: If invalid category
         """
-        if category not in self._by_category:
+        by_category = self._snapshot.by_category
+        if category not in by_category:
             raise ValueError(f"Invalid category: {category}")
 
-        return self._by_category[category].copy()
+        return list(by_category[category])
 
     def get_timing_preferences(self, key: str) -> dict[str, Any]:
         """Get timing preferences for a send type.
@@ -327,7 +514,7 @@ class SendTypeRegistry:
         Returns:
             List of all send type keys
         """
-        return list(self._types.keys())
+        return list(self._snapshot.configs.keys())
 
     def is_valid_key(self, key: str) -> bool:
         """Check if send type key is valid.
@@ -338,7 +525,7 @@ class SendTypeRegistry:
         Returns:
             True if key exists in registry
         """
-        return key in self._types
+        return key in self._snapshot.configs
 
     def get_page_type_compatible(self, page_type: str) -> list[SendTypeConfig]:
         """Get send types compatible with a page type.
@@ -350,27 +537,26 @@ class SendTypeRegistry:
             List of compatible send type configurations
         """
         compatible = []
-        for config in self._types.values():
+        for config in self._snapshot.configs.values():
             if config.page_type == "both" or config.page_type == page_type:
                 compatible.append(config)
         return compatible
 
     def clear(self) -> None:
         """Clear all cached data (for testing)."""
-        self._types.clear()
-        self._raw_types.clear()
-        for category in self._by_category:
-            self._by_category[category].clear()
+        with self._lock:
+            self._snapshot = SendTypeSnapshot(version="")
+            self._stamp = None
         logger.info("Send type registry cleared")
 
     def __len__(self) -> int:
         """Get number of registered send types."""
-        return len(self._types)
+        return len(self._snapshot.configs)
 
     def __contains__(self, key: str) -> bool:
         """Check if send type key exists."""
-        return key in self._types
+        return key in self._snapshot.configs
 
     def __repr__(self) -> str:
         """String representation."""
-        return f"SendTypeRegistry({len(self._types)} types loaded)"
+        return f"SendTypeRegistry({len(self._snapshot.configs)} types loaded)"
@@ -30,6 +30,19 @@ from python.models.schedule import ScheduleItem as ModelScheduleItem
 from python.registry.send_type_registry import SendTypeRegistry
 
 
+# =============================================================================
+# Environment Fixtures
+# =============================================================================
+
+
+@pytest.fixture(autouse=True)
+def algorithm_config_cache_dir(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    """Keep compiled algorithm configs out of the user's cache directory."""
+    cache_dir = tmp_path / "algorithm_config_cache"
+    monkeypatch.setenv("EROS_ALGORITHM_CONFIG_CACHE_DIR", str(cache_dir))
+    return cache_dir
+
+
 # =============================================================================
 # Creator Fixtures
 # =============================================================================
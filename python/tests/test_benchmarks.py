@@ -9,6 +9,7 @@ Performance Targets:
     - send_type_allocator.allocate(): < 50ms
     - dynamic_calculator.calculate(): < 200ms
     - timing_optimizer.optimize_times(): < 100ms
+    - cold `import python` (fresh interpreter): < 250ms
 
 These benchmarks establish performance baselines and detect regressions.
 The targets are based on acceptable latency for real-time schedule generation.
@@ -17,6 +18,7 @@ Note: When running with --benchmark-disable, performance assertions are skipped
 since benchmark.stats is None in that mode.
 """
 
+import subprocess
 import sys
 from datetime import datetime, timedelta
 from pathlib import Path
@@ -933,3 +935,54 @@ class TestRegressionBenchmarks:
         assert result.minute not in {0, 15, 30, 45}
         # Should be sub-millisecond
         assert_benchmark_under(benchmark, 0.001)
+
+
+# =============================================================================
+# Import Time Benchmarks
+# =============================================================================
+
+
+def _cold_import(module: str) -> None:
+    """Import a module in a fresh interpreter (no warm sys.modules)."""
+    subprocess.run(
+        [sys.executable, "-c", f"import {module}"],
+        cwd=project_root,
+        check=True,
+    )
+
+
+class TestImportTimeBenchmarks:
+    """Benchmark cold-start import of the package entry points.
+
+    Measures a whole interpreter start, so the targets include Python
+    startup itself (~20-40ms). Package exports are lazy (PEP 562), so these
+    imports must not pull in every subpackage, yaml, numpy or scipy.
+    """
+
+    @pytest.mark.benchmark(
+        group="import",
+        min_rounds=5,
+    )
+    def test_import_python_package(self, benchmark):
+        """Benchmark `import python` in a fresh interpreter.
+
+        Performance Target: < 250ms
+        """
+        benchmark.pedantic(_cold_import, args=("python",), rounds=5, iterations=1)
+
+        assert_benchmark_under(benchmark, 0.25)
+
+    @pytest.mark.benchmark(
+        group="import",
+        min_rounds=5,
+    )
+    def test_import_volume_and_analytics(self, benchmark):
+        """Benchmark importing python.volume and python.analytics together.
+
+        Performance Target: < 250ms
+        """
+        benchmark.pedantic(
+            _cold_import, args=("python.volume, python.analytics",), rounds=5, iterations=1
+        )
+
+        assert_benchmark_under(benchmark, 0.25)
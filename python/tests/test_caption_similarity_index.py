@@ -0,0 +1,372 @@
+"""
+Tests for the caption near-duplicate index (database/scripts/caption_similarity_index.py).
+
+Tests cover:
+- minhash_signature NumPy and pure-Python paths agree
+- LSHIndex add/query/remove
+- collapse_near_duplicates keep-best ordering and candidates restriction
+- SignatureStore signs each distinct caption once
+- CaptionSimilarityIndex build/update/reindex/query, keyed per source table
+- Opt-in near-duplicate collapsing and incremental index probing in
+  rebuild_caption_bank
+"""
+
+import importlib
+import sqlite3
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add database/scripts to path for imports
+scripts_dir = Path(__file__).parent.parent.parent / "database" / "scripts"
+sys.path.insert(0, str(scripts_dir))
+
+import caption_similarity_index as csi
+from caption_similarity_index import (
+    CaptionSimilarityIndex,
+    LSHIndex,
+    SignatureStore,
+    collapse_near_duplicates,
+    estimate_similarity,
+    minhash_signature,
+)
+
+
+BASE = (
+    "Hey babe, I just filmed something really special for you tonight and "
+    "I cannot wait for you to unlock it and see every single second"
+)
+NEAR = BASE + " xo"
+OTHER = (
+    "Good morning love, the weekend bundle is finally here with three brand "
+    "new sets and a surprise video only my favourite fans get to see"
+)
+OTHER_NEAR = OTHER + " now"
+
+
+@pytest.fixture
+def conn():
+    connection = sqlite3.connect(":memory:")
+    connection.execute("CREATE TABLE caption_bank (caption_id INTEGER PRIMARY KEY, caption_text TEXT)")
+    connection.executemany(
+        "INSERT INTO caption_bank (caption_id, caption_text) VALUES (?, ?)",
+        [(1, BASE), (2, OTHER), (3, None)]
+    )
+    yield connection
+    connection.close()
+
+
+class TestMinhashSignature:
+    """Signature computation."""
+
+    @pytest.mark.parametrize("text", ["", "abc", BASE, OTHER, "  Hey   BABE\n"])
+    def test_numpy_and_python_paths_agree(self, text, monkeypatch):
+        pytest.importorskip("numpy")
+        with_numpy = minhash_signature(text)
+        monkeypatch.setattr(csi, "NUMPY_AVAILABLE", False)
+        assert minhash_signature(text) == with_numpy
+        assert len(with_numpy) == csi.NUM_PERM
+
+    def test_normalization_ignores_case_and_whitespace(self):
+        assert minhash_signature("Hey  Babe\tnew video") == minhash_signature("hey babe new video ")
+
+    def test_near_duplicates_score_high(self):
+        assert estimate_similarity(minhash_signature(BASE), minhash_signature(NEAR)) >= 0.85
+        assert estimate_similarity(minhash_signature(BASE), minhash_signature(OTHER)) < 0.5
+
+
+class TestLSHIndex:
+    """In-memory banded index."""
+
+    def test_query_add_remove(self):
+        index = LSHIndex()
+        index.add("base", minhash_signature(BASE))
+        index.add("other", minhash_signature(OTHER))
+        assert len(index) == 2
+
+        matches = index.query(minhash_signature(NEAR), 0.85)
+        assert [key for key, _ in matches] == ["base"]
+
+        index.remove("base")
+        assert index.query(minhash_signature(NEAR), 0.85) == []
+        assert len(index) == 1
+
+    def test_add_replaces_signature(self):
+        index = LSHIndex()
+        index.add("key", minhash_signature(BASE))
+        index.add("key", minhash_signature(OTHER))
+        assert len(index) == 1
+        assert index.query(minhash_signature(BASE), 0.85) == []
+
+
+class TestCollapseNearDuplicates:
+    """Greedy keep-best collapsing."""
+
+    def test_keeps_first_in_priority_order(self):
+        items = [("near", minhash_signature(NEAR)), ("base", minhash_signature(BASE)),
+                 ("other", minhash_signature(OTHER))]
+        assert collapse_near_duplicates(items, 0.85) == {"base": "near"}
+
+    def test_candidates_restrict_what_may_be_collapsed(self):
+        items = [("base", minhash_signature(BASE)), ("near", minhash_signature(NEAR)),
+                 ("other", minhash_signature(OTHER)), ("other_near", minhash_signature(OTHER_NEAR))]
+        assert collapse_near_duplicates(items, 0.85, candidates={"near"}) == {"near": "base"}
+        assert collapse_near_duplicates(items, 0.85, candidates={"base"}) == {}
+
+
+class TestSignatureStore:
+    """Persisted signatures."""
+
+    def test_signs_each_caption_once(self, conn, monkeypatch):
+        calls = []
+
+        def counting(text):
+            calls.append(text)
+            return minhash_signature(text)
+
+        monkeypatch.setattr(csi, "minhash_signature", counting)
+        store = SignatureStore(conn)
+        texts = {csi.text_key(BASE): BASE, csi.text_key(OTHER): OTHER}
+
+        first = store.get_many(texts)
+        second = store.get_many(texts)
+
+        assert first == second
+        assert first[csi.text_key(BASE)] == minhash_signature(BASE)
+        assert len(calls) == 2
+
+
+class TestCaptionSimilarityIndex:
+    """Persisted LSH index."""
+
+    def test_build_and_query(self, conn):
+        index = CaptionSimilarityIndex(conn)
+        assert index.build() == 2
+        assert len(index) == 2
+
+        matches = index.query(NEAR, 0.85)
+        assert [caption_id for caption_id, _ in matches] == [1]
+        assert index.similar_to(1) == []
+        assert index.query(BASE, 0.85, exclude_id=1) == []
+
+    def test_update_tracks_source_changes(self, conn):
+        index = CaptionSimilarityIndex(conn)
+        index.build()
+        conn.execute("UPDATE caption_bank SET caption_text = ? WHERE caption_id = 2", (OTHER_NEAR,))
+        conn.execute("DELETE FROM caption_bank WHERE caption_id = 1")
+        conn.execute("INSERT INTO caption_bank (caption_id, caption_text) VALUES (4, ?)", (NEAR,))
+
+        assert index.update() == {"added": 1, "updated": 1, "removed": 1}
+        assert [caption_id for caption_id, _ in index.query(BASE, 0.85)] == [4]
+        assert index.update() == {"added": 0, "updated": 0, "removed": 0}
+
+    def test_reindex_specific_rows(self, conn):
+        index = CaptionSimilarityIndex(conn)
+        index.build()
+        conn.execute("INSERT INTO caption_bank (caption_id, caption_text) VALUES (4, ?)", (OTHER_NEAR,))
+        conn.execute("DELETE FROM caption_bank WHERE caption_id = 1")
+
+        assert index.reindex([1, 4]) == 1
+        assert len(index) == 2
+        assert sorted(caption_id for caption_id, _ in index.query(OTHER, 0.85)) == [2, 4]
+        assert index.query(NEAR, 0.85) == []
+
+    def test_bucket_members(self, conn):
+        index = CaptionSimilarityIndex(conn)
+        index.build()
+        members = index.bucket_members([minhash_signature(NEAR), minhash_signature(OTHER_NEAR)])
+        assert members == {1: csi.text_key(BASE), 2: csi.text_key(OTHER)}
+        assert index.bucket_members([]) == {}
+
+    def test_tables_are_indexed_independently(self, conn):
+        conn.execute("CREATE TABLE drafts (draft_id INTEGER PRIMARY KEY, body TEXT)")
+        conn.execute("INSERT INTO drafts VALUES (10, ?)", (OTHER_NEAR,))
+        bank = CaptionSimilarityIndex(conn)
+        drafts = CaptionSimilarityIndex(conn, "drafts", "draft_id", "body")
+        bank.build()
+        drafts.build()
+
+        assert len(bank) == 2
+        assert len(drafts) == 1
+        assert [caption_id for caption_id, _ in drafts.query(OTHER, 0.85)] == [10]
+        assert [caption_id for caption_id, _ in bank.query(OTHER, 0.85)] == [2]
+
+    def test_unkeyed_tables_are_replaced(self, conn):
+        conn.execute("CREATE TABLE caption_lsh_members (caption_id PRIMARY KEY, caption_hash TEXT, params TEXT)")
+        conn.execute("CREATE TABLE caption_lsh_buckets (band, bucket, caption_id)")
+        index = CaptionSimilarityIndex(conn)
+        assert index.build() == 2
+
+    def test_creating_tables_keeps_open_transaction(self, conn):
+        conn.commit()
+        conn.execute("UPDATE caption_bank SET caption_text = 'changed' WHERE caption_id = 1")
+        CaptionSimilarityIndex(conn)
+        assert conn.in_transaction
+        conn.rollback()
+        assert conn.execute("SELECT caption_text FROM caption_bank WHERE caption_id = 1").fetchone()[0] == BASE
+
+    def test_invalid_identifier_rejected(self, conn):
+        with pytest.raises(ValueError):
+            CaptionSimilarityIndex(conn, source_table="caption_bank; DROP TABLE x")
+
+
+# =============================================================================
+# rebuild_caption_bank / extract_qualifying_captions integration
+# =============================================================================
+
+
+def _insert_messages(connection, start_id, texts):
+    connection.executemany(
+        """
+        INSERT INTO mass_messages (
+            message_id, message_type, price, sent_count, earnings, view_rate,
+            purchase_rate, content_type_id, message_content, sending_time
+        ) VALUES (?, 'ppv', 15, 1000, ?, 0.5, 0.1, NULL, ?, '2025-12-01')
+        """,
+        [(start_id + i, earnings, text) for i, (text, earnings) in enumerate(texts)]
+    )
+    connection.commit()
+
+
+@pytest.fixture
+def rebuild_module(tmp_path, monkeypatch):
+    # The module opens a log file in the working directory on import
+    monkeypatch.chdir(tmp_path)
+    module = importlib.import_module("rebuild_caption_bank")
+    yield module
+
+
+@pytest.fixture
+def mass_messages_db(tmp_path):
+    db_path = tmp_path / "bank.db"
+    connection = sqlite3.connect(db_path)
+    connection.execute(
+        """
+        CREATE TABLE mass_messages (
+            message_id INTEGER PRIMARY KEY, message_type TEXT, price REAL,
+            sent_count INTEGER, earnings REAL, view_rate REAL, purchase_rate REAL,
+            content_type_id INTEGER, message_content TEXT, sending_time TEXT
+        )
+        """
+    )
+    _insert_messages(connection, 1, [(BASE, 400.0), (OTHER, 300.0)])
+    connection.close()
+    return db_path
+
+
+def _bank_texts(db_path):
+    connection = sqlite3.connect(db_path)
+    try:
+        return {row[0] for row in connection.execute("SELECT caption_text FROM caption_bank_v2")}
+    finally:
+        connection.close()
+
+
+class TestRebuildNearDuplicates:
+    """Near-duplicate collapsing in the caption bank rebuild."""
+
+    def test_off_by_default(self, rebuild_module, mass_messages_db):
+        rebuilder = rebuild_module.CaptionBankRebuilder(mass_messages_db)
+        assert rebuilder.near_duplicate_threshold is None
+
+    def test_incremental_probes_persisted_index(self, rebuild_module, mass_messages_db, monkeypatch):
+        rebuilder = rebuild_module.CaptionBankRebuilder(mass_messages_db, near_duplicate_threshold=0.85)
+        assert rebuilder.run(skip_classification=True)
+
+        connection = sqlite3.connect(mass_messages_db)
+        _insert_messages(connection, 3, [(NEAR, 150.0), (OTHER_NEAR, 500.0)])
+        connection.close()
+
+        loaded = []
+        original = csi.collapse_near_duplicates
+
+        def recording(items, threshold, candidates=None):
+            items = list(items)
+            loaded.append(len(items))
+            return original(items, threshold, candidates)
+
+        monkeypatch.setattr(csi, "collapse_near_duplicates", recording)
+        rebuilder = rebuild_module.CaptionBankRebuilder(mass_messages_db, near_duplicate_threshold=0.85)
+        assert rebuilder.run_incremental()
+
+        # NEAR earns less than the bank's BASE and is dropped; OTHER_NEAR
+        # outranks OTHER, but bank captions are never collapsed, so both stay
+        assert rebuilder.stats['near_duplicates_removed'] == 1
+        assert _bank_texts(mass_messages_db) == {BASE, OTHER, OTHER_NEAR}
+        # The new captions plus their two bucket neighbours, not all staging rows
+        assert loaded == [4]
+
+        connection = sqlite3.connect(mass_messages_db)
+        index = CaptionSimilarityIndex(connection, source_table="caption_bank_v2")
+        assert len(index) == 3
+        connection.close()
+
+    def test_incremental_scope_excludes_unrelated_captions(self, rebuild_module, mass_messages_db, monkeypatch):
+        rebuilder = rebuild_module.CaptionBankRebuilder(mass_messages_db, near_duplicate_threshold=0.85)
+        assert rebuilder.run(skip_classification=True)
+
+        connection = sqlite3.connect(mass_messages_db)
+        _insert_messages(connection, 3, [(NEAR, 150.0)])
+        connection.close()
+
+        loaded = []
+        original = csi.collapse_near_duplicates
+
+        def recording(items, threshold, candidates=None):
+            items = list(items)
+            loaded.append(len(items))
+            return original(items, threshold, candidates)
+
+        monkeypatch.setattr(csi, "collapse_near_duplicates", recording)
+        rebuilder = rebuild_module.CaptionBankRebuilder(mass_messages_db, near_duplicate_threshold=0.85)
+        assert rebuilder.run_incremental()
+
+        assert rebuilder.stats['near_duplicates_removed'] == 1
+        # NEAR and BASE only; OTHER shares no bucket with NEAR
+        assert loaded == [2]
+
+
+class TestIncrementalRefresh:
+    """Incremental caption bank refresh."""
+
+    def test_refresh_does_not_index_mass_messages(self, rebuild_module, mass_messages_db):
+        assert rebuild_module.CaptionBankRebuilder(mass_messages_db).run(skip_classification=True)
+        connection = sqlite3.connect(mass_messages_db)
+        _insert_messages(connection, 3, [(NEAR, 150.0)])
+        connection.close()
+
+        rebuilder = rebuild_module.CaptionBankRebuilder(mass_messages_db)
+        assert rebuilder.run_incremental()
+
+        connection = sqlite3.connect(mass_messages_db)
+        indexes = {
+            row[0] for row in connection.execute(
+                "SELECT name FROM sqlite_master WHERE type = 'index' AND tbl_name = 'mass_messages'"
+            )
+        }
+        connection.close()
+        assert "idx_mass_messages_content" not in indexes
+        assert NEAR in _bank_texts(mass_messages_db)
+
+
+class TestExtractNearDuplicates:
+    """Near-duplicate collapsing in the staging extractor."""
+
+    def test_opt_in(self, tmp_path, monkeypatch):
+        monkeypatch.chdir(tmp_path)
+        extractor_module = importlib.import_module("extract_qualifying_captions")
+        monkeypatch.setattr(extractor_module, "LOG_DIR", tmp_path)
+        captions = [
+            {"caption_hash": csi.text_key(text), "message_content": text}
+            for text in (BASE, NEAR, OTHER)
+        ]
+
+        extractor = extractor_module.CaptionExtractor(str(tmp_path / "x.db"))
+        extractor.mark_duplicates(captions)
+        assert [caption["is_duplicate"] for caption in captions] == [0, 0, 0]
+
+        extractor = extractor_module.CaptionExtractor(str(tmp_path / "x.db"), near_duplicate_threshold=0.85)
+        extractor.mark_duplicates(captions)
+        assert [caption["is_duplicate"] for caption in captions] == [0, 1, 0]
+        assert extractor.stats["near_duplicates_found"] == 1
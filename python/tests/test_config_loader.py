@@ -9,10 +9,14 @@ Tests cover:
 - Singleton pattern and reload functionality
 - Smooth interpolation configuration
 - New creator configuration
+- Compiled config cache and hot reload
 """
 
+import copy
+import os
 import sys
 import tempfile
+import time
 from pathlib import Path
 from typing import Any, Dict
 
@@ -35,8 +39,11 @@ from python.volume.config_loader import (
     TierBounds,
     TrendConfig,
     clear_config,
+    default_cache_dir,
     get_config,
+    refresh_config,
     reload_config,
+    watch_config,
 )
 
 
@@ -141,6 +148,22 @@ def reset_config():
     clear_config()
 
 
+@pytest.fixture(autouse=True)
+def compiled_cache_dir(tmp_path, monkeypatch) -> Path:
+    """Keep compiled configs written by tests in a per-test directory."""
+    cache_dir = tmp_path / "compiled"
+    monkeypatch.setenv("EROS_ALGORITHM_CONFIG_CACHE_DIR", str(cache_dir))
+    return cache_dir
+
+
+def _rewrite_config(path: str, config_dict: Dict[str, Any]) -> None:
+    """Rewrite a config file and move its mtime forward."""
+    with open(path, "w") as f:
+        yaml.dump(config_dict, f)
+    stat = os.stat(path)
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+
 # =============================================================================
 # Test Classes
 # =============================================================================
@@ -544,6 +567,162 @@ class TestSmoothInterpolationManual:
         )
         assert config.interpolate_saturation(50) == 1.0
 
+    def test_interpolate_at_interior_breakpoint(self) -> None:
+        """Scores on an interior breakpoint use that breakpoint's multiplier."""
+        breakpoints = (
+            InterpolationBreakpoint(0, 1.0),
+            InterpolationBreakpoint(50, 0.9),
+            InterpolationBreakpoint(100, 0.7),
+        )
+        config = SmoothInterpolationConfig(
+            enabled=True,
+            saturation_breakpoints=breakpoints,
+            opportunity_breakpoints=breakpoints,
+        )
+        assert config.interpolate_saturation(50) == pytest.approx(0.9)
+        assert config.interpolate_opportunity(75) == pytest.approx(0.8)
+
+    def test_unsorted_breakpoints_raise(self) -> None:
+        """Breakpoints must be sorted by score."""
+        with pytest.raises(ConfigurationError, match="sorted"):
+            SmoothInterpolationConfig(
+                enabled=True,
+                saturation_breakpoints=(
+                    InterpolationBreakpoint(70, 0.7),
+                    InterpolationBreakpoint(30, 1.0),
+                ),
+                opportunity_breakpoints=(),
+            )
+
+
+class TestCompiledConfigCache:
+    """Tests for the compiled (pre-parsed) config cache."""
+
+    def test_second_load_skips_yaml(
+        self, temp_config_file: str, compiled_cache_dir: Path, monkeypatch
+    ) -> None:
+        """A matching compiled config is used without parsing YAML."""
+        first = AlgorithmConfig(temp_config_file)
+        assert len(list(compiled_cache_dir.iterdir())) == 1
+
+        def fail(self, data):
+            raise AssertionError("YAML should not be parsed")
+
+        monkeypatch.setattr(AlgorithmConfig, "_parse_yaml", fail)
+        second = AlgorithmConfig(temp_config_file)
+        assert second.tier_configs == first.tier_configs
+        assert second.smooth_interpolation == first.smooth_interpolation
+
+    def test_changed_yaml_invalidates_cache(
+        self, temp_config_file: str, valid_config_dict: Dict[str, Any]
+    ) -> None:
+        """Editing the YAML content is picked up despite the compiled copy."""
+        AlgorithmConfig(temp_config_file)
+        valid_config_dict["volume"]["bounds"]["revenue"]["max"] = 9
+        _rewrite_config(temp_config_file, valid_config_dict)
+
+        assert AlgorithmConfig(temp_config_file).bounds["revenue"].max_value == 9
+
+    def test_corrupt_cache_falls_back_to_yaml(
+        self, temp_config_file: str, compiled_cache_dir: Path
+    ) -> None:
+        """An unreadable compiled config is ignored and rewritten."""
+        AlgorithmConfig(temp_config_file)
+        (cache_file,) = compiled_cache_dir.iterdir()
+        cache_file.write_bytes(b"not marshal data")
+
+        assert AlgorithmConfig(temp_config_file).bounds["revenue"].max_value == 8
+        assert cache_file.read_bytes() != b"not marshal data"
+
+    def test_cache_can_be_disabled(
+        self, temp_config_file: str, compiled_cache_dir: Path, monkeypatch
+    ) -> None:
+        """An empty cache directory setting disables compiled configs."""
+        monkeypatch.setenv("EROS_ALGORITHM_CONFIG_CACHE_DIR", "")
+        AlgorithmConfig(temp_config_file)
+        assert not compiled_cache_dir.exists()
+
+    def test_cache_is_opt_in(
+        self, temp_config_file: str, tmp_path: Path, monkeypatch
+    ) -> None:
+        """Without a cache directory setting nothing is written."""
+        monkeypatch.delenv("EROS_ALGORITHM_CONFIG_CACHE_DIR")
+        monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "xdg"))
+        AlgorithmConfig(temp_config_file)
+        assert not (tmp_path / "xdg").exists()
+        assert default_cache_dir() == tmp_path / "xdg" / "eros-schedule-generator"
+
+
+class TestHotReload:
+    """Tests for refresh_config and watch_config."""
+
+    def test_refresh_unchanged_keeps_instance(self, temp_config_file: str) -> None:
+        """Refreshing an unchanged file returns the same instance."""
+        config = reload_config(temp_config_file)
+        assert refresh_config() is config
+
+    def test_refresh_swaps_changed_config(
+        self, temp_config_file: str, valid_config_dict: Dict[str, Any]
+    ) -> None:
+        """A changed file is reloaded into a new global instance."""
+        config = reload_config(temp_config_file)
+        valid_config_dict["performance"]["saturation"]["high"] = 75
+        _rewrite_config(temp_config_file, valid_config_dict)
+
+        refreshed = refresh_config()
+        assert refreshed is not config
+        assert get_config() is refreshed
+        assert refreshed.saturation_thresholds.high == 75
+
+    def test_refresh_keeps_config_on_invalid_file(self, temp_config_file: str) -> None:
+        """An invalid edit leaves the current config in place."""
+        config = reload_config(temp_config_file)
+        with open(temp_config_file, "w") as f:
+            f.write("invalid: yaml: content: [")
+
+        assert refresh_config() is config
+        assert refresh_config() is config
+
+    def test_refresh_keeps_config_on_wrong_section_type(
+        self, temp_config_file: str, valid_config_dict: Dict[str, Any]
+    ) -> None:
+        """A section that is not a mapping fails the reload, not the caller."""
+        config = reload_config(temp_config_file)
+        valid_config_dict["volume"] = "oops"
+        _rewrite_config(temp_config_file, valid_config_dict)
+
+        assert refresh_config() is config
+        assert refresh_config() is config
+
+    def test_watcher_survives_failed_reload(
+        self, temp_config_file: str, valid_config_dict: Dict[str, Any]
+    ) -> None:
+        """The watcher keeps polling after a bad edit and picks up the fix."""
+        config = reload_config(temp_config_file)
+        good_config = copy.deepcopy(valid_config_dict)
+        valid_config_dict["performance"] = "oops"
+        _rewrite_config(temp_config_file, valid_config_dict)
+
+        stop = watch_config(interval_seconds=0.01)
+        try:
+            time.sleep(0.05)
+            assert get_config() is config
+
+            good_config["performance"]["saturation"]["high"] = 75
+            _rewrite_config(temp_config_file, good_config)
+            deadline = time.monotonic() + 5
+            while get_config() is config and time.monotonic() < deadline:
+                time.sleep(0.01)
+        finally:
+            stop.set()
+
+        assert get_config().saturation_thresholds.high == 75
+
+    def test_watch_config_rejects_bad_interval(self) -> None:
+        """The watcher needs a positive poll interval."""
+        with pytest.raises(ValueError):
+            watch_config(interval_seconds=0)
+
 
 class TestDataclassImmutability:
     """Tests for dataclass immutability (frozen=True)."""
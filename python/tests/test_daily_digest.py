@@ -10,10 +10,12 @@ Tests cover:
 - _calculate_length_ratio() with optimal range (250-449)
 - _generate_recommendations() priority assignment
 - _prioritize_actions() returns ordered actionable items
+- Single-pass summaries from iterators and streamed mass_messages rows
 """
 
 from __future__ import annotations
 
+import sqlite3
 import sys
 from datetime import datetime, timedelta
 from pathlib import Path
@@ -37,6 +39,7 @@ from python.analytics.daily_digest import (
     TOP_N_HOURS,
     TOP_N_RESULTS,
     DailyStatisticsAnalyzer,
+    iter_mass_message_records,
 )
 
 
@@ -1433,3 +1436,112 @@ class TestEdgeCases:
 
         assert result["total_earnings"] == 1000.0
         assert result["avg_earnings"] == 500.0
+
+
+class TestSinglePassDigest:
+    """Tests for single-pass summaries and streaming input."""
+
+    def test_digest_accepts_one_shot_iterator(
+        self,
+        analyzer: DailyStatisticsAnalyzer,
+        multi_timeframe_data: list[dict[str, Any]],
+    ) -> None:
+        """A generator is consumed once and gives the same digest as a list."""
+        from_list = analyzer.generate_daily_digest(multi_timeframe_data)
+        from_iter = analyzer.generate_daily_digest(r for r in multi_timeframe_data)
+
+        assert from_iter["timeframe_summaries"] == from_list["timeframe_summaries"]
+        assert from_iter["top_performers"] == from_list["top_performers"]
+        assert from_iter["patterns"]["frequency_gaps"] == from_list["patterns"]["frequency_gaps"]
+
+    def test_top_10_ties_keep_input_order(
+        self,
+        analyzer: DailyStatisticsAnalyzer,
+    ) -> None:
+        """Equal earnings rank in input order, as a stable sort would."""
+        today = datetime.now().strftime("%Y-%m-%d")
+        data = [{"date": today, "earnings": 100.0, "id": i} for i in range(15)]
+
+        result = analyzer._analyze_timeframe(data, 30)
+
+        assert [r["id"] for r in result["top_10"]] == list(range(TOP_N_RESULTS))
+
+    def test_invalid_iso_date_returns_none(
+        self,
+        analyzer: DailyStatisticsAnalyzer,
+    ) -> None:
+        """ISO-shaped strings with impossible values are rejected."""
+        assert analyzer._parse_date("2025-02-30") is None
+        assert analyzer._parse_date("2025-01-15 14:30:00") == datetime(2025, 1, 15, 14, 30)
+
+    def test_digest_from_mass_messages(
+        self,
+        analyzer: DailyStatisticsAnalyzer,
+    ) -> None:
+        """mass_messages rows stream into the same digest as equivalent dicts."""
+        conn = sqlite3.connect(":memory:")
+        conn.executescript("""
+            CREATE TABLE content_types (content_type_id INTEGER PRIMARY KEY, type_name TEXT);
+            CREATE TABLE mass_messages (
+                message_id INTEGER PRIMARY KEY,
+                creator_id TEXT,
+                sending_time TEXT,
+                sending_hour INTEGER,
+                message_content TEXT,
+                content_type_id INTEGER,
+                earnings REAL
+            );
+            INSERT INTO content_types VALUES (1, 'lingerie'), (2, 'bts');
+        """)
+        now = datetime.now()
+        rows = [
+            (
+                i,
+                "alexia" if i % 4 else "other",
+                (now - timedelta(days=i * 7)).strftime("%Y-%m-%d %H:%M:%S"),
+                i % 24,
+                "x" * (100 + i * 10),
+                1 + i % 2,
+                float(1000 + (i * 37) % 500),
+            )
+            for i in range(1, 60)
+        ]
+        conn.executemany("INSERT INTO mass_messages VALUES (?, ?, ?, ?, ?, ?, ?)", rows)
+
+        records = list(iter_mass_message_records(conn, "alexia", batch_size=7))
+        assert len(records) == sum(1 for row in rows if row[1] == "alexia")
+        assert set(records[0]) == {"date", "earnings", "content_type", "caption_length", "hour"}
+
+        digest = analyzer.generate_daily_digest_from_db(conn)
+        expected = analyzer.generate_daily_digest(records)
+        assert digest["timeframe_summaries"] == expected["timeframe_summaries"]
+        assert digest["top_performers"] == expected["top_performers"]
+
+        recent = list(iter_mass_message_records(conn, "alexia", lookback_days=TIMEFRAME_SHORT))
+        assert len(recent) == digest["timeframe_summaries"][TIMEFRAME_SHORT]["record_count"]
+        conn.close()
+
+    def test_undated_mass_messages_kept_without_lookback(self) -> None:
+        """Rows with no sending_time are only dropped when a lookback applies."""
+        conn = sqlite3.connect(":memory:")
+        conn.executescript("""
+            CREATE TABLE content_types (content_type_id INTEGER PRIMARY KEY, type_name TEXT);
+            CREATE TABLE mass_messages (
+                message_id INTEGER PRIMARY KEY,
+                creator_id TEXT,
+                sending_time TEXT,
+                sending_hour INTEGER,
+                message_content TEXT,
+                content_type_id INTEGER,
+                earnings REAL
+            );
+            INSERT INTO mass_messages VALUES (1, 'alexia', NULL, NULL, 'hi', NULL, 50.0);
+        """)
+        conn.execute(
+            "INSERT INTO mass_messages VALUES (2, 'alexia', ?, 9, 'hey', NULL, 75.0)",
+            (datetime.now().strftime("%Y-%m-%d %H:%M:%S"),),
+        )
+
+        assert len(list(iter_mass_message_records(conn, "alexia"))) == 2
+        assert len(list(iter_mass_message_records(conn, "alexia", lookback_days=30))) == 1
+        conn.close()
@@ -6,12 +6,14 @@ Tests cover:
 - calculate_optimized_volume pipeline
 - Error handling and edge cases
 - Database integration scenarios
+- Memoized volume calculation and invalidation on config reload
 """
 
 import os
 import sqlite3
 import sys
 import tempfile
+from concurrent.futures import ThreadPoolExecutor
 from datetime import date, timedelta
 from pathlib import Path
 from unittest.mock import MagicMock, patch, Mock
@@ -32,7 +34,10 @@ from python.volume.dynamic_calculator import (
     _calculate_saturation_multiplier_smooth,
     _calculate_opportunity_multiplier_smooth,
     _apply_bounds,
+    clear_volume_memo,
+    volume_memo_stats,
 )
+from python.volume.config_loader import clear_config
 
 
 # =============================================================================
@@ -663,5 +668,83 @@ class TestCalculateOptimizedVolumeFallbacks:
         assert result.content_allocations is not None
 
 
+class TestVolumeMemo:
+    """Tests for the structural memo behind calculate_dynamic_volume."""
+
+    @pytest.fixture(autouse=True)
+    def fresh_memo(self):
+        clear_volume_memo()
+        yield
+        clear_volume_memo()
+
+    def test_contexts_sharing_structure_share_entry(self):
+        # Same tier, flat saturation/opportunity regions, neutral trend
+        first = calculate_dynamic_volume(
+            PerformanceContext(fan_count=6000, page_type="paid", saturation_score=10,
+                               opportunity_score=20, message_count=20)
+        )
+        second = calculate_dynamic_volume(
+            PerformanceContext(fan_count=9000, page_type="paid", saturation_score=25,
+                               opportunity_score=40, revenue_trend=5, message_count=20)
+        )
+
+        stats = volume_memo_stats()
+        assert stats == {"size": 1, "hits": 1, "misses": 1, "hit_ratio": 0.5}
+        assert second.revenue_per_day == first.revenue_per_day
+        assert second.fan_count == 9000
+
+    def test_sweep_matches_unmemoized_results(self):
+        contexts = [
+            PerformanceContext(fan_count=12434, page_type=page_type,
+                               saturation_score=sat, opportunity_score=opp,
+                               revenue_trend=trend, message_count=20)
+            for page_type in ("paid", "free")
+            for sat in range(0, 101, 5)
+            for opp in range(0, 101, 10)
+            for trend in (-20, 0, 20)
+        ]
+        memoized = [calculate_dynamic_volume(c) for c in contexts]
+        recomputed = []
+        for context in contexts:
+            clear_volume_memo()
+            recomputed.append(calculate_dynamic_volume(context))
+
+        assert memoized == recomputed
+
+    def test_stats_before_any_call(self):
+        assert volume_memo_stats()["hit_ratio"] == 0.0
+
+    def test_config_reload_invalidates_memo(self):
+        context = PerformanceContext(fan_count=6000, page_type="paid", message_count=20)
+        calculate_dynamic_volume(context)
+        clear_config()
+        try:
+            calculate_dynamic_volume(context)
+        finally:
+            clear_config()
+
+        stats = volume_memo_stats()
+        assert stats["hits"] == 0
+        assert stats["misses"] == 2
+        assert stats["size"] == 1
+
+    def test_concurrent_calls_keep_counters_consistent(self):
+        contexts = [
+            PerformanceContext(fan_count=6000, page_type="paid",
+                               saturation_score=sat, message_count=20)
+            for sat in range(0, 101, 10)
+        ] * 20
+        expected = [calculate_dynamic_volume(c).revenue_per_day for c in contexts[:11]] * 20
+        clear_volume_memo()
+
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            results = list(pool.map(calculate_dynamic_volume, contexts))
+
+        stats = volume_memo_stats()
+        assert [r.revenue_per_day for r in results] == expected
+        assert stats["hits"] + stats["misses"] == len(contexts)
+        assert stats["size"] <= stats["misses"]
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
@@ -19,6 +19,12 @@ sys.path.insert(0, str(project_root))
 
 from python.quality.emoji_validator import EmojiValidator, EmojiValidationResult
 from python.quality.font_validator import FontFormatValidator, FontValidationResult
+from python.quality.unicode_classes import (
+    build_range_table,
+    find_emojis,
+    find_styled_runs,
+    fold_to_ascii,
+)
 from python.exceptions import ValidationError
 
 
@@ -365,5 +371,79 @@ class TestValidatorIntegration:
         assert font_result.highlighted_count >= 1
 
 
+# =============================================================================
+# Shared Unicode Classification Tests
+# =============================================================================
+
+
+class TestUnicodeClasses:
+    """Tests for the shared unicode_classes range tables."""
+
+    def test_range_table_merges_and_looks_up(self):
+        """Test overlapping and adjacent ranges merge into one entry."""
+        table = build_range_table([(0x30, 0x39), (0x20, 0x2F), (0x35, 0x40)])
+        assert table.starts == (0x20,)
+        assert table.ends == (0x40,)
+        assert '5' in table
+        assert 'A' not in table
+        assert table.pattern.findall("a1b@") == ['1', '@']
+
+    def test_find_emojis_matches_is_emoji(self, emoji_validator):
+        """Test regex scan agrees with per-character classification."""
+        caption = "Hey \U0001F60D\U0001F3FB \u2764\uFE0F **hot** \U0001FAF6 caf\u00e9 #1"
+        expected = [char for char in caption if emoji_validator._is_emoji(char)]
+        assert find_emojis(caption) == expected
+        assert find_emojis("plain ascii text") == []
+
+    def test_find_styled_runs_splits_by_type(self):
+        """Test bold and italic runs are reported separately."""
+        text = "\U0001D400\U0001D401\U0001D434 x \U0001D5D4"
+        assert find_styled_runs(text) == [
+            ('unicode_bold', '\U0001D400\U0001D401'),
+            ('unicode_italic', '\U0001D434'),
+            ('unicode_bold', '\U0001D5D4'),
+        ]
+
+    def test_fold_to_ascii(self):
+        """Test lookalikes, accents and zero-width characters are folded."""
+        assert fold_to_ascii("\u0430n\u0430l") == "anal"
+        assert fold_to_ascii("caf\u00e9\u200b!") == "cafe!"
+        assert fold_to_ascii("ASCII Stays") == "ASCII Stays"
+
+
+# =============================================================================
+# Batch Validation Tests
+# =============================================================================
+
+
+class TestBatchValidation:
+    """Tests for validate_batch on both validators."""
+
+    def test_emoji_batch_matches_single(self, emoji_validator):
+        """Test batch results equal per-caption results, in order."""
+        captions = [
+            "Hey babe! \U0001F60D",
+            "\U0001F600\U0001F603\U0001F604 too many",
+            "no emojis here",
+        ]
+        results = emoji_validator.validate_batch(captions)
+        assert results == [emoji_validator.validate(caption) for caption in captions]
+        assert results[1]['is_valid'] is False
+
+    def test_font_batch_matches_single(self, font_validator):
+        """Test batch results equal per-caption results, in order."""
+        captions = ["**a** *b* _c_ `d` ~~e~~", "plain caption"]
+        results = font_validator.validate_batch(captions)
+        assert results == [font_validator.validate(caption) for caption in captions]
+        assert results[0].is_valid is False
+
+    def test_batch_reports_invalid_caption_index(self, emoji_validator, font_validator):
+        """Test an invalid caption raises with its position."""
+        for validator in (emoji_validator, font_validator):
+            with pytest.raises(ValidationError) as exc_info:
+                validator.validate_batch(["fine", ""])
+            assert exc_info.value.field == "captions[1]"
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
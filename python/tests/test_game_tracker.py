@@ -0,0 +1,175 @@
+"""
+Tests for game type performance tracking (python.analytics.game_tracker).
+
+Tests cover:
+- GamePosteriorState running statistics match batch statistics
+- Estimates from running statistics match the batch posterior
+- Bounded history does not change estimates
+- to_dict/from_dict round trip restores recommendations
+"""
+
+import math
+import statistics
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add project root to path for imports
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from python.analytics.game_tracker import (
+    GamePosteriorState,
+    GameTypeTracker,
+    _compute_normal_inverse_gamma_posterior,
+    _posterior_from_state,
+)
+
+
+EARNINGS = [5000.0, 5500.0, 4800.0, 6100.0, 5250.0, 3900.0]
+
+
+def _tracker_with(records, history_limit=None):
+    tracker = GameTypeTracker("test_creator", history_limit=history_limit)
+    for game_type, earnings in records:
+        tracker.record_performance(game_type, earnings, "2025-01-15")
+    return tracker
+
+
+RECORDS = [
+    ("spin_the_wheel", 5000.0),
+    ("mystery_box", 2800.0),
+    ("spin_the_wheel", 5500.0),
+    ("card_game", 900.0),
+    ("mystery_box", 3400.0),
+    ("spin_the_wheel", 4800.0),
+    ("custom_game", 1200.0),
+]
+
+
+class TestGamePosteriorState:
+    """Tests for Welford running statistics."""
+
+    def test_empty_state(self):
+        state = GamePosteriorState()
+        assert state.count == 0
+        assert state.sample_variance == 0.0
+
+    def test_matches_batch_statistics(self):
+        state = GamePosteriorState()
+        for earnings in EARNINGS:
+            state.update(earnings)
+
+        assert state.count == len(EARNINGS)
+        assert state.mean == pytest.approx(statistics.fmean(EARNINGS))
+        assert state.sample_variance == pytest.approx(statistics.variance(EARNINGS))
+        assert state.total == pytest.approx(sum(EARNINGS))
+        assert state.min_earnings == min(EARNINGS)
+        assert state.max_earnings == max(EARNINGS)
+
+    def test_dict_round_trip(self):
+        state = GamePosteriorState()
+        for earnings in EARNINGS:
+            state.update(earnings)
+        assert GamePosteriorState.from_dict(state.to_dict()) == state
+
+    def test_from_dict_rejects_negative_count(self):
+        with pytest.raises(ValueError):
+            GamePosteriorState.from_dict({"count": -1, "mean": 0.0, "m2": 0.0})
+
+
+def _batch_posterior(prior_mean, prior_var, prior_n, observations):
+    """Reference Normal-Inverse-Gamma update computed from the raw observations."""
+    n_obs = len(observations)
+    if n_obs == 0:
+        return prior_mean, prior_var, prior_n, prior_var
+
+    sample_mean = statistics.fmean(observations)
+    sample_var = statistics.variance(observations) if n_obs > 1 else prior_var
+    posterior_n = prior_n + n_obs
+    posterior_mean = (prior_n * prior_mean + n_obs * sample_mean) / posterior_n
+    weighted_sample_var = n_obs * sample_var if n_obs > 1 else 0.0
+    mean_diff_sq = prior_n * n_obs * (prior_mean - sample_mean) ** 2 / posterior_n
+    posterior_var = (prior_n * prior_var + weighted_sample_var + mean_diff_sq) / posterior_n
+    return posterior_mean, posterior_var, posterior_n, posterior_var * (1 + 1 / posterior_n)
+
+
+class TestPosteriorFromState:
+    """Running statistics give the same posterior as the full observation list."""
+
+    @pytest.mark.parametrize("observations", [[], [4200.0], EARNINGS])
+    def test_matches_batch_posterior(self, observations):
+        state = GamePosteriorState()
+        for earnings in observations:
+            state.update(earnings)
+
+        expected = _batch_posterior(5178.0, 1500.0 ** 2, 3.0, observations)
+        assert _posterior_from_state(5178.0, 1500.0 ** 2, 3.0, state) == pytest.approx(expected)
+        assert _compute_normal_inverse_gamma_posterior(
+            5178.0, 1500.0 ** 2, 3.0, observations
+        ) == pytest.approx(expected)
+
+
+class TestGameTypeTracker:
+    """Tests for tracker estimates backed by running statistics."""
+
+    def test_record_updates_state(self):
+        tracker = _tracker_with(RECORDS)
+        assert tracker.game_states["spin_the_wheel"].count == 3
+        assert tracker.total_observations == len(RECORDS)
+        assert tracker.game_observations["mystery_box"] == [2800.0, 3400.0]
+
+    def test_history_limit_bounds_memory_not_estimates(self):
+        unbounded = _tracker_with(RECORDS)
+        bounded = _tracker_with(RECORDS, history_limit=2)
+
+        assert len(bounded.performance_history) == 2
+        assert bounded.total_observations == len(RECORDS)
+        for game_type in ("spin_the_wheel", "mystery_box", "custom_game"):
+            assert bounded.get_bayesian_estimate(game_type) == unbounded.get_bayesian_estimate(game_type)
+        assert bounded.get_recommendations() == unbounded.get_recommendations()
+        assert bounded.get_performance_summary() == unbounded.get_performance_summary()
+
+    def test_negative_history_limit_raises(self):
+        with pytest.raises(ValueError):
+            GameTypeTracker("test_creator", history_limit=-1)
+
+    def test_summary_statistics(self):
+        tracker = _tracker_with([("spin_the_wheel", e) for e in EARNINGS])
+        summary = tracker.get_performance_summary()["spin_the_wheel"]
+        assert summary["count"] == len(EARNINGS)
+        assert summary["mean"] == round(statistics.fmean(EARNINGS), 2)
+        assert summary["std"] == round(statistics.stdev(EARNINGS), 2)
+
+    def test_credible_interval_uses_95_percent_z(self):
+        tracker = _tracker_with([("spin_the_wheel", e) for e in EARNINGS])
+        estimate = tracker.get_bayesian_estimate("spin_the_wheel")
+        upper_width = estimate["credible_upper"] - estimate["posterior_mean"]
+        assert upper_width == pytest.approx(1.959964 * estimate["posterior_std"], abs=0.02)
+
+    def test_persistence_round_trip(self):
+        tracker = _tracker_with(RECORDS)
+        restored = GameTypeTracker.from_dict(tracker.to_dict())
+
+        assert restored.creator_id == tracker.creator_id
+        assert len(restored.performance_history) == 0
+        assert restored.get_recommendations() == tracker.get_recommendations()
+
+        # New observations continue from the restored statistics
+        tracker.record_performance("card_game", 1500.0, "2025-01-16")
+        restored.record_performance("card_game", 1500.0, "2025-01-16")
+        assert restored.get_bayesian_estimate("card_game") == tracker.get_bayesian_estimate("card_game")
+
+    def test_from_dict_missing_creator_raises(self):
+        with pytest.raises(ValueError):
+            GameTypeTracker.from_dict({"game_states": {}})
+
+    def test_clear_history_resets_state(self):
+        tracker = _tracker_with(RECORDS)
+        tracker.clear_history()
+        assert tracker.game_states == {}
+        assert tracker.total_observations == 0
+        assert math.isclose(
+            tracker.get_bayesian_estimate("spin_the_wheel")["prior_weight"], 1.0
+        )
@@ -0,0 +1,139 @@
+"""
+Tests for lazy package exports (python.lazy_imports).
+
+Tests cover:
+- Package import does not load submodules or heavy dependencies
+- Every name in __all__ resolves, including aliased re-exports
+- Resolved names are cached in the package namespace
+- lazy_exports error handling
+"""
+
+import importlib
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add project root to path for imports
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from python.lazy_imports import lazy_exports
+
+
+LAZY_PACKAGES = ["python", "python.volume", "python.analytics"]
+
+
+def _modules_loaded_by(statement: str) -> set[str]:
+    """Run an import in a fresh interpreter and return the modules it loaded."""
+    script = f"import sys; {statement}; print('\\n'.join(sys.modules))"
+    output = subprocess.run(
+        [sys.executable, "-c", script],
+        cwd=project_root,
+        check=True,
+        capture_output=True,
+        text=True,
+    ).stdout
+    return set(output.split())
+
+
+# =============================================================================
+# Cold Import Tests
+# =============================================================================
+
+
+class TestColdImport:
+    """Tests that package import stays lightweight."""
+
+    def test_import_python_loads_no_subpackages(self):
+        """Test `import python` defers every subpackage and yaml."""
+        loaded = _modules_loaded_by("import python")
+        assert not {m for m in loaded if m.startswith("python.") and m != "python.lazy_imports"}
+        assert "yaml" not in loaded
+
+    def test_import_volume_loads_no_submodules(self):
+        """Test `import python.volume` defers its fourteen submodules."""
+        loaded = _modules_loaded_by("import python.volume")
+        assert not {m for m in loaded if m.startswith("python.volume.")}
+        assert "yaml" not in loaded
+
+    def test_import_analytics_skips_numpy_and_scipy(self):
+        """Test analytics import does not pull in numpy or scipy."""
+        loaded = _modules_loaded_by("import python.analytics")
+        assert "numpy" not in loaded
+        assert "scipy" not in loaded
+
+    def test_first_access_loads_only_owning_module(self):
+        """Test accessing one export imports just the module that defines it."""
+        loaded = _modules_loaded_by("import python.volume as v; v.get_frequency_rules")
+        assert "python.volume.campaign_frequency" in loaded
+        assert "python.volume.elasticity" not in loaded
+
+
+# =============================================================================
+# Export Resolution Tests
+# =============================================================================
+
+
+class TestExportResolution:
+    """Tests that lazy exports resolve to the same objects as before."""
+
+    @pytest.mark.parametrize("package_name", ["python", "python.volume"])
+    def test_all_names_resolve(self, package_name):
+        """Test every name in __all__ resolves and appears in dir()."""
+        package = importlib.import_module(package_name)
+        for name in package.__all__:
+            assert getattr(package, name) is not None
+        assert set(package.__all__) <= set(dir(package))
+
+    def test_aliases_resolve_to_source_attribute(self):
+        """Test "attr as alias" exports point at the original objects."""
+        import python.volume as volume
+        from python.volume import day_of_week, page_type_calculator
+
+        assert volume.DOW_DEFAULT_MULTIPLIERS is day_of_week.DEFAULT_MULTIPLIERS
+        assert volume.get_volume_tier_name is page_type_calculator.get_volume_tier
+
+    def test_from_import_and_cache(self):
+        """Test from-imports work and resolved names are cached on the package."""
+        import python
+        from python import SendTypeRegistry
+
+        assert vars(python)["SendTypeRegistry"] is SendTypeRegistry
+
+    def test_unknown_name_raises_attribute_error(self):
+        """Test unknown names raise AttributeError like a normal module."""
+        import python.volume as volume
+
+        with pytest.raises(AttributeError, match="no_such_export"):
+            volume.no_such_export
+
+
+# =============================================================================
+# lazy_exports Tests
+# =============================================================================
+
+
+class TestLazyExports:
+    """Tests for the lazy_exports hook builder."""
+
+    def test_duplicate_export_raises(self):
+        """Test declaring the same exported name twice is rejected."""
+        with pytest.raises(ValueError, match="'dumps' twice"):
+            lazy_exports("pkg", {"json": ("dumps",), "pickle": ("dumps",)})
+
+    def test_alias_syntax(self, monkeypatch):
+        """Test hooks resolve plain and aliased names from their modules."""
+        import json
+        import types
+
+        package = types.ModuleType("fake_lazy_pkg")
+        monkeypatch.setitem(sys.modules, "fake_lazy_pkg", package)
+        getattr_hook, dir_hook = lazy_exports(
+            "fake_lazy_pkg", {"json": ("dumps", "loads as parse")}
+        )
+
+        assert getattr_hook("parse") is json.loads
+        assert package.parse is json.loads
+        assert {"dumps", "parse"} <= set(dir_hook())
@@ -30,6 +30,8 @@ from python.allocation.send_type_allocator import (
     DiversityValidation,
     filter_non_converters,
 )
+from python.orchestration.followup_limiter import MAX_FOLLOWUPS_PER_DAY
+from python.orchestration.weekly_limits import WEEKLY_LIMITS
 
 
 # =============================================================================
@@ -515,6 +517,175 @@ class TestAllocateWeek:
                 assert 0 <= item["day_of_week"] <= 6
 
 
+# =============================================================================
+# Week Plan Tests
+# =============================================================================
+
+
+class TestWeekPlan:
+    """Tests for memoized weekly allocation plans."""
+
+    @pytest.fixture(autouse=True)
+    def _fresh_cache(self):
+        SendTypeAllocator.clear_plan_cache()
+        yield
+        SendTypeAllocator.clear_plan_cache()
+
+    def test_plan_shared_by_matching_creators(self, mid_tier_paid_config):
+        """Creators with the same strategy offset share one compiled plan."""
+        first = SendTypeAllocator(creator_id="creator_a")
+        offset = first.timing_profile.strategy_rotation_offset
+        second = next(
+            other
+            for other in (SendTypeAllocator(creator_id=f"creator_{i}") for i in range(100))
+            if other.timing_profile.strategy_rotation_offset == offset
+        )
+
+        plan = first.compile_week_plan(mid_tier_paid_config, "paid", 0)
+
+        assert second.compile_week_plan(mid_tier_paid_config, "paid", 0) is plan
+        assert plan.validation.is_valid
+        assert len(plan.days) == 7
+
+    def test_plan_key_ignores_tier_and_fan_count(self, mid_tier_paid_config):
+        """Only inputs that change the allocation are part of the key."""
+        allocator = SendTypeAllocator(creator_id="creator_a")
+        bigger = VolumeConfig(
+            tier=VolumeTier.HIGH,
+            revenue_per_day=4,
+            engagement_per_day=3,
+            retention_per_day=2,
+            fan_count=9000,
+            page_type="paid",
+        )
+
+        assert allocator.plan_key(bigger, "paid", 0) == allocator.plan_key(mid_tier_paid_config, "paid", 0)
+        assert allocator.plan_key(mid_tier_paid_config, "paid", 0) != allocator.plan_key(mid_tier_paid_config, "paid", 2)
+
+    def test_week_matches_daily_allocation(self, allocator, ultra_tier_config):
+        """Week templates follow allocate_day for each weekday from week_start."""
+        wednesday = datetime(2025, 12, 17)
+        result = allocator.allocate_week(ultra_tier_config, "paid", wednesday)
+
+        for day_offset, (date_str, items) in enumerate(result.items()):
+            day_of_week = (2 + day_offset) % 7
+            assert all(item["day_of_week"] == day_of_week for item in items)
+            expected = allocator.allocate_day(ultra_tier_config, day_of_week, "paid")
+            assert [i["category"] for i in items] == [i["category"] for i in expected]
+
+    def test_results_do_not_share_items(self, allocator, mid_tier_paid_config, monday_start):
+        """Mutating one allocated week does not leak into the cached plan."""
+        first = allocator.allocate_week(mid_tier_paid_config, "paid", monday_start)
+        first["2025-12-15"][0]["send_type_key"] = "mutated"
+
+        second = allocator.allocate_week(mid_tier_paid_config, "paid", monday_start)
+
+        assert second["2025-12-15"][0]["send_type_key"] != "mutated"
+
+    def test_failed_plan_raises_every_time(self, allocator, monday_start):
+        """Plans that cannot meet diversity raise on each allocation."""
+        sparse = VolumeConfig(
+            tier=VolumeTier.LOW,
+            revenue_per_day=1,
+            engagement_per_day=1,
+            retention_per_day=0,
+            fan_count=100,
+            page_type="paid",
+        )
+
+        for _ in range(2):
+            with pytest.raises(ValueError, match="diversity requirements"):
+                allocator.allocate_week(sparse, "paid", monday_start)
+
+    def test_cache_is_bounded(self, allocator, mid_tier_paid_config, monkeypatch):
+        """The oldest plan is evicted once the cache is full."""
+        monkeypatch.setattr(SendTypeAllocator, "PLAN_CACHE_SIZE", 2)
+
+        for first_day in range(3):
+            allocator.compile_week_plan(mid_tier_paid_config, "paid", first_day)
+
+        assert len(SendTypeAllocator._plan_cache) == 2
+        assert allocator.plan_key(mid_tier_paid_config, "paid", 0) not in SendTypeAllocator._plan_cache
+
+
+class TestConstraintMode:
+    """Tests for constraint-propagating weekly allocation."""
+
+    @pytest.fixture(autouse=True)
+    def _fresh_cache(self):
+        SendTypeAllocator.clear_plan_cache()
+        yield
+        SendTypeAllocator.clear_plan_cache()
+
+    @pytest.fixture
+    def heavy_free_config(self) -> VolumeConfig:
+        """Free page volume high enough to hit weekly and followup limits."""
+        return VolumeConfig(
+            tier=VolumeTier.ULTRA,
+            revenue_per_day=8,
+            engagement_per_day=8,
+            retention_per_day=5,
+            fan_count=50000,
+            page_type="free",
+        )
+
+    @pytest.mark.parametrize("page_type", ["paid", "free"])
+    def test_week_is_valid_without_repair(self, allocator, ultra_tier_config, monday_start, page_type):
+        """Constraint mode yields a diverse week with the same slot layout."""
+        result = allocator.allocate_week(ultra_tier_config, page_type, monday_start, mode="constraint")
+
+        assert allocator.validate_diversity(result, page_type).is_valid
+        for day_offset, items in enumerate(result.values()):
+            expected = allocator.allocate_day(ultra_tier_config, day_offset, page_type)
+            assert [i["category"] for i in items] == [i["category"] for i in expected]
+
+    def test_weekly_and_followup_limits(self, allocator, heavy_free_config, monday_start):
+        """Weekly limits and the daily followup cap hold for every day."""
+        result = allocator.allocate_week(heavy_free_config, "free", monday_start, mode="constraint")
+
+        all_keys = [item["send_type_key"] for items in result.values() for item in items]
+        for send_type, limit in WEEKLY_LIMITS.items():
+            assert all_keys.count(send_type) <= limit
+        for items in result.values():
+            followups = [i for i in items if i["send_type_key"] == "ppv_followup"]
+            assert len(followups) <= MAX_FOLLOWUPS_PER_DAY
+
+    def test_no_back_to_back_revenue_types(self, allocator, heavy_free_config, monday_start):
+        """Consecutive revenue sends within a day use different send types."""
+        result = allocator.allocate_week(heavy_free_config, "free", monday_start, mode="constraint")
+
+        for items in result.values():
+            revenue = [i["send_type_key"] for i in items if i["category"] == "revenue"]
+            assert all(a != b for a, b in zip(revenue, revenue[1:]))
+
+    def test_plans_cached_per_mode(self, allocator, mid_tier_paid_config):
+        """Repair and constraint plans are cached under separate keys."""
+        repair = allocator.compile_week_plan(mid_tier_paid_config, "paid", 0)
+        constraint = allocator.compile_week_plan(mid_tier_paid_config, "paid", 0, mode="constraint")
+
+        assert constraint is not repair
+        assert allocator.compile_week_plan(mid_tier_paid_config, "paid", 0, mode="constraint") is constraint
+
+    def test_infeasible_config_raises(self, allocator, monday_start):
+        """A volume too small for the diversity minimums cannot be solved."""
+        sparse = VolumeConfig(
+            tier=VolumeTier.LOW,
+            revenue_per_day=1,
+            engagement_per_day=1,
+            retention_per_day=0,
+            fan_count=100,
+            page_type="paid",
+        )
+
+        with pytest.raises(ValueError, match="under allocation constraints"):
+            allocator.allocate_week(sparse, "paid", monday_start, mode="constraint")
+
+    def test_unknown_mode_raises(self, allocator, mid_tier_paid_config, monday_start):
+        """Only the documented allocation modes are accepted."""
+        with pytest.raises(ValueError, match="mode must be one of"):
+            allocator.allocate_week(mid_tier_paid_config, "paid", monday_start, mode="greedy")
+
+
 # =============================================================================
 # validate_diversity Tests
 # =============================================================================
@@ -0,0 +1,149 @@
+"""
+Tests for top performer trait detection (python.analytics.trait_detector).
+
+Tests cover:
+- chi_square_test_batch matches chi_square_test table by table
+- analyze_fleet_traits matches analyze_top_performer_traits per creator
+- Empty, small and top-only creators in a fleet sweep
+"""
+
+import random
+import sys
+import warnings
+from pathlib import Path
+
+import pytest
+
+# Add project root to path for imports
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+pytest.importorskip("scipy")
+
+from python.analytics.trait_detector import (
+    TraitFrame,
+    analyze_fleet_traits,
+    analyze_top_performer_traits,
+    chi_square_test,
+    chi_square_test_batch,
+)
+
+
+def _make_records(seed: int, count: int):
+    """Synthetic records where high earners skew toward one trait set."""
+    rng = random.Random(seed)
+    records = []
+    for _ in range(count):
+        strong = rng.random() < 0.3
+        records.append({
+            "earnings": rng.uniform(500, 1000) if strong else rng.uniform(0, 600),
+            "caption_text": "A" * (300 if strong else rng.randint(0, 600)),
+            "content_type": "lingerie" if strong else rng.choice(["feet", "b/g", "solo", None]),
+            "detected_tone": rng.choice(["playful", "sultry", None]),
+            "price": 15 if strong else rng.choice([10, 20, None]),
+        })
+    return records
+
+
+def _assert_results_equal(expected, actual):
+    assert actual.keys() == expected.keys()
+    for key in ("has_recommendations", "analyzed_count", "statistical_confidence",
+                "bonferroni_alpha", "warning"):
+        assert actual[key] == expected[key], key
+    assert actual["shared_traits"].keys() == expected["shared_traits"].keys()
+    for trait, info in expected["shared_traits"].items():
+        for field, value in info.items():
+            if field == "p_value":
+                assert actual["shared_traits"][trait][field] == pytest.approx(value, rel=1e-9)
+            else:
+                assert actual["shared_traits"][trait][field] == value, (trait, field)
+    assert [r["trait"] for r in actual["recommendations"]] == [
+        r["trait"] for r in expected["recommendations"]
+    ]
+
+
+class TestChiSquareTestBatch:
+    """Vectorized tests agree with the scalar test."""
+
+    TABLES = [
+        (8, 10, 30, 90),      # chi2
+        (3, 5, 2, 8),         # fisher
+        (10, 10, 0, 40),      # fisher, extreme
+        (5, 10, 25, 50),      # most likely table
+        (0, 10, 0, 40),       # zero trait column
+        (40, 60, 100, 400),   # chi2, large
+    ]
+
+    def test_matches_scalar(self):
+        columns = list(zip(*self.TABLES))
+        p_values, test_types = chi_square_test_batch(*columns)
+        for table, p_value, test_type in zip(self.TABLES, p_values, test_types):
+            expected_p, expected_type = chi_square_test(*table)
+            assert test_type == expected_type
+            assert p_value == pytest.approx(expected_p, rel=1e-9)
+
+    def test_empty(self):
+        p_values, test_types = chi_square_test_batch([], [], [], [])
+        assert len(p_values) == 0
+        assert len(test_types) == 0
+
+    def test_invalid_counts_raise(self):
+        with pytest.raises(ValueError):
+            chi_square_test_batch([11], [10], [0], [5])
+        with pytest.raises(ValueError):
+            chi_square_test_batch([1], [0], [0], [5])
+
+
+class TestAnalyzeFleetTraits:
+    """Fleet sweep matches per-creator analysis."""
+
+    def test_matches_per_creator_analysis(self):
+        fleet = {
+            f"creator_{seed}": _make_records(seed, count)
+            for seed, count in enumerate([120, 60, 35, 12, 200])
+        }
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore", UserWarning)
+            results = analyze_fleet_traits(TraitFrame.from_records(fleet))
+            for creator_id, records in fleet.items():
+                _assert_results_equal(analyze_top_performer_traits(records), results[creator_id])
+
+    def test_significant_trait_detected(self):
+        results = analyze_fleet_traits(
+            TraitFrame.from_records({"alexia": _make_records(7, 200)})
+        )
+        traits = {r["trait"] for r in results["alexia"]["recommendations"]}
+        assert {"optimal_length", "content_type", "price"} <= traits
+
+    def test_edge_creators(self):
+        fleet = {
+            "empty": [],
+            "top_only": _make_records(1, 6),
+            "normal": _make_records(2, 80),
+        }
+        with pytest.warns(UserWarning):
+            results = analyze_fleet_traits(TraitFrame.from_records(fleet))
+
+        assert results["empty"]["warning"] == "No performance data provided"
+        assert results["empty"]["analyzed_count"] == 0
+        assert results["top_only"]["warning"].startswith("No comparison group")
+        assert results["top_only"]["analyzed_count"] == 6
+        assert results["top_only"]["shared_traits"] == {}
+        assert results["normal"]["warning"] is None
+        assert results["normal"]["bonferroni_alpha"] == pytest.approx(0.0125)
+
+    def test_frame_column_lengths_validated(self):
+        frame = TraitFrame.from_records({"alexia": _make_records(3, 20)})
+        with pytest.raises(ValueError):
+            TraitFrame(
+                creator_ids=frame.creator_ids,
+                creator_codes=frame.creator_codes,
+                earnings=frame.earnings[:-1],
+                optimal_length=frame.optimal_length,
+                content_type_codes=frame.content_type_codes,
+                content_types=frame.content_types,
+                tone_codes=frame.tone_codes,
+                tones=frame.tones,
+                price_codes=frame.price_codes,
+                prices=frame.prices,
+            )
@@ -6,8 +6,11 @@ Comprehensive test coverage for the volume_ab_test module including:
 - Sample size validation
 - Test lifecycle management
 - Pre-configured test specifications
+- Running arm statistics and sequential (mSPRT) testing
 """
 
+import random
+import statistics
 from datetime import date
 
 import pytest
@@ -24,16 +27,20 @@ from python.analytics.volume_ab_test import (
     SUBSCRIBER_CHURN_RATE,
     TIP_RATE,
     VOLUME_AB_TESTS,
+    ArmStatistics,
     Metric,
     MetricType,
+    SequentialDecision,
     TestStatus,
     VolumeABTest,
     VolumeConfig,
     _calculate_min_sample_size,
     calculate_achieved_power,
     create_custom_test,
+    evaluate_sequential_test,
     get_test_by_id,
     list_available_tests,
+    run_mixture_sprt,
     validate_test_completion,
 )
 
@@ -745,3 +752,139 @@ class TestIntegration:
 
         assert test.status == TestStatus.CANCELLED
         assert "Budget constraints" in test.notes
+
+
+# =============================================================================
+# Sequential Testing Tests
+# =============================================================================
+
+
+def _arm(values: list[float]) -> ArmStatistics:
+    arm = ArmStatistics()
+    arm.update_many(values)
+    return arm
+
+
+class TestArmStatistics:
+    """Tests for running per-arm statistics."""
+
+    VALUES = [12.5, 9.0, 14.25, 11.0, 10.5, 13.75, 8.0]
+
+    def test_matches_batch_statistics(self) -> None:
+        """Running mean and variance match the batch computation."""
+        arm = _arm(self.VALUES)
+        assert arm.count == len(self.VALUES)
+        assert arm.mean == pytest.approx(statistics.fmean(self.VALUES))
+        assert arm.variance == pytest.approx(statistics.variance(self.VALUES))
+
+    def test_small_arms_have_zero_variance(self) -> None:
+        """Variance and standard error are 0.0 below two outcomes."""
+        assert ArmStatistics().variance == 0.0
+        assert _arm([5.0]).standard_error == 0.0
+
+    def test_merge_matches_single_pass(self) -> None:
+        """Merging partial statistics equals folding all outcomes."""
+        merged = _arm(self.VALUES[:3]).merge(_arm(self.VALUES[3:]))
+        full = _arm(self.VALUES)
+        assert merged.count == full.count
+        assert merged.mean == pytest.approx(full.mean)
+        assert merged.m2 == pytest.approx(full.m2)
+        assert ArmStatistics().merge(ArmStatistics()) == ArmStatistics()
+
+    def test_persistence_round_trips(self) -> None:
+        """Statistics restore from to_dict() and from a stored summary."""
+        arm = _arm(self.VALUES)
+        assert ArmStatistics.from_dict(arm.to_dict()) == arm
+
+        restored = ArmStatistics.from_summary(arm.count, arm.mean, arm.standard_error)
+        assert restored.m2 == pytest.approx(arm.m2)
+
+    def test_invalid_state_raises(self) -> None:
+        """Negative counts and spreads are rejected."""
+        with pytest.raises(ValueError):
+            ArmStatistics.from_dict({"count": -1, "mean": 0.0, "m2": 0.0})
+        with pytest.raises(ValueError):
+            ArmStatistics.from_summary(10, 1.0, -0.5)
+
+
+class TestSequentialTest:
+    """Tests for the mixture SPRT sequential mode."""
+
+    @staticmethod
+    def _run(effect: float, seed: int, batches: int, alpha: float = 0.05):
+        """Check after every batch of 10 outcomes per arm until a stop."""
+        rng = random.Random(seed)
+        control, treatment = ArmStatistics(), ArmStatistics()
+        p_value = 1.0
+        for _ in range(batches):
+            control.update_many(rng.gauss(10.0, 3.0) for _ in range(10))
+            treatment.update_many(rng.gauss(10.0 + effect, 3.0) for _ in range(10))
+            result = run_mixture_sprt(
+                control, treatment, alpha=alpha, mde=0.2, previous_p_value=p_value
+            )
+            p_value = result.p_value
+            if result.should_stop:
+                break
+        return result
+
+    def test_stops_early_on_large_effect(self) -> None:
+        """A clear effect stops well before the fixed-horizon sample size."""
+        result = self._run(effect=1.5, seed=3, batches=200)
+        assert result.decision == SequentialDecision.TREATMENT_WINS
+        assert result.control_n < _calculate_min_sample_size(mde=0.2)
+        low, high = result.confidence_interval
+        assert low < result.effect < high
+
+    def test_false_stop_rate_bounded_under_null(self) -> None:
+        """Hourly checks under no effect stop at most ~alpha of the time."""
+        stops = sum(self._run(effect=0.0, seed=seed, batches=50).should_stop for seed in range(200))
+        assert stops / 200 <= 0.05
+
+    def test_p_value_is_running_minimum(self) -> None:
+        """The always-valid p-value never increases across checks."""
+        result = run_mixture_sprt(_arm([1.0, 2.0, 3.0]), _arm([1.5, 2.5, 3.5]), previous_p_value=0.2)
+        assert result.p_value <= 0.2
+
+    def test_zero_effect_has_no_winner(self) -> None:
+        """Identical arms never declare a winner, even with a low carried p-value."""
+        arm = _arm([8.0, 10.0, 12.0] * 20)
+        result = run_mixture_sprt(arm, _arm([8.0, 10.0, 12.0] * 20), previous_p_value=0.001, burn_in=3)
+        assert result.decision == SequentialDecision.CONTINUE
+        assert not result.should_stop
+
+    def test_burn_in_prevents_early_stop(self) -> None:
+        """Tiny arms cannot stop even when p is below alpha."""
+        control = _arm([1.0, 1.1, 0.9])
+        treatment = _arm([9.0, 9.1, 8.9])
+        assert run_mixture_sprt(control, treatment, burn_in=30).decision == SequentialDecision.CONTINUE
+        assert run_mixture_sprt(control, treatment, burn_in=3).decision == SequentialDecision.TREATMENT_WINS
+
+    def test_insufficient_data_continues(self) -> None:
+        """Arms without a variance estimate always continue."""
+        result = run_mixture_sprt(_arm([1.0]), _arm([2.0, 3.0]))
+        assert result.decision == SequentialDecision.CONTINUE
+        assert result.p_value == 1.0
+
+    def test_respects_metric_direction(self) -> None:
+        """A lower churn rate in treatment is a treatment win."""
+        test = create_custom_test(
+            test_id="churn_seq",
+            hypothesis="Lower volume reduces churn",
+            control_config=VolumeConfig(),
+            treatment_config=VolumeConfig(bump_per_day=1.0),
+            primary_metric=SUBSCRIBER_CHURN_RATE,
+        )
+        control = _arm([0.10 + 0.01 * (i % 5) for i in range(50)])
+        treatment = _arm([0.05 + 0.01 * (i % 5) for i in range(50)])
+
+        result = evaluate_sequential_test(test, control, treatment)
+
+        assert result.decision == SequentialDecision.TREATMENT_WINS
+        assert result.to_dict()["should_stop"] is True
+
+    def test_invalid_parameters_raise(self) -> None:
+        """Out-of-range parameters are rejected."""
+        with pytest.raises(ValueError):
+            run_mixture_sprt(ArmStatistics(), ArmStatistics(), alpha=1.5)
+        with pytest.raises(ValueError):
+            run_mixture_sprt(ArmStatistics(), ArmStatistics(), mixture_variance=0.0)
@@ -23,7 +23,7 @@ from python.models import (
     VolumeConfig,
     VolumeTier,
 )
-from python.registry import SendTypeRegistry
+from python.registry import SendTypeRegistry, SendTypeSnapshot
 from python.config import Settings
 
 
@@ -366,6 +366,91 @@ class TestSendTypeRegistry:
         assert len(free_types) == 2  # Excludes renew_on_post
 
 
+class TestSendTypeSnapshot:
+    """Test immutable send type snapshots and refresh."""
+
+    @pytest.fixture
+    def db_path(self, tmp_path):
+        """On-disk database with send types and caption requirements."""
+        path = tmp_path / "send_types.db"
+        conn = sqlite3.connect(path)
+        conn.executescript("""
+            CREATE TABLE send_types (
+                send_type_id INTEGER PRIMARY KEY,
+                send_type_key TEXT UNIQUE NOT NULL,
+                category TEXT NOT NULL,
+                display_name TEXT NOT NULL,
+                page_type_restriction TEXT DEFAULT 'both',
+                sort_order INTEGER DEFAULT 100,
+                is_active INTEGER DEFAULT 1
+            );
+            CREATE TABLE send_type_caption_requirements (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                send_type_id INTEGER NOT NULL,
+                caption_type TEXT NOT NULL,
+                priority INTEGER DEFAULT 3,
+                notes TEXT
+            );
+            INSERT INTO send_types VALUES
+                (1, 'ppv_unlock', 'revenue', 'PPV Unlock', 'both', 10, 1),
+                (2, 'bump_normal', 'engagement', 'Normal Bump', 'both', 20, 1),
+                (3, 'ppv_message', 'revenue', 'PPV Message', 'both', 5, 0);
+            INSERT INTO send_type_caption_requirements (send_type_id, caption_type, priority, notes)
+            VALUES (1, 'ppv_message', 2, NULL), (1, 'ppv_unlock', 1, 'primary');
+        """)
+        conn.commit()
+        conn.close()
+        return path
+
+    @pytest.fixture
+    def registry(self):
+        registry = SendTypeRegistry()
+        registry.clear()
+        yield registry
+        registry.clear()
+
+    def test_snapshot_contents(self, registry, db_path):
+        """One load covers configs, all rows and caption requirements."""
+        conn = sqlite3.connect(db_path)
+        snapshot = registry.refresh(conn)
+        conn.close()
+
+        assert isinstance(snapshot, SendTypeSnapshot)
+        assert registry.get_all_keys() == ["bump_normal", "ppv_unlock"]
+        assert snapshot.send_type_id("ppv_message") == 3  # Inactive rows stay resolvable
+        assert snapshot.send_type_id("unknown") is None
+        assert [r.caption_type for r in snapshot.requirements_for("ppv_unlock")] == [
+            "ppv_unlock",
+            "ppv_message",
+        ]
+        assert snapshot.requirements_for("bump_normal") == ()
+        with pytest.raises(TypeError):
+            snapshot.rows["ppv_unlock"]["display_name"] = "Changed"
+
+    def test_refresh_reuses_unchanged_snapshot(self, registry, db_path):
+        """Refreshing an unchanged database keeps the same snapshot object."""
+        conn = sqlite3.connect(db_path)
+        first = registry.refresh(conn)
+
+        assert registry.refresh(conn) is first
+        conn.close()
+
+    def test_refresh_swaps_after_table_change(self, registry, db_path):
+        """A table change installs a new version; old snapshots are untouched."""
+        conn = sqlite3.connect(db_path)
+        first = registry.refresh(conn)
+
+        conn.execute("UPDATE send_types SET display_name = 'Unlock' WHERE send_type_key = 'ppv_unlock'")
+        conn.commit()
+        second = registry.refresh(conn)
+        conn.close()
+
+        assert second is not first
+        assert second.version != first.version
+        assert registry.get("ppv_unlock").name == "Unlock"
+        assert first.configs["ppv_unlock"].name == "PPV Unlock"
+
+
 # =============================================================================
 # Settings Tests
 # =============================================================================
@@ -35,174 +35,180 @@ Configuration:
     - Trend adjustment (-1/0/+1) fine-tunes based on revenue performance
 """
 
-from python.models.volume import VolumeConfig, VolumeTier
-from python.volume.dynamic_calculator import (
-    PerformanceContext,
-    OptimizedVolumeResult,
-    calculate_dynamic_volume,
-    calculate_optimized_volume,
-    get_volume_tier,
-)
-from python.volume.tier_config import (
-    TIER_CONFIGS,
-    VOLUME_BOUNDS,
-    FAN_COUNT_THRESHOLDS,
-    SATURATION_THRESHOLDS,
-    OPPORTUNITY_THRESHOLDS,
-)
-from python.volume.score_calculator import (
-    CalculatedScores,
-    PerformanceScores,
-    PeriodMetrics,
-    ScoreCalculator,
-    calculate_opportunity_score,
-    calculate_saturation_score,
-    calculate_scores_from_db,
-)
-from python.volume.caption_constraint import (
-    CaptionAvailability,
-    CaptionPoolStatus,
-    ScheduleSlot,
-    VolumeConstraintResult,
-    CaptionPoolAnalyzer,
-    get_caption_pool_status,
-    check_caption_availability,
-    get_caption_shortage_report,
-    get_caption_coverage_estimate,
-    validate_volume_against_captions,
-    SEND_TYPE_CATEGORIES,
-    get_send_type_category,
-)
-from python.volume.elasticity import (
-    ElasticityParameters,
-    VolumePoint,
-    ElasticityProfile,
-    ElasticityModel,
-    ElasticityOptimizer,
-    fit_elasticity_model,
-    fetch_volume_performance_data,
-    calculate_elasticity_profile,
-    should_cap_volume,
-    DEFAULT_DECAY_RATE,
-    DEFAULT_MIN_MARGINAL_RPS,
-    VOLUME_EVALUATION_POINTS,
-)
-from python.volume.confidence import (
-    ConfidenceResult,
-    ConfidenceAdjustedVolume,
-    calculate_confidence,
-    dampen_multiplier,
-    dampen_multiplier_dict,
-    apply_confidence_to_multipliers,
-    apply_confidence_to_dow_multipliers,
-    apply_confidence_to_content_multipliers,
-    calculate_confidence_adjusted_volume,
-    CONFIDENCE_TIERS,
-    NEUTRAL_MULTIPLIER,
-)
-from python.volume.content_weighting import (
-    ContentTypeRanking,
-    ContentTypeProfile,
-    WeightedAllocation,
-    ContentWeightingOptimizer,
-    get_content_type_rankings,
-    apply_content_weighting,
-    allocate_by_content_type,
-    get_content_type_recommendations,
-    RANK_MULTIPLIERS,
-    DEFAULT_RANK,
-)
-from python.volume.prediction_tracker import (
-    VolumePrediction,
-    PredictionOutcome,
-    PredictionAccuracy,
-    PredictionTracker,
-    save_prediction,
-    measure_prediction_outcome,
-    get_prediction_accuracy,
-    find_unmeasured_predictions,
-    batch_measure_predictions,
-    calculate_mape,
-    get_accuracy_by_algorithm_version,
-    estimate_weekly_revenue,
-    estimate_weekly_messages,
-    CURRENT_ALGORITHM_VERSION,
-)
-from python.volume.multi_horizon import (
-    DEFAULT_WEIGHTS,
-    DIVERGENCE_THRESHOLD,
-    RAPID_CHANGE_WEIGHTS,
-    VALID_PERIODS,
-    FusedScores,
-    HorizonScores,
-    MultiHorizonAnalyzer,
-    detect_divergence,
-    fetch_horizon_scores,
-    fuse_scores,
-    select_weights,
-)
-from python.volume.day_of_week import (
-    DayPerformance,
-    DOWMultipliers,
-    DOWAnalysis,
-    DEFAULT_MULTIPLIERS as DOW_DEFAULT_MULTIPLIERS,
-    DAY_NAMES,
-    MULTIPLIER_MIN as DOW_MULTIPLIER_MIN,
-    MULTIPLIER_MAX as DOW_MULTIPLIER_MAX,
-    MIN_MESSAGES_PER_DAY as DOW_MIN_MESSAGES_PER_DAY,
-    MIN_TOTAL_MESSAGES as DOW_MIN_TOTAL_MESSAGES,
-    convert_sqlite_dow_to_python,
-    convert_python_dow_to_sqlite,
-    fetch_dow_performance,
-    calculate_dow_multipliers,
-    analyze_dow_patterns,
-    apply_dow_modulation,
-    get_weekly_volume_distribution,
-)
-from python.volume.page_type_calculator import (
-    CreatorConfig,
-    VolumeTargets,
-    PageType,
-    SubType,
-    TierName,
-    TIER_PPVS,
-    BUMP_MATRIX,
-    VALID_PAGE_TYPES,
-    VALID_SUB_TYPES,
-    BUMP_RATIO_TOLERANCE,
-    get_volume_tier as get_volume_tier_name,
-    calculate_volume_targets,
-    validate_bump_ratio,
-    get_tier_for_fan_count,
-    get_all_bump_ranges,
-)
-from python.volume.campaign_frequency import (
-    CAMPAIGN_FREQUENCY_RULES,
-    MINIMUM_MONTHLY_CAMPAIGNS,
-    OPTIMAL_MONTHLY_CAMPAIGNS,
-    CRITICALLY_LOW_THRESHOLD,
-    validate_campaign_frequency,
-    get_frequency_rules,
-    get_campaign_types,
-    get_monthly_targets,
-)
-from python.volume.bump_multiplier import (
-    BumpMultiplierResult,
-    FollowupVolumeResult,
-    BUMP_MULTIPLIERS,
-    DEFAULT_CONTENT_CATEGORY,
-    FOLLOWUP_BASE_RATE,
-    MAX_FOLLOWUPS_PER_DAY,
-    HIGH_TIER_MULTIPLIER_CAP,
-    FREE_PAGE_BUMP_BONUS,
-    calculate_bump_multiplier,
-    calculate_followup_volume,
-    get_creator_content_category,
-    apply_bump_to_engagement,
-    get_bump_multiplier_for_category,
-    get_all_content_categories,
-    calculate_effective_engagement,
-)
+from python.lazy_imports import lazy_exports
+
+# Exports resolve on first access (PEP 562): importing python.volume does
+# not load all fourteen submodules, only the ones a caller touches.
+__getattr__, __dir__ = lazy_exports(__name__, {
+    "python.models.volume": ("VolumeConfig", "VolumeTier"),
+    "python.volume.dynamic_calculator": (
+        "PerformanceContext",
+        "OptimizedVolumeResult",
+        "calculate_dynamic_volume",
+        "calculate_optimized_volume",
+        "get_volume_tier",
+    ),
+    "python.volume.tier_config": (
+        "TIER_CONFIGS",
+        "VOLUME_BOUNDS",
+        "FAN_COUNT_THRESHOLDS",
+        "SATURATION_THRESHOLDS",
+        "OPPORTUNITY_THRESHOLDS",
+    ),
+    "python.volume.score_calculator": (
+        "CalculatedScores",
+        "PerformanceScores",
+        "PeriodMetrics",
+        "ScoreCalculator",
+        "calculate_opportunity_score",
+        "calculate_saturation_score",
+        "calculate_scores_from_db",
+    ),
+    "python.volume.caption_constraint": (
+        "CaptionAvailability",
+        "CaptionPoolStatus",
+        "ScheduleSlot",
+        "VolumeConstraintResult",
+        "CaptionPoolAnalyzer",
+        "get_caption_pool_status",
+        "check_caption_availability",
+        "get_caption_shortage_report",
+        "get_caption_coverage_estimate",
+        "validate_volume_against_captions",
+        "SEND_TYPE_CATEGORIES",
+        "get_send_type_category",
+    ),
+    "python.volume.elasticity": (
+        "ElasticityParameters",
+        "VolumePoint",
+        "ElasticityProfile",
+        "ElasticityModel",
+        "ElasticityOptimizer",
+        "fit_elasticity_model",
+        "fetch_volume_performance_data",
+        "calculate_elasticity_profile",
+        "should_cap_volume",
+        "DEFAULT_DECAY_RATE",
+        "DEFAULT_MIN_MARGINAL_RPS",
+        "VOLUME_EVALUATION_POINTS",
+    ),
+    "python.volume.confidence": (
+        "ConfidenceResult",
+        "ConfidenceAdjustedVolume",
+        "calculate_confidence",
+        "dampen_multiplier",
+        "dampen_multiplier_dict",
+        "apply_confidence_to_multipliers",
+        "apply_confidence_to_dow_multipliers",
+        "apply_confidence_to_content_multipliers",
+        "calculate_confidence_adjusted_volume",
+        "CONFIDENCE_TIERS",
+        "NEUTRAL_MULTIPLIER",
+    ),
+    "python.volume.content_weighting": (
+        "ContentTypeRanking",
+        "ContentTypeProfile",
+        "WeightedAllocation",
+        "ContentWeightingOptimizer",
+        "get_content_type_rankings",
+        "apply_content_weighting",
+        "allocate_by_content_type",
+        "get_content_type_recommendations",
+        "RANK_MULTIPLIERS",
+        "DEFAULT_RANK",
+    ),
+    "python.volume.prediction_tracker": (
+        "VolumePrediction",
+        "PredictionOutcome",
+        "PredictionAccuracy",
+        "PredictionTracker",
+        "save_prediction",
+        "measure_prediction_outcome",
+        "get_prediction_accuracy",
+        "find_unmeasured_predictions",
+        "batch_measure_predictions",
+        "calculate_mape",
+        "get_accuracy_by_algorithm_version",
+        "estimate_weekly_revenue",
+        "estimate_weekly_messages",
+        "CURRENT_ALGORITHM_VERSION",
+    ),
+    "python.volume.multi_horizon": (
+        "DEFAULT_WEIGHTS",
+        "DIVERGENCE_THRESHOLD",
+        "RAPID_CHANGE_WEIGHTS",
+        "VALID_PERIODS",
+        "FusedScores",
+        "HorizonScores",
+        "MultiHorizonAnalyzer",
+        "detect_divergence",
+        "fetch_horizon_scores",
+        "fuse_scores",
+        "select_weights",
+    ),
+    "python.volume.day_of_week": (
+        "DayPerformance",
+        "DOWMultipliers",
+        "DOWAnalysis",
+        "DEFAULT_MULTIPLIERS as DOW_DEFAULT_MULTIPLIERS",
+        "DAY_NAMES",
+        "MULTIPLIER_MIN as DOW_MULTIPLIER_MIN",
+        "MULTIPLIER_MAX as DOW_MULTIPLIER_MAX",
+        "MIN_MESSAGES_PER_DAY as DOW_MIN_MESSAGES_PER_DAY",
+        "MIN_TOTAL_MESSAGES as DOW_MIN_TOTAL_MESSAGES",
+        "convert_sqlite_dow_to_python",
+        "convert_python_dow_to_sqlite",
+        "fetch_dow_performance",
+        "calculate_dow_multipliers",
+        "analyze_dow_patterns",
+        "apply_dow_modulation",
+        "get_weekly_volume_distribution",
+    ),
+    "python.volume.page_type_calculator": (
+        "CreatorConfig",
+        "VolumeTargets",
+        "PageType",
+        "SubType",
+        "TierName",
+        "TIER_PPVS",
+        "BUMP_MATRIX",
+        "VALID_PAGE_TYPES",
+        "VALID_SUB_TYPES",
+        "BUMP_RATIO_TOLERANCE",
+        "get_volume_tier as get_volume_tier_name",
+        "calculate_volume_targets",
+        "validate_bump_ratio",
+        "get_tier_for_fan_count",
+        "get_all_bump_ranges",
+    ),
+    "python.volume.campaign_frequency": (
+        "CAMPAIGN_FREQUENCY_RULES",
+        "MINIMUM_MONTHLY_CAMPAIGNS",
+        "OPTIMAL_MONTHLY_CAMPAIGNS",
+        "CRITICALLY_LOW_THRESHOLD",
+        "validate_campaign_frequency",
+        "get_frequency_rules",
+        "get_campaign_types",
+        "get_monthly_targets",
+    ),
+    "python.volume.bump_multiplier": (
+        "BumpMultiplierResult",
+        "FollowupVolumeResult",
+        "BUMP_MULTIPLIERS",
+        "DEFAULT_CONTENT_CATEGORY",
+        "FOLLOWUP_BASE_RATE",
+        "MAX_FOLLOWUPS_PER_DAY",
+        "HIGH_TIER_MULTIPLIER_CAP",
+        "FREE_PAGE_BUMP_BONUS",
+        "calculate_bump_multiplier",
+        "calculate_followup_volume",
+        "get_creator_content_category",
+        "apply_bump_to_engagement",
+        "get_bump_multiplier_for_category",
+        "get_all_content_categories",
+        "calculate_effective_engagement",
+    ),
+})
 
 __all__ = [
     # Domain models (re-exported from python.models.volume)
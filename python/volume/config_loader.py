@@ -4,6 +4,12 @@ Configuration loader for volume algorithm.
 Loads tier configs, thresholds, and multipliers from YAML with validation.
 Provides type-safe access to all algorithm configuration values.
 
+The parsed YAML is cached in a compiled (marshal) form keyed on the file's
+content hash, so later processes load the config without importing or
+running the YAML parser. refresh_config() and watch_config() reload the
+global config when the file changes, swapping the singleton in one
+assignment.
+
 Usage:
     from python.volume.config_loader import get_config, reload_config
 
@@ -11,22 +17,35 @@ Usage:
     thresholds = config.saturation_thresholds
     print(f"High saturation threshold: {thresholds.high}")
 
+    stop = watch_config(interval_seconds=5.0)  # hot reload on file changes
+    stop.set()
+
 Environment Variables:
     EROS_ALGORITHM_CONFIG_PATH: Override default config file location
+    EROS_ALGORITHM_CONFIG_CACHE_DIR: Directory for compiled configs (unset or
+        empty disables caching; the MCP server defaults it to
+        default_cache_dir())
 """
 
-from dataclasses import dataclass
+import hashlib
+import marshal
+import os
+import tempfile
+import threading
+from bisect import bisect_left
+from dataclasses import dataclass, field
 from decimal import ROUND_HALF_UP, Decimal
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Tuple
 
-import yaml
-
 from python.exceptions import ConfigurationError
 from python.logging_config import get_logger
 
 logger = get_logger(__name__)
 
+# Bump when the compiled config payload layout changes
+COMPILED_CONFIG_FORMAT = 1
+
 
 # =============================================================================
 # Configuration Dataclasses
@@ -113,6 +132,9 @@ class InterpolationBreakpoint:
 class SmoothInterpolationConfig:
     """Configuration for smooth threshold interpolation.
 
+    Breakpoint scores are precomputed into sorted lookup tables, so each
+    interpolation is a binary search rather than a walk over the breakpoints.
+
     Attributes:
         enabled: Whether smooth interpolation is enabled.
         saturation_breakpoints: Breakpoints for saturation interpolation.
@@ -122,6 +144,19 @@ class SmoothInterpolationConfig:
     enabled: bool
     saturation_breakpoints: Tuple[InterpolationBreakpoint, ...]
     opportunity_breakpoints: Tuple[InterpolationBreakpoint, ...]
+    _saturation_scores: Tuple[float, ...] = field(init=False, repr=False, compare=False)
+    _opportunity_scores: Tuple[float, ...] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        """Build score lookup tables and validate breakpoint ordering."""
+        for name in ("saturation", "opportunity"):
+            scores = tuple(bp.score for bp in getattr(self, f"{name}_breakpoints"))
+            if any(a > b for a, b in zip(scores, scores[1:])):
+                raise ConfigurationError(
+                    f"{name} breakpoints must be sorted by score, got {list(scores)}",
+                    config_key="smooth_interpolation",
+                )
+            object.__setattr__(self, f"_{name}_scores", scores)
 
     def interpolate_saturation(self, score: float) -> float:
         """Interpolate saturation multiplier for given score.
@@ -134,7 +169,7 @@ class SmoothInterpolationConfig:
         Returns:
             Interpolated multiplier value.
         """
-        return self._interpolate(score, self.saturation_breakpoints)
+        return self._interpolate(score, self._saturation_scores, self.saturation_breakpoints)
 
     def interpolate_opportunity(self, score: float) -> float:
         """Interpolate opportunity multiplier for given score.
@@ -147,16 +182,19 @@ class SmoothInterpolationConfig:
         Returns:
             Interpolated multiplier value.
         """
-        return self._interpolate(score, self.opportunity_breakpoints)
+        return self._interpolate(score, self._opportunity_scores, self.opportunity_breakpoints)
 
     @staticmethod
     def _interpolate(
-        score: float, breakpoints: Tuple[InterpolationBreakpoint, ...]
+        score: float,
+        scores: Tuple[float, ...],
+        breakpoints: Tuple[InterpolationBreakpoint, ...],
     ) -> float:
         """Perform linear interpolation between breakpoints.
 
         Args:
             score: Score value to interpolate.
+            scores: Breakpoint scores (the lookup table for breakpoints).
             breakpoints: Sorted breakpoints for interpolation.
 
         Returns:
@@ -166,23 +204,23 @@ class SmoothInterpolationConfig:
             return 1.0
 
         # Handle edge cases
-        if score <= breakpoints[0].score:
+        if score <= scores[0]:
             return breakpoints[0].multiplier
-        if score >= breakpoints[-1].score:
+        if score >= scores[-1]:
             return breakpoints[-1].multiplier
 
-        # Find surrounding breakpoints
-        for i in range(len(breakpoints) - 1):
-            lower = breakpoints[i]
-            upper = breakpoints[i + 1]
-            if lower.score <= score <= upper.score:
-                # Linear interpolation
-                if upper.score == lower.score:
-                    return lower.multiplier
-                t = (score - lower.score) / (upper.score - lower.score)
-                return lower.multiplier + t * (upper.multiplier - lower.multiplier)
+        # First segment whose upper score is >= score
+        i = bisect_left(scores, score) - 1
+        if i < 0:
+            return 1.0  # Unordered score (NaN)
 
-        return 1.0
+        lower = breakpoints[i]
+        upper = breakpoints[i + 1]
+        # Linear interpolation
+        if upper.score == lower.score:
+            return lower.multiplier
+        t = (score - lower.score) / (upper.score - lower.score)
+        return lower.multiplier + t * (upper.multiplier - lower.multiplier)
 
 
 @dataclass(frozen=True)
@@ -245,6 +283,25 @@ class TrendConfig:
     positive_threshold: float
 
 
+def _file_stamp(path: str) -> Optional[Tuple[int, int]]:
+    """Get (mtime_ns, size) for a file, or None if it cannot be stat'ed."""
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return (stat.st_mtime_ns, stat.st_size)
+
+
+def default_cache_dir() -> Path:
+    """Get the per-user directory for compiled configs.
+
+    Returns:
+        $XDG_CACHE_HOME/eros-schedule-generator (~/.cache by default).
+    """
+    base = os.environ.get("XDG_CACHE_HOME") or str(Path.home() / ".cache")
+    return Path(base) / "eros-schedule-generator"
+
+
 # =============================================================================
 # Main Configuration Class
 # =============================================================================
@@ -276,6 +333,7 @@ class AlgorithmConfig:
             ConfigurationError: If config file not found or invalid.
         """
         self._config_path = config_path or self._default_path()
+        self._source_stamp: Tuple[int, int] = (0, 0)
         self._raw_config = self._load_config()
         self._validate_config()
         self._parse_config()
@@ -289,8 +347,39 @@ class AlgorithmConfig:
         """
         return str(Path(__file__).parent.parent / "config" / "algorithm_config.yaml")
 
+    @staticmethod
+    def _cache_dir() -> Optional[Path]:
+        """Get the compiled config cache directory.
+
+        Caching is opt-in so that scripts and tests do not write to the
+        user's cache directory; long-running processes enable it by setting
+        EROS_ALGORITHM_CONFIG_CACHE_DIR.
+
+        Returns:
+            Cache directory, or None when caching is disabled.
+        """
+        cache_dir = os.environ.get("EROS_ALGORITHM_CONFIG_CACHE_DIR")
+        return Path(cache_dir) if cache_dir else None
+
+    def _cache_path(self) -> Optional[Path]:
+        """Get the compiled config file for this config path.
+
+        Returns:
+            Path of the compiled config, or None when caching is disabled.
+        """
+        cache_dir = self._cache_dir()
+        if cache_dir is None:
+            return None
+        path_key = hashlib.blake2b(
+            os.path.abspath(self._config_path).encode(), digest_size=8
+        ).hexdigest()
+        return cache_dir / f"{Path(self._config_path).stem}-{path_key}.marshal"
+
     def _load_config(self) -> Dict[str, Any]:
-        """Load configuration from YAML file.
+        """Load configuration from the compiled cache or the YAML file.
+
+        The YAML bytes are hashed and compared with the compiled copy; YAML is
+        only parsed (and the compiled copy rewritten) when they differ.
 
         Returns:
             Parsed YAML as dictionary.
@@ -299,24 +388,122 @@ class AlgorithmConfig:
             ConfigurationError: If file not found or invalid YAML.
         """
         try:
-            with open(self._config_path, "r") as f:
-                config = yaml.safe_load(f)
-                logger.debug(
-                    "Loaded algorithm config",
-                    extra={"config_path": self._config_path},
-                )
-                result: dict[str, Any] = dict(config) if config else {}
-                return result
+            with open(self._config_path, "rb") as f:
+                stat = os.fstat(f.fileno())
+                data = f.read()
         except FileNotFoundError as e:
             raise ConfigurationError(
                 f"Algorithm config not found: {self._config_path}",
                 config_key="config_path",
             ) from e
+        self._source_stamp = (stat.st_mtime_ns, stat.st_size)
+
+        digest = hashlib.blake2b(data, digest_size=16).hexdigest()
+        cache_path = self._cache_path()
+        compiled = self._read_compiled(cache_path, digest) if cache_path else None
+        if compiled is not None:
+            logger.debug(
+                "Loaded compiled algorithm config",
+                extra={"config_path": self._config_path},
+            )
+            return compiled
+
+        result = self._parse_yaml(data)
+        if cache_path is not None:
+            self._write_compiled(cache_path, digest, result)
+        return result
+
+    def _parse_yaml(self, data: bytes) -> Dict[str, Any]:
+        """Parse YAML config file contents.
+
+        Args:
+            data: Raw YAML bytes.
+
+        Returns:
+            Parsed YAML as dictionary.
+
+        Raises:
+            ConfigurationError: If the YAML is invalid.
+        """
+        # Imported here so only processes that actually parse the config pay for yaml
+        import yaml
+
+        try:
+            config = yaml.safe_load(data)
         except yaml.YAMLError as e:
             raise ConfigurationError(
                 f"Invalid YAML in algorithm config: {e}",
                 config_key="yaml_syntax",
             ) from e
+        logger.debug(
+            "Loaded algorithm config",
+            extra={"config_path": self._config_path},
+        )
+        result: dict[str, Any] = dict(config) if config else {}
+        return result
+
+    @staticmethod
+    def _read_compiled(cache_path: Path, digest: str) -> Optional[Dict[str, Any]]:
+        """Read a compiled config if it matches the YAML content hash.
+
+        Args:
+            cache_path: Compiled config file.
+            digest: Content hash of the current YAML bytes.
+
+        Returns:
+            Cached parsed config, or None on a miss or unreadable cache.
+        """
+        try:
+            payload = marshal.loads(cache_path.read_bytes())
+        except (OSError, EOFError, ValueError, TypeError):
+            return None
+        if (
+            not isinstance(payload, dict)
+            or payload.get("format") != COMPILED_CONFIG_FORMAT
+            or payload.get("digest") != digest
+            or not isinstance(payload.get("config"), dict)
+        ):
+            return None
+        result: dict[str, Any] = payload["config"]
+        return result
+
+    @staticmethod
+    def _write_compiled(cache_path: Path, digest: str, config: Dict[str, Any]) -> None:
+        """Atomically write a compiled config; failures only disable caching.
+
+        Args:
+            cache_path: Compiled config file.
+            digest: Content hash of the YAML bytes the config was parsed from.
+            config: Parsed config.
+        """
+        try:
+            data = marshal.dumps(
+                {"format": COMPILED_CONFIG_FORMAT, "digest": digest, "config": config}
+            )
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=cache_path.parent, suffix=".tmp")
+            try:
+                with os.fdopen(fd, "wb") as f:
+                    f.write(data)
+                os.replace(tmp_path, cache_path)
+            except BaseException:
+                os.unlink(tmp_path)
+                raise
+        except (OSError, ValueError) as e:
+            logger.debug(
+                "Could not write compiled algorithm config",
+                extra={"cache_path": str(cache_path), "error": str(e)},
+            )
+
+    def is_stale(self) -> bool:
+        """Check whether the config file changed since this config was loaded.
+
+        Returns:
+            True if the file's modification time or size differs. A missing
+            file is not considered stale, so the loaded config stays in use.
+        """
+        stamp = _file_stamp(self._config_path)
+        return stamp is not None and stamp != self._source_stamp
 
     def _validate_config(self) -> None:
         """Validate all required sections exist.
@@ -540,6 +727,9 @@ class AlgorithmConfig:
 # =============================================================================
 
 _config_instance: Optional[AlgorithmConfig] = None
+_reload_lock = threading.Lock()
+# File stamp of the last version that failed to reload (warned about once)
+_failed_stamp: Optional[Tuple[str, Optional[Tuple[int, int]]]] = None
 
 
 def get_config() -> AlgorithmConfig:
@@ -580,6 +770,73 @@ def reload_config(config_path: Optional[str] = None) -> AlgorithmConfig:
     return _config_instance
 
 
+def refresh_config() -> AlgorithmConfig:
+    """Reload the global config if its file changed since it was loaded.
+
+    The new config is fully loaded and validated before it replaces the
+    global instance in a single assignment. If the changed file is invalid
+    (for example, mid-edit), the current config stays in use and that file
+    version is not retried until the file changes again. Any error raised
+    while loading counts as invalid, not only ConfigurationError.
+
+    Returns:
+        The current (possibly reloaded) AlgorithmConfig instance.
+    """
+    global _config_instance, _failed_stamp
+    current = get_config()
+    if not current.is_stale():
+        return current
+
+    with _reload_lock:
+        current = get_config()
+        stamp = _file_stamp(current.config_path)
+        if current.is_stale() and (current.config_path, stamp) != _failed_stamp:
+            try:
+                _config_instance = AlgorithmConfig(current.config_path)
+            except Exception as e:
+                # Parsing assumes the validated sections are mappings, so a
+                # malformed edit can surface as TypeError/AttributeError too
+                _failed_stamp = (current.config_path, stamp)
+                logger.warning(
+                    "Keeping previous algorithm config after failed reload",
+                    extra={"config_path": current.config_path, "error": str(e)},
+                )
+                return current
+            logger.info(
+                "Hot reloaded algorithm config",
+                extra={"config_path": current.config_path},
+            )
+        return get_config()
+
+
+def watch_config(interval_seconds: float = 5.0) -> threading.Event:
+    """Poll the config file in a daemon thread and hot reload on changes.
+
+    Args:
+        interval_seconds: Seconds between file checks.
+
+    Returns:
+        Event that stops the watcher when set.
+
+    Raises:
+        ValueError: If interval_seconds is not positive.
+    """
+    if interval_seconds <= 0:
+        raise ValueError(f"interval_seconds must be positive, got {interval_seconds}")
+
+    stop = threading.Event()
+
+    def _watch() -> None:
+        while not stop.wait(interval_seconds):
+            try:
+                refresh_config()
+            except Exception:
+                logger.exception("Algorithm config watcher check failed")
+
+    threading.Thread(target=_watch, name="algorithm-config-watcher", daemon=True).start()
+    return stop
+
+
 def clear_config() -> None:
     """Clear the global config instance.
 
@@ -608,5 +865,8 @@ __all__ = [
     # Functions
     "get_config",
     "reload_config",
+    "refresh_config",
+    "watch_config",
     "clear_config",
+    "default_cache_dir",
 ]
@@ -33,6 +33,7 @@ from datetime import date, datetime, timedelta
 from decimal import ROUND_HALF_UP, Decimal
 import os
 import sqlite3
+import threading
 import time
 from typing import Optional
 
@@ -40,7 +41,7 @@ from python.exceptions import InsufficientDataError
 from python.logging_config import get_logger, log_operation_start, log_operation_end
 from python.models.volume import VolumeConfig, VolumeTier
 from python.observability.metrics import get_metrics, timed, with_error_tracking
-from python.volume.config_loader import get_config
+from python.volume.config_loader import AlgorithmConfig, get_config
 from python.volume.tier_config import (
     TIER_CONFIGS,
     VOLUME_BOUNDS,
@@ -370,6 +371,135 @@ def _apply_new_creator_defaults(context: PerformanceContext) -> PerformanceConte
     )
 
 
+# Bound on memoized volume triples shared across calls
+VOLUME_MEMO_SIZE = 4096
+
+# (tier, page_type, sat_mult, opp_mult, trend_adj) -> (revenue, engagement, retention)
+_volume_memo: dict[tuple[VolumeTier, str, float, float, int], tuple[int, int, int]] = {}
+_volume_memo_config: Optional[AlgorithmConfig] = None
+_volume_memo_hits = 0
+_volume_memo_misses = 0
+# Guards the memo, its config and the counters (calculations run in threads)
+_volume_memo_lock = threading.Lock()
+
+
+def _memoized_volumes(
+    config: AlgorithmConfig,
+    tier: VolumeTier,
+    page_type: str,
+    sat_mult: float,
+    opp_mult: float,
+    trend_adj: int,
+) -> tuple[int, int, int]:
+    """Rounded, bounded volumes for a structural key, memoized.
+
+    The key holds only what the volumes depend on once scores have been
+    turned into multipliers, so contexts in the flat regions of the
+    interpolation curves (or in the same tier) share an entry. Results
+    are exact: nothing is rounded before the lookup. The memo is dropped
+    whenever get_config() returns a new instance (reload/refresh). Volumes
+    are computed outside the lock; a result computed against a config that
+    was replaced meanwhile is returned but not stored.
+
+    Args:
+        config: The AlgorithmConfig the multipliers were derived from.
+        tier: Volume tier from fan count.
+        page_type: 'paid' or 'free'.
+        sat_mult: Saturation multiplier.
+        opp_mult: Opportunity multiplier.
+        trend_adj: Revenue trend adjustment (-1, 0, or +1).
+
+    Returns:
+        (revenue, engagement, retention) per day.
+    """
+    global _volume_memo_config, _volume_memo_hits, _volume_memo_misses
+
+    key = (tier, page_type, sat_mult, opp_mult, trend_adj)
+    with _volume_memo_lock:
+        if config is not _volume_memo_config:
+            _volume_memo.clear()
+            _volume_memo_config = config
+
+        volumes = _volume_memo.get(key)
+        if volumes is not None:
+            _volume_memo_hits += 1
+            return volumes
+        _volume_memo_misses += 1
+
+    volumes = _compute_volumes(tier, page_type, sat_mult, opp_mult, trend_adj)
+
+    with _volume_memo_lock:
+        if config is _volume_memo_config and key not in _volume_memo:
+            if len(_volume_memo) >= VOLUME_MEMO_SIZE:
+                # Evict the oldest entry (dicts preserve insertion order)
+                del _volume_memo[next(iter(_volume_memo))]
+            _volume_memo[key] = volumes
+    return volumes
+
+
+def _compute_volumes(
+    tier: VolumeTier,
+    page_type: str,
+    sat_mult: float,
+    opp_mult: float,
+    trend_adj: int,
+) -> tuple[int, int, int]:
+    """Rounded, bounded volumes for a structural key (see _memoized_volumes).
+
+    Returns:
+        (revenue, engagement, retention) per day.
+    """
+    base = TIER_CONFIGS[tier][page_type]
+
+    # Apply multipliers and trend adjustment to revenue
+    revenue_raw = _round_volume(base["revenue"] * sat_mult * opp_mult) + trend_adj
+    revenue = _apply_bounds(revenue_raw, "revenue")
+
+    # Engagement uses multipliers but not trend adjustment
+    engagement_raw = _round_volume(base["engagement"] * sat_mult * opp_mult)
+    engagement = _apply_bounds(engagement_raw, "engagement")
+
+    # Retention: free pages must have 0, paid pages use adjusted value
+    # BUG FIX: Apply saturation multiplier to retention as well
+    if page_type == "free":
+        retention = 0
+    else:
+        # Apply saturation multiplier only (not opportunity - retention is defensive)
+        retention_raw = _round_volume(base["retention"] * sat_mult)
+        retention = _apply_bounds(retention_raw, "retention")
+
+    return (revenue, engagement, retention)
+
+
+def volume_memo_stats() -> dict[str, float]:
+    """Hit/miss counters for the calculate_dynamic_volume memo.
+
+    Returns:
+        Dict with size, hits, misses and hit_ratio (0.0 before any call).
+    """
+    with _volume_memo_lock:
+        size = len(_volume_memo)
+        hits = _volume_memo_hits
+        misses = _volume_memo_misses
+    lookups = hits + misses
+    return {
+        "size": size,
+        "hits": hits,
+        "misses": misses,
+        "hit_ratio": hits / lookups if lookups else 0.0,
+    }
+
+
+def clear_volume_memo() -> None:
+    """Drop memoized volumes and reset hit/miss counters."""
+    global _volume_memo_config, _volume_memo_hits, _volume_memo_misses
+    with _volume_memo_lock:
+        _volume_memo.clear()
+        _volume_memo_config = None
+        _volume_memo_hits = 0
+        _volume_memo_misses = 0
+
+
 @timed("volume.calculate_dynamic", log_slow_threshold_ms=200)
 def calculate_dynamic_volume(
     context: PerformanceContext,
@@ -386,6 +516,8 @@ def calculate_dynamic_volume(
        and saturation is low (prevents increasing when already fatigued).
     5. **Trend adjustment**: Fine-tunes based on revenue performance trend.
     6. **Bounds enforcement**: Ensures final values are within safe limits.
+       Steps 5-6 are memoized on (tier, page_type, multipliers, trend
+       adjustment); see volume_memo_stats().
 
     This replaces static volume_assignments with adaptive calculation,
     fixing issues like Grace Bennett (12,434 fans) being incorrectly
@@ -470,23 +602,10 @@ def calculate_dynamic_volume(
     # Step 4: Trend adjustment
     trend_adj = _calculate_trend_adjustment(context.revenue_trend)
 
-    # Step 5: Calculate final values with bounds
-    # Apply multipliers and trend adjustment to revenue
-    revenue_raw = _round_volume(base["revenue"] * sat_mult * opp_mult) + trend_adj
-    revenue = _apply_bounds(revenue_raw, "revenue")
-
-    # Engagement uses multipliers but not trend adjustment
-    engagement_raw = _round_volume(base["engagement"] * sat_mult * opp_mult)
-    engagement = _apply_bounds(engagement_raw, "engagement")
-
-    # Retention: free pages must have 0, paid pages use adjusted value
-    # BUG FIX: Apply saturation multiplier to retention as well
-    if context.page_type == "free":
-        retention = 0
-    else:
-        # Apply saturation multiplier only (not opportunity - retention is defensive)
-        retention_raw = _round_volume(base["retention"] * sat_mult)
-        retention = _apply_bounds(retention_raw, "retention")
+    # Step 5: Calculate final values with bounds (memoized on the structural key)
+    revenue, engagement, retention = _memoized_volumes(
+        get_config(), tier, context.page_type, sat_mult, opp_mult, trend_adj,
+    )
 
     elapsed_ms = (time.perf_counter() - start_time) * 1000
     log_operation_end(
@@ -1334,6 +1453,8 @@ __all__ = [
     "calculate_dynamic_volume_legacy",
     "calculate_optimized_volume",
     "get_volume_tier",
+    "volume_memo_stats",
+    "clear_volume_memo",
     # Internal functions exposed for testing
     "_calculate_saturation_multiplier",
     "_calculate_saturation_multiplier_smooth",